@@ -44,6 +44,71 @@ def build_config(argv=None):
             "annotates the full corpus inline over the hosted API."
         ),
     )
+    parser.add_argument(
+        "--bern2-url",
+        default=PipelineConfig.bern2_url,
+        help=(
+            "BERN2 NER+EL endpoint, e.g. a local stand-in "
+            "(scripts/bern2_standin.py) for offline runs and load tests. "
+            "Default: the hosted bern2.korea.ac.kr/plain endpoint."
+        ),
+    )
+    parser.add_argument(
+        "--ner-cache-store",
+        action="store_true",
+        help=(
+            "Keep the BERN2 cache in a single SQLite file (bern2.sqlite, "
+            "imported from the per-file cache on first use; see "
+            "scripts/bern2_cache.py) instead of one JSON file per text."
+        ),
+    )
+    parser.add_argument(
+        "--ner-workers",
+        type=int,
+        default=1,
+        help=(
+            "Annotate up to N KE/KER texts with BERN2 concurrently. Results "
+            "are identical for any N. Default 1 = one text at a time."
+        ),
+    )
+    parser.add_argument(
+        "--ner-rate-limit",
+        type=float,
+        default=0.0,
+        help=(
+            "Cap BERN2/BridgeDb NER requests at this many per second per host. "
+            "Default 0 = no cap."
+        ),
+    )
+    parser.add_argument(
+        "--ner-dedupe",
+        action="store_true",
+        help=(
+            "Annotate each distinct KE/KER text once and map all NCBI Gene IDs "
+            "to HGNC in one BridgeDb pass. Results are identical."
+        ),
+    )
+    parser.add_argument(
+        "--ner-pack-chars",
+        type=int,
+        default=0,
+        help=(
+            "Pack short uncached KE/KER texts into BERN2 requests of up to N "
+            "characters, mapping the annotations back to each text (1500 "
+            "stays clear of the hosted API's response truncation). Default 0 "
+            "= one text per request."
+        ),
+    )
+    parser.add_argument(
+        "--ner-cache-retention-days",
+        type=float,
+        default=None,
+        help=(
+            "After the BERN2 pass, evict cache entries no current KE/KER text "
+            "references that are older than DAYS (see scripts/bern2_cache.py "
+            "gc). Default: keep everything."
+        ),
+    )
     parser.add_argument(
         "--enable-iri-labels",
         action="store_true",
@@ -66,15 +131,163 @@ def build_config(argv=None):
             "unchanged network behavior, byte-identical to current output."
         ),
     )
+    parser.add_argument(
+        "--stream-xml-download",
+        action="store_true",
+        help=(
+            "Stream the AOP-Wiki XML export through gunzip into a single file "
+            "instead of buffering it and extracting a second copy."
+        ),
+    )
+
+    parser.add_argument(
+        "--parse-cache-dir",
+        default=None,
+        help=(
+            "Directory for parsed-XML snapshots keyed by the XML content hash. "
+            "A rerun against an unchanged XML file loads the snapshot instead "
+            "of parsing again. Default None = parse every run."
+        ),
+    )
+    parser.add_argument(
+        "--incremental-dir",
+        default=None,
+        help=(
+            "Directory for the gene-mapping manifest. Key Events and KERs whose "
+            "text is unchanged since the last run reuse its gene results "
+            "instead of being rescanned. Default None = full scan."
+        ),
+    )
+    parser.add_argument(
+        "--automaton-cache-dir",
+        default=None,
+        help=(
+            "Save the HGNC gene automaton here and memory-map it on later runs "
+            "instead of rebuilding it, while HGNCgenes.txt is unchanged. "
+            "Default None = build every run."
+        ),
+    )
+    parser.add_argument(
+        "--gene-workers",
+        type=int,
+        default=1,
+        help=(
+            "Scan KE/KER texts for genes on up to N processes. Output is "
+            "identical for any N. Default 1 = in-process."
+        ),
+    )
+    parser.add_argument(
+        "--bridgedb-url",
+        default=PipelineConfig.bridgedb_url,
+        help=(
+            "BridgeDb service base URL, e.g. a local stand-in "
+            "(scripts/bridgedb_standin.py) for network-free runs. "
+            "Default: the public webservice.bridgedb.org Human endpoint."
+        ),
+    )
+    parser.add_argument(
+        "--bridgedb-workers",
+        type=int,
+        default=1,
+        help=(
+            "Send up to N BridgeDb batch requests concurrently over one pooled "
+            "connection. Output is identical for any N. Default 1 = sequential."
+        ),
+    )
+    parser.add_argument(
+        "--bridgedb-cache-dir",
+        default=None,
+        help=(
+            "Cache BridgeDb cross-references here per data release; unchanged "
+            "releases are answered from disk. Default None = fetch every run."
+        ),
+    )
+    parser.add_argument(
+        "--promapping-index-dir",
+        default=None,
+        help=(
+            "Index promapping.txt here once per release and look up only the "
+            "cited terms. Default None = download and scan every run."
+        ),
+    )
+    parser.add_argument(
+        "--http-cache-dir",
+        default=None,
+        help=(
+            "Keep upstream downloads here and revalidate them with "
+            "ETag/If-Modified-Since. Default None = full download every run."
+        ),
+    )
+    parser.add_argument(
+        "--stage-workers",
+        type=int,
+        default=1,
+        help=(
+            "Run independent pipeline stages concurrently on up to N threads "
+            "(network-bound mapping stages, the TTL writers). Output is "
+            "identical for any N. Default 1 = sequential."
+        ),
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        default=None,
+        help=(
+            "Snapshot the pipeline state here after every stage so a failed "
+            "run can be resumed with --resume. Default None = no checkpoints."
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Reload the checkpoint in --checkpoint-dir and continue from the "
+            "first incomplete stage. Ignored (fresh start) when the config or "
+            "input XML changed since the checkpoint was written."
+        ),
+    )
+
+    parser.add_argument(
+        "--verify-triple-counts",
+        action="store_true",
+        help=(
+            "Cross-check the VoID triple counts taken while writing against a "
+            "full rdflib re-parse of each TTL (slow). Mismatches are logged."
+        ),
+    )
 
     args = parser.parse_args(argv)
+    if args.resume and not args.checkpoint_dir:
+        parser.error("--resume requires --checkpoint-dir")
 
     return PipelineConfig(
         data_dir=Path(args.output_dir),
         log_level=args.log_level,
         enable_bern2=args.enable_bern2,
+        bern2_url=args.bern2_url,
+        ner_cache_store=args.ner_cache_store,
+        ner_workers=args.ner_workers,
+        ner_rate_limit=args.ner_rate_limit,
+        ner_dedupe=args.ner_dedupe,
+        ner_pack_chars=args.ner_pack_chars,
+        ner_cache_retention_days=args.ner_cache_retention_days,
         enable_iri_labels=args.enable_iri_labels,
         xml_file=Path(args.xml_file) if args.xml_file else None,
+        stream_xml_download=args.stream_xml_download,
+        parse_cache_dir=Path(args.parse_cache_dir) if args.parse_cache_dir else None,
+        incremental_dir=Path(args.incremental_dir) if args.incremental_dir else None,
+        automaton_cache_dir=Path(args.automaton_cache_dir) if args.automaton_cache_dir else None,
+        gene_mapping_workers=args.gene_workers,
+        bridgedb_url=args.bridgedb_url,
+        bridgedb_workers=args.bridgedb_workers,
+        bridgedb_cache_dir=Path(args.bridgedb_cache_dir) if args.bridgedb_cache_dir else None,
+        promapping_index_dir=(
+            Path(args.promapping_index_dir) if args.promapping_index_dir else None
+        ),
+        http_cache_dir=Path(args.http_cache_dir) if args.http_cache_dir else None,
+        stage_workers=args.stage_workers,
+        checkpoint_dir=Path(args.checkpoint_dir) if args.checkpoint_dir else None,
+        resume=args.resume,
+        verify_triple_counts=args.verify_triple_counts,
     )
 
 
@@ -0,0 +1,106 @@
+"""Maintain the BERN2 cache: the single-file store (ner_cache_dir/bern2.sqlite)
+and the per-file cache (bern2/*.json, bridgedb/*.txt).
+
+The pipeline opens the store with ``--ner-cache-store``, imports per-file
+entries it has no usable answer for, and exports the entries a run adds back to
+the per-file cache (the store file is local and git-ignored); this script
+does the same steps on demand, and garbage-collects either layout:
+
+    import   Load a per-file cache directory into the store (usable entries
+             already in the store win; unusable ones are replaced).
+    export   Write the store back out in the per-file layout, e.g. to commit
+             or diff it.
+    compact  Drop entries no run would serve (errors, partial responses) and
+             VACUUM the file.
+    stats    Print entry counts per kind.
+    gc       Evict entries no KE/KER text in an AOP-Wiki XML export references
+             any more (e.g. old hashes of edited descriptions) once they have
+             been unreferenced for --retention-days, and report the bytes
+             reclaimed. When each entry became unreferenced is recorded in
+             gc-orphans.json in the cache dir. Collects the per-file cache,
+             or the store with --store.
+
+Usage:
+    python scripts/bern2_cache.py {import,export,compact,stats}
+                                  [--cache-dir data/cache/bern2/] [--from DIR]
+                                  [--to DIR]
+    python scripts/bern2_cache.py gc [--cache-dir data/cache/bern2/] [--xml PATH]
+                                  [--retention-days 30] [--store] [--dry-run]
+"""
+
+import argparse
+import glob
+import logging
+import os
+import sys
+
+# Ensure the package is importable when run from the repo root.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from aopwiki_rdf.config import PipelineConfig  # noqa: E402
+from aopwiki_rdf.mapping.bern2_gc import collect_cache_garbage  # noqa: E402
+from aopwiki_rdf.mapping.bern2_store import Bern2CacheStore  # noqa: E402
+from aopwiki_rdf.parser.xml_parser import parse_aopwiki_xml  # noqa: E402
+
+
+def _newest_xml() -> str | None:
+    """Return the path to the newest data/aop-wiki-xml-* file, if any."""
+    candidates = sorted(glob.glob("data/aop-wiki-xml-*"))
+    return candidates[-1] if candidates else None
+
+
+def _gc(args) -> int:
+    xml_path = args.xml or _newest_xml()
+    if not xml_path or not os.path.isfile(xml_path):
+        logging.error("XML file not found: %s (pass --xml or place one under data/)",
+                      xml_path)
+        return 1
+    entities = parse_aopwiki_xml(xml_path, config=None)
+    config = PipelineConfig(ner_cache_dir=args.cache_dir, ner_cache_store=args.store)
+    report = collect_cache_garbage(entities.kedict, entities.kerdict, config,
+                                   args.retention_days, dry_run=args.dry_run)
+    verb = "would evict" if args.dry_run else "evicted"
+    for kind in sorted(report.evicted):
+        print(f"{kind}: {report.live[kind]} live, {report.retained[kind]} retained, "
+              f"{report.evicted[kind]} {verb}")
+    print(f"reclaimed: {report.reclaimed_bytes} bytes")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("command", choices=["import", "export", "compact", "stats", "gc"])
+    parser.add_argument("--cache-dir", default=str(PipelineConfig().ner_cache_dir),
+                        help="ner_cache_dir holding bern2.sqlite (default: %(default)s)")
+    parser.add_argument("--from", dest="source", default=None,
+                        help="import: per-file cache to load (default: --cache-dir)")
+    parser.add_argument("--to", dest="dest", default=None,
+                        help="export: directory to write (default: --cache-dir)")
+    parser.add_argument("--xml", default=None,
+                        help="gc: AOP-Wiki XML export (default: newest data/aop-wiki-xml-*)")
+    parser.add_argument("--retention-days", type=float, default=30.0,
+                        help="gc: keep entries unreferenced for fewer days than this "
+                             "(default: %(default)s)")
+    parser.add_argument("--store", action="store_true",
+                        help="gc: collect bern2.sqlite instead of the per-file cache")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="gc: report without deleting")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    if args.command == "gc":
+        return _gc(args)
+    with Bern2CacheStore(args.cache_dir) as store:
+        if args.command == "import":
+            store.import_directory(args.source)
+        elif args.command == "export":
+            store.export_directory(args.dest or args.cache_dir)
+        elif args.command == "compact":
+            store.compact()
+        for kind, counts in sorted(store.stats().items()):
+            print(f"{kind}: {counts['entries']} entries ({counts['usable']} usable)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,286 @@
+"""Offline stand-in for the BERN2 NER+EL service, replaying the response cache.
+
+``--enable-bern2`` sends every uncached KE/KER text to ``config.bern2_url``
+(the hosted ``bern2.korea.ac.kr/plain`` endpoint), which has outages and cuts
+long responses short. This stand-in answers the same ``POST {"text": ...}``
+requests locally, so the NER stage -- its throughput, concurrency
+(``--ner-workers``) and degradation handling (``ner_fallback_on_failure``, the
+truncation fallback) -- can be run and benchmarked without the network:
+
+* A text with a usable entry in a BERN2 cache (``<cache-dir>/bern2/*.json``
+  or ``<cache-dir>/bern2.sqlite``) is answered with the recorded response.
+* Any other text is annotated synthetically. Every gene mention in the cache
+  (and in an optional ``--lexicon`` JSON of ``{"mention": ["NCBIGene:N"]}``)
+  is found by whole-word matching, with the recorded IDs.
+* ``--latency`` / ``--latency-per-kchar`` delay each answer, like the hosted
+  model's length-dependent runtime.
+* ``--truncate-chars`` cuts response bodies longer than that, as the hosted
+  API does past ~5170 characters.
+* ``--error-rate`` answers that fraction of requests with 503 (seeded, so
+  runs repeat).
+
+Point the pipeline at it with ``--bern2-url http://127.0.0.1:PORT/plain``. Use
+a different ``ner_cache_dir`` for the pipeline than the one replayed, or every
+text is a pipeline cache hit and never reaches the stand-in. Gene IDs still go
+to BridgeDb; scripts/bridgedb_standin.py covers that hop.
+
+Usage:
+    python scripts/bern2_standin.py [--cache-dir data/cache/bern2/] [--port 8888]
+                                    [--lexicon JSON] [--latency SECONDS]
+                                    [--latency-per-kchar SECONDS]
+                                    [--truncate-chars N] [--error-rate FRACTION]
+                                    [--seed N]
+
+The stand-in can also run in-process (tests, benchmarks)::
+
+    with Bern2StandIn(cache_dir, latency=0.5) as standin:
+        config = PipelineConfig(bern2_url=standin.url, enable_bern2=True)
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import re
+import signal
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from aopwiki_rdf.config import PipelineConfig  # noqa: E402
+from aopwiki_rdf.mapping.bern2_store import (  # noqa: E402
+    STORE_FILENAME,
+    Bern2CacheStore,
+    entry_usable,
+)
+from aopwiki_rdf.mapping.ner_el_mapper import _cache_key  # noqa: E402
+
+logger = logging.getLogger("bern2_standin")
+
+
+def load_responses(cache_dir) -> dict[str, str]:
+    """Usable recorded BERN2 response bodies by cache key, from both layouts."""
+    cache_dir = Path(cache_dir)
+    responses: dict[str, str] = {}
+    if (cache_dir / STORE_FILENAME).exists():
+        with Bern2CacheStore(cache_dir) as store:
+            for key, _, _ in store.listing("bern2"):
+                body = store.get("bern2", key)
+                if entry_usable("bern2", body):
+                    responses[key] = body
+    for path in sorted((cache_dir / "bern2").glob("*.json")):
+        body = path.read_text(encoding="utf-8")
+        if path.stem not in responses and entry_usable("bern2", body):
+            responses[path.stem] = body
+    return responses
+
+
+def gene_lexicon(responses: dict[str, str]) -> dict[str, list[str]]:
+    """``{mention: ids}`` for every gene annotation in the recorded responses."""
+    lexicon: dict[str, list[str]] = {}
+    for body in responses.values():
+        for ann in json.loads(body).get("annotations", []):
+            if ann.get("obj") == "gene" and ann.get("mention") and ann.get("id"):
+                lexicon.setdefault(ann["mention"], list(ann["id"]))
+    return lexicon
+
+
+class Bern2StandIn:
+    """Threaded HTTP stand-in for the BERN2 ``/plain`` endpoint.
+
+    Parameters
+    ----------
+    cache_dir : str or Path, optional
+        BERN2 cache (``ner_cache_dir``) to replay and learn gene mentions from.
+    lexicon : dict, optional
+        Extra ``{mention: ids}`` for synthesised annotations.
+    port : int
+        Port on 127.0.0.1; 0 picks a free one.
+    latency : float
+        Seconds to wait before every answer.
+    latency_per_kchar : float
+        Further seconds per 1000 characters of input text.
+    truncate_chars : int, optional
+        Cut response bodies longer than this (invalid JSON, as the hosted API).
+    error_rate : float
+        Fraction of requests answered ``503 Service Unavailable``.
+    seed : int
+        Seed for the error injection.
+    """
+
+    def __init__(self, cache_dir=None, lexicon: dict | None = None, port: int = 0,
+                 latency: float = 0.0, latency_per_kchar: float = 0.0,
+                 truncate_chars: int | None = None, error_rate: float = 0.0,
+                 seed: int = 0):
+        self.responses = load_responses(cache_dir) if cache_dir else {}
+        self.lexicon = {**gene_lexicon(self.responses), **(lexicon or {})}
+        # Longest mention first, so "TP53BP1" is not matched as "TP53".
+        mentions = sorted(self.lexicon, key=len, reverse=True)
+        self._pattern = re.compile(
+            r"(?<!\w)(?:" + "|".join(map(re.escape, mentions)) + r")(?!\w)"
+        ) if mentions else None
+        self.latency = latency
+        self.latency_per_kchar = latency_per_kchar
+        self.truncate_chars = truncate_chars
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self.stats = {"requests": 0, "replayed": 0, "synthesised": 0,
+                      "truncated": 0, "errors": 0, "peak_in_flight": 0}
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Endpoint to use as ``PipelineConfig.bern2_url``."""
+        return f"http://127.0.0.1:{self._server.server_address[1]}/plain"
+
+    def start(self) -> "Bern2StandIn":
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        kwargs={"poll_interval": 0.05},
+                                        name="bern2-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # --- answers ---
+
+    def synthesise(self, text: str) -> str:
+        """A BERN2-shaped response with one annotation per known gene mention."""
+        annotations = []
+        if self._pattern is not None:
+            for match in self._pattern.finditer(text):
+                annotations.append({
+                    "id": list(self.lexicon[match.group()]),
+                    "is_neural_normalized": False,
+                    "mention": match.group(),
+                    "obj": "gene",
+                    "prob": 0.99,
+                    "span": {"begin": match.start(), "end": match.end()},
+                })
+        return json.dumps({"annotations": annotations, "text": text})
+
+    def answer(self, text: str) -> tuple[int, str]:
+        """``(status, body)`` for one request, counting it in :attr:`stats`."""
+        with self._lock:
+            self.stats["requests"] += 1
+            if self._random.random() < self.error_rate:
+                self.stats["errors"] += 1
+                return 503, ""
+        body = self.responses.get(_cache_key(text))
+        counter = "replayed" if body is not None else "synthesised"
+        if body is None:
+            body = self.synthesise(text)
+        truncated = self.truncate_chars is not None and len(body) > self.truncate_chars
+        if truncated:
+            body = body[:self.truncate_chars]
+        with self._lock:
+            self.stats[counter] += 1
+            self.stats["truncated"] += truncated
+        return 200, body
+
+    def _handler(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, fmt, *args):
+                logger.debug("%s - %s", self.address_string(), fmt % args)
+
+            def do_POST(self):
+                if self.path.split("?")[0].rstrip("/").rsplit("/", 1)[-1] != "plain":
+                    self.send_error(404)
+                    return
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    text = json.loads(self.rfile.read(length))["text"]
+                except (ValueError, KeyError, TypeError):
+                    self.send_error(400, "expected a JSON body with a 'text' field")
+                    return
+
+                with standin._lock:
+                    standin._in_flight += 1
+                    standin.stats["peak_in_flight"] = max(standin.stats["peak_in_flight"],
+                                                          standin._in_flight)
+                try:
+                    delay = standin.latency + standin.latency_per_kchar * len(text) / 1000
+                    if delay:
+                        # Not time.sleep, which in-process tests patch out of
+                        # the client's retry backoff.
+                        threading.Event().wait(delay)
+                    status, body = standin.answer(text)
+                finally:
+                    with standin._lock:
+                        standin._in_flight -= 1
+
+                if status != 200:
+                    self.send_error(status)
+                    return
+                payload = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--cache-dir", default=str(PipelineConfig().ner_cache_dir),
+                        help="BERN2 cache to replay (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8888)
+    parser.add_argument("--lexicon", default=None,
+                        help='JSON file of extra gene mentions: {"TP53": ["NCBIGene:7157"]}')
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Delay every answer by this many seconds")
+    parser.add_argument("--latency-per-kchar", type=float, default=0.0,
+                        help="Further delay per 1000 characters of input text")
+    parser.add_argument("--truncate-chars", type=int, default=None,
+                        help="Cut response bodies longer than this many characters")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of requests answered 503 (default 0)")
+    parser.add_argument("--seed", type=int, default=0, help="Error-injection seed")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    lexicon = None
+    if args.lexicon:
+        lexicon = json.loads(Path(args.lexicon).read_text(encoding="utf-8"))
+    standin = Bern2StandIn(args.cache_dir, lexicon=lexicon, port=args.port,
+                           latency=args.latency, latency_per_kchar=args.latency_per_kchar,
+                           truncate_chars=args.truncate_chars, error_rate=args.error_rate,
+                           seed=args.seed)
+    logger.info("Serving BERN2 stand-in at %s: %d recorded responses, %d gene mentions "
+                "(Ctrl-C to stop)", standin.url, len(standin.responses), len(standin.lexicon))
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    standin.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        standin.stop()
+        logger.info("Stand-in stats: %s", ", ".join(f"{k} {v}" for k, v in standin.stats.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
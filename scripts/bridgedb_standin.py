@@ -0,0 +1,282 @@
+"""Offline stand-in for the BridgeDb web service, served from recorded fixtures.
+
+The pipeline's BridgeDb traffic -- ``xrefsBatch/H`` (genes), ``xrefsBatch/Ca``
+(chemicals), ``xrefsBatch/L`` (BERN2 NCBI->HGNC), the per-identifier
+``xrefs/<code>/<id>`` fallbacks and ``properties`` for VoID -- is answered
+here from a JSON fixture, so full pipeline runs need no network and give
+repeatable throughput numbers on an isolated machine. Point the pipeline at
+it with ``run_conversion.py --bridgedb-url http://127.0.0.1:PORT/Human/``.
+
+Fixtures are recorded by running the stand-in in front of the real service
+(``--record``): every answer it proxies is kept, one entry per identifier, and
+written back to the fixture on shutdown. Identifiers missing from a fixture
+are answered ``N/A`` (no cross-references), as BridgeDb answers unknown IDs.
+
+Fixture layout::
+
+    {"properties": "<raw properties text>",
+     "batch": {"<system code>": {"<identifier>": "<label>\\t<xrefs>"}},
+     "single": {"<system code>": {"<identifier>": "<raw xrefs response>"}}}
+
+Individual lookups that were never recorded are synthesised from the batch
+entry, so a fixture recorded from batch traffic alone also covers fallbacks.
+
+Usage:
+    python scripts/bridgedb_standin.py FIXTURE [--port 8183]
+                                       [--record https://webservice.bridgedb.org/Human/]
+                                       [--latency SECONDS]
+
+The stand-in can also run in-process (tests, benchmarks)::
+
+    with BridgeDbStandIn(fixture) as standin:
+        config = PipelineConfig(bridgedb_url=standin.url)
+"""
+
+import argparse
+import json
+import logging
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from aopwiki_rdf.mapping.bridgedb import GENE_SYSTEM_CODES  # noqa: E402
+
+logger = logging.getLogger("bridgedb_standin")
+
+# Data-source names BridgeDb uses in individual ``xrefs`` responses, by
+# system code: the gene names the pipeline parses plus the chemical ones
+# matched by bridgedb._CHEMICAL_DB_NAME_MAP.
+DATASOURCE_NAMES = {
+    **GENE_SYSTEM_CODES,
+    "Ca": "CAS",
+    "Ce": "ChEBI",
+    "Cs": "Chemspider",
+    "Cl": "ChEMBL compound",
+    "Dr": "DrugBank",
+    "Ch": "HMDB",
+    "Ck": "KEGG Compound",
+    "Kd": "KEGG Drug",
+    "Lm": "LIPID MAPS",
+    "Cpc": "PubChem-compound",
+    "Wd": "Wikidata",
+}
+
+
+def load_fixture(path) -> dict:
+    """Read a fixture, or start an empty one if ``path`` does not exist."""
+    path = Path(path)
+    fixture = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    fixture.setdefault("properties", "")
+    fixture.setdefault("batch", {})
+    fixture.setdefault("single", {})
+    return fixture
+
+
+def save_fixture(path, fixture: dict) -> None:
+    """Write ``fixture`` atomically, keys sorted so recordings diff cleanly."""
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(fixture, fh, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def _single_from_batch(entry: str | None) -> str:
+    """Individual ``xrefs`` response (``id\\tdatasource`` rows) from a batch entry."""
+    if not entry:
+        return ""
+    xrefs = entry.split("\t", 1)[-1]
+    rows = []
+    for xref in xrefs.split(","):
+        code, sep, value = xref.partition(":")
+        if sep and code in DATASOURCE_NAMES:
+            rows.append(f"{value}\t{DATASOURCE_NAMES[code]}")
+    return "\n".join(rows) + "\n" if rows else ""
+
+
+class BridgeDbStandIn:
+    """Threaded HTTP stand-in for one BridgeDb organism endpoint.
+
+    Parameters
+    ----------
+    fixture_path : str or Path
+        Recorded responses (see module docstring).
+    upstream : str, optional
+        Real service base URL. When set, identifiers not in the fixture are
+        fetched from it and recorded; :meth:`stop` saves the fixture.
+    port : int
+        Port on 127.0.0.1; 0 picks a free one.
+    latency : float
+        Seconds to wait before every answer, to model a remote service.
+    """
+
+    def __init__(self, fixture_path, upstream: str | None = None, port: int = 0,
+                 latency: float = 0.0):
+        self.fixture_path = Path(fixture_path)
+        self.fixture = load_fixture(self.fixture_path)
+        self.upstream = upstream.rstrip("/") if upstream else None
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as ``PipelineConfig.bridgedb_url``."""
+        return f"http://127.0.0.1:{self._server.server_address[1]}/Human/"
+
+    def start(self) -> "BridgeDbStandIn":
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        kwargs={"poll_interval": 0.05},
+                                        name="bridgedb-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self.upstream:
+            save_fixture(self.fixture_path, self.fixture)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # --- answers ---
+
+    def properties(self) -> str:
+        if self.upstream and not self.fixture["properties"]:
+            text = self._fetch("get", "/properties")
+            with self._lock:
+                self.fixture["properties"] = text
+        return self.fixture["properties"]
+
+    def batch(self, code: str, identifiers: list[str]) -> str:
+        recorded = self.fixture["batch"].setdefault(code, {})
+        missing = [i for i in identifiers if i not in recorded]
+        if self.upstream and missing:
+            text = self._fetch("post", f"/xrefsBatch/{code}", data="\n".join(missing))
+            with self._lock:
+                for line in text.split("\n"):
+                    parts = line.split("\t", 1)
+                    if len(parts) == 2:
+                        recorded[parts[0]] = parts[1]
+        unknown = f"{DATASOURCE_NAMES.get(code, code)}\tN/A"
+        rows = [f"{i}\t{recorded.get(i, unknown)}" for i in identifiers]
+        return "\n".join(rows) + "\n"
+
+    def single(self, code: str, identifier: str) -> str:
+        recorded = self.fixture["single"].setdefault(code, {})
+        if identifier in recorded:
+            return recorded[identifier]
+        if self.upstream:
+            text = self._fetch("get", f"/xrefs/{code}/{identifier}")
+            with self._lock:
+                recorded[identifier] = text
+            return text
+        return _single_from_batch(self.fixture["batch"].get(code, {}).get(identifier))
+
+    def _fetch(self, method: str, path: str, **kwargs) -> str:
+        response = getattr(requests, method)(self.upstream + path, timeout=60, **kwargs)
+        response.raise_for_status()
+        return response.text
+
+    def _handler(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, fmt, *args):
+                logger.debug("%s - %s", self.address_string(), fmt % args)
+
+            def _route(self, body: str | None):
+                parts = [unquote(p) for p in self.path.split("?")[0].split("/") if p]
+                # parts[0] is the organism ("Human"); any organism is accepted.
+                route = parts[1:]
+                if route == ["properties"]:
+                    return standin.properties()
+                if len(route) == 2 and route[0] == "xrefsBatch" and body is not None:
+                    ids = [line.strip() for line in body.split("\n") if line.strip()]
+                    return standin.batch(route[1], ids)
+                if len(route) == 3 and route[0] == "xrefs":
+                    return standin.single(route[1], route[2])
+                return None
+
+            def _answer(self, body: str | None):
+                with standin._lock:
+                    standin.requests += 1
+                if standin.latency:
+                    time.sleep(standin.latency)
+                try:
+                    text = self._route(body)
+                except requests.RequestException as exc:
+                    self.send_error(502, f"upstream failed: {exc}")
+                    return
+                if text is None:
+                    self.send_error(404)
+                    return
+                payload = text.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                self._answer(None)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                self._answer(self.rfile.read(length).decode("utf-8"))
+
+        return Handler
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("fixture", help="JSON fixture to serve (created when recording)")
+    parser.add_argument("--port", type=int, default=8183)
+    parser.add_argument("--record", metavar="URL", default=None,
+                        help="Real BridgeDb base URL to fetch and record missing answers from")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Delay every answer by this many seconds")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    standin = BridgeDbStandIn(args.fixture, upstream=args.record, port=args.port,
+                              latency=args.latency)
+    logger.info("Serving BridgeDb stand-in at %s (Ctrl-C to stop)", standin.url)
+    # Stop (and save a recording) on `kill` as well as on Ctrl-C.
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    standin.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        standin.stop()
+        logger.info("Answered %d requests", standin.requests)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
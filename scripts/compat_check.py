@@ -308,7 +308,8 @@ def regenerate(xml_file, out_dir, enable_flags):
     the gate stays offline and fast. The production path builds a
     ``PipelineConfig`` with ``xml_file`` pinned (Plan 11-01's ``--xml-file``
     knob) and the flag pair set per ``enable_flags``, then calls the pipeline
-    ``main``. ``out_dir`` is created if absent.
+    ``main``. ``out_dir`` is created if absent. The parse snapshot cache sits
+    next to ``out_dir`` so the off and on regenerations parse the XML once.
 
     Parameters
     ----------
@@ -344,6 +345,7 @@ def regenerate(xml_file, out_dir, enable_flags):
         xml_file=Path(xml_file),
         enable_bern2=True,                  # baseline + flip both bern2-on (live since v1.2)
         enable_iri_labels=enable_flags,     # the Phase 12 flip under test
+        parse_cache_dir=Path(out_dir).parent / "parse-cache",
     )
     pipeline_main(config)
     return out_dir
@@ -16,19 +16,31 @@ disk keyed by the SHA of its input, so re-running after an interruption
 skips everything already done. Safe to Ctrl-C and restart.
 
 Crucially, this script drives the *exact* production code path
-(parse_aopwiki_xml -> map_ner_genes_in_kes / map_ner_genes_in_kers), so the
-cache keys it writes match what the pipeline will look up. After both passes
+(parse_aopwiki_xml -> map_ner_genes_in_corpus_result, the same concurrent,
+rate-limited engine the pipeline uses), so the cache keys it writes match
+what the pipeline will look up. Texts shared between KEs and KERs are
+annotated once. After both passes
 it prints a cache-coverage summary (cached/total + uncached IDs) computed by
 ner_el_mapper.report_cache_coverage.
 
 Usage:
-    python scripts/warm_bern2_cache.py [--xml PATH] [--sleep SECONDS]
-                                       [--limit N]
-
-    --xml    AOP-Wiki XML file. Default: newest data/aop-wiki-xml-* file.
-    --sleep  Per-call delay, seconds (politeness to the hosted API).
-             Default 0.5.
-    --limit  Process at most N descriptions per corpus (for a smoke test).
+    python scripts/warm_bern2_cache.py [--xml PATH] [--workers N]
+                                       [--rate PER_SECOND] [--sleep SECONDS]
+                                       [--pack-chars N] [--limit N]
+
+    --xml      AOP-Wiki XML file. Default: newest data/aop-wiki-xml-* file.
+    --workers  Texts annotated concurrently. Default 4.
+    --rate     Requests per second per host (politeness to the hosted API).
+               Default 2.0 -- the pace of the former 0.5 s per-call sleep,
+               without serialising the slow calls behind each other.
+    --sleep    Extra per-call delay in each worker, seconds. Default 0.
+    --pack-chars
+               Send short texts several to a request of up to N characters,
+               each cached under its own key and tagged "_packed" (BERN2 sees
+               the neighbouring texts, so annotations can differ from a
+               single-text request). Default 0 = one text per request, the
+               entries the weekly run expects; opt in for a quick local warm.
+    --limit    Process at most N descriptions per corpus (for a smoke test).
 """
 
 import argparse
@@ -45,8 +57,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 from aopwiki_rdf.config import PipelineConfig
 from aopwiki_rdf.parser.xml_parser import parse_aopwiki_xml
 from aopwiki_rdf.mapping.ner_el_mapper import (
-    map_ner_genes_in_kes,
-    map_ner_genes_in_kers,
+    map_ner_genes_in_corpus_result,
     report_cache_coverage,
 )
 
@@ -73,8 +84,15 @@ def _limit_with_description(entity_dict: dict, limit: int | None) -> dict:
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--xml", default=None, help="AOP-Wiki XML file path")
-    parser.add_argument("--sleep", type=float, default=0.5,
-                        help="Per-call delay in seconds (default 0.5)")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Texts annotated concurrently (default 4)")
+    parser.add_argument("--rate", type=float, default=2.0,
+                        help="Requests per second per host (default 2.0)")
+    parser.add_argument("--sleep", type=float, default=0.0,
+                        help="Extra per-call delay in seconds (default 0)")
+    parser.add_argument("--pack-chars", type=int, default=0,
+                        help="Pack short texts into requests of up to N characters "
+                             "(default 0 = one text per request)")
     parser.add_argument("--limit", type=int, default=None,
                         help="Process at most N descriptions per corpus")
     args = parser.parse_args()
@@ -91,7 +109,8 @@ def main() -> int:
                   "(pass --xml or place one under data/)", xml_path)
         return 1
 
-    config = PipelineConfig(enable_bern2=True)
+    config = PipelineConfig(enable_bern2=True, ner_workers=args.workers,
+                            ner_rate_limit=args.rate, ner_pack_chars=args.pack_chars)
     log.info("Cold start: warming BERN2 cache at %s", config.ner_cache_dir)
     log.info("XML: %s", xml_path)
 
@@ -113,18 +132,21 @@ def main() -> int:
              len(kedict), ke_with_desc, len(kerdict), ker_with_desc)
 
     t0 = time.time()
-    log.info("--- Warming Key Event descriptions ---")
-    ke_results = map_ner_genes_in_kes(kedict, config, sleep_after=args.sleep)
-    log.info("--- Warming Key Event Relationship descriptions ---")
-    ker_results = map_ner_genes_in_kers(kerdict, config, sleep_after=args.sleep)
+    log.info("--- Warming Key Event and Key Event Relationship texts ---")
+    ke_results, ker_results = map_ner_genes_in_corpus_result(
+        kedict, kerdict, config, sleep_after=args.sleep)
     elapsed = time.time() - t0
 
-    total_hgnc = (sum(len(v) for v in ke_results.values())
-                  + sum(len(v) for v in ker_results.values()))
+    total_hgnc = (sum(len(r.hgnc_ids) for r in ke_results.values())
+                  + sum(len(r.hgnc_ids) for r in ker_results.values()))
     log.info("=" * 60)
     log.info("Cold start complete in %.1f min", elapsed / 60)
-    log.info("KEs with gene detections:  %d / %d", len(ke_results), ke_with_desc)
-    log.info("KERs with gene detections: %d / %d", len(ker_results), ker_with_desc)
+    log.info("KEs with gene detections:  %d / %d (%d failed)",
+             sum(1 for r in ke_results.values() if r.hgnc_ids), ke_with_desc,
+             sum(1 for r in ke_results.values() if r.failed))
+    log.info("KERs with gene detections: %d / %d (%d failed)",
+             sum(1 for r in ker_results.values() if r.hgnc_ids), ker_with_desc,
+             sum(1 for r in ker_results.values() if r.failed))
     log.info("Total HGNC IDs detected (with duplicates): %d", total_hgnc)
     log.info("Cache directory: %s", config.ner_cache_dir)
     log.info("=" * 60)
@@ -0,0 +1,207 @@
+"""Stage checkpoints so a failed run can resume where it stopped.
+
+After every completed stage the whole stage ``context`` is pickled into the
+run directory as ``NN-<stage>.pickle``, and ``checkpoint.json`` records which
+stages are done. The full context is stored rather than just the keys a stage
+set because stages also mutate earlier outputs in place (the ARR filter, the
+chemical and gene mappers all edit ``entities``); the newest snapshot therefore
+subsumes the older ones, which are deleted as soon as it is written.
+
+A resumed run reloads the newest snapshot and skips the stages it covers. The
+checkpoint is discarded -- and the run starts from the first stage -- when:
+
+- the configuration differs (ignoring knobs that cannot change the output,
+  such as log level or worker count), including the bytes of a pinned
+  ``xml_file``;
+- the extracted AOP-Wiki XML the parse stage read no longer hashes the same.
+
+No module-level side effects.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import tempfile
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "checkpoint.json"
+
+# PipelineConfig fields that do not affect what the stages produce.
+_RUN_INDEPENDENT_FIELDS = frozenset({
+    "log_level", "stage_workers", "gene_mapping_workers", "checkpoint_dir", "resume",
+    "parse_cache_dir", "incremental_dir", "automaton_cache_dir", "bridgedb_workers",
+    "bridgedb_cache_dir", "promapping_index_dir", "http_cache_dir",
+    "stream_xml_download", "ner_cache_store", "ner_workers", "ner_rate_limit",
+    "ner_dedupe", "ner_cache_retention_days",
+})
+
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+def _sha256_file(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def config_fingerprint(config) -> str:
+    """Hash of the output-relevant configuration, including a pinned XML's bytes."""
+    fields = {
+        name: value for name, value in dataclasses.asdict(config).items()
+        if name not in _RUN_INDEPENDENT_FIELDS
+    }
+    if config.xml_file is not None and Path(config.xml_file).exists():
+        fields["xml_file_sha256"] = _sha256_file(config.xml_file)
+    payload = json.dumps(fields, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _input_xml_path(context) -> str | None:
+    """The extracted XML the parse stage read, once it has run."""
+    if "filepath" in context and "aopwikixmlfilename" in context:
+        return context["filepath"] + context["aopwikixmlfilename"]
+    return None
+
+
+def _artefact_name(index: int, stage_name: str) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", stage_name.lower()).strip("-")
+    return f"{index:02d}-{slug}.pickle"
+
+
+def _atomic_write(path: Path, write_fn, mode: str) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            write_fn(f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class CheckpointStore:
+    """Per-run checkpoint directory for :func:`aopwiki_rdf.scheduler.run_stages`.
+
+    Parameters
+    ----------
+    run_dir : str or Path
+        Directory holding the manifest and stage snapshots.
+    config : PipelineConfig
+        The run's configuration; fingerprinted to detect stale checkpoints.
+    resume : bool
+        Reload the checkpoint in :meth:`restore`. Without it any existing
+        checkpoint is cleared and the run starts fresh.
+    """
+
+    def __init__(self, run_dir, config, resume: bool = False):
+        self.run_dir = Path(run_dir)
+        self.resume = resume
+        self.fingerprint = config_fingerprint(config)
+        self._manifest = None
+
+    def _manifest_path(self) -> Path:
+        return self.run_dir / MANIFEST_FILENAME
+
+    def clear(self) -> None:
+        """Delete the manifest and every stage snapshot."""
+        self._manifest_path().unlink(missing_ok=True)
+        if self.run_dir.is_dir():
+            for artefact in self.run_dir.glob("*.pickle"):
+                artefact.unlink()
+
+    def _start_fresh(self) -> None:
+        self.clear()
+        self._manifest = {"config": self.fingerprint, "xml": None, "completed": []}
+
+    def _load_manifest(self) -> dict | None:
+        path = self._manifest_path()
+        if not path.exists():
+            logger.info("No checkpoint in %s; starting from the first stage", self.run_dir)
+            return None
+        try:
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Corrupt checkpoint manifest %s (%s); starting over", path, e)
+            return None
+        if manifest.get("config") != self.fingerprint:
+            logger.info("Configuration changed since the checkpoint; starting over")
+            return None
+        xml = manifest.get("xml")
+        if xml is not None:
+            if not Path(xml["path"]).exists() or _sha256_file(xml["path"]) != xml["sha256"]:
+                logger.info("Input XML %s changed since the checkpoint; starting over", xml["path"])
+                return None
+        return manifest
+
+    def restore(self, stages, context) -> set:
+        """Load the newest snapshot into ``context``; return the stages it covers.
+
+        Only a prefix of ``stages`` is ever restored. Returns an empty set (and
+        clears the directory) when not resuming or when the checkpoint is stale.
+        """
+        manifest = self._load_manifest() if self.resume else None
+        if manifest is None:
+            self._start_fresh()
+            return set()
+
+        names = [name for name, _fn in stages]
+        completed = manifest["completed"]
+        if not completed or completed != names[:len(completed)]:
+            logger.info("Checkpoint does not match the stage list; starting over")
+            self._start_fresh()
+            return set()
+
+        artefact = self.run_dir / manifest["artefact"]
+        try:
+            with open(artefact, "rb") as f:
+                context.update(pickle.load(f))
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            logger.warning("Unreadable checkpoint %s (%s); starting over", artefact, e)
+            self._start_fresh()
+            return set()
+
+        self._manifest = manifest
+        logger.info(
+            "Resuming from checkpoint: %d/%d stages already complete (through %s)",
+            len(completed), len(names), completed[-1],
+        )
+        return set(completed)
+
+    def save(self, stage_name: str, context) -> Path:
+        """Snapshot ``context`` after ``stage_name`` and mark the stage complete."""
+        if self._manifest is None:
+            self._start_fresh()
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self._manifest
+        manifest["completed"].append(stage_name)
+
+        xml_path = _input_xml_path(context)
+        if manifest["xml"] is None and xml_path is not None and os.path.exists(xml_path):
+            manifest["xml"] = {"path": xml_path, "sha256": _sha256_file(xml_path)}
+
+        previous = manifest.get("artefact")
+        name = _artefact_name(len(manifest["completed"]), stage_name)
+        path = self.run_dir / name
+        _atomic_write(
+            path,
+            lambda f: pickle.dump(dict(context), f, protocol=pickle.HIGHEST_PROTOCOL),
+            "wb",
+        )
+        manifest["artefact"] = name
+        _atomic_write(
+            self._manifest_path(),
+            lambda f: json.dump(manifest, f, indent=2),
+            "w",
+        )
+        if previous and previous != name:
+            (self.run_dir / previous).unlink(missing_ok=True)
+        logger.info("Checkpoint written after stage %s: %s", stage_name, path)
+        return path
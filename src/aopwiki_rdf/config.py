@@ -57,6 +57,47 @@ class PipelineConfig:
     # regardless of this flag. Set False to restore the prior union-with-empty
     # behaviour on failure.
     ner_fallback_on_failure: bool = True
+    # Single-file BERN2 cache (see aopwiki_rdf.mapping.bern2_store). When
+    # True, BERN2 and NCBI->HGNC BridgeDb responses are read from and written
+    # to ner_cache_dir/bern2.sqlite -- which imports new files from the
+    # per-file bern2/ and bridgedb/ subdirectories on every open and exports
+    # the entries it gained back to them, since only those are committed --
+    # and the coverage probe is one indexed query. Same entries, same keys,
+    # same results. Default False keeps the one-JSON-file-per-text layout.
+    ner_cache_store: bool = False
+    # BERN2 request concurrency. KE/KER texts are annotated on up to
+    # ner_workers threads, each response written through to the cache as it
+    # arrives; ner_rate_limit caps requests per second per host (0 = no cap)
+    # and a host's retry backoff pauses every worker. Results are the same for
+    # any value. Defaults (1 worker, no cap) annotate one text at a time, as
+    # before.
+    ner_workers: int = 1
+    ner_rate_limit: float = 0.0
+    # Cross-entity NER planning. When True, KE and KER texts are annotated in
+    # one pass: each distinct text (by cache key) is sent to BERN2 once, and
+    # the NCBI Gene IDs of all texts go to BridgeDb together rather than one
+    # batch per text. Per-text cache entries are kept, so the cache works with
+    # either setting, and the results are the same. Default False annotates
+    # the KE and KER corpora separately, text by text, as before.
+    ner_dedupe: bool = False
+    # BERN2 request packing. When > 0, uncached texts up to this many
+    # characters are joined (with a sentinel separator) into requests of at
+    # most this size; the returned annotation offsets are mapped back to each
+    # text, which is cached under its own key with a "_packed" tag. A pack
+    # that fails is left to the usual per-text requests. BERN2 sees
+    # neighbouring texts as context, so annotations can differ slightly from
+    # per-text requests. 1500 (the truncation-fallback chunk size) stays clear of the
+    # hosted API's response truncation. Default 0 sends one text per request,
+    # as before.
+    ner_pack_chars: int = 0
+    # BERN2 cache garbage collection (see aopwiki_rdf.mapping.bern2_gc). When
+    # set, the BERN2 pass ends by evicting cache entries that no current KE/KER
+    # text references (the old hashes of edited descriptions) and that have
+    # been unreferenced for more than this many days, and logs the bytes
+    # reclaimed. Only the cache (and its gc-orphans.json record of when each
+    # entry became unreferenced) changes. Default None keeps every entry, as
+    # before.
+    ner_cache_retention_days: float | None = None
 
     # External-IRI labeling (Phase 8: infrastructure first, flag off).
     # When enable_iri_labels is True, the writer emits a single untagged
@@ -76,6 +117,93 @@ class PipelineConfig:
     # prior production output (A1).
     xml_file: Path | None = None
 
+    # Streaming XML download (see aopwiki_rdf.parser.download). When True, the
+    # export is piped through gunzip straight into the one XML file under
+    # data_dir: it is never buffered in memory and no intermediate .gz copy is
+    # written to the working directory. Bytes received, size on disk and peak
+    # RSS are logged. The XML is the same either way. Default False keeps the
+    # buffered download + separate extract.
+    stream_xml_download: bool = False
+
+    # Parse snapshot cache. When set, _stage_parse stores the parsed entities
+    # under this directory keyed by the SHA-256 of the XML bytes and reuses
+    # them on the next run against the same file (the COMPAT gate regenerates
+    # twice against one pinned snapshot). Snapshots are invalidated whenever
+    # the parser source changes. Default None parses every run, as before.
+    parse_cache_dir: Path | None = None
+
+    # Incremental gene mapping. When set, _stage_gene_mapping keeps a manifest
+    # of per-KE/KER text fingerprints and regex results here, and only rescans
+    # texts the last run did not scan (looked up by content hash, so edits to
+    # one field or renumbered entities do not force rescans). A new HGNC
+    # download or any gene_mapper change discards the manifest. Output is
+    # identical to a full scan. Default None scans every entity, as before.
+    incremental_dir: Path | None = None
+
+    # Saved gene automaton. When set, the Aho-Corasick automaton over the HGNC
+    # dictionary is written here as HGNCgenes.automaton (flat arrays, see
+    # aopwiki_rdf.mapping.automaton) and memory-mapped by later runs instead of
+    # rebuilt, for as long as HGNCgenes.txt and the ownership rules are
+    # unchanged. Output is identical. Default None builds it every run.
+    automaton_cache_dir: Path | None = None
+
+    # Gene-mapping processes. KE/KER texts are scanned on this many worker
+    # processes, started with forkserver (spawn where it is unavailable) and
+    # never forked from the threaded pipeline. Each worker re-maps the
+    # automaton from automaton_cache_dir, or rebuilds it from a pickled copy
+    # when that is unset. Results are merged back in document order, so the
+    # Genes TTL is identical for any value. Default 1 scans in-process.
+    gene_mapping_workers: int = 1
+
+    # BridgeDb request concurrency. Gene and chemical xref chunks (and their
+    # per-identifier fallbacks) are sent over one pooled HTTP session with up
+    # to this many in flight; transient failures are retried max_retries times
+    # with backoff. Results are merged in chunk order, so output does not
+    # depend on this value. Default 1 sends them one after another, as before.
+    bridgedb_workers: int = 1
+
+    # BridgeDb xref cache (see aopwiki_rdf.mapping.xref_cache). When set, gene
+    # and chemical xrefs are kept here per identifier, tagged with the
+    # service's data release (its DATASOURCEVERSION properties); while the
+    # release is unchanged only identifiers not seen before are sent, and a new
+    # release evicts the old entries. Default None fetches every xref every run.
+    bridgedb_cache_dir: Path | None = None
+
+    # Indexed promapping.txt store (see aopwiki_rdf.mapping.promapping_store).
+    # When set, each PRO release is loaded once into an SQLite index and runs
+    # look up only the cited Protein Ontology terms; the download is skipped
+    # while the remote ETag / Last-Modified are unchanged. Results match the
+    # full scan. Default None downloads and scans the file every run.
+    promapping_index_dir: Path | None = None
+
+    # Conditional download cache (see aopwiki_rdf.http_cache). When set, the
+    # AOP-Wiki XML, HGNC, promapping.txt and BridgeDb properties downloads
+    # keep their last body here with its ETag / Last-Modified and revalidate
+    # it; an unchanged file is answered 304 and read from disk. Bytes and time
+    # per URL are logged. Default None downloads every file in full, as before.
+    http_cache_dir: Path | None = None
+
+    # Stage concurrency. Stages whose declared dependencies (pipeline.
+    # STAGE_DEPENDS) have completed run together on up to this many threads:
+    # chemical, protein-ontology and HGNC network work overlap, as do the
+    # Main/Enriched/Genes writers. Output does not depend on this value.
+    # Default 1 runs the stages one by one in STAGES order, as before.
+    stage_workers: int = 1
+
+    # Stage checkpoints (see aopwiki_rdf.checkpoint). When checkpoint_dir is
+    # set, the stage context is snapshotted there after every stage; with
+    # resume also True, a rerun reloads the newest snapshot and continues from
+    # the first incomplete stage. A config or input-XML change discards the
+    # checkpoint. Checkpointed runs are sequential. Default None = off.
+    checkpoint_dir: Path | None = None
+    resume: bool = False
+
+    # VoID void:triples counts come from the writers, which count distinct
+    # triples as they emit. Set True to also re-parse each TTL with rdflib as
+    # a cross-check (slow, memory-hungry); a mismatch is logged and rdflib's
+    # count is used. Default False.
+    verify_triple_counts: bool = False
+
     def __post_init__(self):
         """Ensure path-typed fields are Path objects."""
         if isinstance(self.data_dir, str):
@@ -84,3 +212,17 @@ class PipelineConfig:
             self.ner_cache_dir = Path(self.ner_cache_dir)
         if isinstance(self.xml_file, str):
             self.xml_file = Path(self.xml_file)
+        if isinstance(self.parse_cache_dir, str):
+            self.parse_cache_dir = Path(self.parse_cache_dir)
+        if isinstance(self.incremental_dir, str):
+            self.incremental_dir = Path(self.incremental_dir)
+        if isinstance(self.automaton_cache_dir, str):
+            self.automaton_cache_dir = Path(self.automaton_cache_dir)
+        if isinstance(self.bridgedb_cache_dir, str):
+            self.bridgedb_cache_dir = Path(self.bridgedb_cache_dir)
+        if isinstance(self.promapping_index_dir, str):
+            self.promapping_index_dir = Path(self.promapping_index_dir)
+        if isinstance(self.http_cache_dir, str):
+            self.http_cache_dir = Path(self.http_cache_dir)
+        if isinstance(self.checkpoint_dir, str):
+            self.checkpoint_dir = Path(self.checkpoint_dir)
@@ -14,6 +14,7 @@ def download_hgnc_data(
     timeout: int = 30,
     max_retries: int = 3,
     min_genes: int = 19000,
+    fetcher=None,
 ) -> str:
     """Download HGNC gene data from genenames.org with fallback to cached file.
 
@@ -28,6 +29,9 @@ def download_hgnc_data(
         timeout: HTTP request timeout in seconds.
         max_retries: Maximum number of download attempts.
         min_genes: Minimum number of gene lines required (assertion guard).
+        fetcher: Optional ``aopwiki_rdf.http_cache.ConditionalFetcher``. When
+            given, each attempt is a conditional request and an unchanged
+            download is served from its cache.
 
     Returns:
         Raw TSV text content (header + gene lines).
@@ -41,10 +45,13 @@ def download_hgnc_data(
                 "Downloading HGNC data (attempt %d/%d) from %s",
                 attempt, max_retries, url,
             )
-            response = requests.get(url, timeout=timeout, verify=False)
-            response.raise_for_status()
-
-            content = response.text
+            if fetcher is not None:
+                content = fetcher.fetch(url, timeout=timeout, verify=False,
+                                        max_retries=1).text
+            else:
+                response = requests.get(url, timeout=timeout, verify=False)
+                response.raise_for_status()
+                content = response.text
             # Count data lines (total lines minus header)
             n_lines = content.strip().count("\n")  # number of newlines = data lines
             assert n_lines >= min_genes, (
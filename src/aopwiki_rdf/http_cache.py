@@ -0,0 +1,228 @@
+"""Conditional HTTP downloads (ETag / If-Modified-Since) over an on-disk cache.
+
+The weekly run fetches the same upstream files every time -- the AOP-Wiki
+XML, the HGNC custom download, promapping.txt and the BridgeDb
+``properties`` -- although most of them change far less often.
+:class:`ConditionalFetcher` keeps each URL's last body on disk together with
+the validators the server sent for it (``ETag`` / ``Last-Modified``) and
+revalidates with ``If-None-Match`` / ``If-Modified-Since``; a ``304 Not
+Modified`` answer is served from the stored body without transferring it
+again. Servers that send no validators simply get a full download each time.
+
+Bodies are streamed to disk, so large files are never held in memory, and
+replaced atomically, so an interrupted download never leaves a truncated
+body behind. Failed requests are retried with exponential backoff, and the
+bytes transferred and time taken are recorded per URL in
+:attr:`ConditionalFetcher.metrics` and logged after every fetch.
+
+Several fetchers may share one ``cache_dir`` (concurrent pipeline stages
+each build their own): ``index.json`` is re-read and merged under a lock
+before every write, so no fetcher drops another's validators.
+
+No module-level side effects.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import requests
+
+try:
+    import fcntl
+except ImportError:  # Windows: the in-process lock below still applies
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.json"
+_LOCK_FILENAME = "index.lock"
+
+# One lock per cache directory, shared by every fetcher in the process.
+_INDEX_LOCKS: dict[Path, threading.Lock] = {}
+_INDEX_LOCKS_GUARD = threading.Lock()
+
+_CHUNK_BYTES = 1 << 20
+
+
+@contextlib.contextmanager
+def _index_lock(cache_dir: Path):
+    """Hold ``cache_dir``'s index against other fetchers, threads and processes."""
+    with _INDEX_LOCKS_GUARD:
+        lock = _INDEX_LOCKS.setdefault(cache_dir.resolve(), threading.Lock())
+    with lock:
+        if fcntl is None:
+            yield
+            return
+        with open(cache_dir / _LOCK_FILENAME, "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+@dataclass
+class FetchResult:
+    """Outcome of :meth:`ConditionalFetcher.fetch`.
+
+    ``path`` is the stored body, current whether it was just downloaded
+    (``status`` 200) or revalidated (``status`` 304).
+    """
+
+    url: str
+    path: Path
+    status: int
+    encoding: str | None
+    nbytes: int
+    seconds: float
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+    @property
+    def content(self) -> bytes:
+        return self.path.read_bytes()
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+class ConditionalFetcher:
+    """Download URLs with conditional requests, keeping bodies under ``cache_dir``.
+
+    Parameters
+    ----------
+    cache_dir : str or Path
+        Directory for the stored bodies and ``index.json`` (validators per URL).
+    timeout : int
+        Default per-request timeout in seconds.
+    max_retries : int
+        Default number of attempts per fetch.
+    backoff : float
+        Base delay; attempt ``n`` (0-based) is followed by ``backoff * 2**n``
+        seconds before the next one.
+    """
+
+    def __init__(self, cache_dir, timeout: int = 30, max_retries: int = 3,
+                 backoff: float = 1.0):
+        self.cache_dir = Path(cache_dir)
+        self.timeout = timeout
+        self.max_retries = max(1, max_retries)
+        self.backoff = backoff
+        self.metrics: dict[str, dict] = {}
+        self._session = requests.Session()
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+    def _load_index(self) -> dict:
+        path = self.cache_dir / INDEX_FILENAME
+        if not path.is_file():
+            return {}
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable HTTP cache index %s: %s", path, exc)
+            return {}
+
+    def _save_entry(self, url: str, entry: dict) -> None:
+        """Record ``url``'s validators, merged into the index as it is on disk now."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with _index_lock(self.cache_dir):
+            index = self._load_index()
+            index[url] = entry
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump(index, fh, indent=1, sort_keys=True)
+                os.replace(tmp, self.cache_dir / INDEX_FILENAME)
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+                raise
+        self._index = index
+
+    def _body_path(self, url: str) -> Path:
+        return self.cache_dir / (hashlib.sha256(url.encode("utf-8")).hexdigest()[:24] + ".body")
+
+    def fetch(self, url: str, *, timeout: int | None = None, verify: bool = True,
+              max_retries: int | None = None) -> FetchResult:
+        """Fetch ``url``, revalidating the stored body when there is one.
+
+        Raises the last ``requests.RequestException`` once every attempt has
+        failed; the stored body is left untouched in that case.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        attempts = self.max_retries if max_retries is None else max(1, max_retries)
+        for attempt in range(attempts):
+            try:
+                return self._fetch_once(url, timeout, verify)
+            except requests.RequestException as exc:
+                logger.warning("Fetch of %s failed (attempt %d/%d): %s",
+                               url, attempt + 1, attempts, exc)
+                if attempt == attempts - 1:
+                    raise
+                time.sleep(self.backoff * 2 ** attempt)
+
+    def _fetch_once(self, url: str, timeout: int, verify: bool) -> FetchResult:
+        body_path = self._body_path(url)
+        with self._lock:
+            entry = dict(self._index.get(url, {}))
+        headers = {}
+        if body_path.is_file():
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        start = time.perf_counter()
+        nbytes = 0
+        with self._session.get(url, headers=headers, timeout=timeout, verify=verify,
+                               stream=True) as response:
+            if response.status_code == 304 and headers:
+                status, encoding = 304, entry.get("encoding")
+            else:
+                response.raise_for_status()
+                status, encoding = response.status_code, response.encoding
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as fh:
+                        for block in response.iter_content(_CHUNK_BYTES):
+                            fh.write(block)
+                            nbytes += len(block)
+                    os.replace(tmp, body_path)
+                except BaseException:
+                    if os.path.exists(tmp):
+                        os.unlink(tmp)
+                    raise
+                entry = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "encoding": encoding,
+                }
+        seconds = time.perf_counter() - start
+
+        with self._lock:
+            if status != 304:
+                self._save_entry(url, entry)
+            stats = self.metrics.setdefault(
+                url, {"requests": 0, "not_modified": 0, "bytes": 0, "seconds": 0.0})
+            stats["requests"] += 1
+            stats["not_modified"] += status == 304
+            stats["bytes"] += nbytes
+            stats["seconds"] += seconds
+        if status == 304:
+            logger.info("Not modified: %s (%.2fs; served from %s)", url, seconds, body_path)
+        else:
+            logger.info("Fetched %s: %d bytes in %.2fs", url, nbytes, seconds)
+        return FetchResult(url, body_path, status, encoding, nbytes, seconds)
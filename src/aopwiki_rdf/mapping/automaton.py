@@ -24,12 +24,41 @@ That difference is the point: every ``genedict2`` variant was
 delimiter+token+delimiter, so a token opening a text had no leading delimiter to
 match against and was missed entirely, no matter how unambiguous it was. It was
 pinned as a strict xfail in tests/unit/test_gene_precision.py.
+
+Saved form
+----------
+:meth:`GeneAutomaton.save` flattens the trie into a compact file of flat
+arrays -- per-node transition ranges over sorted (character, target) edge
+tables, fail links, outputs and dictionary-suffix links -- stamped with a
+caller-supplied key (the HGNC file and ownership-rule fingerprint).
+:class:`MappedGeneAutomaton` memory-maps that file and scans straight off the
+arrays, so a run with an unchanged HGNC release skips construction entirely,
+and worker processes re-map the same file (the OS shares the pages) instead of
+unpickling a copy of the trie.
 """
 
+import bisect
+import json
 import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
 
 logger = logging.getLogger(__name__)
 
+# File layout: MAGIC, a little-endian uint32 header length, the JSON header,
+# zero padding to an 8-byte boundary, then the uint32/int32 arrays named in
+# _ARRAYS, in that order, in the byte order recorded in the header.
+MAGIC = b'GENEAC\x00\x01'
+_ARRAYS = ('edge_start', 'edge_char', 'edge_target', 'fail', 'out_len',
+           'out_gene', 'out_link')
+_SIGNED = frozenset({'out_gene'})
+_HEADER_FIELDS = frozenset({'key', 'byteorder', 'size', 'nodes', 'edges',
+                            'itemsize', 'gene_keys'})
+
 # Exactly the delimiters genedict2 enumerated. Kept identical rather than
 # widened to \W so this change is a pure structural swap: broadening what counts
 # as a boundary (to catch "TP53-mediated", say) would alter recall and belongs in
@@ -138,3 +167,191 @@ class GeneAutomaton:
 
     def __len__(self) -> int:
         return self._size
+
+    def save(self, path, key: str) -> None:
+        """Write the automaton in the memory-mappable format, atomically.
+
+        Parameters
+        ----------
+        path : str or Path
+            Destination file.
+        key : str
+            Identifies what the automaton was built from; :meth:`MappedGeneAutomaton.load`
+            only accepts the file back under the same key.
+        """
+        n = len(self._goto)
+        # Breadth-first order guarantees a node's fail target is linked first.
+        order = [0]
+        head = 0
+        while head < len(order):
+            order.extend(self._goto[order[head]].values())
+            head += 1
+        out_link = [0] * n
+        for node in order[1:]:
+            target = self._fail[node]
+            out_link[node] = target if self._output[target] is not None else out_link[target]
+
+        gene_keys = []
+        gene_index = {}
+        tables = {name: array('i' if name in _SIGNED else 'I') for name in _ARRAYS}
+        for node in range(n):
+            tables['edge_start'].append(len(tables['edge_char']))
+            for char, target in sorted(self._goto[node].items()):
+                tables['edge_char'].append(ord(char))
+                tables['edge_target'].append(target)
+            tables['fail'].append(self._fail[node])
+            entry = self._output[node]
+            if entry is None:
+                tables['out_len'].append(0)
+                tables['out_gene'].append(-1)
+            else:
+                length, gene_key = entry
+                if gene_key not in gene_index:
+                    gene_index[gene_key] = len(gene_keys)
+                    gene_keys.append(gene_key)
+                tables['out_len'].append(length)
+                tables['out_gene'].append(gene_index[gene_key])
+            tables['out_link'].append(out_link[node])
+        tables['edge_start'].append(len(tables['edge_char']))
+
+        header = json.dumps({
+            'key': key, 'byteorder': sys.byteorder, 'size': self._size,
+            'nodes': n, 'edges': len(tables['edge_char']),
+            'itemsize': tables['fail'].itemsize, 'gene_keys': gene_keys,
+        }).encode('utf-8')
+        prefix = MAGIC + struct.pack('<I', len(header)) + header
+        prefix += b'\0' * (-len(prefix) % 8)
+
+        path = os.fspath(path)
+        fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(prefix)
+                for name in _ARRAYS:
+                    tables[name].tofile(f)
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        logger.info("Gene automaton saved to %s (%d states)", path, n)
+
+
+class MappedGeneAutomaton:
+    """A saved :class:`GeneAutomaton`, scanned directly from a memory map.
+
+    Obtain one with :meth:`load`. ``find`` yields exactly what the original
+    automaton's did, in the same order. Pickling it (for a worker process)
+    sends only the file path and key; the worker maps the file itself.
+    """
+
+    __slots__ = ('_path', '_key', '_map', '_size', '_gene_keys', '_root',
+                 '_edge_start', '_edge_char', '_edge_target', '_fail',
+                 '_out_len', '_out_gene', '_out_link')
+
+    @classmethod
+    def load(cls, path, key: str):
+        """Map a file written by :meth:`GeneAutomaton.save`.
+
+        Returns ``None`` when the file is missing, unreadable, written under a
+        different ``key`` or for another byte order -- the caller rebuilds.
+        """
+        path = os.fspath(path)
+        try:
+            with open(path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            if mapped[:len(MAGIC)] != MAGIC:
+                raise ValueError("not a gene automaton file")
+            (header_len,) = struct.unpack_from('<I', mapped, len(MAGIC))
+            start = len(MAGIC) + 4
+            header = json.loads(bytes(mapped[start:start + header_len]))
+            if not isinstance(header, dict) or not _HEADER_FIELDS <= header.keys():
+                raise ValueError("incomplete header")
+        except (ValueError, struct.error) as e:
+            logger.warning("Ignoring unreadable gene automaton %s (%s)", path, e)
+            mapped.close()
+            return None
+        if (header['key'] != key or header['byteorder'] != sys.byteorder
+                or header['itemsize'] != array('I').itemsize):
+            mapped.close()
+            return None
+
+        offset = start + header_len
+        offset += -offset % 8
+        lengths = {'edge_start': header['nodes'] + 1, 'edge_char': header['edges'],
+                   'edge_target': header['edges']}
+        counts = [lengths.get(name, header['nodes']) for name in _ARRAYS]
+        if offset + sum(counts) * header['itemsize'] != len(mapped):
+            logger.warning("Ignoring truncated gene automaton %s", path)
+            mapped.close()
+            return None
+
+        self = cls.__new__(cls)
+        self._path = path
+        self._key = key
+        self._map = mapped
+        self._size = header['size']
+        self._gene_keys = header['gene_keys']
+        view = memoryview(mapped)
+        for name, count in zip(_ARRAYS, counts):
+            nbytes = count * header['itemsize']
+            table = view[offset:offset + nbytes].cast('i' if name in _SIGNED else 'I')
+            setattr(self, '_' + name, table)
+            offset += nbytes
+        # The root is consulted on almost every character; a dict beats bisect.
+        lo, hi = self._edge_start[0], self._edge_start[1]
+        self._root = dict(zip(self._edge_char[lo:hi], self._edge_target[lo:hi]))
+        return self
+
+    def __reduce__(self):
+        return (_load_mapped, (self._path, self._key))
+
+    def find(self, text: str):
+        """Yield ``(start, end, gene_key)`` exactly as :meth:`GeneAutomaton.find`."""
+        root = self._root
+        edge_start = self._edge_start
+        edge_char = self._edge_char
+        edge_target = self._edge_target
+        bisect_left = bisect.bisect_left
+        fail = self._fail
+        out_len = self._out_len
+        out_gene = self._out_gene
+        out_link = self._out_link
+        gene_keys = self._gene_keys
+        node = 0
+        for index, char in enumerate(text):
+            code = ord(char)
+            while node:
+                # Each node's edges are a range of edge_char, sorted by code.
+                lo = edge_start[node]
+                hi = edge_start[node + 1]
+                i = bisect_left(edge_char, code, lo, hi)
+                if i < hi and edge_char[i] == code:
+                    node = edge_target[i]
+                    break
+                node = fail[node]
+            else:
+                node = root.get(code, 0)
+
+            # Dictionary-suffix links visit the same output states, in the same
+            # order, as walking the whole failure chain.
+            state = node if out_len[node] else out_link[node]
+            while state:
+                length = out_len[state]
+                start = index - length + 1
+                if _is_boundary(text, start - 1) and _is_boundary(text, index + 1):
+                    yield start, index + 1, gene_keys[out_gene[state]]
+                state = out_link[state]
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def _load_mapped(path, key):
+    automaton = MappedGeneAutomaton.load(path, key)
+    if automaton is None:
+        raise ValueError(f"Gene automaton {path} is missing or no longer matches its key")
+    return automaton
@@ -0,0 +1,232 @@
+"""Garbage collection for the BERN2 NER+EL response cache.
+
+Cache entries are keyed by the hash of the text they annotate, so editing a
+KE description leaves its old entry behind for good, in the per-file cache
+(``bern2/<key>.json``, ``bridgedb/<key>.txt``) and in the SQLite store alike.
+:func:`collect_cache_garbage` computes the keys the current AOP-Wiki entities
+still reference and evicts the others once they have been unreferenced for
+longer than a retention window:
+
+* ``bern2`` -- :func:`~aopwiki_rdf.mapping.ner_el_mapper._cache_key` of every
+  text the NER pass annotates (:func:`_description_text` for KEs,
+  :func:`_ker_ner_texts` for KERs);
+* ``bridgedb`` -- the NCBI Gene -> HGNC batch keys those texts' cached BERN2
+  responses lead to (:func:`_bridgedb_chunks`).
+
+The retention window keeps entries a recent run or a rolled-back export may
+still want. An entry's age is not its file mtime -- the repository ships the
+cache, and a checkout stamps every file with the checkout time -- but the time
+a collection first found it unreferenced, kept in ``gc-orphans.json`` next to
+the cache (:data:`ORPHANS_FILENAME`) and committed with it. Evicted entries
+are only ever re-fetched, never wrong.
+
+No module-level side effects. No network calls.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aopwiki_rdf.mapping.bern2_store import KIND_SUFFIXES
+from aopwiki_rdf.mapping.ner_el_mapper import (
+    _bridgedb_chunks,
+    _cache_key,
+    _description_text,
+    _ker_ner_texts,
+    _ner_store,
+    extract_ncbi_gene_ids,
+)
+
+logger = logging.getLogger(__name__)
+
+_DAY_SECONDS = 86400
+
+ORPHANS_FILENAME = "gc-orphans.json"
+
+
+@dataclass
+class CacheGcReport:
+    """What :func:`collect_cache_garbage` kept and evicted, per entry kind."""
+
+    live: dict[str, int] = field(default_factory=dict)
+    retained: dict[str, int] = field(default_factory=dict)
+    evicted: dict[str, int] = field(default_factory=dict)
+    reclaimed_bytes: int = 0
+    dry_run: bool = False
+
+
+def _read_response(cache_dir: Path, key: str, store) -> dict | None:
+    """A cached BERN2 response, or None; unlike the lookup path, never deletes."""
+    if store is not None:
+        body = store.get("bern2", key)
+    else:
+        path = cache_dir / "bern2" / f"{key}.json"
+        body = path.read_text(encoding="utf-8") if path.exists() else None
+    if body is None:
+        return None
+    try:
+        data = json.loads(body)
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _load_orphans(cache_dir: Path) -> dict[str, dict[str, float]]:
+    """``{kind: {key: epoch first seen unreferenced}}``; empty if missing or corrupt."""
+    path = cache_dir / ORPHANS_FILENAME
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable %s: %s", path, exc)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_orphans(cache_dir: Path, orphans: dict[str, dict[str, float]]) -> None:
+    """Atomically replace :data:`ORPHANS_FILENAME`."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(orphans, fh, indent=1, sort_keys=True)
+        os.replace(tmp, cache_dir / ORPHANS_FILENAME)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def live_cache_keys(kedict: dict, kerdict: dict, config, store=None) -> dict[str, set[str]]:
+    """Cache keys the NER pass over ``kedict`` / ``kerdict`` would read.
+
+    Parameters
+    ----------
+    kedict, kerdict : dict
+        Key Event and Key Event Relationship dictionaries from the parser.
+    config : PipelineConfig
+        Reads ``ner_cache_dir`` and ``ner_min_prob``.
+    store : Bern2CacheStore, optional
+        Read the BERN2 responses from the store instead of the file layout.
+
+    Returns
+    -------
+    dict
+        ``{"bern2": keys, "bridgedb": keys}``.
+    """
+    texts = []
+    for props in kedict.values():
+        description = props.get("dc:description")
+        if description:
+            text = _description_text(description)
+            if text.strip():
+                texts.append(text)
+    for props in kerdict.values():
+        texts.extend(_ker_ner_texts(props))
+
+    bern2 = {_cache_key(text) for text in texts}
+    bridgedb: set[str] = set()
+    cache_dir = Path(config.ner_cache_dir)
+    for key in bern2:
+        response = _read_response(cache_dir, key, store)
+        if response is None or "_error" in response:
+            continue
+        ncbi_ids = extract_ncbi_gene_ids(response, min_prob=config.ner_min_prob)
+        bridgedb.update(chunk_key for chunk_key, _ in _bridgedb_chunks(ncbi_ids))
+    return {"bern2": bern2, "bridgedb": bridgedb}
+
+
+def collect_cache_garbage(kedict: dict, kerdict: dict, config,
+                          retention_days: float, dry_run: bool = False,
+                          now: float | None = None) -> CacheGcReport:
+    """Evict BERN2 cache entries the current entities no longer reference.
+
+    Collects the layout the pipeline reads: the SQLite store when
+    ``config.ner_cache_store`` is set (VACUUMed afterwards), otherwise the
+    per-file cache under ``config.ner_cache_dir``. Collecting the store also
+    deletes evicted entries' per-file copies, which the repository tracks.
+
+    Parameters
+    ----------
+    kedict, kerdict : dict
+        The current Key Events and Key Event Relationships.
+    config : PipelineConfig
+        Reads ``ner_cache_dir``, ``ner_cache_store`` and ``ner_min_prob``.
+    retention_days : float
+        Entries first found unreferenced less than this many days ago are
+        kept. An entry seen unreferenced for the first time is recorded in
+        :data:`ORPHANS_FILENAME` and kept; one referenced again is dropped
+        from it.
+    dry_run : bool
+        Report what would be evicted without deleting anything or recording
+        new orphans.
+    now : float, optional
+        Reference time (epoch seconds); defaults to the current time.
+
+    Returns
+    -------
+    CacheGcReport
+    """
+    now = time.time() if now is None else now
+    cutoff = now - retention_days * _DAY_SECONDS
+    cache_dir = Path(config.ner_cache_dir)
+    report = CacheGcReport(dry_run=dry_run)
+    orphans = _load_orphans(cache_dir)
+
+    with _ner_store(config) as store:
+        live = live_cache_keys(kedict, kerdict, config, store)
+        for kind, suffix in KIND_SUFFIXES.items():
+            report.live[kind] = report.retained[kind] = report.evicted[kind] = 0
+            if store is not None:
+                entries = store.listing(kind)
+            else:
+                entries = [(path.stem, path.stat().st_size, None)
+                           for path in (cache_dir / kind).glob(f"*{suffix}")]
+            since = orphans.get(kind, {})
+            orphaned = {}
+            doomed = []
+            for key, nbytes, _written in entries:
+                if key in live[kind]:
+                    report.live[kind] += 1
+                    continue
+                orphaned[key] = since.get(key, now)
+                if orphaned[key] >= cutoff:
+                    report.retained[kind] += 1
+                else:
+                    doomed.append(key)
+                    report.evicted[kind] += 1
+                    report.reclaimed_bytes += nbytes
+                    if store is not None:
+                        # The per-file copy is the layout the repository
+                        # tracks, and a new store would import it again.
+                        path = cache_dir / kind / f"{key}{suffix}"
+                        if path.exists():
+                            report.reclaimed_bytes += path.stat().st_size
+            for key in doomed:
+                del orphaned[key]
+            orphans[kind] = orphaned
+            if dry_run or not doomed:
+                continue
+            if store is not None:
+                store.delete_keys(kind, doomed)
+            for key in doomed:
+                (cache_dir / kind / f"{key}{suffix}").unlink(missing_ok=True)
+        if store is not None and not dry_run and any(report.evicted.values()):
+            store.vacuum()
+    if not dry_run:
+        _save_orphans(cache_dir, orphans)
+
+    logger.info(
+        "BERN2 cache GC%s: %s %d bern2 + %d bridgedb entries (%.1f KiB); kept %d live, "
+        "%d unreferenced within %g days",
+        " (dry run)" if dry_run else "",
+        "would evict" if dry_run else "evicted",
+        report.evicted["bern2"], report.evicted["bridgedb"], report.reclaimed_bytes / 1024,
+        sum(report.live.values()), sum(report.retained.values()), retention_days,
+    )
+    return report
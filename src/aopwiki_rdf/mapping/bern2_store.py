@@ -0,0 +1,262 @@
+"""Single-file SQLite store for the BERN2 NER+EL response cache.
+
+The per-call cache under ``ner_cache_dir`` is one small file per input text
+(``bern2/<key>.json`` for BERN2 responses, ``bridgedb/<key>.txt`` for the
+NCBI Gene -> HGNC batches): thousands of files, and a coverage probe has to
+open and JSON-decode every one of them just to learn whether it is a usable
+hit. :class:`Bern2CacheStore` keeps the same entries, under the same
+:func:`~aopwiki_rdf.mapping.ner_el_mapper._cache_key` keys, in one SQLite file
+(``bern2.sqlite``) with a ``usable`` flag decided once when an entry is
+written -- so probing a whole corpus is a single indexed query.
+
+Each write is its own transaction, so an interrupted run never leaves a torn
+entry, and records when it happened (the file layout's mtime) for the cache
+garbage collector. Every time a store is opened over a directory cache
+(:func:`open_store`) it imports the files whose keys it has no usable entry
+for, e.g. a freshly warmed cache pulled with git;
+:meth:`Bern2CacheStore.export_directory`
+writes the directory layout back out (e.g. to diff or commit it), and
+:meth:`Bern2CacheStore.compact` drops entries no run would ever read again.
+The store file itself is local (git-ignored): the directory layout is what the
+repository tracks.
+
+No module-level side effects. No network calls.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+STORE_FILENAME = "bern2.sqlite"
+
+# Bump when the table layout changes; older stores are then rebuilt, except
+# version 1, which only lacks the ``written`` column and is migrated in place.
+STORE_VERSION = 2
+
+# Entry kinds, named after the subdirectories of the per-file layout, with
+# that layout's file suffix.
+KIND_SUFFIXES = {"bern2": ".json", "bridgedb": ".txt"}
+
+# Keys per ``IN (...)`` query, under SQLite's default host-parameter limit.
+_PROBE_CHUNK = 500
+
+
+def entry_usable(kind: str, body: str) -> bool:
+    """Whether a cached entry counts as a hit.
+
+    A BERN2 response is a hit only when it decodes and carries neither
+    ``_error`` nor ``_partial`` (the check ``query_bern2`` and ``is_cached``
+    apply); BridgeDb batch responses are only ever cached on success.
+    """
+    if kind != "bern2":
+        return True
+    try:
+        data = json.loads(body)
+    except json.JSONDecodeError:
+        return False
+    return isinstance(data, dict) and "_error" not in data and not data.get("_partial")
+
+
+class Bern2CacheStore:
+    """SQLite-backed BERN2 / BridgeDb response cache.
+
+    Parameters
+    ----------
+    cache_dir : str or Path
+        The configured ``ner_cache_dir``; the store is ``bern2.sqlite`` in it.
+
+    Safe to share between threads: one connection, serialised by a lock.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.path = self.cache_dir / STORE_FILENAME
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.opened = time.time()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == 1:
+            # Entries from before write times were kept count as written now.
+            with self._conn:
+                self._conn.execute(
+                    "ALTER TABLE entries ADD COLUMN written REAL NOT NULL DEFAULT 0")
+                self._conn.execute("UPDATE entries SET written = ?", (time.time(),))
+                self._conn.execute(f"PRAGMA user_version = {STORE_VERSION}")
+        elif version != STORE_VERSION:
+            if version:
+                logger.warning("Rebuilding BERN2 cache store %s (format %d -> %d)",
+                               self.path, version, STORE_VERSION)
+            with self._conn:
+                self._conn.execute("DROP TABLE IF EXISTS entries")
+                self._conn.execute(
+                    "CREATE TABLE entries (kind TEXT NOT NULL, key TEXT NOT NULL, "
+                    "body TEXT NOT NULL, usable INTEGER NOT NULL, "
+                    "written REAL NOT NULL, PRIMARY KEY (kind, key)) WITHOUT ROWID"
+                )
+                self._conn.execute(f"PRAGMA user_version = {STORE_VERSION}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # --- entries ---
+
+    def get(self, kind: str, key: str) -> str | None:
+        """Stored body for ``key``, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM entries WHERE kind = ? AND key = ?", (kind, key),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, kind: str, key: str, body: str) -> None:
+        """Store ``body`` under ``key``, replacing any previous entry."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (kind, key, body, entry_usable(kind, body), time.time()),
+            )
+
+    def delete(self, kind: str, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries WHERE kind = ? AND key = ?", (kind, key))
+
+    def delete_keys(self, kind: str, keys) -> int:
+        """Delete every entry of ``kind`` in ``keys``; returns how many existed."""
+        with self._lock, self._conn:
+            return self._conn.executemany(
+                "DELETE FROM entries WHERE kind = ? AND key = ?",
+                [(kind, key) for key in keys],
+            ).rowcount
+
+    def listing(self, kind: str) -> list[tuple[str, int, float]]:
+        """``(key, body_bytes, written)`` for every entry of ``kind``."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT key, LENGTH(CAST(body AS BLOB)), written FROM entries "
+                "WHERE kind = ?", (kind,),
+            ).fetchall()
+
+    def usable_keys(self, kind: str, keys) -> set[str]:
+        """The subset of ``keys`` that are cache hits, in one query per 500 keys."""
+        keys = sorted(set(keys))
+        hits: set[str] = set()
+        with self._lock:
+            for start in range(0, len(keys), _PROBE_CHUNK):
+                chunk = keys[start:start + _PROBE_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                hits.update(key for (key,) in self._conn.execute(
+                    f"SELECT key FROM entries WHERE kind = ? AND usable = 1 "
+                    f"AND key IN ({placeholders})", (kind, *chunk),
+                ))
+        return hits
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """``{kind: {"entries": n, "usable": n}}``."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, COUNT(*), SUM(usable) FROM entries GROUP BY kind"
+            ).fetchall()
+        return {kind: {"entries": n, "usable": usable or 0} for kind, n, usable in rows}
+
+    # --- maintenance ---
+
+    def import_directory(self, cache_dir=None) -> int:
+        """Load a per-file cache layout; usable entries already in the store are kept.
+
+        Only files whose key has no usable entry in the store are read, so
+        re-importing an unchanged directory is one listing and one probe per
+        kind. A usable file replaces an unusable entry (``_error`` or
+        ``_partial``) under its key, e.g. a re-warmed response pulled with
+        git. Unreadable files are skipped with a warning. Returns the number
+        of entries added or replaced.
+        """
+        root = Path(cache_dir) if cache_dir is not None else self.cache_dir
+        added = 0
+        for kind, suffix in KIND_SUFFIXES.items():
+            paths = sorted((root / kind).glob(f"*{suffix}"))
+            known = self.usable_keys(kind, [path.stem for path in paths])
+            rows = []
+            for path in paths:
+                if path.stem in known:
+                    continue
+                try:
+                    body = path.read_text(encoding="utf-8")
+                    mtime = path.stat().st_mtime
+                except (OSError, UnicodeDecodeError) as exc:
+                    logger.warning("Skipping unreadable cache file %s: %s", path, exc)
+                    continue
+                rows.append((kind, path.stem, body, entry_usable(kind, body), mtime))
+            with self._lock, self._conn:
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    "INSERT INTO entries VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (kind, key) DO UPDATE SET body = excluded.body, "
+                    "usable = excluded.usable, written = excluded.written "
+                    "WHERE entries.usable = 0 AND excluded.usable = 1", rows)
+                added += self._conn.total_changes - before
+        logger.info("Imported %d BERN2 cache entries from %s into %s", added, root, self.path)
+        return added
+
+    def export_directory(self, dest, since: float = 0.0) -> int:
+        """Write every entry out in the per-file layout under ``dest``.
+
+        Only entries written at or after ``since`` (epoch seconds) are
+        written. Each file's mtime is set to the entry's write time.
+        """
+        dest = Path(dest)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, key, body, written FROM entries WHERE written >= ? "
+                "ORDER BY kind, key", (since,),
+            ).fetchall()
+        for kind, key, body, written in rows:
+            path = dest / kind / f"{key}{KIND_SUFFIXES[kind]}"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(body, encoding="utf-8")
+            os.utime(path, (written, written))
+        logger.info("Exported %d BERN2 cache entries to %s", len(rows), dest)
+        return len(rows)
+
+    def compact(self) -> int:
+        """Drop entries that are never served (errors, partials) and reclaim space.
+
+        Such entries are always re-queried, so nothing read from the store
+        changes. Returns the number of entries removed.
+        """
+        with self._lock, self._conn:
+            removed = self._conn.execute("DELETE FROM entries WHERE usable = 0").rowcount
+        self.vacuum()
+        logger.info("Compacted %s: removed %d unusable entries", self.path, removed)
+        return removed
+
+    def vacuum(self) -> None:
+        """Rewrite the file so space freed by deletions is returned to the OS."""
+        with self._lock:
+            self._conn.execute("VACUUM")
+
+
+def open_store(cache_dir) -> Bern2CacheStore:
+    """Open the store in ``cache_dir``, importing per-file entries it cannot serve.
+
+    Files are matched by key, not by mtime, so entries that arrive in the
+    per-file layout later -- a warmed cache pulled with git, or copied with
+    its timestamps kept -- are seen by an existing store.
+    """
+    store = Bern2CacheStore(cache_dir)
+    if any((Path(cache_dir) / kind).is_dir() for kind in KIND_SUFFIXES):
+        store.import_directory()
+    return store
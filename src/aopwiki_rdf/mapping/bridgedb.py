@@ -8,12 +8,23 @@ Both gene and chemical mappings share the same pattern: chunk identifiers,
 POST to BridgeDb xrefsBatch endpoint, parse response, fallback to individual
 calls on failure. The generic ``batch_xrefs`` function captures that pattern;
 ``batch_xrefs_gene`` and ``batch_xrefs_chemical`` provide domain wrappers.
+
+All requests go through a :class:`BridgeDbClient`: one pooled
+``requests.Session`` (keep-alive instead of a new TCP/TLS handshake per chunk),
+retries with exponential backoff on transient failures, and a bounded number
+of chunks in flight at once. Results are merged in chunk order, so the output
+does not depend on the worker count.
 """
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from aopwiki_rdf.mapping.xref_cache import XrefCache
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +104,168 @@ _CHEMICAL_DB_NS: dict[str, str] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Pooled HTTP client
+# ---------------------------------------------------------------------------
+
+# Statuses worth retrying: rate limiting and server-side failures. Anything
+# else (404, 400) will not change on a second attempt.
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class BridgeDbClient:
+    """Pooled, retrying HTTP client for the BridgeDb web service.
+
+    Parameters
+    ----------
+    max_workers:
+        Requests in flight at once for :meth:`map`. ``1`` runs them one after
+        another.
+    max_retries:
+        Attempts per request. Connection errors, timeouts and
+        :data:`_RETRY_STATUS` responses are retried after ``backoff * 2**n``
+        seconds; the last failure is raised.
+    backoff:
+        Base delay in seconds between attempts.
+    cache:
+        Optional :class:`~aopwiki_rdf.mapping.xref_cache.XrefCache` consulted
+        by :func:`batch_xrefs`; saved on :meth:`close`.
+
+    Use as a context manager (or call :meth:`close`) to release the pooled
+    connections.
+    """
+
+    def __init__(self, max_workers: int = 1, max_retries: int = 3,
+                 backoff: float = 1.0, cache: XrefCache | None = None):
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max(1, max_retries)
+        self.backoff = backoff
+        self.cache = cache
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1,
+                              pool_maxsize=max(10, self.max_workers))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        if self.cache is not None:
+            self.cache.save()
+        self.session.close()
+
+    def get(self, url: str, timeout: int,
+            max_retries: int | None = None) -> requests.Response:
+        """GET ``url`` with retries; raises the last ``RequestException``.
+
+        ``max_retries`` overrides the client's attempts for this request.
+        """
+        return self._request("get", url, max_retries, timeout=timeout)
+
+    def post(self, url: str, data: str, timeout: int) -> requests.Response:
+        """POST plain-text ``data`` to ``url`` with retries."""
+        return self._request("post", url, None, data=data, timeout=timeout,
+                             headers={"Content-Type": "text/plain"})
+
+    def _request(self, method: str, url: str, max_retries: int | None,
+                 **kwargs) -> requests.Response:
+        attempts = self.max_retries if max_retries is None else max(1, max_retries)
+        for attempt in range(attempts):
+            try:
+                response = getattr(self.session, method)(url, **kwargs)
+                response.raise_for_status()
+                return response
+            except requests.RequestException as exc:
+                status = getattr(exc.response, "status_code", None)
+                transient = status is None or status in _RETRY_STATUS
+                if not transient or attempt == attempts - 1:
+                    raise
+                delay = self.backoff * 2 ** attempt
+                logger.debug("BridgeDb request to %s failed (%s); retrying in %.1fs",
+                             url, exc, delay)
+                time.sleep(delay)
+
+    def map(self, fn: Callable, items: list) -> list:
+        """Return ``[fn(item) for item in items]``, up to ``max_workers`` at once.
+
+        Results are in ``items`` order whatever order the calls finish in.
+        """
+        if self.max_workers == 1 or len(items) < 2:
+            return [fn(item) for item in items]
+        workers = min(self.max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix="bridgedb") as pool:
+            return list(pool.map(fn, items))
+
+
+def fetch_properties(bridgedb_url: str, timeout: int = 30,
+                     client: BridgeDbClient | None = None,
+                     fetcher=None) -> dict[str, list[str]]:
+    """Fetch the service's ``properties`` as ``{key: [values]}``.
+
+    With a :class:`~aopwiki_rdf.http_cache.ConditionalFetcher` the request is
+    conditional and an unchanged answer is read from its cache. Returns ``{}``
+    (with a warning) when the request fails.
+    """
+    url = bridgedb_url.rstrip("/") + "/properties"
+    try:
+        if fetcher is not None:
+            lines = fetcher.fetch(url, timeout=timeout).text.split("\n")
+        elif client is None:
+            with BridgeDbClient() as own_client:
+                lines = own_client.get(url, timeout=timeout).text.split("\n")
+        else:
+            lines = client.get(url, timeout=timeout).text.split("\n")
+    except requests.RequestException as e:
+        logger.warning("BridgeDb properties request failed: %s", e)
+        return {}
+
+    info: dict[str, list[str]] = {}
+    for item in lines:
+        parts = item.split("\t")
+        # Only ``key\tvalue`` rows are meaningful. Blank lines, HTML error
+        # pages, or any unexpected response shape (which split to a single
+        # field) are skipped so they never pollute ``info`` with an
+        # empty-string key or a key holding an empty value list.
+        if len(parts) != 2:
+            continue
+        info.setdefault(parts[0], []).append(parts[1])
+    return info
+
+
+def data_release(properties: dict[str, list[str]]) -> str | None:
+    """Identify the service's data release from its ``DATASOURCEVERSION`` values.
+
+    Returns None when the properties carry no version, i.e. the release
+    cannot be told apart from any other.
+    """
+    versions = properties.get("DATASOURCEVERSION")
+    if not versions:
+        return None
+    return "|".join(versions)
+
+
+def open_client(bridgedb_url: str, *, max_workers: int = 1, max_retries: int = 3,
+                timeout: int = 30, cache_dir=None) -> BridgeDbClient:
+    """Open a pooled client, with a release-tagged xref cache under ``cache_dir``.
+
+    The cache is only attached when the service reports its data release;
+    without one, cached answers could not be told apart from stale ones.
+    """
+    client = BridgeDbClient(max_workers=max_workers, max_retries=max_retries)
+    if cache_dir is not None:
+        release = data_release(fetch_properties(bridgedb_url, timeout, client))
+        if release is None:
+            logger.warning("BridgeDb data release unknown; xref cache not used this run")
+        else:
+            client.cache = XrefCache(cache_dir, release)
+    return client
+
+
 # ---------------------------------------------------------------------------
 # Generic batch helper
 # ---------------------------------------------------------------------------
@@ -107,13 +280,16 @@ def batch_xrefs(
     fallback_fn: Callable | None = None,
     chunk_size: int = 100,
     timeout: int = 30,
+    client: BridgeDbClient | None = None,
 ) -> dict:
     """Generic batch xref lookup via BridgeDb.
 
     Chunks *identifiers* into groups of *chunk_size*, POSTs each chunk to
     ``{bridgedb_url}/xrefsBatch/{system_code}``, and delegates response
     parsing to *parse_fn*.  On failure, falls back to *fallback_fn* (if
-    provided) for the failed chunk.
+    provided) for the failed chunk.  Chunks (and fallback calls) run on
+    *client*, concurrently if it has more than one worker; results are merged
+    in chunk order either way.
 
     Parameters
     ----------
@@ -131,25 +307,48 @@ def batch_xrefs(
         If set, this prefix is stripped from each identifier before sending
         to the API and re-added to result keys (e.g. ``"hgnc:"``).
     fallback_fn:
-        ``(identifier, bridgedb_url, timeout) -> dict`` called per-identifier
-        when the batch request fails.
+        ``(identifier, bridgedb_url, timeout, client) -> dict`` called
+        per-identifier when the batch request fails. The batch has already
+        used the client's retries, so fallbacks make a single attempt each,
+        as the sequential baseline did.
     chunk_size:
         Number of identifiers per batch POST.
     timeout:
         HTTP request timeout in seconds.
+    client:
+        Client to send the requests with. Default: a sequential client
+        opened and closed for this call. When the client has an
+        :class:`~aopwiki_rdf.mapping.xref_cache.XrefCache`, identifiers it
+        already holds are answered from disk and only the rest are sent.
 
     Returns
     -------
     dict
         Merged results from all chunks.
     """
-    results: dict = {}
-    total_chunks = (len(identifiers) + chunk_size - 1) // chunk_size
+    if client is None:
+        with BridgeDbClient() as own_client:
+            return batch_xrefs(
+                identifiers, bridgedb_url, system_code, parse_fn,
+                id_prefix=id_prefix, fallback_fn=fallback_fn,
+                chunk_size=chunk_size, timeout=timeout, client=own_client,
+            )
+
+    cache = client.cache
+    cached = {}
+    pending = identifiers
+    if cache is not None:
+        for ident in identifiers:
+            hit = cache.get(system_code, ident)
+            if hit is not None:
+                cached[ident] = hit
+        pending = [ident for ident in identifiers if ident not in cached]
+
+    total_chunks = (len(pending) + chunk_size - 1) // chunk_size
     batch_url = bridgedb_url.rstrip("/") + f"/xrefsBatch/{system_code}"
-    headers = {"Content-Type": "text/plain"}
 
-    for chunk_idx in range(0, len(identifiers), chunk_size):
-        chunk = identifiers[chunk_idx : chunk_idx + chunk_size]
+    def fetch_chunk(chunk_idx: int) -> tuple[list, dict, set]:
+        chunk = pending[chunk_idx : chunk_idx + chunk_size]
         chunk_num = chunk_idx // chunk_size + 1
 
         # Strip prefix for the API payload.
@@ -165,31 +364,57 @@ def batch_xrefs(
                 "BridgeDb batch %d/%d: %d identifiers",
                 chunk_num, total_chunks, len(chunk),
             )
-            response = requests.post(
-                batch_url, data=batch_data, headers=headers, timeout=timeout,
-            )
-            response.raise_for_status()
-
-            chunk_results = parse_fn(response.text)
-            results.update(chunk_results)
+            response = client.post(batch_url, data=batch_data, timeout=timeout)
+            return chunk, parse_fn(response.text), set()
 
         except requests.RequestException as exc:
             logger.warning(
                 "BridgeDb batch %d failed, falling back to individual calls: %s",
                 chunk_num, exc,
             )
-            if fallback_fn is not None:
-                for ident in chunk:
-                    try:
-                        individual = fallback_fn(ident, bridgedb_url, timeout)
-                        results[ident] = individual
-                    except Exception:
-                        logger.warning("Individual fallback also failed for %s", ident)
-                        results[ident] = {}
-            else:
-                for ident in chunk:
-                    results[ident] = {}
-
+            chunk_results = {}
+            failed = set()
+            for ident in chunk:
+                if fallback_fn is None:
+                    chunk_results[ident] = {}
+                    failed.add(ident)
+                    continue
+                try:
+                    chunk_results[ident] = fallback_fn(ident, bridgedb_url, timeout, client)
+                except Exception:
+                    logger.warning("Individual fallback also failed for %s", ident)
+                    chunk_results[ident] = {}
+                    failed.add(ident)
+            return chunk, chunk_results, failed
+
+    fetched = client.map(fetch_chunk, range(0, len(pending), chunk_size))
+    results: dict = {}
+    if cache is None:
+        for _chunk, chunk_results, _failed in fetched:
+            results.update(chunk_results)
+        return results
+
+    # Record what the service answered for each requested identifier (the
+    # answer may be filed under a differently-cased key), then merge cached and
+    # fresh answers in request order. Failed lookups are not cached.
+    answers = dict(cached)
+    unmatched: dict = {}
+    for chunk, chunk_results, failed in fetched:
+        lowered = {key.lower(): key for key in chunk_results}
+        for ident in chunk:
+            key = ident if ident in chunk_results else lowered.get(ident.lower())
+            if key is None:
+                continue
+            answers[ident] = (key, chunk_results[key])
+            if ident not in failed:
+                cache.put(system_code, ident, key, chunk_results[key])
+        unmatched.update(chunk_results)
+    for ident in identifiers:
+        if ident in answers:
+            key, value = answers[ident]
+            results[key] = value
+    for key, value in unmatched.items():
+        results.setdefault(key, value)
     return results
 
 
@@ -238,7 +463,7 @@ def _parse_gene_batch_response(response_text: str) -> dict:
 
 
 def _gene_individual_fallback(
-    gene_id: str, bridgedb_url: str, timeout: int
+    gene_id: str, bridgedb_url: str, timeout: int, client: BridgeDbClient
 ) -> dict:
     """Fall back to individual GET for a single gene.
 
@@ -246,8 +471,7 @@ def _gene_individual_fallback(
     """
     symbol = gene_id[5:] if gene_id.startswith("hgnc:") else gene_id
     url = bridgedb_url.rstrip("/") + f"/xrefs/H/{symbol}"
-    response = requests.get(url, timeout=timeout)
-    response.raise_for_status()
+    response = client.get(url, timeout=timeout, max_retries=1)
 
     dictionaryforgene: dict[str, list[str]] = {}
     for item in response.text.split("\n"):
@@ -296,6 +520,7 @@ def batch_xrefs_gene(
     timeout: int = 30,
     chunk_size: int = 100,
     symbol_lookup: dict | None = None,
+    client: BridgeDbClient | None = None,
 ) -> dict:
     """Map HGNC IDs to Entrez/Ensembl/UniProt via BridgeDb batch API.
 
@@ -316,6 +541,8 @@ def batch_xrefs_gene(
         keyed by gene SYMBOL, not by numeric HGNC ID, so when the caller tracks
         genes numerically this translates on the way out and back. Results are
         always keyed by whatever the caller passed in.
+    client:
+        Pooled client to send the requests with (see :func:`batch_xrefs`).
 
     Returns
     -------
@@ -336,6 +563,7 @@ def batch_xrefs_gene(
             fallback_fn=_gene_individual_fallback,
             chunk_size=chunk_size,
             timeout=timeout,
+            client=client,
         )
 
     # Numeric -> symbol for the request, remembering the way back. Building the
@@ -360,6 +588,7 @@ def batch_xrefs_gene(
         fallback_fn=_gene_individual_fallback,
         chunk_size=chunk_size,
         timeout=timeout,
+        client=client,
     )
     return _rekey_to_original(raw, request_to_original)
 
@@ -421,15 +650,14 @@ def parse_batch_chemical_response(response_text: str) -> dict:
 
 
 def _chemical_individual_fallback(
-    cas_number: str, bridgedb_url: str, timeout: int
+    cas_number: str, bridgedb_url: str, timeout: int, client: BridgeDbClient
 ) -> dict:
     """Fall back to individual GET for a single CAS number.
 
     Matches the monolith fallback (lines 702-772).
     """
     url = bridgedb_url.rstrip("/") + f"/xrefs/Ca/{cas_number}"
-    response = requests.get(url, timeout=timeout)
-    response.raise_for_status()
+    response = client.get(url, timeout=timeout, max_retries=1)
 
     chemical_dict: dict[str, list[str]] = {}
     for line in response.text.split("\n"):
@@ -462,6 +690,7 @@ def batch_xrefs_chemical(
     bridgedb_url: str,
     timeout: int = 30,
     batch_size: int = 100,
+    client: BridgeDbClient | None = None,
 ) -> dict:
     """Map CAS numbers to chemical identifiers via BridgeDb batch API.
 
@@ -475,6 +704,8 @@ def batch_xrefs_chemical(
         HTTP request timeout in seconds.
     batch_size:
         Number of chemicals per batch request.
+    client:
+        Pooled client to send the requests with (see :func:`batch_xrefs`).
 
     Returns
     -------
@@ -493,4 +724,5 @@ def batch_xrefs_chemical(
         fallback_fn=_chemical_individual_fallback,
         chunk_size=batch_size,
         timeout=timeout,
+        client=client,
     )
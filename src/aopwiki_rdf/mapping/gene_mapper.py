@@ -8,13 +8,18 @@ This module operates on plain dicts and lists -- no rdflib dependency.
 """
 
 import logging
+import multiprocessing
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 import requests
 
-from aopwiki_rdf.mapping.automaton import GeneAutomaton
+from aopwiki_rdf.mapping.automaton import GeneAutomaton, MappedGeneAutomaton
 from aopwiki_rdf.mapping.bridgedb import batch_xrefs_gene
+from aopwiki_rdf.mapping.incremental import text_fingerprint, text_key
+from aopwiki_rdf.mapping.ordered_set import OrderedSet
+from aopwiki_rdf.parser.xml_parser import XmlSideTables
 
 logger = logging.getLogger(__name__)
 
@@ -202,6 +207,57 @@ def build_token_index(genedict1: dict, symbol_lookup: dict) -> dict:
     return index
 
 
+def build_gene_automaton(genedict1: dict, symbol_lookup: dict | None = None,
+                         token_owners: dict | None = None,
+                         cache_path=None, cache_key: str | None = None):
+    """Return the gene automaton for a dictionary, reusing a saved one if valid.
+
+    Parameters
+    ----------
+    genedict1 : dict
+        Screening dictionary (numeric_hgnc_id -> [symbol, name, aliases...]).
+    symbol_lookup : dict, optional
+        numeric_hgnc_id -> approved symbol, for contested-token resolution.
+    token_owners : dict, optional
+        Contested-token resolution map from :func:`build_token_owners`;
+        overrides the index's own resolution.
+    cache_path : str or Path, optional
+        Saved automaton file (see :meth:`GeneAutomaton.save`). Loaded instead
+        of building when its key matches; (re)written after a build otherwise.
+    cache_key : str, optional
+        Fingerprint of everything the automaton is built from -- normally
+        :func:`aopwiki_rdf.mapping.incremental.dictionary_fingerprint` of the
+        HGNC file, which also covers the ownership rules in this module.
+        Required with ``cache_path``.
+
+    Returns
+    -------
+    GeneAutomaton or MappedGeneAutomaton
+        Interchangeable for scanning.
+    """
+    if cache_path is not None:
+        mapped = MappedGeneAutomaton.load(cache_path, cache_key)
+        if mapped is not None:
+            logger.info(f"Gene automaton loaded from {cache_path} ({len(mapped)} tokens)")
+            return mapped
+
+    index = build_token_index(genedict1, symbol_lookup or {})
+    if token_owners:
+        for token, owner in token_owners.items():
+            if owner is None:
+                index.pop(token, None)
+            else:
+                index[token] = owner
+    automaton = GeneAutomaton(index)
+
+    if cache_path is not None:
+        try:
+            automaton.save(cache_path, cache_key)
+        except OSError as e:
+            logger.warning(f"Could not save gene automaton to {cache_path}: {e}")
+    return automaton
+
+
 # ---------------------------------------------------------------------------
 # Section B: Gene mapping in entity text (three-stage algorithm)
 # ---------------------------------------------------------------------------
@@ -508,16 +564,9 @@ def _map_genes_in_text(text: str, genedict1: dict, hgnc_list: list,
     if automaton is None:
         # Convenience path for callers holding only the raw dicts (tests,
         # ad-hoc use). Production builds the automaton once per run.
-        index = build_token_index(genedict1, symbol_lookup or {})
-        if token_owners:
-            for token, owner in token_owners.items():
-                if owner is None:
-                    index.pop(token, None)
-                else:
-                    index[token] = owner
-        automaton = GeneAutomaton(index)
-
-    found_genes = []
+        automaton = build_gene_automaton(genedict1, symbol_lookup, token_owners)
+
+    found_genes = OrderedSet()
     start_time = time.time()
 
     for start, end, gene_key in automaton.find(text):
@@ -566,13 +615,99 @@ def _map_genes_in_text(text: str, genedict1: dict, hgnc_list: list,
             f"text_len={len(text)}"
         )
 
-    return found_genes
+    return list(found_genes)
+
+
+# KER text fields scanned for genes, in scan order. The order fixes both the
+# order genes are appended to hgnclist and the layout of manifest entries.
+_KER_GENE_TEXT_FIELDS = ('dc:description', 'nci:C80263', 'edam:data_2042')
+
+
+def _merge_found(genes_per_text: list[list[str]], hgnclist: list) -> list[list[str]]:
+    """Append per-text results to ``hgnclist`` exactly as scanning them would.
+
+    :func:`_map_genes_in_text` appends each newly seen ID in match order, so
+    results produced elsewhere (a manifest, a worker process) and merged here in
+    document order leave ``hgnclist`` identical to a sequential scan.
+    """
+    for found in genes_per_text:
+        for hgnc_id in found:
+            if hgnc_id not in hgnclist:
+                hgnclist.append(hgnc_id)
+    return genes_per_text
+
+
+def _replay_manifest_entry(entry: dict | None, texts: list,
+                           hgnclist: list) -> list[list[str]] | None:
+    """Return an entity's recorded per-text genes if its texts are unchanged.
+
+    On a match the genes are merged into ``hgnclist`` (see :func:`_merge_found`),
+    so replayed and rescanned entities interleave in the same order a full run
+    gives.
+    """
+    if entry is None or entry.get('text') != text_fingerprint(texts):
+        return None
+    return _merge_found(entry['genes'], hgnclist)
+
+
+# Per-process scanning state for the worker pool, set once by the initializer.
+# The automaton reaches the workers pickled; a MappedGeneAutomaton pickles as
+# its file path, so each worker just re-maps the saved file.
+_WORKER_STATE: dict = {}
+
+
+def _pool_context():
+    """Start method for the scan pool: never fork.
+
+    The pool is started from a stage thread while other stages (downloads,
+    BridgeDb I/O, logging) may hold locks; a forked child inherits those
+    locks held and can deadlock on them. forkserver children fork from a
+    clean single-threaded server; spawn is the fallback where it is missing.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _init_scan_worker(automaton, symbol_lookup) -> None:
+    _WORKER_STATE['automaton'] = automaton
+    _WORKER_STATE['symbol_lookup'] = symbol_lookup
+
+
+def _scan_job(text: str) -> list[str]:
+    return _map_genes_in_text(text, {}, [], None, None,
+                              _WORKER_STATE['symbol_lookup'], _WORKER_STATE['automaton'])
+
+
+def _scan_in_pool(texts: list, automaton, symbol_lookup: dict | None,
+                  workers: int) -> list[list[str]]:
+    """Scan ``texts`` on ``workers`` processes; returns the genes of each, in order."""
+    start = time.time()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context(),
+                             initializer=_init_scan_worker,
+                             initargs=(automaton, symbol_lookup)) as pool:
+        chunksize = max(1, len(texts) // (workers * 4))
+        results = list(pool.map(_scan_job, texts, chunksize=chunksize))
+    logger.info(
+        f"Gene mapping: scanned {len(texts)} KE/KER texts on {workers} "
+        f"worker processes in {time.time() - start:.1f}s"
+    )
+    return results
+
+
+def _manifest_entry(texts: list, genes_per_text: list[list[str]]) -> dict:
+    """An entity's manifest record: whole-entity and per-text keys, and results."""
+    return {'text': text_fingerprint(texts),
+            'texts': [None if text is None else text_key(text) for text in texts],
+            'genes': genes_per_text}
 
 
 def map_genes_in_entities(kedict: dict, kerdict: dict, genedict1: dict,
                           genedict2: dict, xml_root, aopxml_ns: str,
                           token_owners: dict | None = None,
-                          symbol_lookup: dict | None = None
+                          symbol_lookup: dict | None = None,
+                          manifest: dict | None = None,
+                          automaton=None,
+                          workers: int = 1
                           ) -> tuple[dict, dict, list]:
     """Scan KE/KER text fields for gene mentions using three-stage algorithm.
 
@@ -586,49 +721,122 @@ def map_genes_in_entities(kedict: dict, kerdict: dict, genedict1: dict,
         Screening gene dictionary.
     genedict2 : dict
         Precision gene dictionary.
-    xml_root : Element
-        XML root element of the AOP-Wiki XML.
+    xml_root : Element or XmlSideTables
+        XML root element of the AOP-Wiki XML, or the side tables returned by
+        :func:`~aopwiki_rdf.parser.xml_parser.stream_aopwiki_xml`. Only the
+        document order of Key Events and KERs is read from it.
     aopxml_ns : str
         AOP-Wiki XML namespace string (e.g., '{http://...}').
     token_owners : dict, optional
         Contested-token resolution map from :func:`build_token_owners`.
     symbol_lookup : dict, optional
         numeric_hgnc_id -> approved symbol.
+    manifest : dict, optional
+        Incremental mode (see :mod:`aopwiki_rdf.mapping.incremental`). On
+        entry, the previous run's per-entity results; a KE/KER whose scanned
+        texts are unchanged replays them instead of being rescanned, and any
+        other text the previous run scanned -- in whichever entity -- is
+        looked up by content hash rather than rescanned. On return it holds
+        this run's results for every scanned entity.
+    automaton : GeneAutomaton or MappedGeneAutomaton, optional
+        Prebuilt automaton, e.g. from :func:`build_gene_automaton` with a
+        cache file. Built from the dictionaries when omitted.
+    workers : int
+        Scan on this many processes. Results are merged back in document
+        order, so the output -- ``edam:data_1025`` lists, ``hgnclist`` order,
+        the manifest -- is identical to the sequential default of 1.
 
     Returns
     -------
     tuple[dict, dict, list]
         (updated kedict, updated kerdict, hgnclist)
     """
-    hgnclist = []
+    hgnclist = OrderedSet()
+    previous = dict(manifest) if manifest is not None else {}
+    if manifest is not None:
+        manifest.clear()
+    reused = 0
+
+    # Content-addressed per-text results: everything the previous run scanned,
+    # plus every text scanned so far in this one (repeated texts scan once). A
+    # hit skips the automaton scan and the false-positive filters entirely.
+    text_cache = {}
+    for entry in previous.values():
+        for key, found in zip(entry.get('texts', ()), entry['genes']):
+            if key is not None:
+                text_cache[key] = found
+    text_hits = text_scans = 0
+    pooled = {}
+
+    def scan(text):
+        nonlocal text_hits, text_scans
+        if text is None:
+            return []
+        key = text_key(text)
+        found = text_cache.get(key)
+        if found is not None:
+            text_hits += 1
+            return _merge_found([found], hgnclist)[0]
+        text_scans += 1
+        if key in pooled:
+            found = _merge_found([pooled[key]], hgnclist)[0]
+        else:
+            found = _map_genes_in_text(text, genedict1, hgnclist, genedict2,
+                                       token_owners, symbol_lookup, automaton)
+        text_cache[key] = found
+        return found
 
     # One automaton for the whole corpus. Building it per text would rebuild the
     # entire dictionary each time and be far slower than the loop this replaces.
-    index = build_token_index(genedict1, symbol_lookup or {})
-    if token_owners:
-        for token, owner in token_owners.items():
-            if owner is None:
-                index.pop(token, None)
-            else:
-                index[token] = owner
-    automaton = GeneAutomaton(index)
+    if automaton is None:
+        automaton = build_gene_automaton(genedict1, symbol_lookup, token_owners)
+
+    if not isinstance(xml_root, XmlSideTables):
+        xml_root = XmlSideTables.from_root(xml_root, aopxml_ns)
+
+    # Parallel mode scans every text neither the manifest nor the text cache
+    # covers up front; the loops below then merge the results in document order.
+    if workers > 1:
+        jobs = [('KE/' + ke_id, [kedict[ke_id]['dc:description']])
+                for ke_id in xml_root.ke_ids if 'dc:description' in kedict[ke_id]]
+        jobs += [('KER/' + ker_id, [kerdict[ker_id].get(name) for name in _KER_GENE_TEXT_FIELDS])
+                 for ker_id in xml_root.ker_ids
+                 if any(name in kerdict[ker_id] for name in _KER_GENE_TEXT_FIELDS)]
+        pending = {}
+        for key, texts in jobs:
+            if previous.get(key, {}).get('text') == text_fingerprint(texts):
+                continue
+            for text in texts:
+                if text is not None and text_key(text) not in text_cache:
+                    pending.setdefault(text_key(text), text)
+        if pending:
+            pooled = dict(zip(pending, _scan_in_pool(
+                list(pending.values()), automaton, symbol_lookup, workers)))
 
     # --- Key Events ---
     logger.info("Starting gene mapping on Key Events (this may take a minute)...")
     ke_start_time = time.time()
-    ke_list = xml_root.findall(aopxml_ns + 'key-event')
+    ke_list = xml_root.ke_ids
     total_kes = len(ke_list)
     logger.info(f"Processing {total_kes} Key Events for gene mapping...")
 
-    for ke_idx, ke in enumerate(ke_list):
-        if ke.find(aopxml_ns + 'description').text is not None:
-            description_text = kedict[ke.get('id')]['dc:description']
-            found_genes = _map_genes_in_text(
-                description_text, genedict1, hgnclist, genedict2,
-                token_owners, symbol_lookup, automaton,
-            )
+    for ke_idx, ke_id in enumerate(ke_list):
+        # The parser sets dc:description exactly when the XML text is non-empty.
+        if 'dc:description' in kedict[ke_id]:
+            description_text = kedict[ke_id]['dc:description']
+            key = 'KE/' + ke_id
+            genes_per_text = _replay_manifest_entry(
+                previous.get(key), [description_text], hgnclist)
+            if genes_per_text is not None:
+                reused += 1
+                text_hits += 1
+            else:
+                genes_per_text = [scan(description_text)]
+            if manifest is not None:
+                manifest[key] = _manifest_entry([description_text], genes_per_text)
+            found_genes = genes_per_text[0]
             if found_genes:
-                kedict[ke.get('id')]['edam:data_1025'] = found_genes
+                kedict[ke_id]['edam:data_1025'] = found_genes
 
         # Progress logging
         if (ke_idx + 1) % 100 == 0 or ke_idx + 1 in [10, 50, total_kes]:
@@ -654,11 +862,11 @@ def map_genes_in_entities(kedict: dict, kerdict: dict, genedict1: dict,
         "(this may take a couple of minutes)..."
     )
     ker_start_time = time.time()
-    ker_list = xml_root.findall(aopxml_ns + 'key-event-relationship')
+    ker_list = xml_root.ker_ids
     total_kers = len(ker_list)
     logger.info(f"Processing {total_kers} Key Event Relationships for gene mapping...")
 
-    for ker_idx, ker in enumerate(ker_list):
+    for ker_idx, ker_id in enumerate(ker_list):
         # Progress reporting
         if ker_idx % max(1, total_kers // 10) == 0 or ker_idx % 50 == 0:
             elapsed_ker = time.time() - ker_start_time
@@ -676,44 +884,29 @@ def map_genes_in_entities(kedict: dict, kerdict: dict, genedict1: dict,
                 f"({progress_pct:.1f}%), elapsed: {elapsed_ker/60:.1f}m{eta_str}"
             )
 
-        all_found_genes = []
-
-        # Check description text
-        if (ker.find(aopxml_ns + 'description').text is not None
-                and 'dc:description' in kerdict[ker.get('id')]):
-            description_genes = _map_genes_in_text(
-                kerdict[ker.get('id')]['dc:description'],
-                genedict1, hgnclist, genedict2, token_owners, symbol_lookup,
-                automaton,
-            )
-            all_found_genes.extend(description_genes)
-
-        # Check biological plausibility and empirical support
-        for weight in ker.findall(aopxml_ns + 'weight-of-evidence'):
-            if (weight.find(aopxml_ns + 'biological-plausibility').text is not None
-                    and 'nci:C80263' in kerdict[ker.get('id')]):
-                bio_genes = _map_genes_in_text(
-                    kerdict[ker.get('id')]['nci:C80263'],
-                    genedict1, hgnclist, genedict2,
-                )
-                all_found_genes.extend(bio_genes)
-
-            if (weight.find(aopxml_ns + 'emperical-support-linkage').text is not None
-                    and 'edam:data_2042' in kerdict[ker.get('id')]):
-                emp_genes = _map_genes_in_text(
-                    kerdict[ker.get('id')]['edam:data_2042'],
-                    genedict1, hgnclist, genedict2,
-                )
-                all_found_genes.extend(emp_genes)
+        # As for KEs, each field is present in kerdict exactly when its XML
+        # text was non-empty (weight-of-evidence occurs at most once per KER),
+        # so the dict alone says what to scan.
+        texts = [kerdict[ker_id].get(name) for name in _KER_GENE_TEXT_FIELDS]
+        if not any(name in kerdict[ker_id] for name in _KER_GENE_TEXT_FIELDS):
+            continue
+        key = 'KER/' + ker_id
+        genes_per_text = _replay_manifest_entry(previous.get(key), texts, hgnclist)
+        if genes_per_text is not None:
+            reused += 1
+            text_hits += sum(text is not None for text in texts)
+        else:
+            # Every field goes through the shared automaton with the same
+            # ownership and short-token filters; absent fields (None) yield [].
+            genes_per_text = [scan(text) for text in texts]
+        if manifest is not None:
+            manifest[key] = _manifest_entry(texts, genes_per_text)
 
         # Remove duplicates while preserving order
-        unique_genes = []
-        for gene in all_found_genes:
-            if gene not in unique_genes:
-                unique_genes.append(gene)
+        unique_genes = OrderedSet(gene for found in genes_per_text for gene in found)
 
         if unique_genes:
-            kerdict[ker.get('id')]['edam:data_1025'] = unique_genes
+            kerdict[ker_id]['edam:data_1025'] = list(unique_genes)
 
     ker_total_time = time.time() - ker_start_time
     logger.info(
@@ -724,6 +917,17 @@ def map_genes_in_entities(kedict: dict, kerdict: dict, genedict1: dict,
         f"Total gene mapping completed: {len(hgnclist)} genes "
         f"mapped to Key Events and Key Event Relationships"
     )
+    if manifest is not None:
+        logger.info(
+            f"Incremental gene mapping: reused {reused}/{len(manifest)} "
+            f"unchanged KE/KER results, rescanned {len(manifest) - reused}"
+        )
+    total_texts = text_hits + text_scans
+    if total_texts:
+        logger.info(
+            f"Gene result cache: {text_hits}/{total_texts} texts reused "
+            f"({100.0 * text_hits / total_texts:.1f}% hit ratio), {text_scans} scanned"
+        )
 
     return kedict, kerdict, hgnclist
 
@@ -735,7 +939,8 @@ def map_genes_in_entities(kedict: dict, kerdict: dict, genedict1: dict,
 def build_gene_xrefs(hgnclist: list, bridgedb_url: str,
                      timeout: int = 30,
                      symbol_lookup: dict | None = None,
-                     min_success_rate: float = MIN_BRIDGEDB_SUCCESS_RATE) -> dict:
+                     min_success_rate: float = MIN_BRIDGEDB_SUCCESS_RATE,
+                     client=None) -> dict:
     """Map HGNC IDs to Entrez/Ensembl/UniProt via BridgeDb.
 
     Parameters
@@ -753,6 +958,9 @@ def build_gene_xrefs(hgnclist: list, bridgedb_url: str,
         Percentage of genes that must resolve before the result is trusted.
         Below it, a RuntimeError is raised rather than returning empty
         cross-references. Set to 0 to disable.
+    client : BridgeDbClient, optional
+        Pooled client for the BridgeDb requests; chunks run concurrently when
+        it has more than one worker. Default: a sequential client per call.
 
     Returns
     -------
@@ -773,13 +981,13 @@ def build_gene_xrefs(hgnclist: list, bridgedb_url: str,
 
     batch_results = batch_xrefs_gene(
         hgnclist, bridgedb_url, timeout=timeout, chunk_size=100,
-        symbol_lookup=symbol_lookup,
+        symbol_lookup=symbol_lookup, client=client,
     )
 
     geneiddict = {}
-    listofentrez = []
-    listofensembl = []
-    listofuniprot = []
+    listofentrez = OrderedSet()
+    listofensembl = OrderedSet()
+    listofuniprot = OrderedSet()
     successful_mappings = 0
 
     for gene in hgnclist:
@@ -0,0 +1,122 @@
+"""Incremental gene mapping: reuse last run's per-entity results.
+
+Most Key Events and KERs are unchanged from one weekly export to the next.
+The gene-mapping manifest records, for every scanned KE/KER, a fingerprint of
+the text fields the regex mapper reads and the HGNC IDs found in each field.
+On the next run an entity whose texts still hash the same is not rescanned;
+its recorded per-field results are replayed instead, so ``edam:data_1025`` and
+the global ``hgnclist`` come out exactly as a full scan would build them.
+
+Each field's result is also recorded under its own content hash
+(:func:`text_key`), which makes the manifest a content-addressed result
+cache: a text the previous run scanned is reused even when its entity changed
+in another field, was renumbered, or shares the text with another entity.
+
+The whole manifest is tied to a dictionary fingerprint -- the HGNC download
+plus the mapper and automaton sources -- so a new HGNC release or any change
+to the matching or false-positive rules discards it and forces a full scan.
+
+The BERN2 step needs no manifest: its per-text disk cache already limits
+network calls to new or edited texts.
+
+No module-level side effects. No network calls.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Bump when the manifest layout changes. 2: per-text "texts" keys.
+MANIFEST_VERSION = 2
+
+MANIFEST_FILENAME = "gene-mapping-manifest.json"
+
+
+def dictionary_fingerprint(hgnc_file_path) -> str:
+    """Fingerprint of everything besides the text that decides a scan's result.
+
+    Parameters
+    ----------
+    hgnc_file_path : str or Path
+        The HGNC download the gene dictionaries are built from.
+
+    Returns
+    -------
+    str
+        Hex SHA-256 over the HGNC file and the gene_mapper/automaton sources.
+    """
+    from aopwiki_rdf.mapping import automaton, gene_mapper
+
+    digest = hashlib.sha256()
+    for path in (hgnc_file_path, gene_mapper.__file__, automaton.__file__):
+        digest.update(Path(path).read_bytes())
+    digest.update(f"manifest={MANIFEST_VERSION}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def text_fingerprint(texts) -> str:
+    """Hex SHA-256 of the scanned text fields (``None`` for an absent field)."""
+    payload = json.dumps(list(texts), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def text_key(text: str) -> str:
+    """Hex SHA-256 of one text, the key of its content-addressed result."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def load_manifest(manifest_dir, fingerprint: str) -> dict:
+    """Return the previous run's entries, or ``{}`` when none are usable.
+
+    Parameters
+    ----------
+    manifest_dir : str or Path
+        Directory holding ``gene-mapping-manifest.json``.
+    fingerprint : str
+        This run's :func:`dictionary_fingerprint`. A manifest written under a
+        different one is discarded.
+
+    Returns
+    -------
+    dict
+        ``"KE/<id>"`` / ``"KER/<id>"`` -> ``{"text": str, "texts": [str | None,
+        ...], "genes": [[...], ...]}``: the entity fingerprint, each field's
+        :func:`text_key` and each field's HGNC IDs.
+    """
+    path = Path(manifest_dir) / MANIFEST_FILENAME
+    if not path.exists():
+        logger.info("No gene-mapping manifest at %s; full scan", path)
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("Corrupt gene-mapping manifest %s (%s); full scan", path, e)
+        return {}
+    if data.get("version") != MANIFEST_VERSION or data.get("dictionary") != fingerprint:
+        logger.info("Gene dictionary or mapper changed since the manifest was written; full scan")
+        return {}
+    entries = data.get("entities", {})
+    logger.info("Loaded gene-mapping manifest with %d entities", len(entries))
+    return entries
+
+
+def save_manifest(manifest_dir, fingerprint: str, entries: dict) -> Path:
+    """Write the manifest atomically and return its path."""
+    path = Path(manifest_dir) / MANIFEST_FILENAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"version": MANIFEST_VERSION, "dictionary": fingerprint, "entities": entries}
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    logger.info("Gene-mapping manifest written: %s (%d entities)", path, len(entries))
+    return path
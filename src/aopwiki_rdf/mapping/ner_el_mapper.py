@@ -10,20 +10,33 @@ productionisation lays down the code with `PipelineConfig.enable_bern2`
 defaulting False. Phase B wires this into the orchestrator alongside the
 existing regex `gene_mapper`.
 
+With ``PipelineConfig.ner_cache_store`` the same cache entries live in one
+SQLite file instead (:mod:`aopwiki_rdf.mapping.bern2_store`); every cache
+read and write below then goes through that store.
+
 Feasibility evidence: `prototypes/ner_el_spike/REPORT.md` (May 2026 spike).
 """
 
+import bisect
+import contextlib
 import hashlib
 import json
 import logging
+import os
 import re
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
 
 import requests
 
+from aopwiki_rdf.mapping.bern2_store import open_store
+from aopwiki_rdf.mapping.rate_limit import HostRateLimiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -58,6 +71,13 @@ class NerResult:
 # the input at sentence boundaries keeps each call's response well under that.
 _BERN2_CHUNK_CHARS = 1500
 
+# Joins texts packed into one BERN2 request (ner_pack_chars): a paragraph
+# break around a token BERN2 does not annotate, so no entity spans two texts.
+_PACK_SEPARATOR = "\n\n###\n\n"
+
+# NCBI Gene IDs per BridgeDb xrefsBatch request (map_ncbi_to_hgnc's default).
+_BRIDGEDB_CHUNK_IDS = 100
+
 
 # ---------------------------------------------------------------------------
 # Cache helpers
@@ -79,9 +99,74 @@ def _read_json_cache(path: Path) -> dict | None:
         return None
 
 
-def _write_json_cache(path: Path, data: dict) -> None:
+def _write_text_cache(path: Path, text: str) -> None:
+    # Temp file + rename: concurrent lookups never read a half-written entry.
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def _write_json_cache(path: Path, data: dict) -> None:
+    _write_text_cache(path, json.dumps(data, ensure_ascii=False))
+
+
+def _read_bern2_cache(cache_dir, key: str, store=None) -> dict | None:
+    """Cached BERN2 response for ``key``, from ``store`` or ``cache_dir/<key>.json``."""
+    if store is None:
+        return _read_json_cache(Path(cache_dir) / f"{key}.json")
+    body = store.get("bern2", key)
+    if body is None:
+        return None
+    try:
+        return json.loads(body)
+    except json.JSONDecodeError:
+        logger.warning("Corrupt BERN2 cache entry %s; deleting", key)
+        store.delete("bern2", key)
+        return None
+
+
+def _write_bern2_cache(cache_dir, key: str, data: dict, store=None) -> None:
+    if store is None:
+        _write_json_cache(Path(cache_dir) / f"{key}.json", data)
+    else:
+        store.put("bern2", key, json.dumps(data, ensure_ascii=False))
+
+
+def _read_bridgedb_cache(cache_dir, key: str, store=None) -> str | None:
+    """Cached BridgeDb batch response for ``key``, from ``store`` or ``cache_dir/<key>.txt``."""
+    if store is not None:
+        return store.get("bridgedb", key)
+    path = Path(cache_dir) / f"{key}.txt"
+    return path.read_text(encoding="utf-8") if path.exists() else None
+
+
+def _write_bridgedb_cache(cache_dir, key: str, response_text: str, store=None) -> None:
+    if store is None:
+        _write_text_cache(Path(cache_dir) / f"{key}.txt", response_text)
+    else:
+        store.put("bridgedb", key, response_text)
+
+
+@contextlib.contextmanager
+def _ner_store(config):
+    """Context manager yielding the BERN2 cache store, or None for the file layout.
+
+    Entries the store gained while open are exported to the per-file layout
+    on a clean exit, so the tracked directory cache keeps growing.
+    """
+    if not config.ner_cache_store:
+        yield None
+        return
+    with open_store(config.ner_cache_dir) as store:
+        yield store
+        store.export_directory(config.ner_cache_dir, since=store.opened)
 
 
 # ---------------------------------------------------------------------------
@@ -155,7 +240,7 @@ def _ker_ner_texts(props) -> list[str]:
     return texts
 
 
-def is_cached(text: str, ner_cache_dir) -> bool:
+def is_cached(text: str, ner_cache_dir, store=None) -> bool:
     """Return True iff ``text`` has a usable BERN2 cache entry.
 
     Pure disk probe -- never touches the network. A cache entry counts as
@@ -174,7 +259,12 @@ def is_cached(text: str, ner_cache_dir) -> bool:
         The configured ``ner_cache_dir``; BERN2 responses live under
         ``{ner_cache_dir}/bern2/{_cache_key(text)}.json`` (matching
         :func:`find_hgnc_ids_via_ner_el`).
+    store:
+        Optional :class:`~aopwiki_rdf.mapping.bern2_store.Bern2CacheStore`
+        to probe instead of the per-file layout.
     """
+    if store is not None:
+        return bool(store.usable_keys("bern2", [_cache_key(text)]))
     cache_path = Path(ner_cache_dir) / "bern2" / f"{_cache_key(text)}.json"
     cached = _read_json_cache(cache_path)
     return (
@@ -202,43 +292,38 @@ def report_cache_coverage(*entity_dicts, config) -> dict:
     treated as a KE (single ``dc:description``), so the KE counting is
     byte-unchanged.
 
+    With ``config.ner_cache_store`` the whole corpus is probed in one indexed
+    query against the store rather than one file read per text.
+
     Parameters
     ----------
     *entity_dicts:
         One or more ``{entity_id: properties}`` dicts (e.g. ``kedict``,
         ``kerdict``).
     config:
-        PipelineConfig; only ``ner_cache_dir`` is read.
+        PipelineConfig; only ``ner_cache_dir`` and ``ner_cache_store`` are read.
 
     Returns
     -------
     dict
-        ``{"total": int, "cached": int, "uncached_ids": list[str]}`` where
-        ``uncached_ids`` is sorted. ``total`` counts text entries (a KER
-        contributes one per non-empty NER field). Emits one INFO summary line
+        ``{"total": int, "cached": int, "uncached_ids": list[str],
+        "distinct": int}`` where ``uncached_ids`` is sorted. ``total`` counts
+        text entries (a KER contributes one per non-empty NER field);
+        ``distinct`` counts the different texts among them, i.e. the BERN2
+        calls a cold run needs, and ``total / distinct`` is logged as the
+        dedup ratio. Emits one INFO summary line
         and, when any IDs are uncached, one INFO line listing them (truncated
         to the first 50 with a ``+N more`` suffix; threat T-06-02 bounds log
         volume).
     """
-    total = 0
-    cached = 0
-    uncached_ids: list[str] = []
-
+    probed: list[tuple[str, list[str]]] = []
     for entity_dict in entity_dicts:
         for entity_id, props in entity_dict.items():
             # KER (multi-field): any weight-of-evidence NER field present.
             if props.get("nci:C80263") or props.get("edam:data_2042"):
                 texts = _ker_ner_texts(props)
-                if not texts:
-                    continue
-                total += len(texts)
-                n_cached = sum(
-                    1 for text in texts if is_cached(text, config.ner_cache_dir)
-                )
-                cached += n_cached
-                # A KER is "fully cached" only when ALL its texts are cached.
-                if n_cached < len(texts):
-                    uncached_ids.append(entity_id)
+                if texts:
+                    probed.append((entity_id, texts))
                 continue
 
             # KE (single dc:description) -- byte-unchanged counting.
@@ -246,27 +331,48 @@ def report_cache_coverage(*entity_dicts, config) -> dict:
             if not description:
                 continue
             text = _description_text(description)
-            if not text.strip():
-                continue
-            total += 1
-            if is_cached(text, config.ner_cache_dir):
-                cached += 1
-            else:
-                uncached_ids.append(entity_id)
+            if text.strip():
+                probed.append((entity_id, [text]))
+
+    # Identical texts share one cache entry; probe each distinct one once.
+    distinct = {_cache_key(t): t for _, texts in probed for t in texts}
+    if config.ner_cache_store:
+        with open_store(config.ner_cache_dir) as store:
+            hits = store.usable_keys("bern2", distinct)
+    else:
+        hits = {key for key, text in distinct.items()
+                if is_cached(text, config.ner_cache_dir)}
+
+    def hit(text):
+        return _cache_key(text) in hits
+
+    total = 0
+    cached = 0
+    uncached_ids: list[str] = []
+    for entity_id, texts in probed:
+        total += len(texts)
+        n_cached = sum(1 for text in texts if hit(text))
+        cached += n_cached
+        # An entity is "fully cached" only when ALL its texts are cached.
+        if n_cached < len(texts):
+            uncached_ids.append(entity_id)
 
     uncached_ids.sort()
     n_uncached = len(uncached_ids)
     pct = (100.0 * cached / total) if total else 0.0
     logger.info(
-        "BERN2 cache coverage: %d/%d (%.1f%%); %d uncached",
+        "BERN2 cache coverage: %d/%d (%.1f%%); %d uncached; "
+        "%d distinct texts (%.2fx dedup)",
         cached, total, pct, n_uncached,
+        len(distinct), total / len(distinct) if distinct else 1.0,
     )
     if uncached_ids:
         head = uncached_ids[:50]
         suffix = f" (+{n_uncached - len(head)} more)" if n_uncached > len(head) else ""
         logger.info("BERN2 uncached IDs: %s%s", ", ".join(head), suffix)
 
-    return {"total": total, "cached": cached, "uncached_ids": uncached_ids}
+    return {"total": total, "cached": cached, "uncached_ids": uncached_ids,
+            "distinct": len(distinct)}
 
 
 # ---------------------------------------------------------------------------
@@ -286,18 +392,22 @@ def _loads_bern2(response_text: str) -> dict:
     return json.loads(response_text, parse_constant=lambda _c: None)
 
 
-def _bern2_post(text: str, url: str, timeout: int, max_retries: int = 3) -> dict:
+def _bern2_post(text: str, url: str, timeout: int, max_retries: int = 3,
+                limiter: HostRateLimiter | None = None) -> dict:
     """One BERN2 POST, with retry on transient failure.
 
     Retries up to ``max_retries`` times with exponential backoff (1s, 2s,
     4s) on genuine network errors or malformed responses. The common
     ``NaN``-in-``prob`` case is handled by :func:`_loads_bern2` and is
-    *not* an error.
+    *not* an error. With a ``limiter`` every attempt waits for its turn and
+    the backoff holds all workers' requests to the host, not just this one.
 
     Returns parsed JSON, or ``{"_error": ...}`` if every attempt failed.
     """
     last_error = "unknown"
     for attempt in range(max_retries):
+        if limiter is not None:
+            limiter.acquire(url)
         try:
             r = requests.post(url, json={"text": text}, timeout=timeout)
             r.raise_for_status()
@@ -305,7 +415,10 @@ def _bern2_post(text: str, url: str, timeout: int, max_retries: int = 3) -> dict
         except (requests.RequestException, json.JSONDecodeError) as e:
             last_error = str(e)
             if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
+                if limiter is not None:
+                    limiter.back_off(url, 2 ** attempt)
+                else:
+                    time.sleep(2 ** attempt)
     return {"_error": last_error}
 
 
@@ -315,6 +428,8 @@ def query_bern2(
     cache_dir: Path,
     timeout: int = 120,
     sleep_after: float = 0.0,
+    store=None,
+    limiter: HostRateLimiter | None = None,
 ) -> dict:
     """Query the BERN2 NER+EL service, caching results per input text.
 
@@ -334,6 +449,12 @@ def query_bern2(
         HTTP request timeout in seconds (per sub-call).
     sleep_after:
         Optional sleep after each network call (rate-limit friendliness).
+    store:
+        Optional :class:`~aopwiki_rdf.mapping.bern2_store.Bern2CacheStore`
+        used in place of ``cache_dir``.
+    limiter:
+        Optional :class:`~aopwiki_rdf.mapping.rate_limit.HostRateLimiter`
+        shared with other workers; every sub-call waits on it.
 
     Returns
     -------
@@ -341,17 +462,17 @@ def query_bern2(
         Parsed BERN2 JSON, or ``{"_error": "..."}`` if every attempt failed.
         Successful responses have an ``"annotations"`` list.
     """
-    cache_path = Path(cache_dir) / f"{_cache_key(text)}.json"
-    cached = _read_json_cache(cache_path)
+    cache_key = _cache_key(text)
+    cached = _read_bern2_cache(cache_dir, cache_key, store)
     if cached is not None and "_error" not in cached and not cached.get("_partial"):
         return cached
 
     # First attempt: single call
-    data = _bern2_post(text, bern2_url, timeout)
+    data = _bern2_post(text, bern2_url, timeout, limiter=limiter)
     if sleep_after > 0:
         time.sleep(sleep_after)
     if "_error" not in data:
-        _write_json_cache(cache_path, data)
+        _write_bern2_cache(cache_dir, cache_key, data, store)
         return data
 
     # JSON-truncation fallback: split into sentence-bounded chunks
@@ -371,7 +492,7 @@ def query_bern2(
     seen: set[tuple] = set()
     errors: list[str] = []
     for chunk in chunks:
-        sub = _bern2_post(chunk, bern2_url, timeout)
+        sub = _bern2_post(chunk, bern2_url, timeout, limiter=limiter)
         if sleep_after > 0:
             time.sleep(sleep_after)
         if "_error" in sub:
@@ -404,7 +525,7 @@ def query_bern2(
     else:
         # Clean all-success chunked outcome -- byte-unchanged.
         result = {"annotations": merged}
-    _write_json_cache(cache_path, result)
+    _write_bern2_cache(cache_dir, cache_key, result, store)
     return result
 
 
@@ -458,6 +579,8 @@ def map_ncbi_to_hgnc(
     timeout: int = 60,
     chunk_size: int = 100,
     sleep_after: float = 0.0,
+    store=None,
+    limiter: HostRateLimiter | None = None,
 ) -> dict[str, str]:
     """Map NCBI Gene IDs to HGNC numeric IDs via the BridgeDb batch API.
 
@@ -476,6 +599,11 @@ def map_ncbi_to_hgnc(
         Directory for per-chunk response cache.
     timeout, chunk_size, sleep_after:
         HTTP knobs.
+    store:
+        Optional :class:`~aopwiki_rdf.mapping.bern2_store.Bern2CacheStore`
+        used in place of ``cache_dir``.
+    limiter:
+        Optional shared :class:`~aopwiki_rdf.mapping.rate_limit.HostRateLimiter`.
 
     Returns
     -------
@@ -487,44 +615,64 @@ def map_ncbi_to_hgnc(
         return {}
 
     out: dict[str, str] = {}
-    base = bridgedb_url.rstrip("/") + "/"
     for i in range(0, len(ids), chunk_size):
         chunk = ids[i:i + chunk_size]
-        cache_path = Path(cache_dir) / f"{_cache_key(','.join(chunk))}.txt"
-        if cache_path.exists():
-            response_text = cache_path.read_text(encoding="utf-8")
-        else:
+        key = _cache_key(",".join(chunk))
+        response_text = _read_bridgedb_cache(cache_dir, key, store)
+        if response_text is None:
             try:
-                r = requests.post(
-                    f"{base}xrefsBatch/L",
-                    data="\n".join(chunk),
-                    timeout=timeout,
-                )
-                r.raise_for_status()
-                response_text = r.text
+                response_text = _bridgedb_post(chunk, bridgedb_url, timeout, limiter)
             except requests.RequestException as e:
                 logger.warning("BridgeDb batch failed (chunk %d): %s", i // chunk_size, e)
                 continue
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            cache_path.write_text(response_text, encoding="utf-8")
+            _write_bridgedb_cache(cache_dir, key, response_text, store)
             if sleep_after > 0:
                 time.sleep(sleep_after)
+        out.update(_parse_bridgedb_rows(response_text))
 
-        for line in response_text.strip().split("\n"):
-            parts = line.split("\t")
-            if len(parts) < 3:
-                continue
-            ncbi_id = parts[0]
-            xrefs = parts[2]
-            if xrefs == "N/A":
-                continue
-            for token in xrefs.split(","):
-                if token.startswith("Hac:HGNC:"):
-                    hgnc_numeric = token[len("Hac:HGNC:"):]
-                    if hgnc_numeric.isdigit():
-                        out[ncbi_id] = hgnc_numeric
-                    break
+    return out
 
+
+def _bridgedb_chunks(ncbi_ids: Iterable[str]) -> list[tuple[str, list[str]]]:
+    """``(cache_key, ids)`` per request :func:`map_ncbi_to_hgnc` sends for one text."""
+    ids = sorted({s for s in ncbi_ids if isinstance(s, str) and s.isdigit()})
+    return [(_cache_key(",".join(ids[i:i + _BRIDGEDB_CHUNK_IDS])),
+             ids[i:i + _BRIDGEDB_CHUNK_IDS])
+            for i in range(0, len(ids), _BRIDGEDB_CHUNK_IDS)]
+
+
+def _bridgedb_post(ncbi_ids: list[str], bridgedb_url: str, timeout: int,
+                   limiter: HostRateLimiter | None = None) -> str:
+    """One ``xrefsBatch/L`` POST; raises ``requests.RequestException`` on failure."""
+    base = bridgedb_url.rstrip("/") + "/"
+    if limiter is not None:
+        limiter.acquire(base)
+    r = requests.post(
+        f"{base}xrefsBatch/L",
+        data="\n".join(ncbi_ids),
+        timeout=timeout,
+    )
+    r.raise_for_status()
+    return r.text
+
+
+def _parse_bridgedb_rows(response_text: str) -> dict[str, str]:
+    """``{ncbi_id: hgnc_numeric_id}`` from the ``Hac:HGNC:N`` token of each row."""
+    out: dict[str, str] = {}
+    for line in response_text.strip().split("\n"):
+        parts = line.split("\t")
+        if len(parts) < 3:
+            continue
+        ncbi_id = parts[0]
+        xrefs = parts[2]
+        if xrefs == "N/A":
+            continue
+        for token in xrefs.split(","):
+            if token.startswith("Hac:HGNC:"):
+                hgnc_numeric = token[len("Hac:HGNC:"):]
+                if hgnc_numeric.isdigit():
+                    out[ncbi_id] = hgnc_numeric
+                break
     return out
 
 
@@ -540,6 +688,8 @@ def find_hgnc_ids_via_ner_el_result(
     timeout: int = 120,
     sleep_after: float = 0.0,
     min_prob: float = 0.0,
+    store=None,
+    limiter: HostRateLimiter | None = None,
 ) -> NerResult:
     """Find HGNC numeric IDs in ``text``, signalling BERN2 failure (NER-04).
 
@@ -557,7 +707,9 @@ def find_hgnc_ids_via_ner_el_result(
       failed=False, error=None)``.
 
     The cache layout, knobs, and network behaviour are identical to
-    :func:`find_hgnc_ids_via_ner_el`; this adds no network calls.
+    :func:`find_hgnc_ids_via_ner_el`; this adds no network calls. With a
+    ``store`` both hops cache into it instead of the two subdirectories; a
+    ``limiter`` paces both hops' requests per host.
     """
     cache_dir = Path(cache_dir)
     bern2_cache = cache_dir / "bern2"
@@ -569,6 +721,8 @@ def find_hgnc_ids_via_ner_el_result(
         cache_dir=bern2_cache,
         timeout=timeout,
         sleep_after=sleep_after,
+        store=store,
+        limiter=limiter,
     )
     if "_error" in bern2_response:
         # The only failure boundary: BERN2 itself could not be reached / all
@@ -586,6 +740,8 @@ def find_hgnc_ids_via_ner_el_result(
         cache_dir=bridgedb_cache,
         timeout=timeout,
         sleep_after=sleep_after,
+        store=store,
+        limiter=limiter,
     )
     return NerResult(set(ncbi_to_hgnc.values()), failed=False, error=None)
 
@@ -598,6 +754,7 @@ def find_hgnc_ids_via_ner_el(
     timeout: int = 120,
     sleep_after: float = 0.0,
     min_prob: float = 0.0,
+    store=None,
 ) -> set[str]:
     """Find HGNC numeric IDs in ``text`` via BERN2 + BridgeDb.
 
@@ -636,9 +793,268 @@ def find_hgnc_ids_via_ner_el(
         timeout=timeout,
         sleep_after=sleep_after,
         min_prob=min_prob,
+        store=store,
     ).hgnc_ids
 
 
+def _ner_limiter(config) -> HostRateLimiter | None:
+    """The limiter shared by one run's workers; None for the sequential default."""
+    if config.ner_workers > 1 or config.ner_rate_limit > 0:
+        return HostRateLimiter(config.ner_rate_limit)
+    return None
+
+
+def _pool_map(fn, items: list, config, limiter, label: str, failed) -> list:
+    """``[fn(item, limiter) for item in items]`` on up to ``config.ner_workers`` threads.
+
+    Results are in ``items`` order. Logs progress every 100 items, counting
+    the results for which ``failed(result)`` is true.
+    """
+    workers = min(max(1, config.ner_workers), len(items))
+    total = len(items)
+    done = n_failed = 0
+    progress_lock = threading.Lock()
+
+    def run(item):
+        nonlocal done, n_failed
+        result = fn(item, limiter)
+        with progress_lock:
+            done += 1
+            n_failed += bool(failed(result))
+            if done % 100 == 0 or done == total:
+                logger.info("BERN2 NER+EL progress: %d/%d %s (%d failed)",
+                            done, total, label, n_failed)
+        return result
+
+    if workers <= 1:
+        return [run(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bern2") as pool:
+        return list(pool.map(run, items))
+
+
+def _pack_texts(texts: list[str], limit: int) -> list[list[str]]:
+    """Split ``texts`` in order into packs whose joined length is at most ``limit``."""
+    packs: list[list[str]] = []
+    current: list[str] = []
+    size = 0
+    for text in texts:
+        extra = len(text) + (len(_PACK_SEPARATOR) if current else 0)
+        if current and size + extra > limit:
+            packs.append(current)
+            current, extra = [], len(text)
+            size = 0
+        current.append(text)
+        size += extra
+    if current:
+        packs.append(current)
+    return packs
+
+
+def _split_packed_response(data: dict, texts: list[str]) -> list[dict] | None:
+    """Per-text BERN2 responses from the response to ``texts`` packed together.
+
+    Each annotation goes to the text its ``span`` starts in, with the span
+    shifted to that text's offsets. Annotations reaching into a separator
+    are dropped. Each response is tagged ``"_packed": True``: BERN2 saw the
+    neighbouring texts as context, so it can differ from a single-text
+    response and must stay identifiable in the cache. Returns None when the
+    response cannot be attributed: an annotation without a span, or an echoed
+    ``text`` that is not the packed input.
+    """
+    if "text" in data and data["text"] != _PACK_SEPARATOR.join(texts):
+        return None
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text) + len(_PACK_SEPARATOR)
+    annotations: list[list[dict]] = [[] for _ in texts]
+    for ann in data.get("annotations", []):
+        span = ann.get("span") or {}
+        begin, end = span.get("begin"), span.get("end")
+        if not isinstance(begin, int) or not isinstance(end, int):
+            return None
+        i = bisect.bisect_right(starts, begin) - 1
+        if i < 0 or end > starts[i] + len(texts[i]):
+            logger.debug("Dropping packed BERN2 annotation across a separator: %r",
+                         ann.get("mention"))
+            continue
+        annotations[i].append(
+            {**ann, "span": {**span, "begin": begin - starts[i], "end": end - starts[i]}})
+    return [{"annotations": anns, "_packed": True} for anns in annotations]
+
+
+def _prime_packed(texts: list[str], config, store, limiter, sleep_after: float = 0.0) -> None:
+    """Cache BERN2 responses for the short uncached ``texts``, several per request.
+
+    Texts of at most ``config.ner_pack_chars`` characters without a usable
+    cache entry are packed (:func:`_pack_texts`) and each pack is sent once,
+    without retries. A successful response is split back per text
+    (:func:`_split_packed_response`) and written under each text's own
+    :func:`_cache_key`, exactly where :func:`query_bern2` looks, so the
+    per-text lookups that follow are cache hits. The entries keep their
+    ``_packed`` tag, so they can be found and re-queried one text at a time. Texts of a failed pack stay
+    uncached and take the usual per-text path, retries and fallbacks included.
+    """
+    limit = config.ner_pack_chars
+    pending: dict[str, str] = {}
+    for text in texts:
+        key = _cache_key(text)
+        if len(text) <= limit and key not in pending \
+                and not is_cached(text, config.ner_cache_dir, store):
+            pending[key] = text
+    packs = [pack for pack in _pack_texts(list(pending.values()), limit) if len(pack) > 1]
+    if not packs:
+        return
+    cache_dir = Path(config.ner_cache_dir) / "bern2"
+
+    def post(pack: list[str], limiter) -> bool:
+        data = _bern2_post(_PACK_SEPARATOR.join(pack), config.bern2_url,
+                           config.request_timeout, max_retries=1, limiter=limiter)
+        if sleep_after > 0:
+            time.sleep(sleep_after)
+        responses = None if "_error" in data else _split_packed_response(data, pack)
+        if responses is None:
+            return False
+        for text, response in zip(pack, responses):
+            _write_bern2_cache(cache_dir, _cache_key(text), response, store)
+        return True
+
+    sent = _pool_map(post, packs, config, limiter, "packed requests",
+                     failed=lambda ok: not ok)
+    n_texts = sum(len(pack) for pack in packs)
+    n_failed = sum(len(pack) for pack, ok in zip(packs, sent) if not ok)
+    logger.info("BERN2 packing: %d texts in %d requests (%.1f texts/request); "
+                "%d texts left to per-text requests", n_texts, len(packs),
+                n_texts / len(packs), n_failed)
+
+
+def _annotate_texts(
+    texts: list[str], config, sleep_after: float = 0.0, label: str = "texts",
+) -> list[NerResult]:
+    """Look up every text in ``texts``, up to ``config.ner_workers`` at once.
+
+    Each text goes through :func:`find_hgnc_ids_via_ner_el_result` exactly as
+    in a sequential run -- same cache keys, every response written through to
+    the cache as it arrives -- so the results do not depend on the worker
+    count and an interrupted run resumes from the cache. Concurrent workers
+    share one :class:`~aopwiki_rdf.mapping.rate_limit.HostRateLimiter`:
+    ``config.ner_rate_limit`` requests per second per host (0 = unlimited),
+    and a failing host's retry backoff pauses every worker, not just one.
+    With ``config.ner_pack_chars`` the short uncached texts are first sent
+    several per request (:func:`_prime_packed`), so most lookups are cache hits.
+
+    Returns
+    -------
+    list of NerResult
+        One per text, in ``texts`` order, carrying HGNC numeric IDs.
+    """
+    limiter = _ner_limiter(config)
+    with _ner_store(config) as store:
+        if config.ner_pack_chars > 0:
+            _prime_packed(texts, config, store, limiter, sleep_after)
+
+        def lookup(text: str, limiter) -> NerResult:
+            return find_hgnc_ids_via_ner_el_result(
+                text,
+                bern2_url=config.bern2_url,
+                bridgedb_url=config.bridgedb_url,
+                cache_dir=config.ner_cache_dir,
+                timeout=config.request_timeout,
+                sleep_after=sleep_after,
+                min_prob=config.ner_min_prob,
+                store=store,
+                limiter=limiter,
+            )
+
+        return _pool_map(lookup, texts, config, limiter, label,
+                         failed=lambda result: result.failed)
+
+
+def _ke_texts(kedict: dict) -> tuple[dict[str, str], int]:
+    """``({ke_id: text}, n_described)`` for the KEs the NER pass annotates.
+
+    Blank descriptions are left out of the mapping but counted in
+    ``n_described``, the number of KEs carrying any ``dc:description``.
+    """
+    ke_ids = [
+        ke_id for ke_id, props in kedict.items()
+        if props.get("dc:description")
+    ]
+    logger.info("BERN2 NER+EL: scanning %d Key Event descriptions", len(ke_ids))
+    texts: dict[str, str] = {}
+    for ke_id in ke_ids:
+        text = _description_text(kedict[ke_id]["dc:description"])
+        if text.strip():
+            texts[ke_id] = text
+    return texts, len(ke_ids)
+
+
+def _ker_texts(kerdict: dict) -> dict[str, list[str]]:
+    """``{ker_id: field_texts}`` for the KERs carrying any NER text."""
+    ker_texts = {
+        ker_id: texts for ker_id, props in kerdict.items()
+        if (texts := _ker_ner_texts(props))
+    }
+    logger.info("BERN2 NER+EL: scanning %d Key Event Relationships (3 fields each)",
+                len(ker_texts))
+    return ker_texts
+
+
+def _ke_results(ke_texts: dict[str, str], lookups, total: int) -> dict[str, NerResult]:
+    """Per-KE :class:`NerResult` (``hgnc:N`` IDs) from one lookup per KE text."""
+    results: dict[str, NerResult] = {}
+    n_failed = 0
+    for ke_id, result in zip(ke_texts, lookups):
+        # Re-format HGNC numeric IDs as hgnc:N to match the regex mapper.
+        results[ke_id] = NerResult(
+            hgnc_ids={f"hgnc:{n}" for n in result.hgnc_ids},
+            failed=result.failed,
+            error=result.error,
+        )
+        if result.failed:
+            n_failed += 1
+
+    logger.info(
+        "BERN2 NER+EL complete: %d/%d KEs scanned, %d failed",
+        len(results), total, n_failed,
+    )
+    return results
+
+
+def _ker_results(ker_texts: dict[str, list[str]], lookups) -> dict[str, NerResult]:
+    """Per-KER :class:`NerResult` from the lookups of all field texts, in order."""
+    results: dict[str, NerResult] = {}
+    lookups = iter(lookups)
+    n_failed = 0
+    for ker_id, texts in ker_texts.items():
+        hgnc_union: set[str] = set()
+        n_field_failed = 0
+        last_error: str | None = None
+        for result in (next(lookups) for _ in texts):
+            if result.failed:
+                n_field_failed += 1
+                last_error = result.error
+            else:
+                hgnc_union |= result.hgnc_ids
+
+        # failed only when EVERY field's lookup failed (true KER outage).
+        ker_failed = bool(texts) and n_field_failed == len(texts)
+        results[ker_id] = NerResult(
+            hgnc_ids={f"hgnc:{n}" for n in hgnc_union},
+            failed=ker_failed,
+            error=last_error if ker_failed else None,
+        )
+        if ker_failed:
+            n_failed += 1
+
+    logger.info(
+        "BERN2 NER+EL complete: %d/%d KERs scanned, %d failed",
+        len(results), len(ker_texts), n_failed,
+    )
+    return results
+
+
 def map_ner_genes_in_kes(
     kedict: dict, config, sleep_after: float = 0.0,
 ) -> dict[str, set[str]]:
@@ -679,32 +1095,34 @@ def map_ner_genes_in_kes(
     total = len(ke_ids)
     logger.info("BERN2 NER+EL: scanning %d Key Event descriptions", total)
 
-    for idx, ke_id in enumerate(ke_ids, 1):
-        # dc:description can be a list of triple-quoted strings (parser
-        # appends MIE/AO example text); _description_text joins into one
-        # block for the model -- the single source of truth for the
-        # normalisation, so cache keys match the coverage probe.
-        text = _description_text(kedict[ke_id]["dc:description"])
-        if not text.strip():
-            continue
-
-        hgnc_numeric = find_hgnc_ids_via_ner_el(
-            text,
-            bern2_url=config.bern2_url,
-            bridgedb_url=config.bridgedb_url,
-            cache_dir=config.ner_cache_dir,
-            timeout=config.request_timeout,
-            sleep_after=sleep_after,
-            min_prob=config.ner_min_prob,
-        )
-        if hgnc_numeric:
-            results[ke_id] = {f"hgnc:{n}" for n in hgnc_numeric}
+    with _ner_store(config) as store:
+        for idx, ke_id in enumerate(ke_ids, 1):
+            # dc:description can be a list of triple-quoted strings (parser
+            # appends MIE/AO example text); _description_text joins into one
+            # block for the model -- the single source of truth for the
+            # normalisation, so cache keys match the coverage probe.
+            text = _description_text(kedict[ke_id]["dc:description"])
+            if not text.strip():
+                continue
 
-        if idx % 100 == 0 or idx == total:
-            logger.info(
-                "BERN2 NER+EL progress: %d/%d KEs (%d with gene hits)",
-                idx, total, len(results),
+            hgnc_numeric = find_hgnc_ids_via_ner_el(
+                text,
+                bern2_url=config.bern2_url,
+                bridgedb_url=config.bridgedb_url,
+                cache_dir=config.ner_cache_dir,
+                timeout=config.request_timeout,
+                sleep_after=sleep_after,
+                min_prob=config.ner_min_prob,
+                store=store,
             )
+            if hgnc_numeric:
+                results[ke_id] = {f"hgnc:{n}" for n in hgnc_numeric}
+
+            if idx % 100 == 0 or idx == total:
+                logger.info(
+                    "BERN2 NER+EL progress: %d/%d KEs (%d with gene hits)",
+                    idx, total, len(results),
+                )
 
     logger.info(
         "BERN2 NER+EL complete: %d/%d KEs had gene detections",
@@ -723,7 +1141,9 @@ def map_ner_genes_in_kes_result(
     :class:`NerResult` *per scanned KE* (not just those with hits) so the
     merge step can see exactly WHICH descriptions degraded and fall back to
     their regex genes. Reuses :func:`_description_text` so cache keys match
-    the coverage probe and the existing KE pass.
+    the coverage probe and the existing KE pass. Descriptions are looked up
+    concurrently by :func:`_annotate_texts`; the result does not depend on
+    ``config.ner_workers``.
 
     Parameters
     ----------
@@ -732,7 +1152,8 @@ def map_ner_genes_in_kes_result(
         with a non-empty ``dc:description`` are scanned.
     config:
         PipelineConfig. Reads ``bern2_url``, ``bridgedb_url``,
-        ``ner_cache_dir``, ``ner_min_prob``, and ``request_timeout``.
+        ``ner_cache_dir``, ``ner_min_prob``, ``request_timeout``,
+        ``ner_workers`` and ``ner_rate_limit``.
     sleep_after:
         Optional per-call delay (seconds).
 
@@ -743,49 +1164,9 @@ def map_ner_genes_in_kes_result(
         are formatted as ``hgnc:N`` URI-prefix strings to match the regex
         mapper's output convention. KEs with blank descriptions are absent.
     """
-    results: dict[str, NerResult] = {}
-    ke_ids = [
-        ke_id for ke_id, props in kedict.items()
-        if props.get("dc:description")
-    ]
-    total = len(ke_ids)
-    logger.info("BERN2 NER+EL: scanning %d Key Event descriptions", total)
-
-    n_failed = 0
-    for idx, ke_id in enumerate(ke_ids, 1):
-        text = _description_text(kedict[ke_id]["dc:description"])
-        if not text.strip():
-            continue
-
-        result = find_hgnc_ids_via_ner_el_result(
-            text,
-            bern2_url=config.bern2_url,
-            bridgedb_url=config.bridgedb_url,
-            cache_dir=config.ner_cache_dir,
-            timeout=config.request_timeout,
-            sleep_after=sleep_after,
-            min_prob=config.ner_min_prob,
-        )
-        # Re-format HGNC numeric IDs as hgnc:N to match the regex mapper.
-        results[ke_id] = NerResult(
-            hgnc_ids={f"hgnc:{n}" for n in result.hgnc_ids},
-            failed=result.failed,
-            error=result.error,
-        )
-        if result.failed:
-            n_failed += 1
-
-        if idx % 100 == 0 or idx == total:
-            logger.info(
-                "BERN2 NER+EL progress: %d/%d KEs (%d failed)",
-                idx, total, n_failed,
-            )
-
-    logger.info(
-        "BERN2 NER+EL complete: %d/%d KEs scanned, %d failed",
-        len(results), total, n_failed,
-    )
-    return results
+    ke_texts, total = _ke_texts(kedict)
+    lookups = _annotate_texts(list(ke_texts.values()), config, sleep_after, "KEs")
+    return _ke_results(ke_texts, lookups, total)
 
 
 def map_ner_genes_in_kers(
@@ -828,27 +1209,29 @@ def map_ner_genes_in_kers(
     total = len(ker_ids)
     logger.info("BERN2 NER+EL: scanning %d Key Event Relationships (3 fields each)", total)
 
-    for idx, ker_id in enumerate(ker_ids, 1):
-        hgnc_union: set[str] = set()
-        for text in _ker_ner_texts(kerdict[ker_id]):
-            hgnc_numeric = find_hgnc_ids_via_ner_el(
-                text,
-                bern2_url=config.bern2_url,
-                bridgedb_url=config.bridgedb_url,
-                cache_dir=config.ner_cache_dir,
-                timeout=config.request_timeout,
-                sleep_after=sleep_after,
-                min_prob=config.ner_min_prob,
-            )
-            hgnc_union |= hgnc_numeric
-        if hgnc_union:
-            results[ker_id] = {f"hgnc:{n}" for n in hgnc_union}
-
-        if idx % 100 == 0 or idx == total:
-            logger.info(
-                "BERN2 NER+EL progress: %d/%d KERs (%d with gene hits)",
-                idx, total, len(results),
-            )
+    with _ner_store(config) as store:
+        for idx, ker_id in enumerate(ker_ids, 1):
+            hgnc_union: set[str] = set()
+            for text in _ker_ner_texts(kerdict[ker_id]):
+                hgnc_numeric = find_hgnc_ids_via_ner_el(
+                    text,
+                    bern2_url=config.bern2_url,
+                    bridgedb_url=config.bridgedb_url,
+                    cache_dir=config.ner_cache_dir,
+                    timeout=config.request_timeout,
+                    sleep_after=sleep_after,
+                    min_prob=config.ner_min_prob,
+                    store=store,
+                )
+                hgnc_union |= hgnc_numeric
+            if hgnc_union:
+                results[ker_id] = {f"hgnc:{n}" for n in hgnc_union}
+
+            if idx % 100 == 0 or idx == total:
+                logger.info(
+                    "BERN2 NER+EL progress: %d/%d KERs (%d with gene hits)",
+                    idx, total, len(results),
+                )
 
     logger.info(
         "BERN2 NER+EL complete: %d/%d KERs had gene detections",
@@ -873,7 +1256,8 @@ def map_ner_genes_in_kers_result(
     BERN2 outage for that KER). If at least one field succeeded, the KER keeps
     the genes found and is ``failed=False`` -- the additive union is real and
     must not trigger a regex-only degradation just because one field's call
-    glitched (this composes with the Plan-01 ``_partial`` semantics).
+    glitched (this composes with the Plan-01 ``_partial`` semantics). The
+    field texts of all KERs are looked up together by :func:`_annotate_texts`.
 
     Parameters
     ----------
@@ -882,7 +1266,8 @@ def map_ner_genes_in_kers_result(
         parser. KERs carrying any non-empty NER text field are scanned.
     config:
         PipelineConfig. Reads ``bern2_url``, ``bridgedb_url``,
-        ``ner_cache_dir``, ``ner_min_prob``, and ``request_timeout``.
+        ``ner_cache_dir``, ``ner_min_prob``, ``request_timeout``,
+        ``ner_workers`` and ``ner_rate_limit``.
     sleep_after:
         Optional per-call delay (seconds).
 
@@ -893,57 +1278,148 @@ def map_ner_genes_in_kers_result(
         are formatted as ``hgnc:N`` URI-prefix strings. KERs with no NER text
         are absent.
     """
-    results: dict[str, NerResult] = {}
-    ker_ids = [
-        ker_id for ker_id, props in kerdict.items()
-        if _ker_ner_texts(props)
-    ]
-    total = len(ker_ids)
-    logger.info("BERN2 NER+EL: scanning %d Key Event Relationships (3 fields each)", total)
+    ker_texts = _ker_texts(kerdict)
+    lookups = _annotate_texts(
+        [text for texts in ker_texts.values() for text in texts],
+        config, sleep_after, "KER texts",
+    )
+    return _ker_results(ker_texts, lookups)
 
-    n_failed = 0
-    for idx, ker_id in enumerate(ker_ids, 1):
-        texts = _ker_ner_texts(kerdict[ker_id])
-        hgnc_union: set[str] = set()
-        n_field_failed = 0
-        last_error: str | None = None
-        for text in texts:
-            result = find_hgnc_ids_via_ner_el_result(
+
+def _map_ncbi_union(text_ids: list[set[str]], config, store=None,
+                    limiter: HostRateLimiter | None = None,
+                    sleep_after: float = 0.0) -> dict[str, str]:
+    """Map the NCBI Gene IDs of many texts to HGNC in one BridgeDb pass.
+
+    Each text's IDs are chunked and keyed exactly as :func:`map_ncbi_to_hgnc`
+    would send them, and those per-text cache entries are read first. The IDs
+    of every chunk that missed are sent together, once each, in
+    ``xrefsBatch`` requests of 100. The response rows are then written back
+    under the per-text keys, so the cache stays interchangeable with the
+    per-text path. A chunk touching a failed request is not cached and is
+    retried next run.
+
+    Returns
+    -------
+    dict
+        ``{ncbi_id: hgnc_numeric_id}`` over all texts. Missing mappings are
+        absent.
+    """
+    cache_dir = Path(config.ner_cache_dir) / "bridgedb"
+    out: dict[str, str] = {}
+    pending: dict[str, list[str]] = {}
+    for ids in text_ids:
+        for key, chunk in _bridgedb_chunks(ids):
+            if key in pending:
+                continue
+            response_text = _read_bridgedb_cache(cache_dir, key, store)
+            if response_text is None:
+                pending[key] = chunk
+            else:
+                out.update(_parse_bridgedb_rows(response_text))
+
+    from_cache = len(out)
+    missing = sorted({n for chunk in pending.values() for n in chunk})
+    rows: dict[str, str] = {}
+    failed: set[str] = set()
+    for i in range(0, len(missing), _BRIDGEDB_CHUNK_IDS):
+        batch = missing[i:i + _BRIDGEDB_CHUNK_IDS]
+        try:
+            response_text = _bridgedb_post(batch, config.bridgedb_url,
+                                           config.request_timeout, limiter)
+        except requests.RequestException as e:
+            logger.warning("BridgeDb batch failed (union chunk %d): %s",
+                           i // _BRIDGEDB_CHUNK_IDS, e)
+            failed.update(batch)
+            continue
+        for line in response_text.strip().split("\n"):
+            rows[line.split("\t", 1)[0]] = line
+        if sleep_after > 0:
+            time.sleep(sleep_after)
+
+    for key, chunk in pending.items():
+        if failed.isdisjoint(chunk):
+            _write_bridgedb_cache(
+                cache_dir, key, "".join(rows[n] + "\n" for n in chunk if n in rows), store)
+    out.update(_parse_bridgedb_rows("\n".join(rows.values())))
+    logger.info("BridgeDb NCBI->HGNC: %d mapped from cache, %d IDs sent for %d "
+                "uncached chunks", from_cache, len(missing), len(pending))
+    return out
+
+
+def map_ner_genes_in_corpus_result(
+    kedict: dict, kerdict: dict, config, sleep_after: float = 0.0,
+) -> tuple[dict[str, NerResult], dict[str, NerResult]]:
+    """Run BERN2 NER+EL over KEs and KERs together, each distinct text once.
+
+    Same results as :func:`map_ner_genes_in_kes_result` followed by
+    :func:`map_ner_genes_in_kers_result`, planned across both corpora. KE
+    descriptions and the three KER fields often repeat the same paragraph,
+    so every NER text is first deduplicated by :func:`_cache_key`. BERN2 is
+    queried once per distinct text, concurrently as in :func:`_annotate_texts`.
+    The union of their NCBI Gene IDs goes to BridgeDb in one pass
+    (:func:`_map_ncbi_union`) instead of one batch per text. The results are
+    then fanned back to every KE and KER that carries the text. The dedup
+    ratio is logged. ``config.ner_pack_chars`` packs the distinct texts as in
+    :func:`_annotate_texts`.
+
+    Returns
+    -------
+    tuple
+        ``(ke_results, ker_results)``, as the two per-corpus functions return
+        them.
+    """
+    ke_texts, ke_total = _ke_texts(kedict)
+    ker_texts = _ker_texts(kerdict)
+    all_texts = list(ke_texts.values()) + [t for texts in ker_texts.values() for t in texts]
+    unique: dict[str, str] = {}
+    for text in all_texts:
+        unique.setdefault(_cache_key(text), text)
+    logger.info("BERN2 NER+EL plan: %d texts, %d distinct (%.2fx dedup)",
+                len(all_texts), len(unique),
+                len(all_texts) / len(unique) if unique else 1.0)
+
+    limiter = _ner_limiter(config)
+    with _ner_store(config) as store:
+        if config.ner_pack_chars > 0:
+            _prime_packed(list(unique.values()), config, store, limiter, sleep_after)
+
+        def annotate(text: str, limiter) -> dict:
+            return query_bern2(
                 text,
                 bern2_url=config.bern2_url,
-                bridgedb_url=config.bridgedb_url,
-                cache_dir=config.ner_cache_dir,
+                cache_dir=Path(config.ner_cache_dir) / "bern2",
                 timeout=config.request_timeout,
                 sleep_after=sleep_after,
-                min_prob=config.ner_min_prob,
+                store=store,
+                limiter=limiter,
             )
-            if result.failed:
-                n_field_failed += 1
-                last_error = result.error
-            else:
-                hgnc_union |= result.hgnc_ids
 
-        # failed only when EVERY field's lookup failed (true KER outage).
-        ker_failed = bool(texts) and n_field_failed == len(texts)
-        results[ker_id] = NerResult(
-            hgnc_ids={f"hgnc:{n}" for n in hgnc_union},
-            failed=ker_failed,
-            error=last_error if ker_failed else None,
-        )
-        if ker_failed:
-            n_failed += 1
-
-        if idx % 100 == 0 or idx == total:
-            logger.info(
-                "BERN2 NER+EL progress: %d/%d KERs (%d failed)",
-                idx, total, n_failed,
-            )
-
-    logger.info(
-        "BERN2 NER+EL complete: %d/%d KERs scanned, %d failed",
-        len(results), total, n_failed,
-    )
-    return results
+        responses = dict(zip(unique, _pool_map(
+            annotate, list(unique.values()), config, limiter, "distinct texts",
+            failed=lambda response: "_error" in response,
+        )))
+        ncbi_ids = {
+            key: extract_ncbi_gene_ids(response, min_prob=config.ner_min_prob)
+            for key, response in responses.items() if "_error" not in response
+        }
+        ncbi_to_hgnc = _map_ncbi_union(list(ncbi_ids.values()), config, store,
+                                       limiter, sleep_after)
+
+    by_key: dict[str, NerResult] = {}
+    for key, response in responses.items():
+        if "_error" in response:
+            logger.warning("BERN2 query failed: %s", response["_error"])
+            by_key[key] = NerResult(set(), failed=True, error=response["_error"])
+        else:
+            by_key[key] = NerResult(
+                {ncbi_to_hgnc[n] for n in ncbi_ids[key] if n in ncbi_to_hgnc})
+
+    ke_results = _ke_results(
+        ke_texts, [by_key[_cache_key(t)] for t in ke_texts.values()], ke_total)
+    ker_results = _ker_results(
+        ker_texts, [by_key[_cache_key(t)] for texts in ker_texts.values() for t in texts])
+    return ke_results, ker_results
 
 
 def union_ner_into_entities(
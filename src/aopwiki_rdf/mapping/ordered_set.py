@@ -0,0 +1,67 @@
+"""Insertion-ordered set for the mapping layer's identifier lists.
+
+``hgnclist``, the gene and chemical xref lists and per-text gene hits are
+de-duplicated as they grow with ``if x not in lst: lst.append(x)``. On a plain
+list each test is a linear scan, so building the list is quadratic in its
+length. :class:`OrderedSet` keeps a set of its members beside the list, making
+the test constant-time while iteration order stays the insertion order the
+writers emit in.
+
+It subclasses ``list`` so everything downstream -- the writers, JSON manifests,
+checkpoint pickles, ``==`` against plain lists in tests -- keeps working
+unchanged. Only appending mutators are supported; the rest raise ``TypeError``
+rather than let the list and the member set drift apart.
+
+No module-level side effects.
+"""
+
+
+class OrderedSet(list):
+    """A list whose items are unique, with O(1) ``in``.
+
+    ``append`` / ``add`` of an item already present is a no-op, so existing
+    ``if x not in s: s.append(x)`` loops behave exactly as on a list.
+    """
+
+    __slots__ = ('_members',)
+
+    def __init__(self, iterable=()):
+        super().__init__()
+        self._members = set()
+        self.extend(iterable)
+
+    def __contains__(self, item) -> bool:
+        return item in self._members
+
+    def add(self, item) -> bool:
+        """Append ``item`` unless present; return True if it was added."""
+        if item in self._members:
+            return False
+        self._members.add(item)
+        super().append(item)
+        return True
+
+    def append(self, item) -> None:
+        self.add(item)
+
+    def extend(self, items) -> None:
+        for item in items:
+            self.add(item)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def clear(self) -> None:
+        self._members.clear()
+        super().clear()
+
+    def __reduce__(self):
+        # The default list pickling appends items before restoring __slots__.
+        return (type(self), (list(self),))
+
+    def _unsupported(self, *args, **kwargs):
+        raise TypeError("OrderedSet only supports appending; copy to a list to reorder or remove")
+
+    insert = remove = pop = sort = reverse = _unsupported
+    __setitem__ = __delitem__ = __imul__ = _unsupported
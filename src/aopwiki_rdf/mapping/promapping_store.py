@@ -0,0 +1,129 @@
+"""Indexed SQLite copy of promapping.txt, rebuilt once per PRO release.
+
+promapping.txt has over a million rows, of which a run needs the handful for
+the Protein Ontology terms the AOP-Wiki actually cites. Instead of scanning
+the whole file every run, :class:`PromappingStore` loads it once into a
+SQLite table indexed by PR key and answers each run with keyed lookups.
+
+Every row keeps its line number, so the rows returned for a set of keys come
+back in file order -- the order the full scan visits them in, which fixes the
+order of the identifier lists and ``prodict`` keys. The store also records
+the SHA-256 of the file it was built from (to tell releases apart) and the
+HTTP validators of that download (so an unchanged remote file need not be
+downloaded at all).
+
+No module-level side effects. No network calls.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+STORE_FILENAME = "promapping.sqlite"
+
+# Bump when the table layout changes; older stores are then rebuilt.
+STORE_VERSION = 1
+
+# Keys per ``IN (...)`` query, under SQLite's default host-parameter limit.
+_LOOKUP_CHUNK = 500
+
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+def file_sha256(path) -> str:
+    """Hex SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def iter_promapping_rows(fh):
+    """Yield ``(line_number, pr_key, mapping_column)`` for each data row of ``fh``."""
+    for line_number, line in enumerate(fh):
+        parts = line.split("\t")
+        if len(parts) < 2:
+            continue
+        yield line_number, "pr:" + parts[0][3:], parts[1]
+
+
+class PromappingStore:
+    """SQLite index of one promapping.txt release.
+
+    Parameters
+    ----------
+    store_dir : str or Path
+        Directory holding ``promapping.sqlite``.
+    """
+
+    def __init__(self, store_dir):
+        self.path = Path(store_dir) / STORE_FILENAME
+
+    def meta(self) -> dict:
+        """Metadata of the stored release, or ``{}`` when there is none usable."""
+        if not self.path.is_file():
+            return {}
+        try:
+            with sqlite3.connect(self.path) as conn:
+                meta = dict(conn.execute("SELECT name, value FROM meta"))
+        except sqlite3.Error as exc:
+            logger.warning("Ignoring unreadable promapping store %s: %s", self.path, exc)
+            return {}
+        if meta.get("store_version") != str(STORE_VERSION):
+            return {}
+        return meta
+
+    def build(self, source_path, source_sha256: str, **meta: str) -> None:
+        """Load ``source_path`` into a fresh store, replacing any previous one.
+
+        Extra keyword arguments (validators, modification time) are kept as
+        metadata alongside ``source_sha256``.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        if tmp.exists():
+            tmp.unlink()
+        try:
+            with sqlite3.connect(tmp) as conn:
+                conn.execute("CREATE TABLE rows (line INTEGER PRIMARY KEY, key TEXT, col TEXT)")
+                conn.execute("CREATE TABLE meta (name TEXT PRIMARY KEY, value TEXT)")
+                with open(source_path, "r", encoding="utf-8") as fh:
+                    conn.executemany("INSERT INTO rows VALUES (?, ?, ?)",
+                                     iter_promapping_rows(fh))
+                conn.execute("CREATE INDEX rows_key ON rows (key)")
+                meta = {**meta, "store_version": str(STORE_VERSION),
+                        "source_sha256": source_sha256}
+                conn.executemany("INSERT INTO meta VALUES (?, ?)", meta.items())
+            conn.close()
+            os.replace(tmp, self.path)
+        except BaseException:
+            if tmp.exists():
+                tmp.unlink()
+            raise
+        logger.info("Indexed %s into %s", source_path, self.path)
+
+    def update_meta(self, **meta: str) -> None:
+        """Replace metadata values (e.g. fresh validators for the same file)."""
+        with sqlite3.connect(self.path) as conn:
+            conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", meta.items())
+        conn.close()
+
+    def lookup(self, keys) -> list[tuple[int, str, str]]:
+        """Rows for ``keys`` as ``(line_number, pr_key, mapping_column)``, in file order."""
+        keys = sorted(set(keys))
+        rows = []
+        with sqlite3.connect(self.path) as conn:
+            for start in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[start:start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(conn.execute(
+                    f"SELECT line, key, col FROM rows WHERE key IN ({placeholders})", chunk,
+                ))
+        conn.close()
+        rows.sort()
+        return rows
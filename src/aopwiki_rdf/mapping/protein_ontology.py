@@ -5,17 +5,72 @@ Extracted from pipeline.py lines 1050-1102.
 Downloads the promapping.txt file from the Protein Consortium website and
 parses protein-to-identifier mappings (HGNC, UniProt, NCBIGene) for Protein
 Ontology terms that appear in the AOP-Wiki biological objects.
+
+With an index directory, each release of the file is loaded once into an
+indexed :class:`~aopwiki_rdf.mapping.promapping_store.PromappingStore` and
+later runs look up just the cited terms; the download itself is skipped while
+the remote file's ETag / Last-Modified are unchanged.
 """
 
 import logging
 import os
+import shutil
 import stat
 import time
 import urllib.request
 from pathlib import Path
 
+from aopwiki_rdf.mapping.promapping_store import (
+    PromappingStore,
+    file_sha256,
+    iter_promapping_rows,
+)
+
 logger = logging.getLogger(__name__)
 
+_VALIDATOR_HEADERS = ("ETag", "Last-Modified")
+
+
+def _remote_validators(url: str, timeout: int = 30) -> dict:
+    """ETag / Last-Modified of ``url`` from a HEAD request; ``{}`` on any failure."""
+    try:
+        request = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return {name: response.headers[name] for name in _VALIDATOR_HEADERS
+                    if response.headers.get(name)}
+    except Exception as exc:  # noqa: BLE001 -- network errors are heterogeneous
+        logger.info("Could not check %s for changes: %s", url, exc)
+        return {}
+
+
+def _collect_mappings(rows) -> tuple[dict, list, list, list]:
+    """Build ``prodict`` and the identifier lists from PR rows in file order."""
+    prodict: dict[str, list[str]] = {}
+    hgnclist: list[str] = []
+    uniprotlist: list[str] = []
+    ncbigenelist: list[str] = []
+
+    for _line_number, key, col in rows:
+        if key not in prodict:
+            prodict[key] = []
+
+        if "HGNC:" in col:
+            ident = "hgnc:" + col[5:]
+            prodict[key].append(ident)
+            hgnclist.append(ident)
+        if "NCBIGene:" in col:
+            ident = "ncbigene:" + col[9:]
+            prodict[key].append(ident)
+            ncbigenelist.append(ident)
+        if "UniProtKB:" in col:
+            ident = "uniprot:" + col.split(",")[0][10:]
+            prodict[key].append(ident)
+            uniprotlist.append(ident)
+
+        if not prodict[key]:
+            del prodict[key]
+    return prodict, hgnclist, uniprotlist, ncbigenelist
+
 
 def download_and_parse_promapping(
     promapping_url: str,
@@ -23,6 +78,8 @@ def download_and_parse_promapping(
     prolist: list,
     max_retries: int = 3,
     fallback_paths: list | None = None,
+    index_dir: Path | None = None,
+    fetcher=None,
 ) -> dict:
     """Download promapping.txt and parse protein-to-identifier mappings.
 
@@ -47,6 +104,15 @@ def download_and_parse_promapping(
         in the repository. The output-dir copy (a cached prior download) is
         always tried first. Only when no usable local copy exists does the run
         hard-fail.
+    index_dir:
+        Directory for the indexed store of the file. When set, a new release
+        is indexed once and then only the ``prolist`` terms are looked up; the
+        download is skipped while the remote validators match the indexed
+        release. Default None scans the downloaded file every run.
+    fetcher:
+        Optional :class:`~aopwiki_rdf.http_cache.ConditionalFetcher`; each
+        download attempt is then a conditional request, and an unchanged file
+        is copied from its cache instead of transferred again.
 
     Returns
     -------
@@ -75,6 +141,22 @@ def download_and_parse_promapping(
         # source when the live download is unreachable.
         fallback_paths = [Path("data") / pro_filename]
 
+    store = PromappingStore(index_dir) if index_dir is not None else None
+    stored = store.meta() if store is not None else {}
+    validators = {}
+    if store is not None:
+        validators = _remote_validators(promapping_url)
+        unchanged = bool(validators) and all(
+            stored.get(name) == value for name, value in validators.items()
+        )
+        if unchanged:
+            logger.info(
+                "promapping.txt unchanged since it was indexed (%s); skipping download",
+                ", ".join(f"{k} {v}" for k, v in validators.items()),
+            )
+            return _parse_rows(store.lookup(prolist),
+                               stored.get("modification_time", "Unknown"))
+
     # Download (retry, then degrade to a local copy) ----------------------------
     downloaded = False
     last_exc: Exception | None = None
@@ -86,7 +168,10 @@ def download_and_parse_promapping(
                 attempt,
                 max(1, max_retries),
             )
-            urllib.request.urlretrieve(promapping_url, filepath)
+            if fetcher is not None:
+                shutil.copyfile(fetcher.fetch(promapping_url, max_retries=1).path, filepath)
+            else:
+                urllib.request.urlretrieve(promapping_url, filepath)
             logger.info("Successfully downloaded %s", pro_filename)
             downloaded = True
             break
@@ -134,43 +219,32 @@ def download_and_parse_promapping(
         modification_time = "Unknown"
 
     # Parse ---------------------------------------------------------------------
-    prodict: dict[str, list[str]] = {}
-    hgnclist: list[str] = []
-    uniprotlist: list[str] = []
-    ncbigenelist: list[str] = []
-
     try:
-        with open(filepath, "r", encoding="utf-8") as fh:
-            for line in fh:
-                parts = line.split("\t")
-                if len(parts) < 2:
-                    continue
-                key = "pr:" + parts[0][3:]
-                if key not in prolist:
-                    continue
-                if key not in prodict:
-                    prodict[key] = []
-
-                col = parts[1]
-                if "HGNC:" in col:
-                    ident = "hgnc:" + col[5:]
-                    prodict[key].append(ident)
-                    hgnclist.append(ident)
-                if "NCBIGene:" in col:
-                    ident = "ncbigene:" + col[9:]
-                    prodict[key].append(ident)
-                    ncbigenelist.append(ident)
-                if "UniProtKB:" in col:
-                    ident = "uniprot:" + col.split(",")[0][10:]
-                    prodict[key].append(ident)
-                    uniprotlist.append(ident)
-
-                if not prodict[key]:
-                    del prodict[key]
+        if store is not None:
+            sha256 = file_sha256(filepath)
+            # Validators describe the remote file, so only keep them for a copy
+            # that was actually downloaded.
+            meta = {**(validators if downloaded else {}),
+                    "modification_time": modification_time}
+            if stored.get("source_sha256") == sha256:
+                store.update_meta(**meta)
+            else:
+                store.build(filepath, sha256, **meta)
+            rows = store.lookup(prolist)
+        else:
+            wanted = set(prolist)
+            with open(filepath, "r", encoding="utf-8") as fh:
+                rows = [row for row in iter_promapping_rows(fh) if row[1] in wanted]
     except IOError as exc:
         logger.error("Failed to open promapping file %s: %s", filepath, exc)
         raise SystemExit(1) from exc
 
+    return _parse_rows(rows, modification_time)
+
+
+def _parse_rows(rows, modification_time: str) -> dict:
+    """Assemble the result dict of :func:`download_and_parse_promapping`."""
+    prodict, hgnclist, uniprotlist, ncbigenelist = _collect_mappings(rows)
     logger.info(
         "Protein mapping completed: added %d identifiers for %d Protein Ontology terms",
         len(hgnclist) + len(ncbigenelist) + len(uniprotlist),
@@ -0,0 +1,70 @@
+"""Per-host request rate limiting shared between worker threads.
+
+:class:`HostRateLimiter` is a token bucket per host (``rate`` requests per
+second, bursts of up to ``burst``) plus a shared back-off: when one worker's
+request to a host fails, :meth:`HostRateLimiter.back_off` holds *every*
+worker's next request to that host until the delay has passed, instead of
+each thread retrying into an already struggling service on its own clock.
+
+No module-level side effects. No network calls.
+"""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+class HostRateLimiter:
+    """Token-bucket limiter keyed by URL host.
+
+    Parameters
+    ----------
+    rate : float
+        Requests per second allowed per host. ``0`` disables the rate limit;
+        back-offs are still honoured.
+    burst : int
+        Requests a host may receive back to back after being idle.
+
+    Safe to share between threads.
+    """
+
+    def __init__(self, rate: float = 0.0, burst: int = 1):
+        self.rate = max(0.0, rate)
+        self.burst = max(1, burst)
+        self._lock = threading.Lock()
+        # host -> [tokens, last refill (monotonic), not-before (monotonic)]
+        self._hosts: dict[str, list[float]] = {}
+
+    def _state(self, url: str, now: float) -> list[float]:
+        host = urlsplit(url).netloc or url
+        return self._hosts.setdefault(host, [float(self.burst), now, 0.0])
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to ``url``'s host may be sent.
+
+        Returns the number of seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                state = self._state(url, now)
+                tokens, updated, not_before = state
+                if self.rate > 0:
+                    tokens = min(float(self.burst), tokens + (now - updated) * self.rate)
+                    state[0], state[1] = tokens, now
+                if now >= not_before and (self.rate == 0 or tokens >= 1):
+                    if self.rate > 0:
+                        state[0] = tokens - 1
+                    return waited
+                delay = max(not_before - now,
+                            (1 - tokens) / self.rate if self.rate > 0 else 0.0)
+            time.sleep(delay)
+            waited += delay
+
+    def back_off(self, url: str, delay: float) -> None:
+        """Hold requests to ``url``'s host for at least ``delay`` seconds."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._state(url, now)
+            state[2] = max(state[2], now + delay)
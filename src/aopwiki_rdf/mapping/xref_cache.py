@@ -0,0 +1,138 @@
+"""Persistent BridgeDb cross-reference cache, one shard per system code.
+
+BridgeDb's data changes only with its data releases, a few times a year, yet
+every run used to re-fetch every gene and chemical xref. :class:`XrefCache`
+keeps the per-identifier results of :func:`aopwiki_rdf.mapping.bridgedb.
+batch_xrefs` on disk, keyed by (system code, identifier) and tagged with the
+service's ``DATASOURCEVERSION`` values (see :func:`~aopwiki_rdf.mapping.
+bridgedb.data_release`). While the release is unchanged a run answers from
+disk and only identifiers it has not seen before go to the network; once the
+service moves to a new release, the entries of the superseded one are evicted
+the first time a shard is opened.
+
+Each system code (``H`` genes, ``Ca`` chemicals) lives in its own JSON file,
+so the gene and chemical stages can cache concurrently without writing the
+same file. Files are replaced atomically.
+
+No module-level side effects. No network calls.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Bump when the shard layout changes; older shards are then discarded.
+CACHE_VERSION = 1
+
+
+class XrefCache:
+    """Release-tagged, per-identifier store of BridgeDb xref results.
+
+    Parameters
+    ----------
+    cache_dir : str or Path
+        Directory for the ``xrefs-<system code>.json`` shards. Created on save.
+    release : str
+        Data release the service is currently serving. Entries recorded
+        under any other release are evicted.
+
+    Notes
+    -----
+    Safe to share between the worker threads of one
+    :class:`~aopwiki_rdf.mapping.bridgedb.BridgeDbClient`.
+    """
+
+    def __init__(self, cache_dir, release: str):
+        self.cache_dir = Path(cache_dir)
+        self.release = release
+        self.hits = 0
+        self.misses = 0
+        self._shards: dict[str, dict] = {}
+        self._dirty: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _path(self, system_code: str) -> Path:
+        return self.cache_dir / f"xrefs-{system_code}.json"
+
+    def _shard(self, system_code: str) -> dict:
+        # Callers hold self._lock.
+        shard = self._shards.get(system_code)
+        if shard is not None:
+            return shard
+        shard = {}
+        path = self._path(system_code)
+        try:
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except FileNotFoundError:
+            data = None
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable BridgeDb xref cache %s: %s", path, exc)
+            data = None
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            entries = data.get("entries", {})
+            if data.get("release") == self.release:
+                shard = entries
+            elif entries:
+                logger.info(
+                    "Evicting %d cached BridgeDb %s xrefs from superseded release %s",
+                    len(entries), system_code, data.get("release"),
+                )
+                self._dirty.add(system_code)
+        self._shards[system_code] = shard
+        return shard
+
+    def get(self, system_code: str, identifier: str) -> tuple[str, dict] | None:
+        """Return ``(result_key, xrefs)`` for a cached identifier, else None.
+
+        ``result_key`` is the key the service's answer was filed under, which
+        may differ from ``identifier`` in case.
+        """
+        with self._lock:
+            entry = self._shard(system_code).get(identifier)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[0], entry[1]
+
+    def put(self, system_code: str, identifier: str, result_key: str,
+            xrefs: dict) -> None:
+        """Record the service's answer for ``identifier``."""
+        with self._lock:
+            self._shard(system_code)[identifier] = [result_key, xrefs]
+            self._dirty.add(system_code)
+
+    def save(self) -> None:
+        """Write every shard changed since it was loaded."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            if dirty:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for system_code in sorted(dirty):
+                payload = {
+                    "version": CACHE_VERSION,
+                    "release": self.release,
+                    "entries": self._shards[system_code],
+                }
+                fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                        json.dump(payload, fh, ensure_ascii=False)
+                    os.replace(tmp, self._path(system_code))
+                except BaseException:
+                    if os.path.exists(tmp):
+                        os.unlink(tmp)
+                    raise
+        if self.hits or self.misses:
+            total = self.hits + self.misses
+            logger.info(
+                "BridgeDb xref cache: %d/%d identifiers answered from disk "
+                "(%.1f%%), %d fetched (release %s)",
+                self.hits, total, self.hits / total * 100, self.misses, self.release,
+            )
@@ -1,5 +1,10 @@
 """AOP-Wiki XML parser module."""
 
-from aopwiki_rdf.parser.xml_parser import ParsedEntities, parse_aopwiki_xml
+from aopwiki_rdf.parser.xml_parser import (
+    ParsedEntities,
+    XmlSideTables,
+    parse_aopwiki_xml,
+    stream_aopwiki_xml,
+)
 
-__all__ = ['parse_aopwiki_xml', 'ParsedEntities']
+__all__ = ['parse_aopwiki_xml', 'stream_aopwiki_xml', 'ParsedEntities', 'XmlSideTables']
@@ -0,0 +1,206 @@
+"""Download of the AOP-Wiki XML export.
+
+:func:`download_with_retry` is the original two-copy path: the whole gzip
+response is read into memory, written to the working directory, and the
+parse stage gunzips that file into a second copy under the data directory.
+
+:func:`download_and_decompress` streams instead. The HTTP body is fed chunk
+by chunk through a gzip decompressor straight into the one XML file the
+parser reads, so neither the compressed nor the decompressed export is ever
+held in memory and no intermediate ``.gz`` copy is written (unless a
+conditional-request cache keeps one). It reports the bytes received, the
+bytes on disk and the process's peak resident memory.
+
+No module-level side effects.
+"""
+
+import gzip
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zlib
+from dataclasses import dataclass
+
+import requests
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_BYTES = 1 << 20
+
+
+def download_with_retry(url, filename, timeout=30, max_retries=3, fetcher=None):
+    """Download a file with retry logic and exponential backoff."""
+    if fetcher is not None:
+        shutil.copyfile(fetcher.fetch(url, timeout=timeout, verify=False).path, filename)
+        return True
+    for attempt in range(max_retries):
+        try:
+            logger.info("Downloading %s (attempt %d/%d)", url, attempt + 1, max_retries)
+            resp = requests.get(url, verify=False, timeout=timeout)
+            resp.raise_for_status()
+            with open(filename, "wb") as f:
+                f.write(resp.content)
+            return True
+        except requests.RequestException as e:
+            logger.warning("Download attempt %d failed: %s", attempt + 1, e)
+            if attempt == max_retries - 1:
+                raise
+            time.sleep(2 ** attempt)
+    return False
+
+
+@dataclass
+class DownloadReport:
+    """What :func:`download_and_decompress` transferred and kept.
+
+    ``compressed_bytes`` is what came over the network (0 when a cached body
+    was revalidated), ``cached_gzip_bytes`` the size of the ``.gz`` a
+    conditional-request cache keeps on disk next to the XML (0 without one).
+    """
+
+    compressed_bytes: int
+    xml_bytes: int
+    seconds: float
+    peak_rss_bytes: int | None
+    cached_gzip_bytes: int = 0
+
+
+def _peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process so far, where the OS reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _GunzipWriter:
+    """Incremental gunzip of a chunked stream into a binary file.
+
+    Handles multi-member gzip files the way :func:`gzip.open` does, and
+    raises :class:`gzip.BadGzipFile` for corrupt or truncated input.
+    """
+
+    def __init__(self, out):
+        self.out = out
+        self.compressed_bytes = 0
+        self.xml_bytes = 0
+        self._decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+
+    def write(self, chunk: bytes) -> None:
+        self.compressed_bytes += len(chunk)
+        while chunk:
+            try:
+                # Bounded output: a highly compressible chunk must not
+                # inflate into one huge buffer.
+                data = self._decompressor.decompress(chunk, _CHUNK_BYTES)
+            except zlib.error as exc:
+                raise gzip.BadGzipFile(f"corrupt gzip stream: {exc}") from exc
+            self.out.write(data)
+            self.xml_bytes += len(data)
+            chunk = self._decompressor.unconsumed_tail
+            if self._decompressor.eof:
+                chunk = self._decompressor.unused_data
+                if chunk:
+                    self._decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+
+    def close(self) -> None:
+        if not self._decompressor.eof:
+            raise gzip.BadGzipFile("truncated gzip stream")
+
+
+def _stream_into(chunks, dest: str) -> _GunzipWriter:
+    """Gunzip ``chunks`` into ``dest`` atomically (a temp file, then rename)."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(dest)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            writer = _GunzipWriter(out)
+            for chunk in chunks:
+                writer.write(chunk)
+            writer.close()
+        os.replace(tmp, dest)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    return writer
+
+
+def download_and_decompress(url: str, dest: str, *, timeout: int = 30,
+                            max_retries: int = 3, fetcher=None) -> DownloadReport:
+    """Stream the gzip export at ``url`` into the decompressed file ``dest``.
+
+    Parameters
+    ----------
+    url : str
+        Location of the gzip-compressed XML export.
+    dest : str
+        Path of the decompressed XML. Replaced only once the whole export
+        has been received and decompressed.
+    timeout : int
+        Per-request timeout in seconds.
+    max_retries : int
+        Attempts before giving up; a failure mid-stream (including a
+        truncated body) restarts the download, with exponential backoff.
+    fetcher : ConditionalFetcher, optional
+        When given, the export is fetched (conditionally) through its cache and
+        the cached body is decompressed from disk. That body stays in the
+        cache as a second, compressed copy.
+
+    Returns
+    -------
+    DownloadReport
+
+    Raises
+    ------
+    requests.RequestException
+        When every attempt failed to download.
+    gzip.BadGzipFile
+        When the (last) body is not a complete gzip stream.
+    """
+    start = time.perf_counter()
+    cached = None
+    if fetcher is not None:
+        cached = fetcher.fetch(url, timeout=timeout, verify=False)
+        with open(cached.path, "rb") as fh:
+            writer = _stream_into(iter(lambda: fh.read(_CHUNK_BYTES), b""), dest)
+    else:
+        for attempt in range(max_retries):
+            try:
+                logger.info("Streaming %s (attempt %d/%d)", url, attempt + 1, max_retries)
+                with requests.get(url, verify=False, timeout=timeout, stream=True) as resp:
+                    resp.raise_for_status()
+                    writer = _stream_into(resp.iter_content(_CHUNK_BYTES), dest)
+                break
+            except (requests.RequestException, gzip.BadGzipFile) as e:
+                logger.warning("Download attempt %d failed: %s", attempt + 1, e)
+                if attempt == max_retries - 1:
+                    raise
+                time.sleep(2 ** attempt)
+
+    if cached is None:
+        report = DownloadReport(writer.compressed_bytes, writer.xml_bytes,
+                                time.perf_counter() - start, _peak_rss_bytes())
+    else:
+        report = DownloadReport(cached.nbytes, writer.xml_bytes,
+                                time.perf_counter() - start, _peak_rss_bytes(),
+                                cached_gzip_bytes=writer.compressed_bytes)
+    logger.info(
+        "Streamed %s into %s: %d bytes received, %d bytes on disk, %.1fs, peak RSS %s",
+        url, dest, report.compressed_bytes, report.xml_bytes, report.seconds,
+        "unknown" if report.peak_rss_bytes is None
+        else f"{report.peak_rss_bytes / (1 << 20):.0f} MiB",
+    )
+    if cached is not None:
+        logger.info("Cached gzip export kept at %s: %d bytes on disk (%s)",
+                    cached.path, report.cached_gzip_bytes,
+                    "revalidated" if cached.not_modified else "downloaded")
+    return report
@@ -0,0 +1,102 @@
+"""On-disk snapshots of parsed AOP-Wiki XML.
+
+Parsing a full export is pure: the same bytes always give the same
+``ParsedEntities``. A snapshot stores that result (plus the streaming parser's
+side tables) keyed by the SHA-256 of the XML, so a rerun against an unchanged
+file -- the COMPAT gate regenerates twice against one pinned snapshot -- loads
+it instead of parsing again.
+
+Snapshots are versioned against the parser source itself: the fingerprint is
+the hash of ``xml_parser.py``, so any parser change invalidates every existing
+snapshot without anyone remembering to bump a number.
+
+Only the network-free parse is snapshotted. A parse that ran BridgeDb or
+promapping.txt lookups depends on more than the XML bytes.
+
+No module-level side effects. No network calls.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+from aopwiki_rdf.parser import xml_parser
+
+logger = logging.getLogger(__name__)
+
+# Bump when the payload layout changes independently of the parser source.
+SNAPSHOT_FORMAT = 1
+
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+def _sha256_file(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_HASH_CHUNK_BYTES), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def parser_fingerprint() -> str:
+    """Hash of the parser module source plus the snapshot format version."""
+    digest = hashlib.sha256(Path(xml_parser.__file__).read_bytes())
+    digest.update(f'format={SNAPSHOT_FORMAT}'.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def snapshot_path(xml_path, cache_dir) -> Path:
+    """Where the snapshot for ``xml_path`` lives under ``cache_dir``."""
+    return Path(cache_dir) / f'{_sha256_file(xml_path)}.pickle'
+
+
+def load_snapshot(xml_path, cache_dir):
+    """Return ``(ParsedEntities, XmlSideTables)`` for ``xml_path``, or ``None``.
+
+    A missing, unreadable or stale (different parser fingerprint) snapshot is
+    a miss. Unreadable files are deleted so the next save replaces them.
+    """
+    path = snapshot_path(xml_path, cache_dir)
+    if not path.exists():
+        logger.info("Parse snapshot miss: %s", path.name)
+        return None
+    try:
+        with open(path, 'rb') as f:
+            payload = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+        logger.warning("Corrupt parse snapshot %s (%s); deleting", path, e)
+        path.unlink(missing_ok=True)
+        return None
+    if payload.get('parser') != parser_fingerprint():
+        logger.info("Parse snapshot %s is from another parser version; reparsing", path.name)
+        return None
+    logger.info("Parse snapshot hit: loaded %s", path.name)
+    return payload['entities'], payload['side_tables']
+
+
+def save_snapshot(xml_path, cache_dir, entities, side_tables) -> Path:
+    """Write the snapshot for ``xml_path`` atomically and return its path.
+
+    Written to a temporary file in the same directory and renamed into place,
+    so a crash mid-write never leaves a truncated snapshot behind.
+    """
+    path = snapshot_path(xml_path, cache_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        'parser': parser_fingerprint(),
+        'entities': entities,
+        'side_tables': side_tables,
+    }
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    logger.info("Parse snapshot written: %s", path)
+    return path
@@ -3,6 +3,11 @@
 Extracted from AOP-Wiki_XML_to_RDF_conversion.py (lines 347-1201).
 Parses AOP-Wiki XML into typed entity dictionaries.
 
+Two entry points share the same per-element section parsers:
+:func:`parse_aopwiki_xml` loads the whole tree, and
+:func:`stream_aopwiki_xml` walks the file once with ``iterparse``, releasing
+each top-level element as soon as it has been converted.
+
 No module-level side effects. No logging.basicConfig(). No network calls at import.
 """
 
@@ -14,7 +19,7 @@ import time
 import urllib.request
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
-from xml.etree.ElementTree import parse
+from xml.etree.ElementTree import iterparse, parse
 
 from aopwiki_rdf.config import PipelineConfig
 from aopwiki_rdf.utils import clean_html_tags, validate_entity_counts, validate_required_fields, validate_xml_structure
@@ -25,6 +30,33 @@ logger = logging.getLogger(__name__)
 AOPXML_NS = '{http://www.aopkb.org/aop-xml}'
 HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
 
+# Ontology source -> (CURIE prefix, characters to strip from source-id).
+_SOURCE_PREFIX_MAP_BP = {
+    '"GO"': ('go:', 3),
+    '"MI"': ('mi:', 0),
+    '"MP"': ('mp:', 3),
+    '"MESH"': ('mesh:', 0),
+    '"HP"': ('hp:', 3),
+    '"PCO"': ('pco:', 4),
+    '"NBO"': ('nbo:', 4),
+    '"VT"': ('vt:', 3),
+    '"RBO"': ('rbo:', 4),
+    '"NCI"': ('nci:', 4),
+    '"IDO"': ('ido:', 4),
+}
+
+_SOURCE_PREFIX_MAP_BO = {
+    '"PR"': ('pr:', 3),
+    '"CL"': ('cl:', 3),
+    '"MESH"': ('mesh:', 0),
+    '"GO"': ('go:', 3),
+    '"UBERON"': ('uberon:', 7),
+    '"CHEBI"': ('chebio:', 6),
+    '"MP"': ('mp:', 3),
+    '"FMA"': ('fma:', 4),
+    '"PCO"': ('pco:', 4),
+}
+
 
 def _get_ke_id(element):
     """Resolve key event ID from element regardless of XML schema version.
@@ -57,9 +89,588 @@ class ParsedEntities:
     prodict: Dict[str, list]
 
 
-# --- Main parser function ---
+@dataclass
+class XmlSideTables:
+    """The parts of the XML tree the mapping stages still read after parsing.
+
+    Gene mapping walks Key Events and KERs in document order; everything else
+    it needs is already in the entity dicts. Keeping just the two ID lists lets
+    the pipeline drop the element tree once parsing is done.
+    """
+    ke_ids: List[str] = field(default_factory=list)
+    ker_ids: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_root(cls, root, aopxml: str = AOPXML_NS) -> 'XmlSideTables':
+        """Build the side tables from an already-parsed tree root."""
+        return cls(
+            ke_ids=[ke.get('id') for ke in root.findall(aopxml + 'key-event')],
+            ker_ids=[ker.get('id') for ker in root.findall(aopxml + 'key-event-relationship')],
+        )
+
+
+# --- Per-element section parsers ---
+#
+# Each converts ONE top-level element into the dict(s) it populates. Both the
+# tree parser and the streaming parser drive these, in the same section order,
+# so the two produce identical dicts (including insertion order).
+
+def _parse_refs(vendor, refs):
+    """Read the vendor-specific ID -> AOP-Wiki ID reference tables (monolith lines 354-365)."""
+    aopxml = AOPXML_NS
+    for ref in vendor.findall(aopxml + 'aop-reference'):
+        refs['AOP'][ref.get('id')] = ref.get('aop-wiki-id')
+    for ref in vendor.findall(aopxml + 'key-event-reference'):
+        refs['KE'][ref.get('id')] = ref.get('aop-wiki-id')
+    for ref in vendor.findall(aopxml + 'key-event-relationship-reference'):
+        refs['KER'][ref.get('id')] = ref.get('aop-wiki-id')
+    for ref in vendor.findall(aopxml + 'stressor-reference'):
+        refs['Stressor'][ref.get('id')] = ref.get('aop-wiki-id')
+
+
+def _parse_aop(AOP, refs, aopdict, kedict):
+    """Convert one <aop> element (monolith lines 374-464)."""
+    links = _convert_aop(AOP, aopdict)
+    _resolve_aop(AOP.get('id'), links, refs, aopdict, kedict)
+
+
+def _convert_aop(AOP, aopdict):
+    """The reference-free part of one <aop> element.
+
+    Every key goes into ``aopdict`` in its final position, the ones derived
+    from the vendor reference tables as ``None`` and the key-event,
+    relationship and stressor maps empty. Returns the raw IDs and texts
+    :func:`_resolve_aop` fills them from, and the taxonomy applicability
+    :func:`_resolve_aop_taxonomy` reads, so the element can be dropped.
+    """
+    aopxml = AOPXML_NS
+    aop_id = AOP.get('id')
+    aop = aopdict[aop_id] = {}
+    aop['dc:identifier'] = None
+    aop['rdfs:label'] = None
+    aop['foaf:page'] = None
+    title_elem = AOP.find(aopxml + 'title')
+    aop['dc:title'] = '"' + (title_elem.text if title_elem is not None and title_elem.text else '') + '"'
+    short_name_elem = AOP.find(aopxml + 'short-name')
+    aop['dcterms:alternative'] = short_name_elem.text if short_name_elem is not None else None
+    aop['dc:description'] = []
+    if AOP.find(aopxml + 'background') is not None:
+        if AOP.find(aopxml + 'background').text is not None:
+            aop['dc:description'].append('"""' + HTML_TAG_PATTERN.sub('', AOP.find(aopxml + 'background').text) + '"""')
+    authors_elem = AOP.find(aopxml + 'authors')
+    if authors_elem is not None and authors_elem.text is not None:
+        aop['dc:creator'] = '"""' + HTML_TAG_PATTERN.sub('', authors_elem.text) + '"""'
+    abstract_elem = AOP.find(aopxml + 'abstract')
+    if abstract_elem is not None and abstract_elem.text is not None:
+        aop['dcterms:abstract'] = '"""' + HTML_TAG_PATTERN.sub('', abstract_elem.text) + '"""'
+    status_elem = AOP.find(aopxml + 'status')
+    if status_elem is not None:
+        wiki_status = status_elem.find(aopxml + 'wiki-status')
+        if wiki_status is not None:
+            aop['dcterms:accessRights'] = '"' + wiki_status.text + '"'
+        oecd_status = status_elem.find(aopxml + 'oecd-status')
+        if oecd_status is not None:
+            aop['oecd-status'] = '"' + oecd_status.text + '"'
+        saaop_status = status_elem.find(aopxml + 'saaop-status')
+        if saaop_status is not None:
+            aop['saaop-status'] = '"' + saaop_status.text + '"'
+        wiki_license_el = status_elem.find(aopxml + 'wiki-license')
+        if wiki_license_el is not None and wiki_license_el.text:
+            aop['_wiki_license'] = wiki_license_el.text
+    oecd_proj_elem = AOP.find(aopxml + 'oecd-project')
+    aop['oecd-project'] = oecd_proj_elem.text if oecd_proj_elem is not None else None
+    source_elem = AOP.find(aopxml + 'source')
+    aop['dc:source'] = source_elem.text if source_elem is not None else None
+    created_elem = AOP.find(aopxml + 'creation-timestamp')
+    aop['dcterms:created'] = created_elem.text if created_elem is not None else None
+    modified_elem = AOP.find(aopxml + 'last-modification-timestamp')
+    aop['dcterms:modified'] = modified_elem.text if modified_elem is not None else None
+    for appl in AOP.findall(aopxml + 'applicability'):
+        for sex in appl.findall(aopxml + 'sex'):
+            if 'pato:0000047' not in aop:
+                aop['pato:0000047'] = [[sex.find(aopxml + 'evidence').text, sex.find(aopxml + 'sex').text]]
+            else:
+                aop['pato:0000047'].append([sex.find(aopxml + 'evidence').text, sex.find(aopxml + 'sex').text])
+        for life in appl.findall(aopxml + 'life-stage'):
+            if 'aopo:LifeStageContext' not in aop:
+                aop['aopo:LifeStageContext'] = [[life.find(aopxml + 'evidence').text, life.find(aopxml + 'life-stage').text]]
+            else:
+                aop['aopo:LifeStageContext'].append([life.find(aopxml + 'evidence').text, life.find(aopxml + 'life-stage').text])
+    links = {'key-events': [], 'relationships': [], 'mies': [], 'aos': [], 'stressors': [],
+             'taxonomy': _aop_taxa(AOP)}
+    aop['aopo:has_key_event'] = {}
+    if AOP.find(aopxml + 'key-events') is not None:
+        for KE in AOP.find(aopxml + 'key-events').findall(aopxml + 'key-event'):
+            links['key-events'].append(_get_ke_id(KE))
+    aop['aopo:has_key_event_relationship'] = {}
+    if AOP.find(aopxml + 'key-event-relationships') is not None:
+        for KER in AOP.find(aopxml + 'key-event-relationships').findall(aopxml + 'relationship'):
+            links['relationships'].append((KER.get('id'), KER.find(aopxml + 'adjacency').text,
+                                           KER.find(aopxml + 'quantitative-understanding-value').text,
+                                           KER.find(aopxml + 'evidence').text))
+    aop['aopo:has_molecular_initiating_event'] = {}
+    for MIE in AOP.findall(aopxml + 'molecular-initiating-event'):
+        esc_elem = MIE.find(aopxml + 'evidence-supporting-chemical-initiation')
+        links['mies'].append((_get_ke_id(MIE), esc_elem.text if esc_elem is not None else None))
+    aop['aopo:has_adverse_outcome'] = {}
+    for AO in AOP.findall(aopxml + 'adverse-outcome'):
+        examples_elem = AO.find(aopxml + 'examples')
+        links['aos'].append((_get_ke_id(AO), examples_elem.text if examples_elem is not None else None))
+    aop['nci:C54571'] = {}
+    if AOP.find(aopxml + 'aop-stressors') is not None:
+        for stressor in AOP.find(aopxml + 'aop-stressors').findall(aopxml + 'aop-stressor'):
+            links['stressors'].append((stressor.get('stressor-id'), stressor.find(aopxml + 'evidence').text))
+    overall_assessment = AOP.find(aopxml + 'overall-assessment')
+    if overall_assessment is not None:
+        oa_desc = overall_assessment.find(aopxml + 'description')
+        if oa_desc is not None and oa_desc.text is not None:
+            aop['nci:C25217'] = '"""' + HTML_TAG_PATTERN.sub('', oa_desc.text) + '"""'
+        oa_ke_ess = overall_assessment.find(aopxml + 'key-event-essentiality-summary')
+        if oa_ke_ess is not None and oa_ke_ess.text is not None:
+            aop['nci:C48192'] = '"""' + HTML_TAG_PATTERN.sub('', oa_ke_ess.text) + '"""'
+        oa_appl = overall_assessment.find(aopxml + 'applicability')
+        if oa_appl is not None and oa_appl.text is not None:
+            aop['aopo:AopContext'] = '"""' + HTML_TAG_PATTERN.sub('', oa_appl.text) + '"""'
+        oa_woe = overall_assessment.find(aopxml + 'weight-of-evidence-summary')
+        if oa_woe is not None and oa_woe.text is not None:
+            aop['aopo:has_evidence'] = '"""' + HTML_TAG_PATTERN.sub('', oa_woe.text) + '"""'
+        oa_quant = overall_assessment.find(aopxml + 'quantitative-considerations')
+        if oa_quant is not None and oa_quant.text is not None:
+            aop['edam:operation_3799'] = '"""' + HTML_TAG_PATTERN.sub('', oa_quant.text) + '"""'
+    pot_appl_elem = AOP.find(aopxml + 'potential-applications')
+    if pot_appl_elem is not None and pot_appl_elem.text is not None:
+        aop['nci:C25725'] = '"""' + HTML_TAG_PATTERN.sub('', pot_appl_elem.text) + '"""'
+    return links
+
+
+def _resolve_aop(aop_id, links, refs, aopdict, kedict):
+    """Fill one AOP's reference-derived fields from :func:`_convert_aop`'s links.
+
+    Key events, MIEs and AOs whose IDs are not in the reference tables are
+    skipped; each MIE with chemical-initiation evidence and each AO with
+    examples seeds its Key Event in ``kedict``.
+    """
+    aop = aopdict[aop_id]
+    aop['dc:identifier'] = 'aop:' + refs['AOP'][aop_id]
+    aop['rdfs:label'] = '"AOP ' + refs['AOP'][aop_id] + '"'
+    aop['foaf:page'] = '<https://identifiers.org/aop/' + refs['AOP'][aop_id] + '>'
+    for ke_id in links['key-events']:
+        if ke_id is None or ke_id not in refs['KE']:
+            logger.warning(f"Skipping KE with unresolvable ID in AOP {aop_id}")
+            continue
+        aop['aopo:has_key_event'][ke_id] = {'dc:identifier': 'aop.events:' + refs['KE'][ke_id]}
+    for ker_id, adjacency, quantitative, evidence in links['relationships']:
+        aop['aopo:has_key_event_relationship'][ker_id] = {
+            'dc:identifier': 'aop.relationships:' + refs['KER'][ker_id],
+            'adjacency': adjacency,
+            'quantitative-understanding-value': quantitative,
+            'aopo:has_evidence': evidence,
+        }
+    for section, kind, key in (('mies', 'MIE', 'aopo:has_molecular_initiating_event'),
+                               ('aos', 'AO', 'aopo:has_adverse_outcome')):
+        for ke_id, text in links[section]:
+            if ke_id is None or ke_id not in refs['KE']:
+                logger.warning(f"Skipping {kind} with unresolvable ID in AOP {aop_id}")
+                continue
+            aop[key][ke_id] = {'dc:identifier': 'aop.events:' + refs['KE'][ke_id]}
+            aop['aopo:has_key_event'][ke_id] = {'dc:identifier': 'aop.events:' + refs['KE'][ke_id]}
+            if text is not None:
+                kedict[ke_id] = {}
+                aop['dc:description'].append('"""' + HTML_TAG_PATTERN.sub('', text) + '"""')
+    for stressor_id, evidence in links['stressors']:
+        aop['nci:C54571'][stressor_id] = {
+            'dc:identifier': 'aop.stressor:' + refs['Stressor'][stressor_id],
+            'aopo:has_evidence': evidence,
+        }
+
+
+def _parse_chemical_cas(che, chedict, listofcas, chemicals_to_map, cas_to_chemical_id):
+    """CAS pass for one <chemical> element (monolith lines 474-823)."""
+    aopxml = AOPXML_NS
+    chedict[che.get('id')] = {}
+    if che.find(aopxml + 'casrn') is not None:
+        if 'NOCAS' not in che.find(aopxml + 'casrn').text:
+            cas_number = che.find(aopxml + 'casrn').text
+            chedict[che.get('id')]['dc:identifier'] = 'cas:' + cas_number
+            listofcas.append('cas:' + cas_number)
+            chedict[che.get('id')]['cheminf:000446'] = '"' + cas_number + '"'
+
+            # Collect for batch processing
+            chemicals_to_map.append((che.get('id'), cas_number))
+            if cas_number not in cas_to_chemical_id:
+                cas_to_chemical_id[cas_number] = []
+            cas_to_chemical_id[cas_number].append(che.get('id'))
+        else:
+            chedict[che.get('id')]['dc:identifier'] = '"' + che.find(aopxml + 'casrn').text + '"'
+
+
+def _parse_chemical_properties(che, chedict, listofinchikey, listofcomptox):
+    """InChI key, name, DSSTox and synonym pass for one <chemical> element."""
+    aopxml = AOPXML_NS
+    if che.find(aopxml + 'jchem-inchi-key') is not None:
+        chedict[che.get('id')]['cheminf:000059'] = 'inchikey:' + str(che.find(aopxml + 'jchem-inchi-key').text)
+        listofinchikey.append('inchikey:' + str(che.find(aopxml + 'jchem-inchi-key').text))
+    if che.find(aopxml + 'preferred-name') is not None:
+        chedict[che.get('id')]['dc:title'] = '"' + che.find(aopxml + 'preferred-name').text + '"'
+    if che.find(aopxml + 'dsstox-id') is not None:
+        chedict[che.get('id')]['cheminf:000568'] = 'comptox:' + che.find(aopxml + 'dsstox-id').text
+        listofcomptox.append('comptox:' + che.find(aopxml + 'dsstox-id').text)
+    if che.find(aopxml + 'synonyms') is not None:
+        chedict[che.get('id')]['dcterms:alternative'] = []
+        for synonym in che.find(aopxml + 'synonyms').findall(aopxml + 'synonym'):
+            chedict[che.get('id')]['dcterms:alternative'].append(synonym.text[:-1])
+
+
+def _parse_stressor(stressor, refs, strdict):
+    """Convert one <stressor> element (monolith lines 826-847)."""
+    _convert_stressor(stressor, strdict)
+    _resolve_stressor(stressor.get('id'), refs, strdict)
+
+
+def _convert_stressor(stressor, strdict):
+    """One <stressor> element, its reference-derived fields left ``None``."""
+    aopxml = AOPXML_NS
+    strdict[stressor.get('id')] = {}
+    strdict[stressor.get('id')]['dc:identifier'] = None
+    strdict[stressor.get('id')]['rdfs:label'] = None
+    strdict[stressor.get('id')]['foaf:page'] = None
+    strdict[stressor.get('id')]['dc:title'] = '"' + stressor.find(aopxml + 'name').text + '"'
+    if stressor.find(aopxml + 'description').text is not None:
+        strdict[stressor.get('id')]['dc:description'] = '"""' + HTML_TAG_PATTERN.sub('', stressor.find(aopxml + 'description').text) + '"""'
+    strdict[stressor.get('id')]['dcterms:created'] = stressor.find(aopxml + 'creation-timestamp').text
+    strdict[stressor.get('id')]['dcterms:modified'] = stressor.find(aopxml + 'last-modification-timestamp').text
+    strdict[stressor.get('id')]['aopo:has_chemical_entity'] = []
+    strdict[stressor.get('id')]['linktochemical'] = []
+    if stressor.find(aopxml + 'chemicals') is not None:
+        for chemical in stressor.find(aopxml + 'chemicals').findall(aopxml + 'chemical-initiator'):
+            strdict[stressor.get('id')]['aopo:has_chemical_entity'].append('"' + chemical.get('user-term') + '"')
+            strdict[stressor.get('id')]['linktochemical'].append(chemical.get('chemical-id'))
+
+
+def _resolve_stressor(stressor_id, refs, strdict):
+    """Fill one stressor's identifier, label and page from the reference tables."""
+    strdict[stressor_id]['dc:identifier'] = 'aop.stressor:' + refs['Stressor'][stressor_id]
+    strdict[stressor_id]['rdfs:label'] = '"Stressor ' + refs['Stressor'][stressor_id] + '"'
+    strdict[stressor_id]['foaf:page'] = '<https://identifiers.org/aop.stressor/' + refs['Stressor'][stressor_id] + '>'
+
+
+def _parse_taxonomy(tax, taxdict):
+    """Convert one <taxonomy> element (monolith lines 850-865)."""
+    aopxml = AOPXML_NS
+    taxdict[tax.get('id')] = {}
+    taxdict[tax.get('id')]['dc:source'] = tax.find(aopxml + 'source').text
+    taxdict[tax.get('id')]['dc:title'] = tax.find(aopxml + 'name').text
+    if taxdict[tax.get('id')]['dc:source'] == 'NCBI':
+        taxdict[tax.get('id')]['dc:identifier'] = 'ncbitaxon:' + tax.find(aopxml + 'source-id').text
+    elif taxdict[tax.get('id')]['dc:source'] is not None:
+        taxdict[tax.get('id')]['dc:identifier'] = '"' + tax.find(aopxml + 'source-id').text + '"'
+    else:
+        taxdict[tax.get('id')]['dc:identifier'] = '"' + tax.find(aopxml + 'source-id').text + '"'
+
+
+def _parse_aop_taxonomy(AOP, aopdict, taxdict):
+    """Attach taxonomic applicability to an already-parsed AOP (monolith lines 868-880)."""
+    _resolve_aop_taxonomy(AOP.get('id'), _aop_taxa(AOP), aopdict, taxdict)
+
+
+def _aop_taxa(AOP):
+    """``[(taxonomy_id, evidence)]`` for an <aop>'s taxonomic applicability."""
+    aopxml = AOPXML_NS
+    return [(tax.get('taxonomy-id'), tax.find(aopxml + 'evidence').text)
+            for appl in AOP.findall(aopxml + 'applicability')
+            for tax in appl.findall(aopxml + 'taxonomy')]
+
+
+def _resolve_aop_taxonomy(aop_id, taxa, aopdict, taxdict):
+    """Append ``ncbitaxon:131567`` to one AOP from its :func:`_aop_taxa`."""
+    for tax_id, evidence in taxa:
+        if 'dc:identifier' in taxdict[tax_id]:
+            aopdict[aop_id].setdefault('ncbitaxon:131567', []).append(
+                [tax_id, evidence, taxdict[tax_id]['dc:identifier'],
+                 taxdict[tax_id]['dc:source'], taxdict[tax_id]['dc:title']])
+
+
+def _parse_biological_action(bioact, bioactdict):
+    """Convert one <biological-action> element (monolith lines 883-897)."""
+    aopxml = AOPXML_NS
+    bioactdict[bioact.get('id')] = {}
+    bioactdict[bioact.get('id')]['dc:source'] = '"' + bioact.find(aopxml + 'source').text + '"'
+    bioactdict[bioact.get('id')]['dc:title'] = '"' + bioact.find(aopxml + 'name').text + '"'
+    bioactdict[bioact.get('id')]['dc:identifier'] = '"' + bioact.find(aopxml + 'name').text + '"'
+
+
+def _parse_biological_process(biopro, bioprodict):
+    """Convert one <biological-process> element (monolith lines 902-949)."""
+    aopxml = AOPXML_NS
+    biopro_id = biopro.get('id')
+    bioprodict[biopro_id] = {}
+
+    source = f'"{biopro.find(aopxml + "source").text}"'
+    name = f'"{biopro.find(aopxml + "name").text}"'
+    source_id = biopro.find(aopxml + 'source-id').text
+
+    bioprodict[biopro_id]['dc:source'] = source
+    bioprodict[biopro_id]['dc:title'] = name
+
+    if source in _SOURCE_PREFIX_MAP_BP:
+        prefix, offset = _SOURCE_PREFIX_MAP_BP[source]
+        identifier = prefix + source_id[offset:]
+        bioprodict[biopro_id]['dc:identifier'] = identifier
+    else:
+        bioprodict[biopro_id]['dc:identifier'] = source_id
+
+
+def _parse_biological_object(bioobj, bioobjdict, prolist):
+    """Convert one <biological-object> element (monolith lines 954-1005)."""
+    aopxml = AOPXML_NS
+    bioobj_id = bioobj.get('id')
+    bioobjdict[bioobj_id] = {}
+
+    source = f'"{bioobj.find(aopxml + "source").text}"'
+    name = f'"{bioobj.find(aopxml + "name").text}"'
+    source_id = bioobj.find(aopxml + 'source-id').text
+
+    bioobjdict[bioobj_id]['dc:source'] = source
+    bioobjdict[bioobj_id]['dc:title'] = name
+
+    if source in _SOURCE_PREFIX_MAP_BO:
+        prefix, offset = _SOURCE_PREFIX_MAP_BO[source]
+        identifier = prefix + source_id[offset:]
+        bioobjdict[bioobj_id]['dc:identifier'] = identifier
+
+        if source == '"PR"':
+            prolist.append(identifier)
+    else:
+        bioobjdict[bioobj_id]['dc:identifier'] = f'"{source_id}"'
+
+
+def _parse_key_event(ke, refs, kedict, taxdict, strdict, bioprodict,
+                     bioobjdict, bioactdict, celldict, organdict):
+    """Convert one <key-event> element (monolith lines 1067-1152)."""
+    _convert_key_event(ke, kedict, celldict, organdict)
+    _resolve_key_event(ke.get('id'), refs, kedict, taxdict, strdict, bioprodict,
+                       bioobjdict, bioactdict)
+
+
+def _convert_key_event(ke, kedict, celldict, organdict):
+    """The reference-free part of one <key-event> element.
+
+    Fields taken from the reference tables, taxonomies, stressors and
+    biological components are left as ``None`` placeholders and raw IDs for
+    :func:`_resolve_key_event`.
+    """
+    aopxml = AOPXML_NS
+    if ke.get('id') not in kedict:
+        kedict[ke.get('id')] = {}
+    kedict[ke.get('id')]['dc:identifier'] = None
+    kedict[ke.get('id')]['rdfs:label'] = None
+    kedict[ke.get('id')]['foaf:page'] = None
+    kedict[ke.get('id')]['dc:title'] = '"' + ke.find(aopxml + 'title').text + '"'
+    kedict[ke.get('id')]['dcterms:alternative'] = ke.find(aopxml + 'short-name').text
+    kedict[ke.get('id')]['nci:C25664'] = '"""' + ke.find(aopxml + 'biological-organization-level').text + '"""'
+    if ke.find(aopxml + 'description').text is not None:
+        kedict[ke.get('id')]['dc:description'] = '"""' + HTML_TAG_PATTERN.sub('', ke.find(aopxml + 'description').text) + '"""'
+    if ke.find(aopxml + 'measurement-methodology').text is not None:
+        kedict[ke.get('id')]['mmo:0000000'] = '"""' + HTML_TAG_PATTERN.sub('', ke.find(aopxml + 'measurement-methodology').text) + '"""'
+    # Coverage gap-fix (Plan 09-03, XML-02): KE-level taxonomic-applicability
+    # evidence free text (also present at KER level above). Additive, guarded.
+    ke_esta = ke.find(aopxml + 'evidence-supporting-taxonomic-applicability')
+    if ke_esta is not None and ke_esta.text is not None:
+        kedict[ke.get('id')]['nci:C17469'] = '"""' + HTML_TAG_PATTERN.sub('', ke_esta.text) + '"""'
+    kedict[ke.get('id')]['biological-organization-level'] = ke.find(aopxml + 'biological-organization-level').text
+    kedict[ke.get('id')]['dc:source'] = ke.find(aopxml + 'source').text
+    for appl in ke.findall(aopxml + 'applicability'):
+        for sex in appl.findall(aopxml + 'sex'):
+            if 'pato:0000047' not in kedict[ke.get('id')]:
+                kedict[ke.get('id')]['pato:0000047'] = [[sex.find(aopxml + 'evidence').text, sex.find(aopxml + 'sex').text]]
+            else:
+                kedict[ke.get('id')]['pato:0000047'].append([sex.find(aopxml + 'evidence').text, sex.find(aopxml + 'sex').text])
+        for life in appl.findall(aopxml + 'life-stage'):
+            if 'aopo:LifeStageContext' not in kedict[ke.get('id')]:
+                kedict[ke.get('id')]['aopo:LifeStageContext'] = [[life.find(aopxml + 'evidence').text, life.find(aopxml + 'life-stage').text]]
+            else:
+                kedict[ke.get('id')]['aopo:LifeStageContext'].append([life.find(aopxml + 'evidence').text, life.find(aopxml + 'life-stage').text])
+        for tax in appl.findall(aopxml + 'taxonomy'):
+            kedict[ke.get('id')].setdefault('ncbitaxon:131567', []).append(
+                [tax.get('taxonomy-id'), tax.find(aopxml + 'evidence').text, None, None, None])
+    kedict[ke.get('id')]['biological-events'] = []
+    kedict[ke.get('id')]['biological-event'] = {}
+    kedict[ke.get('id')]['biological-event']['go:0008150'] = []
+    kedict[ke.get('id')]['biological-event']['pato:0001241'] = []
+    kedict[ke.get('id')]['biological-event']['pato:0000001'] = []
+    bioevents = ke.find(aopxml + 'biological-events')
+    if bioevents is not None:
+        for event in bioevents.findall(aopxml + 'biological-event'):
+            # Raw component IDs until _resolve_key_event.
+            event_entry = {}
+            for key in ('process', 'object', 'action'):
+                if event.get(key + '-id') is not None:
+                    event_entry[key] = event.get(key + '-id')
+            kedict[ke.get('id')]['biological-events'].append(event_entry)
+    if ke.find(aopxml + 'cell-term') is not None:
+        kedict[ke.get('id')]['aopo:CellTypeContext'] = {}
+        kedict[ke.get('id')]['aopo:CellTypeContext']['dc:source'] = '"' + ke.find(aopxml + 'cell-term').find(aopxml + 'source').text + '"'
+        kedict[ke.get('id')]['aopo:CellTypeContext']['dc:title'] = '"' + ke.find(aopxml + 'cell-term').find(aopxml + 'name').text + '"'
+        if kedict[ke.get('id')]['aopo:CellTypeContext']['dc:source'] == '"CL"':
+            kedict[ke.get('id')]['aopo:CellTypeContext']['dc:identifier'] = ['cl:' + ke.find(aopxml + 'cell-term').find(aopxml + 'source-id').text[3:], ke.find(aopxml + 'cell-term').find(aopxml + 'source-id').text]
+        elif kedict[ke.get('id')]['aopo:CellTypeContext']['dc:source'] == '"UBERON"':
+            kedict[ke.get('id')]['aopo:CellTypeContext']['dc:identifier'] = ['uberon:' + ke.find(aopxml + 'cell-term').find(aopxml + 'source-id').text[7:], ke.find(aopxml + 'cell-term').find(aopxml + 'source-id').text]
+        else:
+            kedict[ke.get('id')]['aopo:CellTypeContext']['dc:identifier'] = ['"' + ke.find(aopxml + 'cell-term').find(aopxml + 'source-id').text + '"', 'placeholder']
+        # Also store in celldict for standalone access
+        celldict[ke.get('id')] = kedict[ke.get('id')]['aopo:CellTypeContext']
+    if ke.find(aopxml + 'organ-term') is not None:
+        kedict[ke.get('id')]['aopo:OrganContext'] = {}
+        kedict[ke.get('id')]['aopo:OrganContext']['dc:source'] = '"' + ke.find(aopxml + 'organ-term').find(aopxml + 'source').text + '"'
+        kedict[ke.get('id')]['aopo:OrganContext']['dc:title'] = '"' + ke.find(aopxml + 'organ-term').find(aopxml + 'name').text + '"'
+        if kedict[ke.get('id')]['aopo:OrganContext']['dc:source'] == '"UBERON"':
+            kedict[ke.get('id')]['aopo:OrganContext']['dc:identifier'] = ['uberon:' + ke.find(aopxml + 'organ-term').find(aopxml + 'source-id').text[7:], ke.find(aopxml + 'organ-term').find(aopxml + 'source-id').text]
+        else:
+            kedict[ke.get('id')]['aopo:OrganContext']['dc:identifier'] = [
+                '"' + ke.find(aopxml + 'organ-term').find(aopxml + 'source-id').text + '"', 'placeholder']
+        # Also store in organdict for standalone access
+        organdict[ke.get('id')] = kedict[ke.get('id')]['aopo:OrganContext']
+    if ke.find(aopxml + 'key-event-stressors') is not None:
+        kedict[ke.get('id')]['nci:C54571'] = {}
+        for stressor in ke.find(aopxml + 'key-event-stressors').findall(aopxml + 'key-event-stressor'):
+            kedict[ke.get('id')]['nci:C54571'][stressor.get('stressor-id')] = {}
+            kedict[ke.get('id')]['nci:C54571'][stressor.get('stressor-id')]['dc:identifier'] = None
+            kedict[ke.get('id')]['nci:C54571'][stressor.get('stressor-id')]['aopo:has_evidence'] = stressor.find(aopxml + 'evidence').text
+
+
+def _resolve_taxa(entity, taxdict):
+    """Fill the ``ncbitaxon:131567`` placeholders of a converted KE or KER."""
+    taxa = [tax for tax in entity.get('ncbitaxon:131567', ()) if 'dc:identifier' in taxdict[tax[0]]]
+    for tax in taxa:
+        tax[2:] = [taxdict[tax[0]]['dc:identifier'], taxdict[tax[0]]['dc:source'],
+                   taxdict[tax[0]]['dc:title']]
+    if 'ncbitaxon:131567' in entity:
+        if taxa:
+            entity['ncbitaxon:131567'] = taxa
+        else:
+            del entity['ncbitaxon:131567']
+
+
+def _resolve_key_event(ke_id, refs, kedict, taxdict, strdict, bioprodict,
+                       bioobjdict, bioactdict):
+    """Fill one converted Key Event's references (see :func:`_convert_key_event`)."""
+    ke = kedict[ke_id]
+    ke['dc:identifier'] = 'aop.events:' + refs['KE'][ke_id]
+    ke['rdfs:label'] = '"KE ' + refs['KE'][ke_id] + '"'
+    ke['foaf:page'] = '<https://identifiers.org/aop.events/' + refs['KE'][ke_id] + '>'
+    _resolve_taxa(ke, taxdict)
+    components = (('process', bioprodict, 'go:0008150'), ('object', bioobjdict, 'pato:0001241'),
+                  ('action', bioactdict, 'pato:0000001'))
+    for event_entry in ke['biological-events']:
+        for key, component_dict, predicate in components:
+            if key in event_entry:
+                event_entry[key] = component_dict[event_entry[key]]['dc:identifier']
+                ke['biological-event'][predicate].append(event_entry[key])
+    for stressor_id, stressor in ke.get('nci:C54571', {}).items():
+        stressor['dc:identifier'] = strdict[stressor_id]['dc:identifier']
+
+
+def _parse_ker(ker, refs, kerdict, taxdict):
+    """Convert one <key-event-relationship> element (monolith lines 1155-1201)."""
+    _convert_ker(ker, kerdict)
+    _resolve_ker(ker.get('id'), refs, kerdict, taxdict)
+
+
+def _convert_ker(ker, kerdict):
+    """One <key-event-relationship> element, references left for :func:`_resolve_ker`."""
+    aopxml = AOPXML_NS
+    kerdict[ker.get('id')] = {}
+    kerdict[ker.get('id')]['dc:identifier'] = None
+    kerdict[ker.get('id')]['rdfs:label'] = None
+    kerdict[ker.get('id')]['foaf:page'] = None
+    kerdict[ker.get('id')]['dc:source'] = ker.find(aopxml + 'source').text
+    kerdict[ker.get('id')]['dcterms:created'] = ker.find(aopxml + 'creation-timestamp').text
+    kerdict[ker.get('id')]['dcterms:modified'] = ker.find(aopxml + 'last-modification-timestamp').text
+    if ker.find(aopxml + 'description').text is not None:
+        kerdict[ker.get('id')]['dc:description'] = '"""' + HTML_TAG_PATTERN.sub('', ker.find(aopxml + 'description').text) + '"""'
+    for weight in ker.findall(aopxml + 'weight-of-evidence'):
+        if weight.find(aopxml + 'biological-plausibility').text is not None:
+            kerdict[ker.get('id')]['nci:C80263'] = '"""' + HTML_TAG_PATTERN.sub('', weight.find(aopxml + 'biological-plausibility').text) + '"""'
+        if weight.find(aopxml + 'emperical-support-linkage').text is not None:
+            kerdict[ker.get('id')]['edam:data_2042'] = '"""' + HTML_TAG_PATTERN.sub('', weight.find(aopxml + 'emperical-support-linkage').text) + '"""'
+        if weight.find(aopxml + 'uncertainties-or-inconsistencies').text is not None:
+            kerdict[ker.get('id')]['nci:C71478'] = '"""' + HTML_TAG_PATTERN.sub('', weight.find(aopxml + 'uncertainties-or-inconsistencies').text) + '"""'
+    # Coverage gap-fixes (Plan 09-03, XML-02): KER-level free-text WoE /
+    # quantitative-understanding sub-elements that were present in the XML
+    # but never mapped to RDF. Each is additive and guarded with is not None.
+    ecs = ker.find(aopxml + 'evidence-collection-strategy')
+    if ecs is not None and ecs.text is not None:
+        kerdict[ker.get('id')]['nci:C103159'] = '"""' + HTML_TAG_PATTERN.sub('', ecs.text) + '"""'
+    kmf = ker.find(aopxml + 'known-modulating-factors')
+    if kmf is not None and kmf.text is not None:
+        kerdict[ker.get('id')]['nci:C68821'] = '"""' + HTML_TAG_PATTERN.sub('', kmf.text) + '"""'
+    esta = ker.find(aopxml + 'evidence-supporting-taxonomic-applicability')
+    if esta is not None and esta.text is not None:
+        kerdict[ker.get('id')]['nci:C17469'] = '"""' + HTML_TAG_PATTERN.sub('', esta.text) + '"""'
+    qu = ker.find(aopxml + 'quantitative-understanding')
+    if qu is not None:
+        qu_desc = qu.find(aopxml + 'description')
+        if qu_desc is not None and qu_desc.text is not None:
+            kerdict[ker.get('id')]['edam:operation_3799'] = '"""' + HTML_TAG_PATTERN.sub('', qu_desc.text) + '"""'
+        rrr = qu.find(aopxml + 'response-response-relationship')
+        if rrr is not None and rrr.text is not None:
+            kerdict[ker.get('id')]['edam:operation_3438'] = '"""' + HTML_TAG_PATTERN.sub('', rrr.text) + '"""'
+        ts = qu.find(aopxml + 'time-scale')
+        if ts is not None and ts.text is not None:
+            kerdict[ker.get('id')]['nci:C25207'] = '"""' + HTML_TAG_PATTERN.sub('', ts.text) + '"""'
+        ffl = qu.find(aopxml + 'feedforward-feedback-loops')
+        if ffl is not None and ffl.text is not None:
+            kerdict[ker.get('id')]['nci:C25343'] = '"""' + HTML_TAG_PATTERN.sub('', ffl.text) + '"""'
+    kerdict[ker.get('id')]['aopo:has_upstream_key_event'] = {}
+    kerdict[ker.get('id')]['aopo:has_upstream_key_event']['id'] = ker.find(aopxml + 'title').find(aopxml + 'upstream-id').text
+    kerdict[ker.get('id')]['aopo:has_upstream_key_event']['dc:identifier'] = None
+    kerdict[ker.get('id')]['aopo:has_downstream_key_event'] = {}
+    kerdict[ker.get('id')]['aopo:has_downstream_key_event']['id'] = ker.find(aopxml + 'title').find(aopxml + 'downstream-id').text
+    kerdict[ker.get('id')]['aopo:has_downstream_key_event']['dc:identifier'] = None
+    # AOP-Wiki renamed <taxonomic-applicability> to <applicability> on KERs in the
+    # 2022-Q3 XML schema. Both names are accepted so historical snapshots round-trip.
+    for appl in (ker.findall(aopxml + 'applicability') + ker.findall(aopxml + 'taxonomic-applicability')):
+        for sex in appl.findall(aopxml + 'sex'):
+            if 'pato:0000047' not in kerdict[ker.get('id')]:
+                kerdict[ker.get('id')]['pato:0000047'] = [[sex.find(aopxml + 'evidence').text, sex.find(aopxml + 'sex').text]]
+            else:
+                kerdict[ker.get('id')]['pato:0000047'].append([sex.find(aopxml + 'evidence').text, sex.find(aopxml + 'sex').text])
+        for life in appl.findall(aopxml + 'life-stage'):
+            if 'aopo:LifeStageContext' not in kerdict[ker.get('id')]:
+                kerdict[ker.get('id')]['aopo:LifeStageContext'] = [[life.find(aopxml + 'evidence').text, life.find(aopxml + 'life-stage').text]]
+            else:
+                kerdict[ker.get('id')]['aopo:LifeStageContext'].append([life.find(aopxml + 'evidence').text, life.find(aopxml + 'life-stage').text])
+        for tax in appl.findall(aopxml + 'taxonomy'):
+            kerdict[ker.get('id')].setdefault('ncbitaxon:131567', []).append(
+                [tax.get('taxonomy-id'), tax.find(aopxml + 'evidence').text, None, None, None])
+
+
+def _resolve_ker(ker_id, refs, kerdict, taxdict):
+    """Fill one converted KER's references (see :func:`_convert_ker`)."""
+    ker = kerdict[ker_id]
+    ker['dc:identifier'] = 'aop.relationships:' + refs['KER'][ker_id]
+    ker['rdfs:label'] = '"KER ' + refs['KER'][ker_id] + '"'
+    ker['foaf:page'] = '<https://identifiers.org/aop.relationships/' + refs['KER'][ker_id] + '>'
+    for side in ('aopo:has_upstream_key_event', 'aopo:has_downstream_key_event'):
+        ker[side]['dc:identifier'] = 'aop.events:' + refs['KE'][ker[side]['id']]
+    _resolve_taxa(ker, taxdict)
+
+
+def _new_component_dict():
+    """Component dict seeded with the ``None`` sentinel entry KEs may point at."""
+    return {
+        None: {
+            'dc:identifier': None,
+            'dc:source': None,
+            'dc:title': None
+        }
+    }
+
+
+# --- Main parser functions ---
 
-def parse_aopwiki_xml(xml_path: str, config: PipelineConfig = None) -> ParsedEntities:
+def parse_aopwiki_xml(xml_path: str, config: PipelineConfig = None,
+                      cache_dir=None) -> ParsedEntities:
     """Parse AOP-Wiki XML file and return all entity dictionaries.
 
     Args:
@@ -67,12 +678,21 @@ def parse_aopwiki_xml(xml_path: str, config: PipelineConfig = None) -> ParsedEnt
         config: Optional PipelineConfig for network-dependent operations
                 (BridgeDb chemical mapping, promapping.txt download).
                 If None, chemical BridgeDb mapping and protein mapping are skipped.
+        cache_dir: Optional parse snapshot directory (see
+                :mod:`aopwiki_rdf.parser.snapshot`). Only consulted when
+                config is None -- a networked parse depends on more than the
+                XML bytes.
 
     Returns:
         ParsedEntities dataclass with all 13 entity dictionaries.
     """
     aopxml = AOPXML_NS
 
+    if cache_dir is not None and config is None:
+        # The streaming parser produces the same dicts and also the side
+        # tables the snapshot carries, so it owns the load/save.
+        return stream_aopwiki_xml(xml_path, cache_dir=cache_dir)[0]
+
     # Resolve config values
     if config is not None:
         bridgedb_url = config.bridgedb_url
@@ -99,17 +719,10 @@ def parse_aopwiki_xml(xml_path: str, config: PipelineConfig = None) -> ParsedEnt
         raise
 
     # ---------------------------------------------------------------
-    # Reference extraction (monolith lines 354-365)
+    # Reference extraction
     # ---------------------------------------------------------------
     refs = {'AOP': {}, 'KE': {}, 'KER': {}, 'Stressor': {}}
-    for ref in root.find(aopxml + 'vendor-specific').findall(aopxml + 'aop-reference'):
-        refs['AOP'][ref.get('id')] = ref.get('aop-wiki-id')
-    for ref in root.find(aopxml + 'vendor-specific').findall(aopxml + 'key-event-reference'):
-        refs['KE'][ref.get('id')] = ref.get('aop-wiki-id')
-    for ref in root.find(aopxml + 'vendor-specific').findall(aopxml + 'key-event-relationship-reference'):
-        refs['KER'][ref.get('id')] = ref.get('aop-wiki-id')
-    for ref in root.find(aopxml + 'vendor-specific').findall(aopxml + 'stressor-reference'):
-        refs['Stressor'][ref.get('id')] = ref.get('aop-wiki-id')
+    _parse_refs(root.find(aopxml + 'vendor-specific'), refs)
     for item in refs:
         logger.info(f'Found {len(refs[item])} identifiers for entity type: {item}')
 
@@ -120,133 +733,12 @@ def parse_aopwiki_xml(xml_path: str, config: PipelineConfig = None) -> ParsedEnt
         logger.error(f"Entity count validation failed: {e}")
 
     # ---------------------------------------------------------------
-    # AOP extraction (monolith lines 374-464)
+    # AOP extraction
     # ---------------------------------------------------------------
     aopdict = {}
     kedict = {}
     for AOP in root.findall(aopxml + 'aop'):
-        aopdict[AOP.get('id')] = {}
-        aopdict[AOP.get('id')]['dc:identifier'] = 'aop:' + refs['AOP'][AOP.get('id')]
-        aopdict[AOP.get('id')]['rdfs:label'] = '"AOP ' + refs['AOP'][AOP.get('id')] + '"'
-        aopdict[AOP.get('id')]['foaf:page'] = '<https://identifiers.org/aop/' + refs['AOP'][AOP.get('id')] + '>'
-        title_elem = AOP.find(aopxml + 'title')
-        aopdict[AOP.get('id')]['dc:title'] = '"' + (title_elem.text if title_elem is not None and title_elem.text else '') + '"'
-        short_name_elem = AOP.find(aopxml + 'short-name')
-        aopdict[AOP.get('id')]['dcterms:alternative'] = short_name_elem.text if short_name_elem is not None else None
-        aopdict[AOP.get('id')]['dc:description'] = []
-        if AOP.find(aopxml + 'background') is not None:
-            if AOP.find(aopxml + 'background').text is not None:
-                aopdict[AOP.get('id')]['dc:description'].append('"""' + HTML_TAG_PATTERN.sub('', AOP.find(aopxml + 'background').text) + '"""')
-        authors_elem = AOP.find(aopxml + 'authors')
-        if authors_elem is not None and authors_elem.text is not None:
-            aopdict[AOP.get('id')]['dc:creator'] = '"""' + HTML_TAG_PATTERN.sub('', authors_elem.text) + '"""'
-        abstract_elem = AOP.find(aopxml + 'abstract')
-        if abstract_elem is not None and abstract_elem.text is not None:
-            aopdict[AOP.get('id')]['dcterms:abstract'] = '"""' + HTML_TAG_PATTERN.sub('', abstract_elem.text) + '"""'
-        status_elem = AOP.find(aopxml + 'status')
-        if status_elem is not None:
-            wiki_status = status_elem.find(aopxml + 'wiki-status')
-            if wiki_status is not None:
-                aopdict[AOP.get('id')]['dcterms:accessRights'] = '"' + wiki_status.text + '"'
-            oecd_status = status_elem.find(aopxml + 'oecd-status')
-            if oecd_status is not None:
-                aopdict[AOP.get('id')]['oecd-status'] = '"' + oecd_status.text + '"'
-            saaop_status = status_elem.find(aopxml + 'saaop-status')
-            if saaop_status is not None:
-                aopdict[AOP.get('id')]['saaop-status'] = '"' + saaop_status.text + '"'
-            wiki_license_el = status_elem.find(aopxml + 'wiki-license')
-            if wiki_license_el is not None and wiki_license_el.text:
-                aopdict[AOP.get('id')]['_wiki_license'] = wiki_license_el.text
-        oecd_proj_elem = AOP.find(aopxml + 'oecd-project')
-        aopdict[AOP.get('id')]['oecd-project'] = oecd_proj_elem.text if oecd_proj_elem is not None else None
-        source_elem = AOP.find(aopxml + 'source')
-        aopdict[AOP.get('id')]['dc:source'] = source_elem.text if source_elem is not None else None
-        created_elem = AOP.find(aopxml + 'creation-timestamp')
-        aopdict[AOP.get('id')]['dcterms:created'] = created_elem.text if created_elem is not None else None
-        modified_elem = AOP.find(aopxml + 'last-modification-timestamp')
-        aopdict[AOP.get('id')]['dcterms:modified'] = modified_elem.text if modified_elem is not None else None
-        for appl in AOP.findall(aopxml + 'applicability'):
-            for sex in appl.findall(aopxml + 'sex'):
-                if 'pato:0000047' not in aopdict[AOP.get('id')]:
-                    aopdict[AOP.get('id')]['pato:0000047'] = [[sex.find(aopxml + 'evidence').text, sex.find(aopxml + 'sex').text]]
-                else:
-                    aopdict[AOP.get('id')]['pato:0000047'].append([sex.find(aopxml + 'evidence').text, sex.find(aopxml + 'sex').text])
-            for life in appl.findall(aopxml + 'life-stage'):
-                if 'aopo:LifeStageContext' not in aopdict[AOP.get('id')]:
-                    aopdict[AOP.get('id')]['aopo:LifeStageContext'] = [[life.find(aopxml + 'evidence').text, life.find(aopxml + 'life-stage').text]]
-                else:
-                    aopdict[AOP.get('id')]['aopo:LifeStageContext'].append([life.find(aopxml + 'evidence').text, life.find(aopxml + 'life-stage').text])
-        aopdict[AOP.get('id')]['aopo:has_key_event'] = {}
-        if AOP.find(aopxml + 'key-events') is not None:
-            for KE in AOP.find(aopxml + 'key-events').findall(aopxml + 'key-event'):
-                ke_id = _get_ke_id(KE)
-                if ke_id is None or ke_id not in refs['KE']:
-                    logger.warning(f"Skipping KE with unresolvable ID in AOP {AOP.get('id')}")
-                    continue
-                aopdict[AOP.get('id')]['aopo:has_key_event'][ke_id] = {}
-                aopdict[AOP.get('id')]['aopo:has_key_event'][ke_id]['dc:identifier'] = 'aop.events:' + refs['KE'][ke_id]
-        aopdict[AOP.get('id')]['aopo:has_key_event_relationship'] = {}
-        if AOP.find(aopxml + 'key-event-relationships') is not None:
-            for KER in AOP.find(aopxml + 'key-event-relationships').findall(aopxml + 'relationship'):
-                aopdict[AOP.get('id')]['aopo:has_key_event_relationship'][KER.get('id')] = {}
-                aopdict[AOP.get('id')]['aopo:has_key_event_relationship'][KER.get('id')]['dc:identifier'] = 'aop.relationships:' + refs['KER'][KER.get('id')]
-                aopdict[AOP.get('id')]['aopo:has_key_event_relationship'][KER.get('id')]['adjacency'] = KER.find(aopxml + 'adjacency').text
-                aopdict[AOP.get('id')]['aopo:has_key_event_relationship'][KER.get('id')]['quantitative-understanding-value'] = KER.find(aopxml + 'quantitative-understanding-value').text
-                aopdict[AOP.get('id')]['aopo:has_key_event_relationship'][KER.get('id')]['aopo:has_evidence'] = KER.find(aopxml + 'evidence').text
-        aopdict[AOP.get('id')]['aopo:has_molecular_initiating_event'] = {}
-        for MIE in AOP.findall(aopxml + 'molecular-initiating-event'):
-            mie_id = _get_ke_id(MIE)
-            if mie_id is None or mie_id not in refs['KE']:
-                logger.warning(f"Skipping MIE with unresolvable ID in AOP {AOP.get('id')}")
-                continue
-            aopdict[AOP.get('id')]['aopo:has_molecular_initiating_event'][mie_id] = {}
-            aopdict[AOP.get('id')]['aopo:has_molecular_initiating_event'][mie_id]['dc:identifier'] = 'aop.events:' + refs['KE'][mie_id]
-            aopdict[AOP.get('id')]['aopo:has_key_event'][mie_id] = {}
-            aopdict[AOP.get('id')]['aopo:has_key_event'][mie_id]['dc:identifier'] = 'aop.events:' + refs['KE'][mie_id]
-            esc_elem = MIE.find(aopxml + 'evidence-supporting-chemical-initiation')
-            if esc_elem is not None and esc_elem.text is not None:
-                kedict[mie_id] = {}
-                aopdict[AOP.get('id')]['dc:description'].append('"""' + HTML_TAG_PATTERN.sub('', esc_elem.text) + '"""')
-        aopdict[AOP.get('id')]['aopo:has_adverse_outcome'] = {}
-        for AO in AOP.findall(aopxml + 'adverse-outcome'):
-            ao_id = _get_ke_id(AO)
-            if ao_id is None or ao_id not in refs['KE']:
-                logger.warning(f"Skipping AO with unresolvable ID in AOP {AOP.get('id')}")
-                continue
-            aopdict[AOP.get('id')]['aopo:has_adverse_outcome'][ao_id] = {}
-            aopdict[AOP.get('id')]['aopo:has_adverse_outcome'][ao_id]['dc:identifier'] = 'aop.events:' + refs['KE'][ao_id]
-            aopdict[AOP.get('id')]['aopo:has_key_event'][ao_id] = {}
-            aopdict[AOP.get('id')]['aopo:has_key_event'][ao_id]['dc:identifier'] = 'aop.events:' + refs['KE'][ao_id]
-            examples_elem = AO.find(aopxml + 'examples')
-            if examples_elem is not None and examples_elem.text is not None:
-                kedict[ao_id] = {}
-                aopdict[AOP.get('id')]['dc:description'].append('"""' + HTML_TAG_PATTERN.sub('', examples_elem.text) + '"""')
-        aopdict[AOP.get('id')]['nci:C54571'] = {}
-        if AOP.find(aopxml + 'aop-stressors') is not None:
-            for stressor in AOP.find(aopxml + 'aop-stressors').findall(aopxml + 'aop-stressor'):
-                aopdict[AOP.get('id')]['nci:C54571'][stressor.get('stressor-id')] = {}
-                aopdict[AOP.get('id')]['nci:C54571'][stressor.get('stressor-id')]['dc:identifier'] = 'aop.stressor:' + refs['Stressor'][stressor.get('stressor-id')]
-                aopdict[AOP.get('id')]['nci:C54571'][stressor.get('stressor-id')]['aopo:has_evidence'] = stressor.find(aopxml + 'evidence').text
-        overall_assessment = AOP.find(aopxml + 'overall-assessment')
-        if overall_assessment is not None:
-            oa_desc = overall_assessment.find(aopxml + 'description')
-            if oa_desc is not None and oa_desc.text is not None:
-                aopdict[AOP.get('id')]['nci:C25217'] = '"""' + HTML_TAG_PATTERN.sub('', oa_desc.text) + '"""'
-            oa_ke_ess = overall_assessment.find(aopxml + 'key-event-essentiality-summary')
-            if oa_ke_ess is not None and oa_ke_ess.text is not None:
-                aopdict[AOP.get('id')]['nci:C48192'] = '"""' + HTML_TAG_PATTERN.sub('', oa_ke_ess.text) + '"""'
-            oa_appl = overall_assessment.find(aopxml + 'applicability')
-            if oa_appl is not None and oa_appl.text is not None:
-                aopdict[AOP.get('id')]['aopo:AopContext'] = '"""' + HTML_TAG_PATTERN.sub('', oa_appl.text) + '"""'
-            oa_woe = overall_assessment.find(aopxml + 'weight-of-evidence-summary')
-            if oa_woe is not None and oa_woe.text is not None:
-                aopdict[AOP.get('id')]['aopo:has_evidence'] = '"""' + HTML_TAG_PATTERN.sub('', oa_woe.text) + '"""'
-            oa_quant = overall_assessment.find(aopxml + 'quantitative-considerations')
-            if oa_quant is not None and oa_quant.text is not None:
-                aopdict[AOP.get('id')]['edam:operation_3799'] = '"""' + HTML_TAG_PATTERN.sub('', oa_quant.text) + '"""'
-        pot_appl_elem = AOP.find(aopxml + 'potential-applications')
-        if pot_appl_elem is not None and pot_appl_elem.text is not None:
-            aopdict[AOP.get('id')]['nci:C25725'] = '"""' + HTML_TAG_PATTERN.sub('', pot_appl_elem.text) + '"""'
+        _parse_aop(AOP, refs, aopdict, kedict)
     logger.info(f'Completed AOP parsing: {len(aopdict)} Adverse Outcome Pathways processed')
 
     # Validate AOP required fields
@@ -256,7 +748,7 @@ def parse_aopwiki_xml(xml_path: str, config: PipelineConfig = None) -> ParsedEnt
         logger.error(f"AOP required fields validation failed: {e}")
 
     # ---------------------------------------------------------------
-    # Chemical extraction (monolith lines 474-823)
+    # Chemical extraction
     # ---------------------------------------------------------------
     chedict = {}
     listofchebi = []
@@ -277,27 +769,13 @@ def parse_aopwiki_xml(xml_path: str, config: PipelineConfig = None) -> ParsedEnt
     cas_to_chemical_id = {}
 
     for che in root.findall(aopxml + 'chemical'):
-        chedict[che.get('id')] = {}
-        if che.find(aopxml + 'casrn') is not None:
-            if 'NOCAS' not in che.find(aopxml + 'casrn').text:
-                cas_number = che.find(aopxml + 'casrn').text
-                chedict[che.get('id')]['dc:identifier'] = 'cas:' + cas_number
-                listofcas.append('cas:' + cas_number)
-                chedict[che.get('id')]['cheminf:000446'] = '"' + cas_number + '"'
-
-                # Collect for batch processing
-                chemicals_to_map.append((che.get('id'), cas_number))
-                if cas_number not in cas_to_chemical_id:
-                    cas_to_chemical_id[cas_number] = []
-                cas_to_chemical_id[cas_number].append(che.get('id'))
-            else:
-                chedict[che.get('id')]['dc:identifier'] = '"' + che.find(aopxml + 'casrn').text + '"'
+        _parse_chemical_cas(che, chedict, listofcas, chemicals_to_map, cas_to_chemical_id)
 
     # Batch BridgeDb chemical mapping (only when config is provided)
     if chemicals_to_map and bridgedb_url is not None:
         from aopwiki_rdf.mapping.chemical_mapper import map_chemicals
-        chem_result = map_chemicals(chedict, root, aopxml,
-                                    bridgedb_url=bridgedb_url, timeout=request_timeout)
+        chem_result = map_chemicals(chedict, bridgedb_url=bridgedb_url,
+                                    timeout=request_timeout)
         chedict = chem_result['chedict']
         listofchebi = chem_result['listofchebi']
         listofchemspider = chem_result['listofchemspider']
@@ -311,177 +789,49 @@ def parse_aopwiki_xml(xml_path: str, config: PipelineConfig = None) -> ParsedEnt
 
     # Continue with other chemical properties (InChI keys, names, etc.)
     for che in root.findall(aopxml + 'chemical'):
-        if che.find(aopxml + 'jchem-inchi-key') is not None:
-            chedict[che.get('id')]['cheminf:000059'] = 'inchikey:' + str(che.find(aopxml + 'jchem-inchi-key').text)
-            listofinchikey.append('inchikey:' + str(che.find(aopxml + 'jchem-inchi-key').text))
-        if che.find(aopxml + 'preferred-name') is not None:
-            chedict[che.get('id')]['dc:title'] = '"' + che.find(aopxml + 'preferred-name').text + '"'
-        if che.find(aopxml + 'dsstox-id') is not None:
-            chedict[che.get('id')]['cheminf:000568'] = 'comptox:' + che.find(aopxml + 'dsstox-id').text
-            listofcomptox.append('comptox:' + che.find(aopxml + 'dsstox-id').text)
-        if che.find(aopxml + 'synonyms') is not None:
-            chedict[che.get('id')]['dcterms:alternative'] = []
-            for synonym in che.find(aopxml + 'synonyms').findall(aopxml + 'synonym'):
-                chedict[che.get('id')]['dcterms:alternative'].append(synonym.text[:-1])
+        _parse_chemical_properties(che, chedict, listofinchikey, listofcomptox)
     logger.info(f'Completed chemical parsing: {len(chedict)} chemicals processed')
 
     # ---------------------------------------------------------------
-    # Stressor extraction (monolith lines 826-847)
+    # Stressor extraction
     # ---------------------------------------------------------------
     strdict = {}
     for stressor in root.findall(aopxml + 'stressor'):
-        strdict[stressor.get('id')] = {}
-        strdict[stressor.get('id')]['dc:identifier'] = 'aop.stressor:' + refs['Stressor'][stressor.get('id')]
-        strdict[stressor.get('id')]['rdfs:label'] = '"Stressor ' + refs['Stressor'][stressor.get('id')] + '"'
-        strdict[stressor.get('id')]['foaf:page'] = '<https://identifiers.org/aop.stressor/' + refs['Stressor'][stressor.get('id')] + '>'
-        strdict[stressor.get('id')]['dc:title'] = '"' + stressor.find(aopxml + 'name').text + '"'
-        if stressor.find(aopxml + 'description').text is not None:
-            strdict[stressor.get('id')]['dc:description'] = '"""' + HTML_TAG_PATTERN.sub('', stressor.find(aopxml + 'description').text) + '"""'
-        strdict[stressor.get('id')]['dcterms:created'] = stressor.find(aopxml + 'creation-timestamp').text
-        strdict[stressor.get('id')]['dcterms:modified'] = stressor.find(aopxml + 'last-modification-timestamp').text
-        strdict[stressor.get('id')]['aopo:has_chemical_entity'] = []
-        strdict[stressor.get('id')]['linktochemical'] = []
-        if stressor.find(aopxml + 'chemicals') is not None:
-            for chemical in stressor.find(aopxml + 'chemicals').findall(aopxml + 'chemical-initiator'):
-                strdict[stressor.get('id')]['aopo:has_chemical_entity'].append('"' + chemical.get('user-term') + '"')
-                strdict[stressor.get('id')]['linktochemical'].append(chemical.get('chemical-id'))
+        _parse_stressor(stressor, refs, strdict)
     logger.info(f'Completed stressor parsing: {len(strdict)} stressors processed')
 
     # ---------------------------------------------------------------
-    # Taxonomy extraction (monolith lines 850-865)
+    # Taxonomy extraction
     # ---------------------------------------------------------------
     taxdict = {}
     for tax in root.findall(aopxml + 'taxonomy'):
-        taxdict[tax.get('id')] = {}
-        taxdict[tax.get('id')]['dc:source'] = tax.find(aopxml + 'source').text
-        taxdict[tax.get('id')]['dc:title'] = tax.find(aopxml + 'name').text
-        if taxdict[tax.get('id')]['dc:source'] == 'NCBI':
-            taxdict[tax.get('id')]['dc:identifier'] = 'ncbitaxon:' + tax.find(aopxml + 'source-id').text
-        elif taxdict[tax.get('id')]['dc:source'] is not None:
-            taxdict[tax.get('id')]['dc:identifier'] = '"' + tax.find(aopxml + 'source-id').text + '"'
-        else:
-            taxdict[tax.get('id')]['dc:identifier'] = '"' + tax.find(aopxml + 'source-id').text + '"'
+        _parse_taxonomy(tax, taxdict)
     logger.info(f'Taxonomy parsing completed: {len(taxdict)} taxonomies processed')
 
     # ---------------------------------------------------------------
-    # AOP Taxonomy second pass (monolith lines 868-880)
+    # AOP Taxonomy second pass
     # ---------------------------------------------------------------
     for AOP in root.findall(aopxml + 'aop'):
-        for appl in AOP.findall(aopxml + 'applicability'):
-            for tax in appl.findall(aopxml + 'taxonomy'):
-                if 'ncbitaxon:131567' not in aopdict[AOP.get('id')]:
-                    if 'dc:identifier' in taxdict[tax.get('taxonomy-id')]:
-                        aopdict[AOP.get('id')]['ncbitaxon:131567'] = [[tax.get('taxonomy-id'), tax.find(aopxml + 'evidence').text, taxdict[tax.get('taxonomy-id')]['dc:identifier'], taxdict[tax.get('taxonomy-id')]['dc:source'], taxdict[tax.get('taxonomy-id')]['dc:title']]]
-                else:
-                    if 'dc:identifier' in taxdict[tax.get('taxonomy-id')]:
-                        aopdict[AOP.get('id')]['ncbitaxon:131567'].append([tax.get('taxonomy-id'), tax.find(aopxml + 'evidence').text, taxdict[tax.get('taxonomy-id')]['dc:identifier'], taxdict[tax.get('taxonomy-id')]['dc:source'], taxdict[tax.get('taxonomy-id')]['dc:title']])
+        _parse_aop_taxonomy(AOP, aopdict, taxdict)
     logger.info(f'AOP taxonomy second pass completed')
 
     # ---------------------------------------------------------------
-    # KE components: biological actions (monolith lines 883-897)
+    # KE components: biological actions, processes, objects
     # ---------------------------------------------------------------
-    bioactdict = {None: {}}
-    bioactdict[None]['dc:identifier'] = None
-    bioactdict[None]['dc:source'] = None
-    bioactdict[None]['dc:title'] = None
+    bioactdict = _new_component_dict()
     for bioact in root.findall(aopxml + 'biological-action'):
-        bioactdict[bioact.get('id')] = {}
-        bioactdict[bioact.get('id')]['dc:source'] = '"' + bioact.find(aopxml + 'source').text + '"'
-        bioactdict[bioact.get('id')]['dc:title'] = '"' + bioact.find(aopxml + 'name').text + '"'
-        bioactdict[bioact.get('id')]['dc:identifier'] = '"' + bioact.find(aopxml + 'name').text + '"'
+        _parse_biological_action(bioact, bioactdict)
     logger.info(f'Biological Activity parsing completed: {len(bioactdict)} annotations processed')
 
-    # ---------------------------------------------------------------
-    # KE components: biological processes (monolith lines 902-949)
-    # ---------------------------------------------------------------
-    bioprodict = {
-        None: {
-            'dc:identifier': None,
-            'dc:source': None,
-            'dc:title': None
-        }
-    }
-
-    source_prefix_map_bp = {
-        '"GO"': ('go:', 3),
-        '"MI"': ('mi:', 0),
-        '"MP"': ('mp:', 3),
-        '"MESH"': ('mesh:', 0),
-        '"HP"': ('hp:', 3),
-        '"PCO"': ('pco:', 4),
-        '"NBO"': ('nbo:', 4),
-        '"VT"': ('vt:', 3),
-        '"RBO"': ('rbo:', 4),
-        '"NCI"': ('nci:', 4),
-        '"IDO"': ('ido:', 4),
-    }
-
+    bioprodict = _new_component_dict()
     for biopro in root.findall(aopxml + 'biological-process'):
-        biopro_id = biopro.get('id')
-        bioprodict[biopro_id] = {}
-
-        source = f'"{biopro.find(aopxml + "source").text}"'
-        name = f'"{biopro.find(aopxml + "name").text}"'
-        source_id = biopro.find(aopxml + 'source-id').text
-
-        bioprodict[biopro_id]['dc:source'] = source
-        bioprodict[biopro_id]['dc:title'] = name
-
-        if source in source_prefix_map_bp:
-            prefix, offset = source_prefix_map_bp[source]
-            identifier = prefix + source_id[offset:]
-            bioprodict[biopro_id]['dc:identifier'] = identifier
-        else:
-            bioprodict[biopro_id]['dc:identifier'] = source_id
-
+        _parse_biological_process(biopro, bioprodict)
     logger.info(f'Biological Process parsing completed: {len(bioprodict)} annotations processed')
 
-    # ---------------------------------------------------------------
-    # KE components: biological objects (monolith lines 954-1005)
-    # ---------------------------------------------------------------
-    bioobjdict = {
-        None: {
-            'dc:identifier': None,
-            'dc:source': None,
-            'dc:title': None
-        }
-    }
-    objectstoskip = []
+    bioobjdict = _new_component_dict()
     prolist = []
-
-    source_prefix_map_bo = {
-        '"PR"': ('pr:', 3),
-        '"CL"': ('cl:', 3),
-        '"MESH"': ('mesh:', 0),
-        '"GO"': ('go:', 3),
-        '"UBERON"': ('uberon:', 7),
-        '"CHEBI"': ('chebio:', 6),
-        '"MP"': ('mp:', 3),
-        '"FMA"': ('fma:', 4),
-        '"PCO"': ('pco:', 4),
-    }
-
     for bioobj in root.findall(aopxml + 'biological-object'):
-        bioobj_id = bioobj.get('id')
-        bioobjdict[bioobj_id] = {}
-
-        source = f'"{bioobj.find(aopxml + "source").text}"'
-        name = f'"{bioobj.find(aopxml + "name").text}"'
-        source_id = bioobj.find(aopxml + 'source-id').text
-
-        bioobjdict[bioobj_id]['dc:source'] = source
-        bioobjdict[bioobj_id]['dc:title'] = name
-
-        if source in source_prefix_map_bo:
-            prefix, offset = source_prefix_map_bo[source]
-            identifier = prefix + source_id[offset:]
-            bioobjdict[bioobj_id]['dc:identifier'] = identifier
-
-            if source == '"PR"':
-                prolist.append(identifier)
-        else:
-            bioobjdict[bioobj_id]['dc:identifier'] = f'"{source_id}"'
-
+        _parse_biological_object(bioobj, bioobjdict, prolist)
     logger.info(f'Biological Object parsing completed: {len(bioobjdict)} annotations processed')
 
     # ---------------------------------------------------------------
@@ -539,172 +889,21 @@ def parse_aopwiki_xml(xml_path: str, config: PipelineConfig = None) -> ParsedEnt
             logger.info(f'Protein mapping completed: added {len(hgnclist) + len(ncbigenelist) + len(uniprotlist)} identifiers for {len(prodict)} Protein Ontology terms')
 
     # ---------------------------------------------------------------
-    # Key Event extraction (monolith lines 1067-1152)
+    # Key Event extraction
     # ---------------------------------------------------------------
     celldict = {}
     organdict = {}
-    listofkedescriptions = []
     for ke in root.findall(aopxml + 'key-event'):
-        if ke.get('id') not in kedict:
-            kedict[ke.get('id')] = {}
-        kedict[ke.get('id')]['dc:identifier'] = 'aop.events:' + refs['KE'][ke.get('id')]
-        kedict[ke.get('id')]['rdfs:label'] = '"KE ' + refs['KE'][ke.get('id')] + '"'
-        kedict[ke.get('id')]['foaf:page'] = '<https://identifiers.org/aop.events/' + refs['KE'][ke.get('id')] + '>'
-        kedict[ke.get('id')]['dc:title'] = '"' + ke.find(aopxml + 'title').text + '"'
-        kedict[ke.get('id')]['dcterms:alternative'] = ke.find(aopxml + 'short-name').text
-        kedict[ke.get('id')]['nci:C25664'] = '"""' + ke.find(aopxml + 'biological-organization-level').text + '"""'
-        if ke.find(aopxml + 'description').text is not None:
-            kedict[ke.get('id')]['dc:description'] = '"""' + HTML_TAG_PATTERN.sub('', ke.find(aopxml + 'description').text) + '"""'
-        if ke.find(aopxml + 'measurement-methodology').text is not None:
-            kedict[ke.get('id')]['mmo:0000000'] = '"""' + HTML_TAG_PATTERN.sub('', ke.find(aopxml + 'measurement-methodology').text) + '"""'
-        # Coverage gap-fix (Plan 09-03, XML-02): KE-level taxonomic-applicability
-        # evidence free text (also present at KER level above). Additive, guarded.
-        ke_esta = ke.find(aopxml + 'evidence-supporting-taxonomic-applicability')
-        if ke_esta is not None and ke_esta.text is not None:
-            kedict[ke.get('id')]['nci:C17469'] = '"""' + HTML_TAG_PATTERN.sub('', ke_esta.text) + '"""'
-        kedict[ke.get('id')]['biological-organization-level'] = ke.find(aopxml + 'biological-organization-level').text
-        kedict[ke.get('id')]['dc:source'] = ke.find(aopxml + 'source').text
-        for appl in ke.findall(aopxml + 'applicability'):
-            for sex in appl.findall(aopxml + 'sex'):
-                if 'pato:0000047' not in kedict[ke.get('id')]:
-                    kedict[ke.get('id')]['pato:0000047'] = [[sex.find(aopxml + 'evidence').text, sex.find(aopxml + 'sex').text]]
-                else:
-                    kedict[ke.get('id')]['pato:0000047'].append([sex.find(aopxml + 'evidence').text, sex.find(aopxml + 'sex').text])
-            for life in appl.findall(aopxml + 'life-stage'):
-                if 'aopo:LifeStageContext' not in kedict[ke.get('id')]:
-                    kedict[ke.get('id')]['aopo:LifeStageContext'] = [[life.find(aopxml + 'evidence').text, life.find(aopxml + 'life-stage').text]]
-                else:
-                    kedict[ke.get('id')]['aopo:LifeStageContext'].append([life.find(aopxml + 'evidence').text, life.find(aopxml + 'life-stage').text])
-            for tax in appl.findall(aopxml + 'taxonomy'):
-                if 'ncbitaxon:131567' not in kedict[ke.get('id')]:
-                    if 'dc:identifier' in taxdict[tax.get('taxonomy-id')]:
-                        kedict[ke.get('id')]['ncbitaxon:131567'] = [[tax.get('taxonomy-id'), tax.find(aopxml + 'evidence').text, taxdict[tax.get('taxonomy-id')]['dc:identifier'], taxdict[tax.get('taxonomy-id')]['dc:source'], taxdict[tax.get('taxonomy-id')]['dc:title']]]
-                else:
-                    if 'dc:identifier' in taxdict[tax.get('taxonomy-id')]:
-                        kedict[ke.get('id')]['ncbitaxon:131567'].append([tax.get('taxonomy-id'), tax.find(aopxml + 'evidence').text, taxdict[tax.get('taxonomy-id')]['dc:identifier'], taxdict[tax.get('taxonomy-id')]['dc:source'], taxdict[tax.get('taxonomy-id')]['dc:title']])
-        kedict[ke.get('id')]['biological-events'] = []
-        kedict[ke.get('id')]['biological-event'] = {}
-        kedict[ke.get('id')]['biological-event']['go:0008150'] = []
-        kedict[ke.get('id')]['biological-event']['pato:0001241'] = []
-        kedict[ke.get('id')]['biological-event']['pato:0000001'] = []
-        bioevents = ke.find(aopxml + 'biological-events')
-        if bioevents is not None:
-            for event in bioevents.findall(aopxml + 'biological-event'):
-                event_entry = {}
-                if event.get('process-id') is not None:
-                    event_entry['process'] = bioprodict[event.get('process-id')]['dc:identifier']
-                    kedict[ke.get('id')]['biological-event']['go:0008150'].append(bioprodict[event.get('process-id')]['dc:identifier'])
-                if event.get('object-id') is not None:
-                    event_entry['object'] = bioobjdict[event.get('object-id')]['dc:identifier']
-                    kedict[ke.get('id')]['biological-event']['pato:0001241'].append(bioobjdict[event.get('object-id')]['dc:identifier'])
-                if event.get('action-id') is not None:
-                    event_entry['action'] = bioactdict[event.get('action-id')]['dc:identifier']
-                    kedict[ke.get('id')]['biological-event']['pato:0000001'].append(bioactdict[event.get('action-id')]['dc:identifier'])
-                kedict[ke.get('id')]['biological-events'].append(event_entry)
-        if ke.find(aopxml + 'cell-term') is not None:
-            kedict[ke.get('id')]['aopo:CellTypeContext'] = {}
-            kedict[ke.get('id')]['aopo:CellTypeContext']['dc:source'] = '"' + ke.find(aopxml + 'cell-term').find(aopxml + 'source').text + '"'
-            kedict[ke.get('id')]['aopo:CellTypeContext']['dc:title'] = '"' + ke.find(aopxml + 'cell-term').find(aopxml + 'name').text + '"'
-            if kedict[ke.get('id')]['aopo:CellTypeContext']['dc:source'] == '"CL"':
-                kedict[ke.get('id')]['aopo:CellTypeContext']['dc:identifier'] = ['cl:' + ke.find(aopxml + 'cell-term').find(aopxml + 'source-id').text[3:], ke.find(aopxml + 'cell-term').find(aopxml + 'source-id').text]
-            elif kedict[ke.get('id')]['aopo:CellTypeContext']['dc:source'] == '"UBERON"':
-                kedict[ke.get('id')]['aopo:CellTypeContext']['dc:identifier'] = ['uberon:' + ke.find(aopxml + 'cell-term').find(aopxml + 'source-id').text[7:], ke.find(aopxml + 'cell-term').find(aopxml + 'source-id').text]
-            else:
-                kedict[ke.get('id')]['aopo:CellTypeContext']['dc:identifier'] = ['"' + ke.find(aopxml + 'cell-term').find(aopxml + 'source-id').text + '"', 'placeholder']
-            # Also store in celldict for standalone access
-            celldict[ke.get('id')] = kedict[ke.get('id')]['aopo:CellTypeContext']
-        if ke.find(aopxml + 'organ-term') is not None:
-            kedict[ke.get('id')]['aopo:OrganContext'] = {}
-            kedict[ke.get('id')]['aopo:OrganContext']['dc:source'] = '"' + ke.find(aopxml + 'organ-term').find(aopxml + 'source').text + '"'
-            kedict[ke.get('id')]['aopo:OrganContext']['dc:title'] = '"' + ke.find(aopxml + 'organ-term').find(aopxml + 'name').text + '"'
-            if kedict[ke.get('id')]['aopo:OrganContext']['dc:source'] == '"UBERON"':
-                kedict[ke.get('id')]['aopo:OrganContext']['dc:identifier'] = ['uberon:' + ke.find(aopxml + 'organ-term').find(aopxml + 'source-id').text[7:], ke.find(aopxml + 'organ-term').find(aopxml + 'source-id').text]
-            else:
-                kedict[ke.get('id')]['aopo:OrganContext']['dc:identifier'] = [
-                    '"' + ke.find(aopxml + 'organ-term').find(aopxml + 'source-id').text + '"', 'placeholder']
-            # Also store in organdict for standalone access
-            organdict[ke.get('id')] = kedict[ke.get('id')]['aopo:OrganContext']
-        if ke.find(aopxml + 'key-event-stressors') is not None:
-            kedict[ke.get('id')]['nci:C54571'] = {}
-            for stressor in ke.find(aopxml + 'key-event-stressors').findall(aopxml + 'key-event-stressor'):
-                kedict[ke.get('id')]['nci:C54571'][stressor.get('stressor-id')] = {}
-                kedict[ke.get('id')]['nci:C54571'][stressor.get('stressor-id')]['dc:identifier'] = strdict[stressor.get('stressor-id')]['dc:identifier']
-                kedict[ke.get('id')]['nci:C54571'][stressor.get('stressor-id')]['aopo:has_evidence'] = stressor.find(aopxml + 'evidence').text
+        _parse_key_event(ke, refs, kedict, taxdict, strdict, bioprodict,
+                         bioobjdict, bioactdict, celldict, organdict)
     logger.info(f'Key Events parsing completed: {len(kedict)} events processed')
 
     # ---------------------------------------------------------------
-    # KER extraction (monolith lines 1155-1201)
+    # KER extraction
     # ---------------------------------------------------------------
     kerdict = {}
     for ker in root.findall(aopxml + 'key-event-relationship'):
-        kerdict[ker.get('id')] = {}
-        kerdict[ker.get('id')]['dc:identifier'] = 'aop.relationships:' + refs['KER'][ker.get('id')]
-        kerdict[ker.get('id')]['rdfs:label'] = '"KER ' + refs['KER'][ker.get('id')] + '"'
-        kerdict[ker.get('id')]['foaf:page'] = '<https://identifiers.org/aop.relationships/' + refs['KER'][ker.get('id')] + '>'
-        kerdict[ker.get('id')]['dc:source'] = ker.find(aopxml + 'source').text
-        kerdict[ker.get('id')]['dcterms:created'] = ker.find(aopxml + 'creation-timestamp').text
-        kerdict[ker.get('id')]['dcterms:modified'] = ker.find(aopxml + 'last-modification-timestamp').text
-        if ker.find(aopxml + 'description').text is not None:
-            kerdict[ker.get('id')]['dc:description'] = '"""' + HTML_TAG_PATTERN.sub('', ker.find(aopxml + 'description').text) + '"""'
-        for weight in ker.findall(aopxml + 'weight-of-evidence'):
-            if weight.find(aopxml + 'biological-plausibility').text is not None:
-                kerdict[ker.get('id')]['nci:C80263'] = '"""' + HTML_TAG_PATTERN.sub('', weight.find(aopxml + 'biological-plausibility').text) + '"""'
-            if weight.find(aopxml + 'emperical-support-linkage').text is not None:
-                kerdict[ker.get('id')]['edam:data_2042'] = '"""' + HTML_TAG_PATTERN.sub('', weight.find(aopxml + 'emperical-support-linkage').text) + '"""'
-            if weight.find(aopxml + 'uncertainties-or-inconsistencies').text is not None:
-                kerdict[ker.get('id')]['nci:C71478'] = '"""' + HTML_TAG_PATTERN.sub('', weight.find(aopxml + 'uncertainties-or-inconsistencies').text) + '"""'
-        # Coverage gap-fixes (Plan 09-03, XML-02): KER-level free-text WoE /
-        # quantitative-understanding sub-elements that were present in the XML
-        # but never mapped to RDF. Each is additive and guarded with is not None.
-        ecs = ker.find(aopxml + 'evidence-collection-strategy')
-        if ecs is not None and ecs.text is not None:
-            kerdict[ker.get('id')]['nci:C103159'] = '"""' + HTML_TAG_PATTERN.sub('', ecs.text) + '"""'
-        kmf = ker.find(aopxml + 'known-modulating-factors')
-        if kmf is not None and kmf.text is not None:
-            kerdict[ker.get('id')]['nci:C68821'] = '"""' + HTML_TAG_PATTERN.sub('', kmf.text) + '"""'
-        esta = ker.find(aopxml + 'evidence-supporting-taxonomic-applicability')
-        if esta is not None and esta.text is not None:
-            kerdict[ker.get('id')]['nci:C17469'] = '"""' + HTML_TAG_PATTERN.sub('', esta.text) + '"""'
-        qu = ker.find(aopxml + 'quantitative-understanding')
-        if qu is not None:
-            qu_desc = qu.find(aopxml + 'description')
-            if qu_desc is not None and qu_desc.text is not None:
-                kerdict[ker.get('id')]['edam:operation_3799'] = '"""' + HTML_TAG_PATTERN.sub('', qu_desc.text) + '"""'
-            rrr = qu.find(aopxml + 'response-response-relationship')
-            if rrr is not None and rrr.text is not None:
-                kerdict[ker.get('id')]['edam:operation_3438'] = '"""' + HTML_TAG_PATTERN.sub('', rrr.text) + '"""'
-            ts = qu.find(aopxml + 'time-scale')
-            if ts is not None and ts.text is not None:
-                kerdict[ker.get('id')]['nci:C25207'] = '"""' + HTML_TAG_PATTERN.sub('', ts.text) + '"""'
-            ffl = qu.find(aopxml + 'feedforward-feedback-loops')
-            if ffl is not None and ffl.text is not None:
-                kerdict[ker.get('id')]['nci:C25343'] = '"""' + HTML_TAG_PATTERN.sub('', ffl.text) + '"""'
-        kerdict[ker.get('id')]['aopo:has_upstream_key_event'] = {}
-        kerdict[ker.get('id')]['aopo:has_upstream_key_event']['id'] = ker.find(aopxml + 'title').find(aopxml + 'upstream-id').text
-        kerdict[ker.get('id')]['aopo:has_upstream_key_event']['dc:identifier'] = 'aop.events:' + refs['KE'][ker.find(aopxml + 'title').find(aopxml + 'upstream-id').text]
-        kerdict[ker.get('id')]['aopo:has_downstream_key_event'] = {}
-        kerdict[ker.get('id')]['aopo:has_downstream_key_event']['id'] = ker.find(aopxml + 'title').find(aopxml + 'downstream-id').text
-        kerdict[ker.get('id')]['aopo:has_downstream_key_event']['dc:identifier'] = 'aop.events:' + refs['KE'][ker.find(aopxml + 'title').find(aopxml + 'downstream-id').text]
-        # AOP-Wiki renamed <taxonomic-applicability> to <applicability> on KERs in the
-        # 2022-Q3 XML schema. Both names are accepted so historical snapshots round-trip.
-        for appl in (ker.findall(aopxml + 'applicability') + ker.findall(aopxml + 'taxonomic-applicability')):
-            for sex in appl.findall(aopxml + 'sex'):
-                if 'pato:0000047' not in kerdict[ker.get('id')]:
-                    kerdict[ker.get('id')]['pato:0000047'] = [[sex.find(aopxml + 'evidence').text, sex.find(aopxml + 'sex').text]]
-                else:
-                    kerdict[ker.get('id')]['pato:0000047'].append([sex.find(aopxml + 'evidence').text, sex.find(aopxml + 'sex').text])
-            for life in appl.findall(aopxml + 'life-stage'):
-                if 'aopo:LifeStageContext' not in kerdict[ker.get('id')]:
-                    kerdict[ker.get('id')]['aopo:LifeStageContext'] = [[life.find(aopxml + 'evidence').text, life.find(aopxml + 'life-stage').text]]
-                else:
-                    kerdict[ker.get('id')]['aopo:LifeStageContext'].append([life.find(aopxml + 'evidence').text, life.find(aopxml + 'life-stage').text])
-            for tax in appl.findall(aopxml + 'taxonomy'):
-                if 'ncbitaxon:131567' not in kerdict[ker.get('id')]:
-                    if 'dc:identifier' in taxdict[tax.get('taxonomy-id')]:
-                        kerdict[ker.get('id')]['ncbitaxon:131567'] = [[tax.get('taxonomy-id'), tax.find(aopxml + 'evidence').text, taxdict[tax.get('taxonomy-id')]['dc:identifier'], taxdict[tax.get('taxonomy-id')]['dc:source'], taxdict[tax.get('taxonomy-id')]['dc:title']]]
-                else:
-                    if 'dc:identifier' in taxdict[tax.get('taxonomy-id')]:
-                        kerdict[ker.get('id')]['ncbitaxon:131567'].append([tax.get('taxonomy-id'), tax.find(aopxml + 'evidence').text, taxdict[tax.get('taxonomy-id')]['dc:identifier'], taxdict[tax.get('taxonomy-id')]['dc:source'], taxdict[tax.get('taxonomy-id')]['dc:title']])
+        _parse_ker(ker, refs, kerdict, taxdict)
     logger.info(f'Key Event Relationships parsing completed: {len(kerdict)} relationships processed')
 
     # ---------------------------------------------------------------
@@ -725,3 +924,169 @@ def parse_aopwiki_xml(xml_path: str, config: PipelineConfig = None) -> ParsedEnt
         badict=bioactdict,
         prodict=prodict,
     )
+
+
+def stream_aopwiki_xml(xml_path: str, cache_dir=None) -> tuple[ParsedEntities, XmlSideTables]:
+    """Parse AOP-Wiki XML in a single ``iterparse`` pass.
+
+    Equivalent to ``parse_aopwiki_xml(xml_path, config=None)`` -- same dicts,
+    same insertion order -- but never holds a second tree. Each top-level
+    element is converted and released as soon as it closes. AOPs, stressors,
+    Key Events and KERs refer to the vendor-specific reference tables (last
+    in the real export), taxonomies and biological components, so they are
+    kept with the raw IDs in place and those references are resolved in the
+    usual section order once the walk ends.
+
+    Args:
+        xml_path: Path to the AOP-Wiki XML file.
+        cache_dir: Optional parse snapshot directory. On a hit (same XML
+            bytes, same parser source) the snapshot is returned without
+            reading the XML; on a miss the result is parsed and saved there.
+
+    Returns:
+        ``(ParsedEntities, XmlSideTables)``. The side tables carry the Key
+        Event and KER document order the gene mapping stage walks, in place
+        of the element tree.
+    """
+    if cache_dir is not None:
+        from aopwiki_rdf.parser.snapshot import load_snapshot, save_snapshot
+        cached = load_snapshot(xml_path, cache_dir)
+        if cached is not None:
+            return cached
+        entities, side_tables = stream_aopwiki_xml(xml_path)
+        save_snapshot(xml_path, cache_dir, entities, side_tables)
+        return entities, side_tables
+
+    aopxml = AOPXML_NS
+
+    refs = {'AOP': {}, 'KE': {}, 'KER': {}, 'Stressor': {}}
+    chedict = {}
+    listofcas = []
+    listofinchikey = []
+    listofcomptox = []
+    taxdict = {}
+    bioactdict = _new_component_dict()
+    bioprodict = _new_component_dict()
+    bioobjdict = _new_component_dict()
+    side_tables = XmlSideTables()
+    aopdict = {}
+    aop_links = {}
+    strdict = {}
+    ke_pending = {}
+    celldict = {}
+    organdict = {}
+    kerdict = {}
+    seen_vendor = False
+
+    root = None
+    depth = 0
+    for event, elem in iterparse(xml_path, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = elem
+                if root.tag != aopxml + 'data':
+                    logger.warning(f"Unexpected root tag: {root.tag}")
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth != 1:
+            continue
+
+        # A top-level element just closed: take it off the root so the tree
+        # never grows beyond the element being read.
+        root.remove(elem)
+        tag = elem.tag[len(aopxml):] if elem.tag.startswith(aopxml) else elem.tag
+
+        if tag == 'vendor-specific':
+            _parse_refs(elem, refs)
+            seen_vendor = True
+        elif tag == 'taxonomy':
+            _parse_taxonomy(elem, taxdict)
+        elif tag == 'biological-action':
+            _parse_biological_action(elem, bioactdict)
+        elif tag == 'biological-process':
+            _parse_biological_process(elem, bioprodict)
+        elif tag == 'biological-object':
+            _parse_biological_object(elem, bioobjdict, [])
+        elif tag == 'chemical':
+            # No BridgeDb step runs between the two passes here, so both can
+            # run back to back per element with unchanged key order.
+            _parse_chemical_cas(elem, chedict, listofcas, [], {})
+            _parse_chemical_properties(elem, chedict, listofinchikey, listofcomptox)
+        elif tag == 'aop':
+            aop_links[elem.get('id')] = _convert_aop(elem, aopdict)
+        elif tag == 'stressor':
+            _convert_stressor(elem, strdict)
+        elif tag == 'key-event':
+            _convert_key_event(elem, ke_pending, celldict, organdict)
+            side_tables.ke_ids.append(elem.get('id'))
+        elif tag == 'key-event-relationship':
+            _convert_ker(elem, kerdict)
+            side_tables.ker_ids.append(elem.get('id'))
+        elem.clear()
+
+    if not seen_vendor:
+        logger.error("XML structure validation failed: Missing vendor-specific section in XML")
+        raise ValueError("Missing vendor-specific section in XML")
+    logger.info("XML structure validation passed")
+
+    for item in refs:
+        logger.info(f'Found {len(refs[item])} identifiers for entity type: {item}')
+    try:
+        validate_entity_counts(refs)
+    except Exception as e:
+        logger.error(f"Entity count validation failed: {e}")
+
+    kedict = {}
+    for aop_id, links in aop_links.items():
+        _resolve_aop(aop_id, links, refs, aopdict, kedict)
+    logger.info(f'Completed AOP parsing: {len(aopdict)} Adverse Outcome Pathways processed')
+    try:
+        validate_required_fields(aopdict, 'AOP', ['dc:identifier', 'dc:title'])
+    except Exception as e:
+        logger.error(f"AOP required fields validation failed: {e}")
+    logger.info(f'Completed chemical parsing: {len(chedict)} chemicals processed')
+
+    for stressor_id in strdict:
+        _resolve_stressor(stressor_id, refs, strdict)
+    logger.info(f'Completed stressor parsing: {len(strdict)} stressors processed')
+    logger.info(f'Taxonomy parsing completed: {len(taxdict)} taxonomies processed')
+
+    for aop_id, links in aop_links.items():
+        _resolve_aop_taxonomy(aop_id, links['taxonomy'], aopdict, taxdict)
+    del aop_links
+    logger.info(f'AOP taxonomy second pass completed')
+    logger.info(f'Biological Activity parsing completed: {len(bioactdict)} annotations processed')
+    logger.info(f'Biological Process parsing completed: {len(bioprodict)} annotations processed')
+    logger.info(f'Biological Object parsing completed: {len(bioobjdict)} annotations processed')
+
+    # Key Events seeded by the AOP pass keep their position, as in the tree
+    # parser, where they are filled in place.
+    for ke_id, ke in ke_pending.items():
+        kedict[ke_id] = ke
+        _resolve_key_event(ke_id, refs, kedict, taxdict, strdict, bioprodict,
+                           bioobjdict, bioactdict)
+    del ke_pending
+    logger.info(f'Key Events parsing completed: {len(kedict)} events processed')
+
+    for ker_id in kerdict:
+        _resolve_ker(ker_id, refs, kerdict, taxdict)
+    logger.info(f'Key Event Relationships parsing completed: {len(kerdict)} relationships processed')
+
+    entities = ParsedEntities(
+        refs=refs,
+        aopdict=aopdict,
+        kedict=kedict,
+        kerdict=kerdict,
+        stressordict=strdict,
+        chemicaldict=chedict,
+        taxdict=taxdict,
+        celldict=celldict,
+        organdict=organdict,
+        bpdict=bioprodict,
+        bodict=bioobjdict,
+        badict=bioactdict,
+        prodict={},
+    )
+    return entities, side_tables
@@ -13,24 +13,31 @@ import stat
 import time
 from datetime import date
 from pathlib import Path
-from xml.etree.ElementTree import parse
 
 import requests
 
+from aopwiki_rdf.checkpoint import CheckpointStore
 from aopwiki_rdf.config import PipelineConfig
-from aopwiki_rdf.parser.xml_parser import parse_aopwiki_xml, AOPXML_NS
+from aopwiki_rdf.parser.download import download_and_decompress, download_with_retry
+from aopwiki_rdf.parser.xml_parser import stream_aopwiki_xml, AOPXML_NS
 from aopwiki_rdf.hgnc import download_hgnc_data
+from aopwiki_rdf.http_cache import ConditionalFetcher
 from aopwiki_rdf.mapping.gene_mapper import (
+    build_gene_automaton,
     build_gene_dicts,
     build_token_owners,
     map_genes_in_entities,
     build_gene_xrefs,
 )
+from aopwiki_rdf.mapping.incremental import dictionary_fingerprint, load_manifest, save_manifest
+from aopwiki_rdf.mapping.bern2_gc import collect_cache_garbage
 from aopwiki_rdf.mapping.ner_el_mapper import (
+    map_ner_genes_in_corpus_result,
     map_ner_genes_in_kers_result,
     map_ner_genes_in_kes_result,
     union_ner_into_entities,
 )
+from aopwiki_rdf.mapping.bridgedb import fetch_properties, open_client
 from aopwiki_rdf.mapping.chemical_mapper import map_chemicals
 from aopwiki_rdf.mapping.iri_labels import (
     build_chem_label_map,
@@ -40,6 +47,7 @@ from aopwiki_rdf.mapping.iri_labels import (
 from aopwiki_rdf.mapping.protein_ontology import download_and_parse_promapping
 from aopwiki_rdf.rdf.writer import write_aop_rdf, write_enriched_rdf, write_genes_rdf, write_void_rdf
 from aopwiki_rdf.provenance import release_metadata
+from aopwiki_rdf.scheduler import run_stages
 
 logger = logging.getLogger(__name__)
 
@@ -70,22 +78,12 @@ def _collect(data, key, prefix, target):
         target.append(val)
 
 
-def _download_with_retry(url, filename, timeout=30, max_retries=3):
-    """Download a file with retry logic and exponential backoff."""
-    for attempt in range(max_retries):
-        try:
-            logger.info("Downloading %s (attempt %d/%d)", url, attempt + 1, max_retries)
-            resp = requests.get(url, verify=False, timeout=timeout)
-            resp.raise_for_status()
-            with open(filename, "wb") as f:
-                f.write(resp.content)
-            return True
-        except requests.RequestException as e:
-            logger.warning("Download attempt %d failed: %s", attempt + 1, e)
-            if attempt == max_retries - 1:
-                raise
-            time.sleep(2 ** attempt)
-    return False
+def _fetcher(config):
+    """Conditional-request fetcher over config.http_cache_dir, or None when unset."""
+    if config.http_cache_dir is None:
+        return None
+    return ConditionalFetcher(config.http_cache_dir, timeout=config.request_timeout,
+                              max_retries=config.max_retries)
 
 
 def _count_triples(filepath):
@@ -98,6 +96,21 @@ def _count_triples(filepath):
     return count
 
 
+def _triple_count(config, filepath, stats):
+    """VoID triple total from the writer's stats; rdflib when missing or verifying.
+
+    On a mismatch with the opt-in rdflib cross-check, rdflib's count wins.
+    """
+    if stats is not None and not config.verify_triple_counts:
+        logger.info("Triple count for %s: %d", filepath, stats.total)
+        return stats.total
+    count = _count_triples(filepath)
+    if stats is not None and stats.total != count:
+        logger.error("Writer triple count %d != rdflib count %d for %s",
+                     stats.total, count, filepath)
+    return count
+
+
 # ---------------------------------------------------------------------------
 # Pipeline stages
 # ---------------------------------------------------------------------------
@@ -142,17 +155,30 @@ def _stage_parse(config, context):
             logger.error("Failed to read pinned XML snapshot %s: %s", src, e)
             raise SystemExit(1)
         xml_path = dest
+    elif config.stream_xml_download:
+        # Stream the export through gunzip into the one XML copy, in place of
+        # the buffered download + extract below.
+        aopwikixmlfilename = f"aop-wiki-xml-{date.today()}"
+        xml_path = filepath + aopwikixmlfilename
+        try:
+            download_and_decompress(config.aopwiki_xml_url, xml_path,
+                                    timeout=config.request_timeout,
+                                    max_retries=config.max_retries, fetcher=_fetcher(config))
+        except (requests.RequestException, gzip.BadGzipFile, IOError) as e:
+            logger.error("Failed to download AOP-Wiki XML: %s", e)
+            raise SystemExit(1)
     else:
         today = date.today()
         aopwikixmlfilename = f"aop-wiki-xml-{today}"
 
         # Download
         try:
-            _download_with_retry(
+            download_with_retry(
                 config.aopwiki_xml_url,
                 aopwikixmlfilename,
                 timeout=config.request_timeout,
                 max_retries=config.max_retries,
+                fetcher=_fetcher(config),
             )
         except requests.RequestException as e:
             logger.error("Failed to download AOP-Wiki XML: %s", e)
@@ -170,18 +196,14 @@ def _stage_parse(config, context):
 
         xml_path = filepath + aopwikixmlfilename
 
-    # Parse XML to get root for mapping stages
-    tree = parse(xml_path)
-    xml_root = tree.getroot()
-    aopxml_ns = AOPXML_NS
-
-    # Parse entities via the parser module (config=None to skip internal
-    # promapping -- we call protein_ontology module separately)
-    entities = parse_aopwiki_xml(xml_path, config=None)
+    # Single streaming pass (no internal BridgeDb/promapping -- the chemical
+    # and protein_ontology stages run separately). Gene mapping gets the
+    # compact side tables instead of a second element tree.
+    entities, side_tables = stream_aopwiki_xml(xml_path, cache_dir=config.parse_cache_dir)
 
     context["entities"] = entities
-    context["xml_root"] = xml_root
-    context["aopxml_ns"] = aopxml_ns
+    context["xml_side_tables"] = side_tables
+    context["aopxml_ns"] = AOPXML_NS
     context["aopwikixmlfilename"] = aopwikixmlfilename
 
 
@@ -208,19 +230,21 @@ def _stage_filter_arr_aops(config, context):
     )
 
 
+def _bridgedb_client(config):
+    """Pooled BridgeDb client, caching xrefs per data release if configured."""
+    return open_client(config.bridgedb_url, max_workers=config.bridgedb_workers,
+                       max_retries=config.max_retries, timeout=config.request_timeout,
+                       cache_dir=config.bridgedb_cache_dir)
+
+
 def _stage_chemicals(config, context):
     """Map chemicals via BridgeDb batch API."""
     entities = context["entities"]
-    xml_root = context["xml_root"]
-    aopxml_ns = context["aopxml_ns"]
 
-    chem_result = map_chemicals(
-        entities.chemicaldict,
-        xml_root,
-        aopxml_ns,
-        bridgedb_url=config.bridgedb_url,
-        timeout=config.request_timeout,
-    )
+    with _bridgedb_client(config) as client:
+        chem_result = map_chemicals(entities.chemicaldict,
+                                    bridgedb_url=config.bridgedb_url,
+                                    timeout=config.request_timeout, client=client)
     context["chemical_result"] = chem_result
 
 
@@ -252,6 +276,8 @@ def _stage_protein_ontology(config, context):
         promapping_url=config.promapping_url,
         data_dir=config.data_dir,
         prolist=prolist,
+        index_dir=config.promapping_index_dir,
+        fetcher=_fetcher(config),
     )
     context["pro_result"] = pro_result
 
@@ -288,8 +314,13 @@ def _apply_bern2_enrichment(kedict, kerdict, gene_hgnclist, config):
     """
     existing_hgnc = set(gene_hgnclist)
 
-    # KE branch: union BERN2 NER detections into KE gene mappings.
-    ner_results = map_ner_genes_in_kes_result(kedict, config)
+    # KE branch: union BERN2 NER detections into KE gene mappings. With
+    # ner_dedupe both corpora are annotated up front, each distinct text once.
+    if config.ner_dedupe:
+        ner_results, ker_ner_results = map_ner_genes_in_corpus_result(kedict, kerdict, config)
+    else:
+        ner_results = map_ner_genes_in_kes_result(kedict, config)
+        ker_ner_results = map_ner_genes_in_kers_result(kerdict, config)
     ok, degraded, skipped = union_ner_into_entities(
         kedict, ner_results, gene_hgnclist, existing_hgnc,
         fallback_on_failure=config.ner_fallback_on_failure,
@@ -318,7 +349,6 @@ def _apply_bern2_enrichment(kedict, kerdict, gene_hgnclist, config):
     # union NER union, with NER-detected genes populating :geneDetectedByNER on
     # the KER subject (the writer emits it automatically whenever _genes_ner is
     # set).
-    ker_ner_results = map_ner_genes_in_kers_result(kerdict, config)
     ker_ok, ker_degraded, ker_skipped = union_ner_into_entities(
         kerdict, ker_ner_results, gene_hgnclist, existing_hgnc,
         fallback_on_failure=config.ner_fallback_on_failure,
@@ -341,14 +371,12 @@ def _apply_bern2_enrichment(kedict, kerdict, gene_hgnclist, config):
         "BERN2 KER enrichment coverage: %d ok, %d degraded, %d skipped, %d total",
         ker_ok, ker_degraded, ker_skipped, ker_total,
     )
+    if config.ner_cache_retention_days is not None:
+        collect_cache_garbage(kedict, kerdict, config, config.ner_cache_retention_days)
 
 
-def _stage_gene_mapping(config, context):
-    """Download HGNC data, build gene dicts, map genes, build xrefs."""
-    entities = context["entities"]
-    xml_root = context["xml_root"]
-    aopxml_ns = context["aopxml_ns"]
-
+def _stage_hgnc_download(config, context):
+    """Download HGNC data and build the gene dicts and token owners."""
     # Download HGNC data
     hgnc_cache_path = config.data_dir / "HGNCgenes.txt"
     _hgnc_content = download_hgnc_data(
@@ -357,6 +385,7 @@ def _stage_gene_mapping(config, context):
         timeout=config.request_timeout,
         max_retries=config.max_retries,
         min_genes=config.hgnc_min_genes,
+        fetcher=_fetcher(config),
     )
 
     # Get HGNC file modification time
@@ -375,17 +404,37 @@ def _stage_gene_mapping(config, context):
     # mention of "AR" no longer asserts AR, FDXR and AREG all at once.
     token_owners = build_token_owners(genedict1, symbol_lookup)
 
-    # Map genes in KE/KER text
+    context["hgnc_filepath"] = hgnc_filepath
+    context["hgnc_modification_time"] = hgnc_mod_time
+    context["gene_dicts"] = (genedict1, genedict2, symbol_lookup, token_owners)
+
+
+def _stage_gene_mapping(config, context):
+    """Map genes in KE/KER text, optionally enrich via BERN2, build xrefs."""
+    entities = context["entities"]
+    side_tables = context["xml_side_tables"]
+    aopxml_ns = context["aopxml_ns"]
+    hgnc_filepath = context["hgnc_filepath"]
+    genedict1, genedict2, symbol_lookup, token_owners = context["gene_dicts"]
+
+    # Map genes in KE/KER text. The HGNC fingerprint keys both the incremental
+    # manifest (unchanged texts replay the previous run's results) and the
+    # saved automaton (reused instead of rebuilt while HGNCgenes.txt is unchanged).
+    fingerprint = dictionary_fingerprint(hgnc_filepath)
+    manifest = automaton_path = None
+    if config.incremental_dir is not None:
+        manifest = load_manifest(config.incremental_dir, fingerprint)
+    if config.automaton_cache_dir is not None:
+        automaton_path = config.automaton_cache_dir / "HGNCgenes.automaton"
+    automaton = build_gene_automaton(genedict1, symbol_lookup, token_owners,
+                                     cache_path=automaton_path, cache_key=fingerprint)
     kedict, kerdict, gene_hgnclist = map_genes_in_entities(
-        entities.kedict,
-        entities.kerdict,
-        genedict1,
-        genedict2,
-        xml_root,
-        aopxml_ns,
-        token_owners,
-        symbol_lookup,
+        entities.kedict, entities.kerdict, genedict1, genedict2, side_tables, aopxml_ns,
+        token_owners, symbol_lookup, manifest=manifest, automaton=automaton,
+        workers=config.gene_mapping_workers,
     )
+    if manifest is not None:
+        save_manifest(config.incremental_dir, fingerprint, manifest)
 
     # Optional BERN2 NER+EL enrichment (Phase B). When config.enable_bern2
     # is True, BERN2 scans KE descriptions for descriptive-name gene
@@ -397,20 +446,23 @@ def _stage_gene_mapping(config, context):
 
     # Build cross-references via BridgeDb (gene_hgnclist now includes any
     # BERN2-discovered HGNC IDs appended by _apply_bern2_enrichment)
-    xref_result = build_gene_xrefs(
-        gene_hgnclist,
-        bridgedb_url=config.bridgedb_url,
-        timeout=config.request_timeout,
-        symbol_lookup=symbol_lookup,
-    )
+    with _bridgedb_client(config) as client:
+        xref_result = build_gene_xrefs(gene_hgnclist, config.bridgedb_url,
+                                       timeout=config.request_timeout,
+                                       symbol_lookup=symbol_lookup, client=client)
 
     context["gene_kedict"] = kedict
     context["gene_kerdict"] = kerdict
     context["gene_hgnclist"] = gene_hgnclist
     context["gene_xref_result"] = xref_result
-    context["hgnc_modification_time"] = hgnc_mod_time
     context["gene_symbol_lookup"] = symbol_lookup
 
+
+def _stage_iri_labels(config, context):
+    """Build the xref IRI label maps and, if enabled, the coverage report."""
+    xref_result = context["gene_xref_result"]
+    symbol_lookup = context["gene_symbol_lookup"]
+
     # Build the inverted xref_iri -> name label maps ONCE (both upstream stages
     # have run). Byte-stable, order-independent, network-free (LABEL-02 / D-03);
     # the writer (Plan 08-02) consumes them by loop variable like symbol_lookup.
@@ -475,8 +527,8 @@ def _stage_write_aop_rdf(config, context):
     writer_entities["chem_label_by_iri"] = context.get("chem_label_by_iri", {})
 
     prefix_csv = "prefixes.csv"
-    write_aop_rdf(filepath + "AOPWikiRDF.ttl", writer_entities, prefix_csv, config=config)
-    context["triple_count_main"] = _count_triples(filepath + "AOPWikiRDF.ttl")
+    stats = write_aop_rdf(filepath + "AOPWikiRDF.ttl", writer_entities, prefix_csv, config=config)
+    context["triple_count_main"] = _triple_count(config, filepath + "AOPWikiRDF.ttl", stats)
     logger.info("RDF file created: %sAOPWikiRDF.ttl", filepath)
 
 
@@ -493,8 +545,8 @@ def _stage_write_enriched_rdf(config, context):
         "prodict": pro_result["prodict"],
     }
 
-    write_enriched_rdf(filepath + "AOPWikiRDF-Enriched.ttl", enrichment_data, config=config)
-    context["triple_count_enriched"] = _count_triples(filepath + "AOPWikiRDF-Enriched.ttl")
+    stats = write_enriched_rdf(filepath + "AOPWikiRDF-Enriched.ttl", enrichment_data, config=config)
+    context["triple_count_enriched"] = _triple_count(config, filepath + "AOPWikiRDF-Enriched.ttl", stats)
 
 
 def _stage_write_genes_rdf(config, context):
@@ -516,8 +568,8 @@ def _stage_write_genes_rdf(config, context):
         "chem_label_by_iri": context.get("chem_label_by_iri", {}),
     }
 
-    write_genes_rdf(filepath + "AOPWikiRDF-Genes.ttl", gene_data, config=config)
-    context["triple_count_genes"] = _count_triples(filepath + "AOPWikiRDF-Genes.ttl")
+    stats = write_genes_rdf(filepath + "AOPWikiRDF-Genes.ttl", gene_data, config=config)
+    context["triple_count_genes"] = _triple_count(config, filepath + "AOPWikiRDF-Genes.ttl", stats)
 
 
 def _stage_write_void_rdf(config, context):
@@ -527,30 +579,7 @@ def _stage_write_void_rdf(config, context):
     pro_result = context["pro_result"]
 
     # BridgeDb properties for VoID metadata
-    try:
-        response = requests.get(
-            config.bridgedb_url + "properties",
-            timeout=config.request_timeout,
-        )
-        response.raise_for_status()
-        lines = response.text.split("\n")
-    except requests.RequestException as e:
-        logger.warning("BridgeDb properties request failed: %s", e)
-        lines = []
-
-    info = {}
-    for item in lines:
-        parts = item.split("\t")
-        # Only ``key\tvalue`` rows are meaningful. Blank lines, HTML error
-        # pages, or any unexpected response shape (which split to a single
-        # field) are skipped so they never pollute ``info`` with an
-        # empty-string key or a key holding an empty value list.
-        if len(parts) != 2:
-            continue
-        if parts[0] not in info:
-            info[parts[0]] = []
-        info[parts[0]].append(parts[1])
-
+    info = fetch_properties(config.bridgedb_url, config.request_timeout, fetcher=_fetcher(config))
     if "DATASOURCENAME" in info and "DATASOURCEVERSION" in info:
         names, versions = info["DATASOURCENAME"], info["DATASOURCEVERSION"]
         logger.info(
@@ -597,13 +626,32 @@ STAGES = [
     ("Filter ARR-licensed AOPs", _stage_filter_arr_aops),
     ("Chemical Mapping", _stage_chemicals),
     ("Protein Ontology Mapping", _stage_protein_ontology),
+    ("HGNC Download", _stage_hgnc_download),
     ("HGNC Gene Mapping", _stage_gene_mapping),
+    ("IRI Label Maps", _stage_iri_labels),
     ("Write Main RDF", _stage_write_aop_rdf),
     ("Write Enriched RDF", _stage_write_enriched_rdf),
     ("Write Genes RDF", _stage_write_genes_rdf),
     ("Write VoID RDF", _stage_write_void_rdf),
 ]
 
+# Which earlier stages each stage reads from (see aopwiki_rdf.scheduler). With
+# config.stage_workers > 1 everything whose dependencies are done runs at once.
+_MAPPED = ("Chemical Mapping", "Protein Ontology Mapping", "IRI Label Maps")
+STAGE_DEPENDS = {
+    "XML Download & Parse": ("Setup & Static Files",),
+    "Filter ARR-licensed AOPs": ("XML Download & Parse",),
+    "Chemical Mapping": ("Filter ARR-licensed AOPs",),
+    "Protein Ontology Mapping": ("Filter ARR-licensed AOPs",),
+    "HGNC Download": ("Setup & Static Files",),
+    "HGNC Gene Mapping": ("Filter ARR-licensed AOPs", "HGNC Download"),
+    "IRI Label Maps": ("Chemical Mapping", "HGNC Gene Mapping"),
+    "Write Main RDF": _MAPPED,
+    "Write Enriched RDF": _MAPPED,
+    "Write Genes RDF": _MAPPED,
+    "Write VoID RDF": ("Write Main RDF", "Write Enriched RDF", "Write Genes RDF"),
+}
+
 
 def main(config: PipelineConfig | None = None) -> None:
     """Run the full AOP-Wiki XML to RDF conversion pipeline.
@@ -634,12 +682,11 @@ def main(config: PipelineConfig | None = None) -> None:
     pipeline_start = time.time()
     context: dict = {}
 
-    for stage_name, stage_fn in STAGES:
-        t0 = time.time()
-        logger.info("Stage: %s -- starting", stage_name)
-        stage_fn(config, context)
-        elapsed = time.time() - t0
-        logger.info("Stage: %s -- completed in %.1fs", stage_name, elapsed)
+    checkpoint = None
+    if config.checkpoint_dir is not None:
+        checkpoint = CheckpointStore(config.checkpoint_dir, config, resume=config.resume)
+    run_stages(STAGES, STAGE_DEPENDS, config, context,
+               max_workers=config.stage_workers, checkpoint=checkpoint)
 
     total_elapsed = time.time() - pipeline_start
     logger.info("AOP-Wiki RDF pipeline completed successfully in %.1fs", total_elapsed)
@@ -10,6 +10,7 @@ to preserve byte-identical output with the monolith.
 import datetime
 import logging
 import re
+from dataclasses import dataclass, field
 
 import pandas as pd
 
@@ -18,6 +19,7 @@ from aopwiki_rdf.rdf.namespaces import (
     GENES_PROVENANCE_ACTIVITIES, GENES_MINTED_PREDICATE_LABELS,
     VOID_PREFIXES, ENRICHED_PREFIXES,
 )
+from aopwiki_rdf.rdf.stats import TripleCounter
 from aopwiki_rdf.utils import clean_html_tags
 
 logger = logging.getLogger(__name__)
@@ -243,6 +245,51 @@ def _write_gene_block(fh, entity: dict, provenance: bool) -> None:
     fh.write(' ;\n'.join(lines) + ' .\n\n')
 
 
+@dataclass
+class _MembershipIndexes:
+    """Reverse lookups behind the main file's ``dcterms:isPartOf`` links.
+
+    Every list keeps the order the old per-entity scans produced (the order
+    of the dict being scanned), so the output is byte-identical.
+    """
+
+    aops_by_ke: dict = field(default_factory=dict)
+    aops_by_ker: dict = field(default_factory=dict)
+    aops_by_stressor: dict = field(default_factory=dict)
+    kes_by_stressor: dict = field(default_factory=dict)
+    kes_by_identifier: dict = field(default_factory=dict)
+    stressors_by_chemical: dict = field(default_factory=dict)
+
+
+def _build_membership_indexes(aopdict, kedict, strdict):
+    """Invert the AOP, KE and stressor membership dicts in one pass each.
+
+    Replaces scanning every AOP per KE/KER, every KE x KE x AOP per stressor
+    and every stressor per chemical, which grew quadratically (the stressor
+    section cubically) with the size of AOP-Wiki.
+    """
+    idx = _MembershipIndexes()
+    for aop, aop_data in aopdict.items():
+        identifier = aop_data['dc:identifier']
+        for ke in aop_data.get('aopo:has_key_event', {}):
+            idx.aops_by_ke.setdefault(ke, []).append(identifier)
+        for ker in aop_data.get('aopo:has_key_event_relationship', {}):
+            idx.aops_by_ker.setdefault(ker, []).append(identifier)
+        for stressor in aop_data.get('nci:C54571', {}):
+            idx.aops_by_stressor.setdefault(stressor, []).append(identifier)
+    for ke, ke_data in kedict.items():
+        idx.kes_by_identifier.setdefault(ke_data['dc:identifier'], []).append(ke)
+        for stressor in ke_data.get('nci:C54571', {}):
+            idx.kes_by_stressor.setdefault(stressor, []).append(ke)
+    for stressor, str_data in strdict.items():
+        if 'aopo:has_chemical_entity' not in str_data:
+            continue
+        # dict.fromkeys: a chemical linked twice still lists the stressor once.
+        for che in dict.fromkeys(str_data.get('linktochemical', [])):
+            idx.stressors_by_chemical.setdefault(che, []).append(str_data['dc:identifier'])
+    return idx
+
+
 # ---------------------------------------------------------------------------
 # Main RDF file writer (pipeline.py lines 1280-1812)
 # ---------------------------------------------------------------------------
@@ -268,6 +315,12 @@ def write_aop_rdf(filepath, entities, prefix_csv_path, config=None):
         Pipeline configuration. When None, only owl:sameAs is emitted.
         When config.emit_legacy_predicates is True, both skos:exactMatch
         and owl:sameAs are emitted.
+
+    Returns
+    -------
+    TripleStats or None
+        Distinct-triple counts gathered while writing (see
+        :mod:`aopwiki_rdf.rdf.stats`); None if they could not be computed.
     """
     # Unpack entities
     aopdict = entities['aopdict']
@@ -309,9 +362,12 @@ def write_aop_rdf(filepath, entities, prefix_csv_path, config=None):
     chem_label_by_iri = entities.get('chem_label_by_iri', {})
     gene_label_by_iri = entities.get('gene_label_by_iri', {})
 
+    membership = _build_membership_indexes(aopdict, kedict, strdict)
+
     logger.info(f"Writing main RDF file: {filepath}")
 
-    with open(filepath, 'w', encoding='utf-8') as g:
+    with open(filepath, 'w', encoding='utf-8') as fh:
+        g = TripleCounter(fh)
         # --- Prefixes ---
         rdf_prefixes = get_main_prefixes(prefix_csv_path)
         g.write(rdf_prefixes + "\n")
@@ -456,12 +512,7 @@ def write_aop_rdf(filepath, entities, prefix_csv_path, config=None):
                     values = sorted(set(kedict[ke]['biological-event'].get(p, [])))
                     _write_multivalue_triple(g, p, values)
 
-            aop_links = [
-                aopdict[aop]['dc:identifier']
-                for aop in aopdict
-                if ke in aopdict[aop]['aopo:has_key_event']
-            ]
-            _write_multivalue_triple(g, 'dcterms:isPartOf', aop_links)
+            _write_multivalue_triple(g, 'dcterms:isPartOf', membership.aops_by_ke.get(ke, []))
 
             g.write(' .\n\n')
 
@@ -515,12 +566,7 @@ def write_aop_rdf(filepath, entities, prefix_csv_path, config=None):
             if 'ncbitaxon:131567' in kerdict[ker]:
                 _write_multivalue_triple(g, 'ncbitaxon:131567', [tax[2] for tax in kerdict[ker]['ncbitaxon:131567']])
 
-            aop_links = [
-                aopdict[aop]['dc:identifier']
-                for aop in aopdict
-                if ker in aopdict[aop]['aopo:has_key_event_relationship']
-            ]
-            _write_multivalue_triple(g, 'dcterms:isPartOf', aop_links)
+            _write_multivalue_triple(g, 'dcterms:isPartOf', membership.aops_by_ker.get(ker, []))
 
             g.write(' .\n\n')
 
@@ -556,23 +602,14 @@ def write_aop_rdf(filepath, entities, prefix_csv_path, config=None):
 
             _write_multivalue_triple(g, 'aopo:has_chemical_entity', [chedict[chem]['dc:identifier'] for chem in strdict[stressor].get('linktochemical', [])])
 
-            ke_ids = [
-                kedict[ke]['dc:identifier']
-                for ke in kedict
-                if 'nci:C54571' in kedict[ke] and stressor in kedict[ke]['nci:C54571']
-            ]
+            ke_ids = [kedict[ke]['dc:identifier'] for ke in membership.kes_by_stressor.get(stressor, [])]
 
-            aop_ids = set()
+            # AOPs containing any KE the stressor acts on (matched by KE
+            # identifier), plus the AOPs that name the stressor directly.
+            aop_ids = set(membership.aops_by_stressor.get(stressor, []))
             for ke_id in ke_ids:
-                for ke in kedict:
-                    if kedict[ke]['dc:identifier'] == ke_id:
-                        for aop in aopdict:
-                            if ke in aopdict[aop]['aopo:has_key_event']:
-                                aop_ids.add(aopdict[aop]['dc:identifier'])
-
-            for aop in aopdict:
-                if stressor in aopdict[aop].get('nci:C54571', {}):
-                    aop_ids.add(aopdict[aop]['dc:identifier'])
+                for ke in membership.kes_by_identifier[ke_id]:
+                    aop_ids.update(membership.aops_by_ke.get(ke, []))
 
             # sorted() for byte-stable output: aop_ids is a set (hash-seed-randomized
             # iteration), so emit a deterministically ordered, de-duplicated union.
@@ -638,13 +675,7 @@ def write_aop_rdf(filepath, entities, prefix_csv_path, config=None):
             if 'dcterms:alternative' in che_data:
                 _write_multivalue_triple(g, 'dcterms:alternative', che_data['dcterms:alternative'], quote=True)
 
-            part_of_stressors = [
-                strdict[stressor]['dc:identifier']
-                for stressor in strdict
-                if 'aopo:has_chemical_entity' in strdict[stressor]
-                and che in strdict[stressor]['linktochemical']
-            ]
-            _write_multivalue_triple(g, 'dcterms:isPartOf', part_of_stressors)
+            _write_multivalue_triple(g, 'dcterms:isPartOf', membership.stressors_by_chemical.get(che, []))
 
             g.write(' .\n\n')
 
@@ -752,6 +783,7 @@ def write_aop_rdf(filepath, entities, prefix_csv_path, config=None):
         g.write(_external_predicate_label_block(
             emit_labels, set(prefixes['prefix'].astype(str)),
         ))
+        stats = g.close()
 
     logger.info("AOP-Wiki RDF conversion completed successfully!")
     logger.info("=== Conversion Summary ===")
@@ -760,6 +792,7 @@ def write_aop_rdf(filepath, entities, prefix_csv_path, config=None):
     logger.info(f"Total KERs processed: {len(kerdict)}")
     logger.info(f"Total Chemicals processed: {len(chedict)}")
     logger.info(f"RDF file created: {filepath}")
+    return stats
 
 
 # ---------------------------------------------------------------------------
@@ -784,6 +817,12 @@ def write_enriched_rdf(filepath, enrichment_data, config=None):
         Pipeline configuration. When None, only owl:sameAs is emitted.
         When config.emit_legacy_predicates is True, both skos:exactMatch
         and owl:sameAs are emitted.
+
+    Returns
+    -------
+    TripleStats or None
+        Distinct-triple counts gathered while writing; None if they could not
+        be computed.
     """
     chedict = enrichment_data['chedict']
     bioobjdict = enrichment_data['bioobjdict']
@@ -791,7 +830,8 @@ def write_enriched_rdf(filepath, enrichment_data, config=None):
 
     logger.info(f"Writing enriched RDF file: {filepath}")
 
-    with open(filepath, 'w', encoding='utf-8') as g:
+    with open(filepath, 'w', encoding='utf-8') as fh:
+        g = TripleCounter(fh)
         # Header comment and prefixes
         g.write(f"# Generated: {datetime.date.today()}\n")
         g.write("# Load alongside AOPWikiRDF.ttl for full cross-reference capability\n")
@@ -845,8 +885,10 @@ def write_enriched_rdf(filepath, enrichment_data, config=None):
                 pro_count += 1
 
         logger.info(f"Protein ontology cross-references written: {pro_count}")
+        stats = g.close()
 
     logger.info(f"Enriched RDF file created: {filepath}")
+    return stats
 
 
 # ---------------------------------------------------------------------------
@@ -867,6 +909,12 @@ def write_genes_rdf(filepath, gene_data, config=None):
         Optional 'symbol_lookup' for gene rdfs:label generation.
     config : PipelineConfig, optional
         Pipeline configuration. When None, only owl:sameAs is emitted.
+
+    Returns
+    -------
+    TripleStats or None
+        Distinct-triple counts gathered while writing; None if they could not
+        be computed.
     """
     kedict = gene_data['kedict']
     kerdict = gene_data['kerdict']
@@ -892,7 +940,8 @@ def write_genes_rdf(filepath, gene_data, config=None):
     emit_labels = bool(config and getattr(config, 'enable_iri_labels', False))
     gene_label_by_iri = gene_data.get('gene_label_by_iri', {})
 
-    with open(filepath, 'w', encoding='utf-8') as g:
+    with open(filepath, 'w', encoding='utf-8') as fh:
+        g = TripleCounter(fh)
         if genes_provenance:
             g.write(GENES_PROVENANCE_PREFIX)
         g.write(GENES_PREFIXES + '\n')
@@ -954,8 +1003,10 @@ def write_genes_rdf(filepath, gene_data, config=None):
         for uniprot in listofuniprot:
             g.write(uniprot + '\ta\tedam:data_2291, edam:data_1025 ;\n\tedam:data_2291\t"' + uniprot[8:] + '";\n\tdc:identifier\t"' + uniprot + '";\n\tdc:source\t"UniProt"' + _iri_label_clause(emit_labels, uniprot, gene_label_by_iri) + '.\n\n')
         logger.info(f"{len(listofuniprot)} UniProt triples written")
+        stats = g.close()
 
     logger.info("AOP-Wiki RDF Genes file created successfully")
+    return stats
 
 
 # ---------------------------------------------------------------------------
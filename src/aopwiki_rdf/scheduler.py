@@ -0,0 +1,129 @@
+"""Dependency-aware runner for the pipeline stages.
+
+``pipeline.STAGES`` lists the stages in an order that is valid to run one by
+one; ``pipeline.STAGE_DEPENDS`` declares which earlier stages each one reads
+from. With one worker the stages run sequentially in list order, exactly as
+before. With more, every stage whose dependencies have completed is handed to
+a thread pool, so the network-bound mapping stages (BridgeDb chemicals, the
+promapping.txt and HGNC downloads) and the independent writers overlap.
+
+Stages communicate only through distinct keys of the shared ``context`` dict,
+and a stage only reads what its declared dependencies wrote, so the output
+does not depend on the worker count.
+
+No module-level side effects.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+logger = logging.getLogger(__name__)
+
+
+def validate_stage_graph(stages, depends) -> None:
+    """Check that every dependency names a stage declared earlier in ``stages``.
+
+    Requiring dependencies to come first keeps the list order a valid
+    sequential schedule and rules out cycles.
+
+    Raises
+    ------
+    ValueError
+        On a dependency that is unknown or declared after its dependent, or a
+        ``depends`` entry for a stage that does not exist.
+    """
+    seen = set()
+    for name, _fn in stages:
+        for dep in depends.get(name, ()):
+            if dep not in seen:
+                raise ValueError(
+                    f"Stage {name!r} depends on {dep!r}, which is not declared before it"
+                )
+        seen.add(name)
+    unknown = set(depends) - seen
+    if unknown:
+        raise ValueError(f"Dependencies declared for unknown stages: {sorted(unknown)}")
+
+
+def _run_stage(name, fn, config, context) -> None:
+    t0 = time.time()
+    logger.info("Stage: %s -- starting", name)
+    fn(config, context)
+    elapsed = time.time() - t0
+    logger.info("Stage: %s -- completed in %.1fs", name, elapsed)
+
+
+def run_stages(stages, depends, config, context, max_workers: int = 1,
+               checkpoint=None) -> None:
+    """Run ``stages`` respecting ``depends``, up to ``max_workers`` at a time.
+
+    Parameters
+    ----------
+    stages : list[tuple[str, callable]]
+        ``(name, fn(config, context))`` pairs in a valid sequential order.
+    depends : dict[str, tuple[str, ...]]
+        Stage name -> names of the stages it must wait for. Stages absent from
+        the dict have no dependencies.
+    config : PipelineConfig
+        Passed through to every stage.
+    context : dict
+        Shared stage context, passed through to every stage.
+    max_workers : int
+        ``1`` (or less) runs the stages sequentially in list order.
+    checkpoint : CheckpointStore, optional
+        Snapshot ``context`` after every stage and skip the stages a resumed
+        checkpoint already covers (see :mod:`aopwiki_rdf.checkpoint`).
+        Snapshots must see a context no stage is still mutating, so
+        checkpointed runs are sequential regardless of ``max_workers``.
+
+    Raises
+    ------
+    ValueError
+        If the dependency graph is invalid (see :func:`validate_stage_graph`).
+
+    Notes
+    -----
+    The first stage to fail stops the run: no further stages are started,
+    stages already running are allowed to finish, and the failure (including
+    ``SystemExit``) is re-raised in the caller's thread.
+    """
+    validate_stage_graph(stages, depends)
+
+    if checkpoint is not None:
+        if max_workers > 1:
+            logger.info("Checkpointing enabled; running stages sequentially")
+        restored = checkpoint.restore(stages, context)
+        for name, fn in stages:
+            if name in restored:
+                logger.info("Stage: %s -- restored from checkpoint", name)
+                continue
+            _run_stage(name, fn, config, context)
+            checkpoint.save(name, context)
+        return
+
+    if max_workers <= 1:
+        for name, fn in stages:
+            _run_stage(name, fn, config, context)
+        return
+
+    pending = list(stages)
+    done = set()
+    running = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stage") as pool:
+        try:
+            while pending or running:
+                ready = [(name, fn) for name, fn in pending
+                         if all(dep in done for dep in depends.get(name, ()))]
+                for name, fn in ready:
+                    pending.remove((name, fn))
+                    running[pool.submit(_run_stage, name, fn, config, context)] = name
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    future.result()
+                    done.add(name)
+        except BaseException:
+            for future in running:
+                future.cancel()
+            raise
@@ -2,7 +2,9 @@
 
 import pytest
 
-from aopwiki_rdf.mapping.automaton import DELIMITERS, GeneAutomaton, _is_boundary
+from aopwiki_rdf.mapping.automaton import (
+    DELIMITERS, GeneAutomaton, MappedGeneAutomaton, _is_boundary,
+)
 from aopwiki_rdf.mapping.gene_mapper import _context_window
 
 SIMPLE = {'TP53': '11998', 'BRCA1': '1100', 'AR': '644'}
@@ -114,3 +116,57 @@ def test_context_window_snaps_to_whole_words():
 def test_context_window_respects_text_edges():
     text = 'TP53 induced'
     assert _context_window(text, 0, 4, radius=100) == text
+
+
+# --- Saved, memory-mapped form ---------------------------------------------
+
+OVERLAPPING = {'RAR': '1', 'AR': '2', 'TP53': '11998', 'P53': '3', 'BRCA1': '1100'}
+SCAN_TEXT = 'RAR and AR (TP53), P53 [BRCA1] ARX TP53.BRCA1 AR'
+
+
+def _saved(tmp_path, index, key='k1'):
+    path = tmp_path / 'genes.automaton'
+    GeneAutomaton(index).save(path, key)
+    return path
+
+
+def test_mapped_automaton_finds_exactly_what_the_original_does(tmp_path):
+    original = GeneAutomaton(OVERLAPPING)
+    mapped = MappedGeneAutomaton.load(_saved(tmp_path, OVERLAPPING), 'k1')
+    assert len(mapped) == len(original)
+    assert list(mapped.find(SCAN_TEXT)) == list(original.find(SCAN_TEXT))
+    assert list(mapped.find('')) == []
+
+
+def test_mapped_automaton_rejects_other_key_and_damaged_files(tmp_path):
+    path = _saved(tmp_path, OVERLAPPING)
+    assert MappedGeneAutomaton.load(path, 'other') is None
+    assert MappedGeneAutomaton.load(tmp_path / 'missing', 'k1') is None
+    path.write_bytes(path.read_bytes()[:-4])
+    assert MappedGeneAutomaton.load(path, 'k1') is None
+    path.write_bytes(b'')
+    assert MappedGeneAutomaton.load(path, 'k1') is None
+
+
+def test_mapped_automaton_pickles_as_a_file_reference(tmp_path):
+    """Workers re-map the file rather than receiving a copy of the tables."""
+    import pickle
+
+    mapped = MappedGeneAutomaton.load(_saved(tmp_path, OVERLAPPING), 'k1')
+    payload = pickle.dumps(mapped)
+    assert len(payload) < 500
+    assert list(pickle.loads(payload).find(SCAN_TEXT)) == list(mapped.find(SCAN_TEXT))
+
+
+def test_build_gene_automaton_reuses_saved_file(tmp_path, monkeypatch):
+    from aopwiki_rdf.mapping import gene_mapper
+
+    genedict1 = {'1100': ['BRCA1'], '11998': ['TP53', 'p53']}
+    path = tmp_path / 'HGNCgenes.automaton'
+    first = gene_mapper.build_gene_automaton(genedict1, cache_path=path, cache_key='v1')
+    assert isinstance(first, GeneAutomaton)
+
+    monkeypatch.setattr(gene_mapper, 'GeneAutomaton', None)  # a rebuild would fail
+    second = gene_mapper.build_gene_automaton(genedict1, cache_path=path, cache_key='v1')
+    assert isinstance(second, MappedGeneAutomaton)
+    assert list(second.find('p53 and BRCA1')) == list(first.find('p53 and BRCA1'))
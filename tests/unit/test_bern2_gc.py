@@ -0,0 +1,149 @@
+"""Tests for BERN2 cache garbage collection (mapping/bern2_gc.py). No network I/O."""
+
+import importlib.util
+import json
+import os
+import time
+
+import pytest
+
+from aopwiki_rdf.config import PipelineConfig
+from aopwiki_rdf.mapping.bern2_gc import ORPHANS_FILENAME, collect_cache_garbage, live_cache_keys
+from aopwiki_rdf.mapping.bern2_store import open_store
+from aopwiki_rdf.mapping.ner_el_mapper import _bridgedb_chunks, _cache_key
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DAY = 86400
+TP53 = {"obj": "gene", "mention": "TP53", "id": ["NCBIGene:7157"], "prob": 0.99}
+KEDICT = {"1": {"dc:description": '"""TP53 drives apoptosis."""'},
+          "2": {"dc:description": '"""   """'}}
+KERDICT = {"r1": {"dc:description": "Relationship text.", "nci:C80263": "Plausibility."}}
+
+
+def _put(cache_dir, kind, key, body, orphaned_days=None):
+    """Write one entry, stamped now as a fresh checkout would be.
+
+    With ``orphaned_days``, the entry is recorded as first found unreferenced
+    that many days ago.
+    """
+    suffix = ".json" if kind == "bern2" else ".txt"
+    path = cache_dir / kind / f"{key}{suffix}"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(body, encoding="utf-8")
+    if orphaned_days is not None:
+        sidecar = cache_dir / ORPHANS_FILENAME
+        orphans = json.loads(sidecar.read_text()) if sidecar.exists() else {}
+        orphans.setdefault(kind, {})[key] = time.time() - orphaned_days * DAY
+        sidecar.write_text(json.dumps(orphans))
+    return path
+
+
+def _cache(cache_dir):
+    """Entries for the corpus above, plus ones unreferenced for 60 days and for 1 day."""
+    tp53_key = _bridgedb_chunks({"7157"})[0][0]
+    _put(cache_dir, "bern2", _cache_key("TP53 drives apoptosis."),
+         json.dumps({"annotations": [TP53]}))
+    _put(cache_dir, "bern2", _cache_key("Relationship text."), '{"annotations": []}')
+    _put(cache_dir, "bern2", _cache_key("Plausibility."), '{"_error": "down"}')
+    _put(cache_dir, "bridgedb", tp53_key, "7157\tEntrez Gene\tHac:HGNC:11998\n")
+    orphans = [
+        _put(cache_dir, "bern2", _cache_key("An old edit of KE 1."), '{"annotations": []}', 60),
+        _put(cache_dir, "bridgedb", _cache_key("1,2,3"), "1\tEntrez Gene\tN/A\n", 60),
+    ]
+    recent = _put(cache_dir, "bern2", _cache_key("Edited yesterday."), '{"annotations": []}', 1)
+    return orphans, recent
+
+
+def test_live_keys_follow_texts_and_responses(tmp_path):
+    _cache(tmp_path)
+    live = live_cache_keys(KEDICT, KERDICT, PipelineConfig(ner_cache_dir=tmp_path))
+    assert live["bern2"] == {_cache_key(t) for t in
+                             ("TP53 drives apoptosis.", "Relationship text.", "Plausibility.")}
+    assert live["bridgedb"] == {_bridgedb_chunks({"7157"})[0][0]}
+
+
+def test_evicts_only_old_unreferenced_files(tmp_path):
+    orphans, recent = _cache(tmp_path)
+    before = sorted(p.name for p in tmp_path.rglob("*.*"))
+    sidecar = (tmp_path / ORPHANS_FILENAME).read_text()
+    config = PipelineConfig(ner_cache_dir=tmp_path)
+
+    dry = collect_cache_garbage(KEDICT, KERDICT, config, retention_days=30, dry_run=True)
+    assert sorted(p.name for p in tmp_path.rglob("*.*")) == before
+    assert (tmp_path / ORPHANS_FILENAME).read_text() == sidecar
+
+    report = collect_cache_garbage(KEDICT, KERDICT, config, retention_days=30)
+    assert report.evicted == dry.evicted == {"bern2": 1, "bridgedb": 1}
+    assert report.live == {"bern2": 3, "bridgedb": 1}
+    assert report.retained == {"bern2": 1, "bridgedb": 0}
+    assert report.reclaimed_bytes == dry.reclaimed_bytes > 0
+    assert not any(p.exists() for p in orphans) and recent.exists()
+    assert len(list(tmp_path.rglob("*.*"))) == len(before) - 2
+    orphans = json.loads((tmp_path / ORPHANS_FILENAME).read_text())
+    assert orphans == {"bern2": {_cache_key("Edited yesterday."): pytest.approx(
+        time.time() - DAY, abs=60)}, "bridgedb": {}}
+
+
+def test_age_counts_from_when_an_entry_was_first_unreferenced(tmp_path):
+    """A fresh checkout's mtimes say nothing: the first sighting starts the clock."""
+    config = PipelineConfig(ner_cache_dir=tmp_path)
+    orphan = _put(tmp_path, "bern2", _cache_key("Dropped from the export."), "{}")
+    stamp = time.time() - 90 * DAY
+    os.utime(orphan, (stamp, stamp))
+    revived = _put(tmp_path, "bern2", _cache_key("TP53 drives apoptosis."), "{}", 90)
+    now = time.time()
+
+    first = collect_cache_garbage(KEDICT, {}, config, retention_days=30, now=now)
+    assert first.evicted["bern2"] == 0 and first.retained["bern2"] == 1
+    orphans = json.loads((tmp_path / ORPHANS_FILENAME).read_text())
+    # Referenced again, so no longer counted as orphaned.
+    assert orphans["bern2"] == {_cache_key("Dropped from the export."): now}
+
+    later = collect_cache_garbage(KEDICT, {}, config, retention_days=30, now=now + 31 * DAY)
+    assert later.evicted["bern2"] == 1
+    assert not orphan.exists() and revived.exists()
+    assert json.loads((tmp_path / ORPHANS_FILENAME).read_text())["bern2"] == {}
+
+
+def test_collects_the_store(tmp_path):
+    orphans, recent = _cache(tmp_path)
+    config = PipelineConfig(ner_cache_dir=tmp_path, ner_cache_store=True)
+    with open_store(tmp_path) as store:
+        assert sum(c["entries"] for c in store.stats().values()) == 7
+    file_bytes = sum(p.stat().st_size for p in orphans)
+
+    report = collect_cache_garbage(KEDICT, KERDICT, config, retention_days=30)
+    assert report.evicted == {"bern2": 1, "bridgedb": 1}
+    # Each entry's row and its per-file copy.
+    assert report.reclaimed_bytes == 2 * file_bytes
+    assert not any(p.exists() for p in orphans) and recent.exists()
+    with open_store(tmp_path) as store:
+        assert store.get("bern2", _cache_key("An old edit of KE 1.")) is None
+        assert store.get("bern2", _cache_key("Edited yesterday.")) is not None
+        assert sum(c["entries"] for c in store.stats().values()) == 5
+
+    # A fresh clone's first store is built from the files alone.
+    (tmp_path / "bern2.sqlite").unlink()
+    with open_store(tmp_path) as store:
+        assert store.get("bern2", _cache_key("An old edit of KE 1.")) is None
+        assert sum(c["entries"] for c in store.stats().values()) == 5
+
+
+@pytest.fixture
+def cache_script():
+    spec = importlib.util.spec_from_file_location(
+        "bern2_cache", os.path.join(PROJECT_ROOT, "scripts", "bern2_cache.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_script_gc_reports_reclaimed_bytes(tmp_path, cache_script, capsys):
+    orphan = _put(tmp_path, "bern2", _cache_key("No longer in the export."), "{}", 90)
+    xml = os.path.join(PROJECT_ROOT, "tests", "fixtures", "sample_aopwiki.xml")
+    assert cache_script.main(["gc", "--cache-dir", str(tmp_path), "--xml", xml]) == 0
+    out = capsys.readouterr().out
+    assert "bern2: 0 live, 0 retained, 1 evicted" in out
+    assert "reclaimed: 2 bytes" in out
+    assert not orphan.exists()
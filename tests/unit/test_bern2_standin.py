@@ -0,0 +1,120 @@
+"""Tests for the offline BERN2 stand-in (scripts/bern2_standin.py).
+
+The stand-in is loaded via importlib (it lives outside a package) and served on
+a free localhost port; the pipeline's own BERN2 client talks to it over real
+HTTP, so no request reaches the network. Retry backoffs are patched out.
+"""
+
+import importlib.util
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from aopwiki_rdf.config import PipelineConfig
+from aopwiki_rdf.mapping.bern2_store import open_store
+from aopwiki_rdf.mapping.ner_el_mapper import (
+    _cache_key,
+    extract_ncbi_gene_ids,
+    map_ner_genes_in_kes_result,
+    query_bern2,
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+STANDIN_PATH = os.path.join(PROJECT_ROOT, "scripts", "bern2_standin.py")
+
+RECORDED_TEXT = "Activation of the AhR induces CYP1A1 expression."
+RECORDED = {"annotations": [
+    {"id": ["NCBIGene:196"], "is_neural_normalized": False, "mention": "AhR",
+     "obj": "gene", "prob": 0.99, "span": {"begin": 18, "end": 21}},
+    {"id": ["NCBIGene:1543"], "is_neural_normalized": False, "mention": "CYP1A1",
+     "obj": "gene", "prob": 0.99, "span": {"begin": 30, "end": 36}},
+]}
+
+
+@pytest.fixture
+def standin_module():
+    spec = importlib.util.spec_from_file_location("bern2_standin", STANDIN_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def recorded_cache(tmp_path):
+    cache_dir = tmp_path / "recorded"
+    (cache_dir / "bern2").mkdir(parents=True)
+    (cache_dir / "bern2" / f"{_cache_key(RECORDED_TEXT)}.json").write_text(json.dumps(RECORDED))
+    (cache_dir / "bern2" / f"{_cache_key('Never answered.')}.json").write_text(
+        '{"_error": "timeout"}')
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def no_backoff():
+    with patch("aopwiki_rdf.mapping.ner_el_mapper.time.sleep"):
+        yield
+
+
+def test_replays_recorded_responses(standin_module, recorded_cache, tmp_path):
+    with standin_module.Bern2StandIn(recorded_cache) as standin:
+        data = query_bern2(RECORDED_TEXT, standin.url, tmp_path / "fresh")
+    assert data == RECORDED
+    assert standin.stats["replayed"] == 1 and standin.stats["synthesised"] == 0
+    # The recorded error is not replayed, nor learned from.
+    assert len(standin.responses) == 1
+
+
+def test_replays_the_store(standin_module, recorded_cache, tmp_path):
+    with open_store(recorded_cache):
+        pass  # imports the per-file cache
+    for path in (recorded_cache / "bern2").glob("*.json"):
+        path.unlink()
+    with standin_module.Bern2StandIn(recorded_cache) as standin:
+        assert query_bern2(RECORDED_TEXT, standin.url, tmp_path / "fresh") == RECORDED
+
+
+def test_synthesises_annotations_from_learned_mentions(standin_module, recorded_cache, tmp_path):
+    text = "CYP1A1 and TP53, but not AhRR or TP53BP1."
+    with standin_module.Bern2StandIn(recorded_cache, lexicon={"TP53": ["NCBIGene:7157"]}) \
+            as standin:
+        data = query_bern2(text, standin.url, tmp_path / "fresh")
+    assert [(a["mention"], a["span"]["begin"]) for a in data["annotations"]] == [
+        ("CYP1A1", 0), ("TP53", 11),
+    ]
+    assert extract_ncbi_gene_ids(data) == {"1543", "7157"}
+    assert standin.stats["synthesised"] == 1
+
+
+def test_truncated_responses_take_the_chunk_fallback(standin_module, recorded_cache, tmp_path):
+    filler = "The liver responds to the exposure over several days. "
+    text = RECORDED_TEXT + " " + (filler * 72).strip()  # ~4000 characters
+    with standin_module.Bern2StandIn(recorded_cache, truncate_chars=3000) as standin:
+        data = query_bern2(text, standin.url, tmp_path / "fresh")
+    assert "_error" not in data and not data.get("_partial")
+    assert extract_ncbi_gene_ids(data) == {"196", "1543"}
+    # Three truncated attempts at the whole text, then one call per chunk.
+    assert standin.stats["truncated"] == 3
+    assert standin.stats["requests"] == 3 + 3
+
+
+def test_injected_errors_mark_texts_failed(standin_module, tmp_path):
+    kedict = {"1": {"dc:description": '"""TP53 drives apoptosis."""'}}
+    with standin_module.Bern2StandIn(error_rate=1.0) as standin:
+        config = PipelineConfig(ner_cache_dir=tmp_path, bern2_url=standin.url)
+        results = map_ner_genes_in_kes_result(kedict, config)
+    assert results["1"].failed
+    # Three attempts, then three for the one-chunk truncation fallback.
+    assert standin.stats["errors"] == standin.stats["requests"] == 6
+
+
+def test_latency_exposes_worker_concurrency(standin_module, tmp_path):
+    kedict = {str(i): {"dc:description": f'"""Key event {i} without gene mentions."""'}
+              for i in range(8)}
+    with standin_module.Bern2StandIn(latency=0.05) as standin:
+        config = PipelineConfig(ner_cache_dir=tmp_path, bern2_url=standin.url, ner_workers=4)
+        results = map_ner_genes_in_kes_result(kedict, config)
+    assert not any(r.failed for r in results.values())
+    assert standin.stats["requests"] == 8
+    assert standin.stats["peak_in_flight"] > 1
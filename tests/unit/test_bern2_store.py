@@ -0,0 +1,205 @@
+"""Tests for the single-file BERN2 cache store (mapping/bern2_store.py).
+
+The store must hold exactly what the per-file cache holds and classify hits
+the same way, so each test compares it against the file layout built by hand
+the way ``query_bern2`` / ``map_ncbi_to_hgnc`` write it. No network I/O.
+"""
+
+import importlib.util
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from aopwiki_rdf.config import PipelineConfig
+from aopwiki_rdf.mapping.bern2_store import Bern2CacheStore, open_store
+from aopwiki_rdf.mapping.ner_el_mapper import (
+    _cache_key,
+    is_cached,
+    map_ner_genes_in_kes_result,
+    query_bern2,
+    report_cache_coverage,
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+TP53 = {"obj": "gene", "mention": "TP53", "id": ["NCBIGene:7157"], "prob": 0.99}
+BRIDGEDB_TP53 = "7157\tEntrez Gene\tL:7157,H:TP53,Hac:HGNC:11998\n"
+
+
+def _write(cache_dir, kind, key, body):
+    suffix = ".json" if kind == "bern2" else ".txt"
+    path = cache_dir / kind / f"{key}{suffix}"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(body, encoding="utf-8")
+    return path
+
+
+def _file_cache(cache_dir):
+    """A per-file cache with one entry of every kind the pipeline can leave."""
+    entries = {
+        "TP53 is cached.": json.dumps({"annotations": [TP53]}),
+        "Failed lookup.": json.dumps({"_error": "net down"}),
+        "Half done.": json.dumps({"annotations": [], "_partial": True}),
+        "Corrupt entry.": "not json {{{",
+    }
+    for text, body in entries.items():
+        _write(cache_dir, "bern2", _cache_key(text), body)
+    _write(cache_dir, "bridgedb", _cache_key("7157"), BRIDGEDB_TP53)
+    return list(entries) + ["Never warmed."]
+
+
+def _usable_file(path):
+    try:
+        data = json.loads(path.read_text())
+    except json.JSONDecodeError:
+        return False
+    return "_error" not in data and not data.get("_partial")
+
+
+def test_put_get_and_batch_probe(tmp_path):
+    with Bern2CacheStore(tmp_path) as store:
+        store.put("bern2", "a", json.dumps({"annotations": []}))
+        store.put("bern2", "b", json.dumps({"_error": "x"}))
+        store.put("bridgedb", "a", BRIDGEDB_TP53)
+        assert store.get("bridgedb", "a") == BRIDGEDB_TP53
+        assert store.get("bern2", "missing") is None
+        assert store.usable_keys("bern2", ["a", "b", "c"]) == {"a"}
+        assert store.stats() == {"bern2": {"entries": 2, "usable": 1},
+                                 "bridgedb": {"entries": 1, "usable": 1}}
+
+
+def test_probes_agree_with_the_file_layout(tmp_path):
+    texts = _file_cache(tmp_path)
+    with open_store(tmp_path) as store:
+        from_store = [is_cached(t, tmp_path, store=store) for t in texts]
+    from_files = [is_cached(t, tmp_path) for t in texts]
+    assert from_store == from_files == [True, False, False, False, False]
+
+
+def test_coverage_report_is_identical(tmp_path):
+    texts = _file_cache(tmp_path)
+    kedict = {str(i): {"dc:description": f'"""{t}"""'} for i, t in enumerate(texts)}
+    kerdict = {"r1": {"dc:description": texts[0], "nci:C80263": texts[4]}}
+
+    with_store = report_cache_coverage(
+        kedict, kerdict, config=PipelineConfig(ner_cache_dir=tmp_path, ner_cache_store=True))
+    with_files = report_cache_coverage(
+        kedict, kerdict, config=PipelineConfig(ner_cache_dir=tmp_path))
+    assert with_store == with_files
+    assert with_store["cached"] == 2
+
+
+def test_imported_entries_are_served_without_network(tmp_path):
+    _file_cache(tmp_path)
+    with patch("aopwiki_rdf.mapping.ner_el_mapper.requests.post",
+               side_effect=AssertionError("network used")):
+        results = map_ner_genes_in_kes_result(
+            {"KE1": {"dc:description": '"""TP53 is cached."""'}},
+            PipelineConfig(ner_cache_dir=tmp_path, ner_cache_store=True),
+        )
+    assert results["KE1"].hgnc_ids == {"hgnc:11998"}
+
+
+def test_new_responses_go_to_the_store(tmp_path):
+    resp = MagicMock(text=json.dumps({"annotations": [TP53]}))
+    with Bern2CacheStore(tmp_path) as store:
+        with patch("aopwiki_rdf.mapping.ner_el_mapper.requests.post", return_value=resp):
+            query_bern2("Fresh text.", "http://bern2", tmp_path / "bern2", store=store)
+        with patch("aopwiki_rdf.mapping.ner_el_mapper.requests.post",
+                   side_effect=requests.ConnectionError("down")):
+            assert query_bern2("Fresh text.", "http://bern2", tmp_path / "bern2",
+                               store=store)["annotations"] == [TP53]
+    assert not (tmp_path / "bern2").exists()
+
+
+def test_entries_added_after_the_store_exists_are_imported(tmp_path):
+    _file_cache(tmp_path)
+    with open_store(tmp_path) as store:
+        assert not store.usable_keys("bern2", [_cache_key("Pulled later.")])
+    _write(tmp_path, "bern2", _cache_key("Pulled later."), json.dumps({"annotations": []}))
+    with open_store(tmp_path) as store:
+        assert store.usable_keys("bern2", [_cache_key("Pulled later.")])
+        assert store.stats()["bern2"]["entries"] == 5
+
+
+def test_usable_files_replace_unusable_store_entries(tmp_path):
+    key = _cache_key("Re-warmed.")
+    with Bern2CacheStore(tmp_path) as store:
+        store.put("bern2", key, json.dumps({"_error": "timeout"}))
+        store.put("bern2", "kept", json.dumps({"annotations": [TP53]}))
+    path = _write(tmp_path, "bern2", key, json.dumps({"annotations": []}))
+    _write(tmp_path, "bern2", "kept", json.dumps({"annotations": []}))
+    # Copied with its old timestamp kept (cp -p, rsync -a, tar).
+    os.utime(path, (0, 0))
+    with open_store(tmp_path) as store:
+        assert store.usable_keys("bern2", [key]) == {key}
+        assert json.loads(store.get("bern2", key)) == {"annotations": []}
+        assert json.loads(store.get("bern2", "kept"))["annotations"] == [TP53]
+
+
+def test_store_runs_export_new_entries_to_the_file_layout(tmp_path):
+    _file_cache(tmp_path)
+    before = {p.name for p in tmp_path.rglob("*.*")}
+    resp = MagicMock(text=json.dumps({"annotations": [TP53]}))
+    with patch("aopwiki_rdf.mapping.ner_el_mapper.requests.post", return_value=resp):
+        results = map_ner_genes_in_kes_result(
+            {"KE1": {"dc:description": '"""TP53 is new."""'}},
+            PipelineConfig(ner_cache_dir=tmp_path, ner_cache_store=True),
+        )
+    assert results["KE1"].hgnc_ids == {"hgnc:11998"}
+    exported = tmp_path / "bern2" / f"{_cache_key('TP53 is new.')}.json"
+    assert json.loads(exported.read_text())["annotations"] == [TP53]
+    assert {p.name for p in tmp_path.rglob("*.*")} - before == {exported.name, "bern2.sqlite"}
+
+
+def test_compact_and_export_round_trip(tmp_path):
+    source = tmp_path / "files"
+    _file_cache(source)
+    with open_store(tmp_path / "store") as store:
+        store.import_directory(source)
+        assert store.compact() == 3
+        store.export_directory(tmp_path / "exported")
+
+    exported = sorted(p.relative_to(tmp_path / "exported")
+                      for p in (tmp_path / "exported").rglob("*.*"))
+    kept = [p.relative_to(source) for p in (source / "bern2").glob("*.json")
+            if _usable_file(p)] + [p.relative_to(source)
+                                     for p in (source / "bridgedb").glob("*.txt")]
+    assert exported == sorted(kept)
+    for rel in exported:
+        assert (tmp_path / "exported" / rel).read_text() == (source / rel).read_text()
+
+
+@pytest.fixture
+def cache_script():
+    spec = importlib.util.spec_from_file_location(
+        "bern2_cache", os.path.join(PROJECT_ROOT, "scripts", "bern2_cache.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_script_imports_and_reports(tmp_path, cache_script, capsys):
+    _file_cache(tmp_path)
+    assert cache_script.main(["import", "--cache-dir", str(tmp_path)]) == 0
+    assert "bern2: 4 entries (1 usable)" in capsys.readouterr().out
+
+
+def test_version_1_store_is_migrated_in_place(tmp_path):
+    import sqlite3
+    conn = sqlite3.connect(tmp_path / "bern2.sqlite")
+    conn.execute("CREATE TABLE entries (kind TEXT NOT NULL, key TEXT NOT NULL, "
+                 "body TEXT NOT NULL, usable INTEGER NOT NULL, "
+                 "PRIMARY KEY (kind, key)) WITHOUT ROWID")
+    conn.execute("INSERT INTO entries VALUES ('bridgedb', 'a', ?, 1)", (BRIDGEDB_TP53,))
+    conn.execute("PRAGMA user_version = 1")
+    conn.commit()
+    conn.close()
+
+    with Bern2CacheStore(tmp_path) as store:
+        assert store.get("bridgedb", "a") == BRIDGEDB_TP53
+        [(key, nbytes, written)] = store.listing("bridgedb")
+        assert (key, nbytes) == ("a", len(BRIDGEDB_TP53)) and written > 0
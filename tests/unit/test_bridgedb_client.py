@@ -0,0 +1,122 @@
+"""Tests for the pooled, concurrent BridgeDb client (mapping/bridgedb.py)."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from aopwiki_rdf.mapping.bridgedb import BridgeDbClient, batch_xrefs_gene
+
+SESSION = "aopwiki_rdf.mapping.bridgedb.requests.Session"
+
+
+def _response(text, status=200):
+    resp = MagicMock()
+    resp.text = text
+    resp.status_code = status
+    if status >= 400:
+        error = requests.HTTPError(f"{status} error")
+        error.response = resp
+        resp.raise_for_status.side_effect = error
+    else:
+        resp.raise_for_status.return_value = None
+    return resp
+
+
+def _echo_batch(url, data="", **kwargs):
+    """Answer every requested symbol with an Entrez ID derived from it."""
+    time.sleep(0.01 * (hash(data) % 3))  # finish out of order
+    rows = [f"{sym}\tHGNC Symbol\tL:{sym[1:]}" for sym in data.split("\n")]
+    return _response("\n".join(rows) + "\n")
+
+
+def test_concurrent_chunks_merge_in_chunk_order():
+    genes = [f"hgnc:G{i}" for i in range(250)]
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def fake_post(url, data="", **kwargs):
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        try:
+            return _echo_batch(url, data)
+        finally:
+            with lock:
+                in_flight.pop()
+
+    with patch(f"{SESSION}.post", side_effect=fake_post):
+        sequential = batch_xrefs_gene(genes, "http://bridgedb/Human/", chunk_size=10)
+        with BridgeDbClient(max_workers=4) as client:
+            pooled = batch_xrefs_gene(genes, "http://bridgedb/Human/", chunk_size=10,
+                                      client=client)
+
+    assert list(pooled.items()) == list(sequential.items())
+    assert pooled["hgnc:G42"] == {"Entrez Gene": ["42"]}
+    assert 1 < max(peak) <= 4
+
+
+def test_transient_failures_are_retried():
+    calls = []
+
+    def fake_post(url, data="", **kwargs):
+        calls.append(url)
+        if len(calls) == 1:
+            raise requests.ConnectionError("reset by peer")
+        if len(calls) == 2:
+            return _response("busy", status=503)
+        return _echo_batch(url, data)
+
+    with patch(f"{SESSION}.post", side_effect=fake_post):
+        with BridgeDbClient(max_retries=3, backoff=0) as client:
+            result = batch_xrefs_gene(["hgnc:G1"], "http://bridgedb/Human/", client=client)
+
+    assert len(calls) == 3
+    assert result == {"hgnc:G1": {"Entrez Gene": ["1"]}}
+
+
+def test_permanent_failure_falls_back_to_individual_calls():
+    posts = []
+
+    def fake_post(url, data="", **kwargs):
+        posts.append(url)
+        return _response("not found", status=404)
+
+    def fake_get(url, **kwargs):
+        return _response("672\tEntrez Gene\n")
+
+    with patch(f"{SESSION}.post", side_effect=fake_post), \
+            patch(f"{SESSION}.get", side_effect=fake_get) as get:
+        with BridgeDbClient(max_retries=3, backoff=0) as client:
+            result = batch_xrefs_gene(["hgnc:BRCA1", "hgnc:TP53"], "http://bridgedb/Human/",
+                                      client=client)
+
+    assert len(posts) == 1  # a 404 is not retried
+    assert get.call_count == 2
+    assert result["hgnc:BRCA1"] == {"Entrez Gene": ["672"]}
+
+
+def test_fallbacks_do_not_retry_after_the_batch_did():
+    """A service that is down costs the batch's retries plus one call per identifier."""
+    with patch(f"{SESSION}.post", side_effect=requests.ConnectionError("refused")) as post, \
+            patch(f"{SESSION}.get", side_effect=requests.ConnectionError("refused")) as get, \
+            patch("aopwiki_rdf.mapping.bridgedb.time.sleep") as sleep:
+        with BridgeDbClient(max_retries=3, backoff=1) as client:
+            result = batch_xrefs_gene([f"hgnc:G{i}" for i in range(5)], "http://bridgedb/Human/",
+                                      client=client)
+
+    assert post.call_count == 3
+    assert get.call_count == 5
+    assert sleep.call_count == 2  # the batch's backoffs only
+    assert result == {f"hgnc:G{i}": {} for i in range(5)}
+
+
+def test_retries_exhausted_raises_last_error():
+    with patch(f"{SESSION}.get", side_effect=requests.Timeout("slow")) as get:
+        with BridgeDbClient(max_retries=2, backoff=0) as client:
+            with pytest.raises(requests.Timeout):
+                client.get("http://bridgedb/Human/properties", timeout=1)
+    assert get.call_count == 2
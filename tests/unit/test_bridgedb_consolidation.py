@@ -36,7 +36,7 @@ def fake_post_factory(text):
 # --- Key shape: the whole point of the exercise ----------------------------
 
 def test_results_are_keyed_by_the_caller_s_numeric_ids():
-    with patch("aopwiki_rdf.mapping.bridgedb.requests.post",
+    with patch("aopwiki_rdf.mapping.bridgedb.requests.Session.post",
                side_effect=fake_post_factory(BATCH_RESPONSE)):
         result = batch_xrefs_gene(GENES, "http://bridgedb/Human/",
                                   symbol_lookup=SYMBOLS)
@@ -58,7 +58,7 @@ def test_symbols_are_what_gets_sent_to_the_service():
         resp.raise_for_status.return_value = None
         return resp
 
-    with patch("aopwiki_rdf.mapping.bridgedb.requests.post", side_effect=fake_post):
+    with patch("aopwiki_rdf.mapping.bridgedb.requests.Session.post", side_effect=fake_post):
         batch_xrefs_gene(GENES, "http://bridgedb/Human/", symbol_lookup=SYMBOLS)
 
     sent = captured["data"].split("\n")
@@ -67,7 +67,7 @@ def test_symbols_are_what_gets_sent_to_the_service():
 
 
 def test_xref_payload_survives_the_round_trip():
-    with patch("aopwiki_rdf.mapping.bridgedb.requests.post",
+    with patch("aopwiki_rdf.mapping.bridgedb.requests.Session.post",
                side_effect=fake_post_factory(BATCH_RESPONSE)):
         result = batch_xrefs_gene(GENES, "http://bridgedb/Human/",
                                   symbol_lookup=SYMBOLS)
@@ -79,7 +79,7 @@ def test_xref_payload_survives_the_round_trip():
 
 def test_symbol_keyed_callers_are_unaffected():
     """Without symbol_lookup the previous symbol-keyed behaviour is preserved."""
-    with patch("aopwiki_rdf.mapping.bridgedb.requests.post",
+    with patch("aopwiki_rdf.mapping.bridgedb.requests.Session.post",
                side_effect=fake_post_factory(BATCH_RESPONSE)):
         result = batch_xrefs_gene(["hgnc:BRCA1"], "http://bridgedb/Human/")
 
@@ -112,7 +112,7 @@ def test_collapsed_resolution_rate_raises():
     something the parser does not understand, every gene resolves to {}, and
     nothing raises.
     """
-    with patch("aopwiki_rdf.mapping.bridgedb.requests.post",
+    with patch("aopwiki_rdf.mapping.bridgedb.requests.Session.post",
                side_effect=fake_post_factory("<html>gateway error</html>")):
         with pytest.raises(RuntimeError, match="resolved only"):
             build_gene_xrefs(GENES, "http://bridgedb/Human/",
@@ -120,7 +120,7 @@ def test_collapsed_resolution_rate_raises():
 
 
 def test_healthy_rate_does_not_raise():
-    with patch("aopwiki_rdf.mapping.bridgedb.requests.post",
+    with patch("aopwiki_rdf.mapping.bridgedb.requests.Session.post",
                side_effect=fake_post_factory(BATCH_RESPONSE)):
         result = build_gene_xrefs(GENES, "http://bridgedb/Human/",
                                   symbol_lookup=SYMBOLS)
@@ -133,7 +133,7 @@ def test_healthy_rate_does_not_raise():
 
 def test_guard_can_be_disabled():
     """An explicit opt-out for the rare case where a low rate is expected."""
-    with patch("aopwiki_rdf.mapping.bridgedb.requests.post",
+    with patch("aopwiki_rdf.mapping.bridgedb.requests.Session.post",
                side_effect=fake_post_factory("")):
         result = build_gene_xrefs(GENES, "http://bridgedb/Human/",
                                   symbol_lookup=SYMBOLS, min_success_rate=0)
@@ -0,0 +1,104 @@
+"""Tests for the offline BridgeDb stand-in (scripts/bridgedb_standin.py).
+
+The stand-in is loaded via importlib (it lives outside a package) and served on
+a free localhost port; the pipeline's own BridgeDb client talks to it over
+real HTTP, so no request reaches the network.
+"""
+
+import importlib.util
+import json
+import os
+
+import pytest
+
+from aopwiki_rdf.mapping.bridgedb import (
+    BridgeDbClient,
+    batch_xrefs_chemical,
+    batch_xrefs_gene,
+    data_release,
+    fetch_properties,
+)
+from aopwiki_rdf.mapping.gene_mapper import build_gene_xrefs
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+STANDIN_PATH = os.path.join(PROJECT_ROOT, "scripts", "bridgedb_standin.py")
+
+FIXTURE = {
+    "properties": "DATASOURCENAME\tEnsembl\nDATASOURCEVERSION\t110\n",
+    "batch": {
+        "H": {
+            "BRCA1": "HGNC\tL:672,En:ENSG00000012048,S:P38398",
+            "TP53": "HGNC\tL:7157,En:ENSG00000141510,S:P04637",
+        },
+        "Ca": {"50-00-0": "CAS\tCe:CHEBI:16842,Cpc:712,Wd:Q161210"},
+    },
+    "single": {},
+}
+
+
+@pytest.fixture
+def standin_module():
+    spec = importlib.util.spec_from_file_location("bridgedb_standin", STANDIN_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def fixture_path(tmp_path):
+    path = tmp_path / "bridgedb-fixture.json"
+    path.write_text(json.dumps(FIXTURE))
+    return path
+
+
+def test_serves_gene_and_chemical_batches(standin_module, fixture_path):
+    with standin_module.BridgeDbStandIn(fixture_path) as standin:
+        with BridgeDbClient(max_workers=2) as client:
+            genes = batch_xrefs_gene(["hgnc:1100", "hgnc:11998", "hgnc:5"], standin.url,
+                                     symbol_lookup={"1100": "BRCA1", "11998": "TP53",
+                                                    "5": "UNKNOWN"},
+                                     chunk_size=1, client=client)
+            chemicals = batch_xrefs_chemical(["50-00-0"], standin.url, client=client)
+        release = data_release(fetch_properties(standin.url))
+
+    assert genes["hgnc:1100"]["Entrez Gene"] == ["672"]
+    assert genes["hgnc:5"] == {}
+    assert chemicals["50-00-0"]["cheminf:000407"] == ["chebi:16842"]
+    assert release == "110"
+    assert standin.requests == 5
+
+
+def test_gene_xrefs_match_the_service_shape(standin_module, fixture_path):
+    with standin_module.BridgeDbStandIn(fixture_path) as standin:
+        result = build_gene_xrefs(["hgnc:1100", "hgnc:11998"], standin.url,
+                                  symbol_lookup={"1100": "BRCA1", "11998": "TP53"})
+    assert result["geneiddict"]["hgnc:1100"] == [
+        "ncbigene:672", "ensembl:ENSG00000012048", "uniprot:P38398",
+    ]
+
+
+def test_individual_lookups_are_synthesised_from_batch_entries(standin_module, fixture_path):
+    with standin_module.BridgeDbStandIn(fixture_path) as standin:
+        with BridgeDbClient() as client:
+            text = client.get(standin.url + "xrefs/H/BRCA1", timeout=5).text
+            assert client.get(standin.url + "xrefs/H/NOPE", timeout=5).text == ""
+    assert text.splitlines() == [
+        "672\tEntrez Gene", "ENSG00000012048\tEnsembl", "P38398\tUniprot-TrEMBL",
+    ]
+
+
+def test_record_mode_fills_a_new_fixture_from_upstream(standin_module, fixture_path, tmp_path):
+    recording = tmp_path / "recorded.json"
+    with standin_module.BridgeDbStandIn(fixture_path) as upstream:
+        with standin_module.BridgeDbStandIn(recording, upstream=upstream.url) as recorder:
+            batch_xrefs_gene(["hgnc:BRCA1"], recorder.url)
+            fetch_properties(recorder.url)
+
+    recorded = json.loads(recording.read_text())
+    assert recorded["batch"]["H"] == {"BRCA1": FIXTURE["batch"]["H"]["BRCA1"]}
+    assert recorded["properties"] == FIXTURE["properties"]
+
+    # The recording now answers on its own.
+    with standin_module.BridgeDbStandIn(recording) as replay:
+        result = batch_xrefs_gene(["hgnc:BRCA1"], replay.url)
+    assert result["hgnc:BRCA1"]["Ensembl"] == ["ENSG00000012048"]
@@ -0,0 +1,92 @@
+"""Tests for stage checkpoints and resume."""
+
+import pytest
+
+from aopwiki_rdf.checkpoint import CheckpointStore
+from aopwiki_rdf.config import PipelineConfig
+from aopwiki_rdf.scheduler import run_stages
+
+
+def _stages(calls, fail_at=None, xml_path=None):
+    def parse(config, context):
+        calls.append('parse')
+        if xml_path is not None:
+            context['filepath'] = str(xml_path.parent) + '/'
+            context['aopwikixmlfilename'] = xml_path.name
+        context['entities'] = {'aop': ['1', '2', '3']}
+
+    def filter_(config, context):
+        calls.append('filter')
+        # Mutates an earlier stage's output in place, as the ARR filter does.
+        context['entities']['aop'].remove('2')
+
+    def write(config, context):
+        calls.append('write')
+        if fail_at == 'write':
+            raise SystemExit(1)
+        context['written'] = list(context['entities']['aop'])
+
+    return [('parse', parse), ('filter', filter_), ('write', write)]
+
+
+def _run(tmp_path, calls, config, resume, **kwargs):
+    context = {}
+    store = CheckpointStore(tmp_path / 'ckpt', config, resume=resume)
+    run_stages(_stages(calls, **kwargs), {}, config, context, checkpoint=store)
+    return context
+
+
+def test_resume_skips_completed_stages_and_keeps_mutations(tmp_path):
+    config = PipelineConfig(data_dir=tmp_path)
+    calls = []
+    with pytest.raises(SystemExit):
+        _run(tmp_path, calls, config, resume=False, fail_at='write')
+    assert calls == ['parse', 'filter', 'write']
+    # Only the newest snapshot is kept; it subsumes the earlier ones.
+    assert [p.name for p in (tmp_path / 'ckpt').glob('*.pickle')] == ['02-filter.pickle']
+
+    calls.clear()
+    context = _run(tmp_path, calls, config, resume=True)
+    assert calls == ['write']
+    assert context['written'] == ['1', '3']
+
+
+def test_config_change_discards_checkpoint(tmp_path):
+    calls = []
+    with pytest.raises(SystemExit):
+        _run(tmp_path, calls, PipelineConfig(data_dir=tmp_path), resume=False, fail_at='write')
+    calls.clear()
+    _run(tmp_path, calls, PipelineConfig(data_dir=tmp_path, enable_bern2=True), resume=True)
+    assert calls == ['parse', 'filter', 'write']
+
+
+def test_run_independent_config_keeps_checkpoint(tmp_path):
+    calls = []
+    with pytest.raises(SystemExit):
+        _run(tmp_path, calls, PipelineConfig(data_dir=tmp_path), resume=False, fail_at='write')
+    calls.clear()
+    _run(tmp_path, calls, PipelineConfig(data_dir=tmp_path, log_level='DEBUG'), resume=True)
+    assert calls == ['write']
+
+
+def test_input_xml_change_discards_checkpoint(tmp_path):
+    xml_path = tmp_path / 'aop-wiki-xml'
+    xml_path.write_text('<data/>')
+    config = PipelineConfig(data_dir=tmp_path)
+    calls = []
+    with pytest.raises(SystemExit):
+        _run(tmp_path, calls, config, resume=False, fail_at='write', xml_path=xml_path)
+    xml_path.write_text('<data><aop/></data>')
+    calls.clear()
+    _run(tmp_path, calls, config, resume=True, xml_path=xml_path)
+    assert calls == ['parse', 'filter', 'write']
+
+
+def test_without_resume_starts_fresh(tmp_path):
+    config = PipelineConfig(data_dir=tmp_path)
+    calls = []
+    with pytest.raises(SystemExit):
+        _run(tmp_path, calls, config, resume=False, fail_at='write')
+    calls.clear()
+    _run(tmp_path, calls, config, resume=False)
+    assert calls == ['parse', 'filter', 'write']
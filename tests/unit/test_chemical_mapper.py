@@ -1,7 +1,6 @@
 """Unit tests for chemical mapper module."""
 
 import pytest
-from xml.etree.ElementTree import Element, SubElement
 
 
 def test_chemical_mapper_importable():
@@ -17,33 +16,13 @@ def test_chemical_mapper_importable():
     # check that the import itself succeeded without error)
 
 
-def _make_minimal_xml(chemicals):
-    """Build minimal XML root with chemical elements for testing.
-
-    Args:
-        chemicals: list of dicts with keys 'id' and optionally 'casrn'.
-    Returns:
-        (root Element, namespace string)
-    """
-    ns = '{http://www.aopkb.org/aop-xml}'
-    root = Element('data')
-    for chem in chemicals:
-        elem = SubElement(root, f'{ns}chemical')
-        elem.set('id', chem['id'])
-        if 'casrn' in chem:
-            casrn_elem = SubElement(elem, f'{ns}casrn')
-            casrn_elem.text = chem['casrn']
-    return root, ns
-
-
 def test_chemical_mapper_empty_input():
     """Verify that empty CAS list returns empty results without errors."""
     from aopwiki_rdf.mapping.chemical_mapper import map_chemicals
 
-    root, ns = _make_minimal_xml([])
     chedict = {}
 
-    result = map_chemicals(chedict, root, ns,
+    result = map_chemicals(chedict,
                            bridgedb_url='https://webservice.bridgedb.org/Human/',
                            timeout=10)
 
@@ -74,14 +53,8 @@ def test_map_chemicals_live():
     """Test with real BridgeDb API using known CAS numbers."""
     from aopwiki_rdf.mapping.chemical_mapper import map_chemicals
 
-    # Bisphenol A (CAS 80-05-7) and Formaldehyde (CAS 50-00-0)
-    chemicals = [
-        {'id': '1', 'casrn': '80-05-7'},
-        {'id': '2', 'casrn': '50-00-0'},
-    ]
-    root, ns = _make_minimal_xml(chemicals)
-
-    # Build chedict as the parser would
+    # Bisphenol A (CAS 80-05-7) and Formaldehyde (CAS 50-00-0), as the
+    # parser would build them
     chedict = {
         '1': {
             'dc:identifier': 'cas:80-05-7',
@@ -93,7 +66,7 @@ def test_map_chemicals_live():
         },
     }
 
-    result = map_chemicals(chedict, root, ns,
+    result = map_chemicals(chedict,
                            bridgedb_url='https://webservice.bridgedb.org/Human/',
                            timeout=30)
 
@@ -119,3 +92,36 @@ def test_map_chemicals_live():
     )]
     total_identifiers = sum(len(lst) for lst in all_lists)
     assert total_identifiers > 0, "Expected at least some cross-reference identifiers"
+
+
+def test_map_chemicals_queries_each_cas_once():
+    """Chemicals sharing a CAS number share one lookup and all get its xrefs."""
+    from unittest.mock import MagicMock, patch
+    from aopwiki_rdf.mapping.chemical_mapper import map_chemicals
+
+    sent = []
+
+    def fake_post(url, data='', **kwargs):
+        sent.extend(data.split('\n'))
+        resp = MagicMock()
+        resp.text = (
+            '50-00-0\tCAS\tCe:CHEBI:16842,Cpc:712\n'
+            '80-05-7\tCAS\tCpc:6623\n'
+        )
+        resp.raise_for_status.return_value = None
+        return resp
+
+    chedict = {
+        '1': {'cheminf:000446': '"50-00-0"'},
+        '2': {'cheminf:000446': '"80-05-7"'},
+        '3': {'cheminf:000446': '"50-00-0"'},
+        '4': {'dc:identifier': 'no CAS'},
+    }
+    with patch('aopwiki_rdf.mapping.bridgedb.requests.Session.post', side_effect=fake_post):
+        result = map_chemicals(chedict, bridgedb_url='http://bridgedb/Human/')
+
+    assert sent == ['50-00-0', '80-05-7']
+    assert result['chedict']['3']['cheminf:000407'] == ['chebi:16842']
+    assert result['chedict']['1']['cheminf:000140'] == ['pubchem.compound:712']
+    assert 'cheminf:000140' not in result['chedict']['4']
+    assert result['listofpubchem'] == ['pubchem.compound:712', 'pubchem.compound:6623']
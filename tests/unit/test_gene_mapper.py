@@ -215,8 +215,264 @@ def test_batch_xrefs_normalizes_base_url(base):
     # The inline client was replaced by the shared bridgedb module (#103); the
     # URL-normalisation guarantee from #100 must survive that move, so this now
     # exercises the shared path.
-    with patch("aopwiki_rdf.mapping.bridgedb.requests.post", side_effect=fake_post):
+    with patch("aopwiki_rdf.mapping.bridgedb.requests.Session.post", side_effect=fake_post):
         batch_xrefs_gene(["hgnc:1100"], base, timeout=5,
                          symbol_lookup={"1100": "BRCA1"})
 
     assert captured["url"] == "https://webservice.bridgedb.org/Human/xrefsBatch/H"
+
+
+# ---------------------------------------------------------------------------
+# Test: map_genes_in_entities accepts the streaming parser's side tables
+# ---------------------------------------------------------------------------
+
+def test_map_genes_in_entities_side_tables_match_tree(sample_xml_path):
+    """Side tables in place of the XML root give identical mappings."""
+    import copy
+    from xml.etree.ElementTree import parse
+    from aopwiki_rdf.mapping.gene_mapper import map_genes_in_entities
+    from aopwiki_rdf.parser.xml_parser import AOPXML_NS, stream_aopwiki_xml
+
+    entities, side_tables = stream_aopwiki_xml(sample_xml_path)
+    genedict1 = {'1100': ['BRCA1'], '11998': ['TP53']}
+    symbol_lookup = {'1100': 'BRCA1', '11998': 'TP53'}
+    for kedict in (entities.kedict, entities.kerdict):
+        for entity in kedict.values():
+            if 'dc:description' in entity:
+                entity['dc:description'] += ' TP53 gene expression and BRCA1 protein'
+
+    root = parse(sample_xml_path).getroot()
+    from_tree = map_genes_in_entities(
+        copy.deepcopy(entities.kedict), copy.deepcopy(entities.kerdict),
+        genedict1, {}, root, AOPXML_NS, symbol_lookup=symbol_lookup,
+    )
+    from_tables = map_genes_in_entities(
+        copy.deepcopy(entities.kedict), copy.deepcopy(entities.kerdict),
+        genedict1, {}, side_tables, AOPXML_NS, symbol_lookup=symbol_lookup,
+    )
+    assert from_tables == from_tree
+    assert from_tables[2] == ['hgnc:11998', 'hgnc:1100']
+
+
+# ---------------------------------------------------------------------------
+# Test: incremental mode replays unchanged entities from the manifest
+# ---------------------------------------------------------------------------
+
+def _gene_rich_entities(sample_xml_path):
+    from aopwiki_rdf.parser.xml_parser import stream_aopwiki_xml
+    entities, side_tables = stream_aopwiki_xml(sample_xml_path)
+    for entity in list(entities.kedict.values()) + list(entities.kerdict.values()):
+        if 'dc:description' in entity:
+            entity['dc:description'] += ' TP53 gene expression and BRCA1 protein'
+    return entities, side_tables
+
+
+def test_incremental_manifest_matches_full_scan(sample_xml_path, monkeypatch):
+    """Replayed results equal a full scan; only edited entities are rescanned."""
+    import copy
+    from aopwiki_rdf.mapping import gene_mapper
+    from aopwiki_rdf.parser.xml_parser import AOPXML_NS
+
+    entities, side_tables = _gene_rich_entities(sample_xml_path)
+    genedict1 = {'1100': ['BRCA1'], '11998': ['TP53'], '6018': ['EGFR']}
+    symbol_lookup = {'1100': 'BRCA1', '11998': 'TP53', '6018': 'EGFR'}
+
+    manifest = {}
+    gene_mapper.map_genes_in_entities(
+        copy.deepcopy(entities.kedict), copy.deepcopy(entities.kerdict),
+        genedict1, {}, side_tables, AOPXML_NS, symbol_lookup=symbol_lookup,
+        manifest=manifest,
+    )
+    assert set(manifest) == {'KE/100', 'KE/101', 'KER/50'}
+
+    # Edit one KE: it alone is rescanned, and the result equals a full scan.
+    entities.kedict['101']['dc:description'] += ' EGFR receptor signalling'
+    full = gene_mapper.map_genes_in_entities(
+        copy.deepcopy(entities.kedict), copy.deepcopy(entities.kerdict),
+        genedict1, {}, side_tables, AOPXML_NS, symbol_lookup=symbol_lookup,
+    )
+    scanned = []
+    real_scan = gene_mapper._map_genes_in_text
+
+    def _recording_scan(text, *args, **kwargs):
+        scanned.append(text)
+        return real_scan(text, *args, **kwargs)
+
+    monkeypatch.setattr(gene_mapper, '_map_genes_in_text', _recording_scan)
+    incremental = gene_mapper.map_genes_in_entities(
+        copy.deepcopy(entities.kedict), copy.deepcopy(entities.kerdict),
+        genedict1, {}, side_tables, AOPXML_NS, symbol_lookup=symbol_lookup,
+        manifest=manifest,
+    )
+    assert incremental == full
+    assert scanned == [entities.kedict['101']['dc:description']]
+    assert 'hgnc:6018' in manifest['KE/101']['genes'][0]
+
+
+def test_text_cache_reuses_unchanged_fields_across_entities(sample_xml_path, monkeypatch, caplog):
+    """Per-text hits survive edits to other fields, renumbering and repeats."""
+    import copy
+    import logging
+    from aopwiki_rdf.mapping import gene_mapper
+    from aopwiki_rdf.parser.xml_parser import AOPXML_NS, XmlSideTables
+
+    entities, side_tables = _gene_rich_entities(sample_xml_path)
+    genedict1 = {'1100': ['BRCA1'], '11998': ['TP53'], '6018': ['EGFR']}
+    symbol_lookup = {'1100': 'BRCA1', '11998': 'TP53', '6018': 'EGFR'}
+    ker = entities.kerdict['50']
+    ker['nci:C80263'] = 'EGFR receptor signalling'
+
+    manifest = {}
+    gene_mapper.map_genes_in_entities(
+        copy.deepcopy(entities.kedict), copy.deepcopy(entities.kerdict),
+        genedict1, {}, side_tables, AOPXML_NS, symbol_lookup=symbol_lookup,
+        manifest=manifest,
+    )
+
+    # Edit one KER field, and renumber a KE into a new entity with a copy.
+    ker['edam:data_2042'] = 'BRCA1 knockout'
+    entities.kedict['900'] = copy.deepcopy(entities.kedict['101'])
+    side_tables = XmlSideTables(ke_ids=side_tables.ke_ids + ['900'],
+                                ker_ids=side_tables.ker_ids)
+    full = gene_mapper.map_genes_in_entities(
+        copy.deepcopy(entities.kedict), copy.deepcopy(entities.kerdict),
+        genedict1, {}, side_tables, AOPXML_NS, symbol_lookup=symbol_lookup,
+    )
+
+    scanned = []
+    real_scan = gene_mapper._map_genes_in_text
+
+    def _recording_scan(text, *args, **kwargs):
+        scanned.append(text)
+        return real_scan(text, *args, **kwargs)
+
+    monkeypatch.setattr(gene_mapper, '_map_genes_in_text', _recording_scan)
+    with caplog.at_level(logging.INFO, logger='aopwiki_rdf.mapping.gene_mapper'):
+        cached = gene_mapper.map_genes_in_entities(
+            copy.deepcopy(entities.kedict), copy.deepcopy(entities.kerdict),
+            genedict1, {}, side_tables, AOPXML_NS, symbol_lookup=symbol_lookup,
+            manifest=manifest,
+        )
+    assert cached == full
+    assert scanned == ['BRCA1 knockout']
+    assert 'Gene result cache: 5/6 texts reused (83.3% hit ratio), 1 scanned' in caplog.text
+
+
+def test_incremental_manifest_invalidated_by_dictionary(tmp_path):
+    """A manifest written against another HGNC file is discarded."""
+    from aopwiki_rdf.mapping.incremental import (
+        dictionary_fingerprint, load_manifest, save_manifest,
+    )
+    hgnc = tmp_path / "HGNCgenes.txt"
+    hgnc.write_text("HGNC ID\tApproved symbol\nHGNC:1100\tBRCA1\n")
+    fingerprint = dictionary_fingerprint(hgnc)
+    entries = {'KE/1': {'text': 'abc', 'genes': [['hgnc:1100']]}}
+    save_manifest(tmp_path, fingerprint, entries)
+    assert load_manifest(tmp_path, fingerprint) == entries
+
+    hgnc.write_text("HGNC ID\tApproved symbol\nHGNC:1100\tBRCA1\nHGNC:11998\tTP53\n")
+    assert load_manifest(tmp_path, dictionary_fingerprint(hgnc)) == {}
+
+
+# ---------------------------------------------------------------------------
+# Test: KER weight-of-evidence fields share the prebuilt automaton
+# ---------------------------------------------------------------------------
+
+def _woe_kerdict(count):
+    return {
+        str(i): {
+            'dc:identifier': f'aop.relationships:{i}',
+            'dc:description': 'TP53 gene expression',
+            'nci:C80263': 'Activation of the androgen receptor AR increases CYP1A1 expression.',
+            'edam:data_2042': 'Empirical support from EGFR knockout studies.',
+        }
+        for i in range(count)
+    }
+
+
+def test_ker_woe_fields_use_shared_automaton_and_filters(monkeypatch):
+    """One automaton per run, and WoE fields get ownership resolution too."""
+    from aopwiki_rdf.mapping import gene_mapper
+    from aopwiki_rdf.parser.xml_parser import XmlSideTables
+
+    built = []
+    real_automaton = gene_mapper.GeneAutomaton
+
+    def _counting_automaton(index):
+        built.append(len(index))
+        return real_automaton(index)
+
+    monkeypatch.setattr(gene_mapper, 'GeneAutomaton', _counting_automaton)
+    # 'AR' is contested; only the approved-symbol owner may claim it.
+    genedict1 = {'644': ['AR'], '9999': ['AR', 'ARX1'], '6018': ['EGFR']}
+    symbol_lookup = {'644': 'AR', '9999': 'ARX1', '6018': 'EGFR'}
+    kerdict = _woe_kerdict(5)
+    _, kerdict, hgnclist = gene_mapper.map_genes_in_entities(
+        {}, kerdict, genedict1, {}, XmlSideTables(ker_ids=list(kerdict)), '',
+        symbol_lookup=symbol_lookup,
+    )
+    assert len(built) == 1
+    assert hgnclist == ['hgnc:644', 'hgnc:6018']
+    assert kerdict['0']['edam:data_1025'] == ['hgnc:644', 'hgnc:6018']
+
+
+@pytest.mark.skipif(not HGNC_AVAILABLE, reason="HGNCgenes.txt not present")
+def test_ker_woe_mapping_scales_with_full_dictionary():
+    """Regression benchmark: WoE scans once rebuilt the ~45k-gene automaton per
+    text (about 80s for these 20 KERs); on the shared one they take seconds."""
+    import time
+    from aopwiki_rdf.mapping.gene_mapper import build_token_owners, map_genes_in_entities
+    from aopwiki_rdf.parser.xml_parser import XmlSideTables
+
+    genedict1, genedict2, symbol_lookup = build_gene_dicts(HGNC_FILE)
+    token_owners = build_token_owners(genedict1, symbol_lookup)
+    kerdict = _woe_kerdict(20)
+
+    start = time.perf_counter()
+    _, _, hgnclist = map_genes_in_entities(
+        {}, kerdict, genedict1, genedict2, XmlSideTables(ker_ids=list(kerdict)), '',
+        token_owners=token_owners, symbol_lookup=symbol_lookup,
+    )
+    elapsed = time.perf_counter() - start
+
+    assert 'hgnc:3236' in hgnclist  # EGFR, found in edam:data_2042
+    assert elapsed < 20, f"KER gene mapping took {elapsed:.1f}s"
+
+
+# ---------------------------------------------------------------------------
+# Test: worker processes give the same results as the in-process scan
+# ---------------------------------------------------------------------------
+
+def test_map_genes_in_entities_workers_match_sequential(sample_xml_path):
+    """Sharded scans merge back in document order, manifest replay included."""
+    import copy
+    from aopwiki_rdf.mapping.gene_mapper import map_genes_in_entities
+    from aopwiki_rdf.parser.xml_parser import AOPXML_NS
+
+    entities, side_tables = _gene_rich_entities(sample_xml_path)
+    entities.kerdict['50']['edam:data_2042'] = 'EGFR knockout and BRCA1 protein levels'
+    genedict1 = {'1100': ['BRCA1'], '11998': ['TP53'], '3236': ['EGFR']}
+    symbol_lookup = {'1100': 'BRCA1', '11998': 'TP53', '3236': 'EGFR'}
+
+    def run(workers, manifest=None):
+        return map_genes_in_entities(
+            copy.deepcopy(entities.kedict), copy.deepcopy(entities.kerdict),
+            genedict1, {}, side_tables, AOPXML_NS, symbol_lookup=symbol_lookup,
+            manifest=manifest, workers=workers,
+        )
+
+    sequential_manifest, parallel_manifest = {}, {}
+    sequential = run(1, sequential_manifest)
+    assert run(2, parallel_manifest) == sequential
+    assert parallel_manifest == sequential_manifest
+
+    # With a partly stale manifest, only the edited entity goes to the pool.
+    entities.kedict['100']['dc:description'] += ' EGFR receptor signalling'
+    assert run(2, parallel_manifest) == run(1)
+
+
+def test_scan_pool_never_forks():
+    """The pool starts from a stage thread, so children must not fork its locks."""
+    from aopwiki_rdf.mapping.gene_mapper import _pool_context
+
+    assert _pool_context().get_start_method() in ("forkserver", "spawn")
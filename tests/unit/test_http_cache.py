@@ -0,0 +1,155 @@
+"""Tests for conditional downloads (aopwiki_rdf/http_cache.py).
+
+A small localhost server honours ``If-None-Match`` / ``If-Modified-Since`` the
+way the upstream hosts do, so the fetcher is exercised over real HTTP.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from aopwiki_rdf.hgnc.download import download_hgnc_data
+from aopwiki_rdf.http_cache import ConditionalFetcher
+from aopwiki_rdf.mapping.bridgedb import fetch_properties
+
+LAST_MODIFIED = "Sat, 03 Oct 2026 08:00:00 GMT"
+
+
+class Upstream:
+    """Serves ``body`` with an ETag and/or Last-Modified; records request headers."""
+
+    def __init__(self, body=b"v1 body\n", etag='"v1"', last_modified=None):
+        self.body, self.etag, self.last_modified = body, etag, last_modified
+        self.status = None
+        self.seen = []
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, fmt, *args):
+                pass
+
+            def do_GET(self):
+                upstream.seen.append(dict(self.headers))
+                if upstream.status:
+                    self.send_error(upstream.status)
+                    return
+                if ((upstream.etag and self.headers.get("If-None-Match") == upstream.etag)
+                        or (upstream.last_modified
+                            and self.headers.get("If-Modified-Since") == upstream.last_modified)):
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; charset=utf-8")
+                self.send_header("Content-Length", str(len(upstream.body)))
+                if upstream.etag:
+                    self.send_header("ETag", upstream.etag)
+                if upstream.last_modified:
+                    self.send_header("Last-Modified", upstream.last_modified)
+                self.end_headers()
+                self.wfile.write(upstream.body)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}/file.txt"
+        threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05},
+                         daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def upstream():
+    server = Upstream()
+    yield server
+    server.close()
+
+
+def test_unchanged_file_is_served_from_cache(tmp_path, upstream):
+    fetcher = ConditionalFetcher(tmp_path)
+    first = fetcher.fetch(upstream.url)
+    second = ConditionalFetcher(tmp_path).fetch(upstream.url)
+
+    assert (first.status, second.status) == (200, 304)
+    assert upstream.seen[1]["If-None-Match"] == '"v1"'
+    assert second.content == b"v1 body\n"
+    assert second.nbytes == 0
+    assert fetcher.metrics[upstream.url]["bytes"] == len(b"v1 body\n")
+
+
+def test_changed_file_is_downloaded_again(tmp_path, upstream):
+    fetcher = ConditionalFetcher(tmp_path)
+    fetcher.fetch(upstream.url)
+    upstream.body, upstream.etag = b"v2 body\n", '"v2"'
+    result = fetcher.fetch(upstream.url)
+
+    assert result.status == 200
+    assert result.text == "v2 body\n"
+    assert fetcher.fetch(upstream.url).not_modified
+    assert fetcher.metrics[upstream.url] == {
+        "requests": 3, "not_modified": 1, "bytes": 16,
+        "seconds": fetcher.metrics[upstream.url]["seconds"],
+    }
+
+
+def test_fetchers_sharing_a_cache_keep_each_others_validators(tmp_path, upstream):
+    other = Upstream(body=b"other body\n", etag='"o1"')
+    try:
+        # Both created before either fetches, as concurrent pipeline stages do.
+        first, second = ConditionalFetcher(tmp_path), ConditionalFetcher(tmp_path)
+        first.fetch(upstream.url)
+        second.fetch(other.url)
+
+        fresh = ConditionalFetcher(tmp_path)
+        assert fresh.fetch(upstream.url).not_modified
+        assert fresh.fetch(other.url).not_modified
+    finally:
+        other.close()
+
+
+def test_last_modified_alone_is_used(tmp_path):
+    server = Upstream(etag=None, last_modified=LAST_MODIFIED)
+    try:
+        fetcher = ConditionalFetcher(tmp_path)
+        fetcher.fetch(server.url)
+        assert fetcher.fetch(server.url).not_modified
+        assert server.seen[1]["If-Modified-Since"] == LAST_MODIFIED
+        assert "If-None-Match" not in server.seen[1]
+    finally:
+        server.close()
+
+
+def test_failures_are_retried_and_keep_the_stored_body(tmp_path, upstream):
+    fetcher = ConditionalFetcher(tmp_path, max_retries=3)
+    fetcher.fetch(upstream.url)
+    upstream.status = 503
+    with patch("aopwiki_rdf.http_cache.time.sleep") as sleep:
+        with pytest.raises(requests.HTTPError):
+            fetcher.fetch(upstream.url)
+    assert [c.args[0] for c in sleep.call_args_list] == [1.0, 2.0]
+    assert len(upstream.seen) == 4
+
+    upstream.status = None
+    assert fetcher.fetch(upstream.url).content == b"v1 body\n"
+
+
+def test_downloads_accept_a_fetcher(tmp_path):
+    hgnc = Upstream(body=b"HGNC ID\tApproved symbol\nHGNC:5\tA1BG\n")
+    properties = Upstream(body=b"DATASOURCENAME\tEnsembl\nDATASOURCEVERSION\t110\n")
+    try:
+        fetcher = ConditionalFetcher(tmp_path / "http")
+        for _ in range(2):
+            content = download_hgnc_data(hgnc.url, tmp_path / "HGNCgenes.txt",
+                                         min_genes=1, fetcher=fetcher)
+            info = fetch_properties(properties.url.removesuffix("file.txt"), fetcher=fetcher)
+        assert content.endswith("HGNC:5\tA1BG\n")
+        assert info["DATASOURCEVERSION"] == ["110"]
+        assert fetcher.metrics[hgnc.url]["not_modified"] == 1
+    finally:
+        hgnc.close()
+        properties.close()
@@ -0,0 +1,192 @@
+"""Tests for concurrent, rate-limited, deduplicated BERN2 annotation.
+
+Covers ``ner_workers`` / ``ner_rate_limit`` and the ``ner_dedupe`` planning
+step (:func:`map_ner_genes_in_corpus_result`).
+
+A fake BERN2 + BridgeDb answers every POST (``patch`` against
+``ner_el_mapper.requests.post``): a text mentions gene N when it contains
+``GENE<N>``, and a text containing ``DOWN`` always fails. The concurrent
+engine must return exactly what the sequential one-text-at-a-time run does.
+Retry backoffs are patched out so failures are instant.
+"""
+
+import json
+import re
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from aopwiki_rdf.config import PipelineConfig
+from aopwiki_rdf.mapping.ner_el_mapper import (
+    map_ner_genes_in_corpus_result,
+    map_ner_genes_in_kers_result,
+    map_ner_genes_in_kes_result,
+    report_cache_coverage,
+)
+from aopwiki_rdf.mapping.rate_limit import HostRateLimiter
+
+
+class FakeServices:
+    """Thread-safe stand-in for both services that records peak concurrency."""
+
+    def __init__(self, delay=0.005):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+        self.posts = 0
+        self.bern2_texts = []
+        self.bridgedb_ids = []
+
+    def __call__(self, url, timeout=None, **body):
+        with self.lock:
+            self.in_flight += 1
+            self.posts += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            # Not time.sleep: the retry backoff sleeps are patched out.
+            threading.Event().wait(self.delay)
+            if "xrefsBatch" in url:
+                with self.lock:
+                    self.bridgedb_ids.append(body["data"].split("\n"))
+                rows = [f"{n}\tEntrez Gene\tL:{n},Hac:HGNC:{int(n) + 1000}"
+                        for n in body["data"].split("\n")]
+                return MagicMock(text="\n".join(rows) + "\n")
+            text = body["json"]["text"]
+            with self.lock:
+                self.bern2_texts.append(text)
+            if "DOWN" in text:
+                raise requests.ConnectionError("bern2 down")
+            anns = [{"obj": "gene", "mention": f"GENE{n}", "id": [f"NCBIGene:{n}"], "prob": 0.99}
+                    for n in re.findall(r"GENE(\d+)", text)]
+            return MagicMock(text=json.dumps({"annotations": anns}))
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def _corpus():
+    kedict = {
+        str(i): {"dc:description": f'"""Key event {i} about GENE{i} and GENE{i % 7}."""'}
+        for i in range(1, 25)
+    }
+    kedict["down"] = {"dc:description": '"""This one is DOWN."""'}
+    kedict["blank"] = {"dc:description": '"""   """'}
+    kerdict = {
+        f"r{i}": {"dc:description": f"Relationship GENE{i}.",
+                  "nci:C80263": "Evidence DOWN." if i % 5 == 0 else f"Evidence GENE{i + 50}."}
+        for i in range(1, 16)
+    }
+    kerdict["rdown"] = {"dc:description": "All DOWN.", "nci:C80263": "Still DOWN."}
+    return kedict, kerdict
+
+
+def _shared_corpus():
+    """KERs that repeat KE paragraphs, and each other's evidence."""
+    kedict, kerdict = _corpus()
+    for i in range(1, 16):
+        kerdict[f"r{i}"]["edam:data_2042"] = f'"""Key event {i} about GENE{i} and GENE{i % 7}."""'
+        kerdict[f"s{i}"] = {"dc:description": f"Relationship GENE{i}.",
+                            "nci:C80263": "Shared evidence for GENE3."}
+    return kedict, kerdict
+
+
+def _run(tmp_path, corpus=_corpus, dedupe=False, **overrides):
+    config = PipelineConfig(ner_cache_dir=tmp_path, **overrides)
+    fake = FakeServices()
+    kedict, kerdict = corpus()
+    with patch("aopwiki_rdf.mapping.ner_el_mapper.requests.post", side_effect=fake), \
+            patch("aopwiki_rdf.mapping.ner_el_mapper.time.sleep"), \
+            patch.object(HostRateLimiter, "back_off"):
+        if dedupe:
+            results = map_ner_genes_in_corpus_result(kedict, kerdict, config)
+        else:
+            results = (map_ner_genes_in_kes_result(kedict, config),
+                       map_ner_genes_in_kers_result(kerdict, config))
+    return results, fake
+
+
+def test_concurrent_results_match_sequential(tmp_path):
+    sequential, seq_fake = _run(tmp_path / "seq")
+    concurrent, fake = _run(tmp_path / "conc", ner_workers=6)
+
+    assert concurrent == sequential
+    assert seq_fake.peak == 1 and fake.peak > 1
+    ke_results, ker_results = concurrent
+    assert ke_results["3"].hgnc_ids == {"hgnc:1003"}
+    assert ke_results["down"].failed and "blank" not in ke_results
+    assert not ker_results["r5"].failed and ker_results["r5"].hgnc_ids == {"hgnc:1005"}
+    assert ker_results["rdown"].failed
+
+
+def test_responses_are_written_through_to_the_cache(tmp_path):
+    _run(tmp_path, ner_workers=6)
+    _, fake = _run(tmp_path, ner_workers=6)
+    # Only the six failing texts (the DOWN KE, the r5/r10/r15 evidence and
+    # both rdown fields) go back to the network: 3 attempts, then 3 more for
+    # the one-chunk truncation fallback.
+    assert fake.posts == 6 * (3 + 3)
+
+
+def test_concurrent_run_through_the_store(tmp_path):
+    sequential, _ = _run(tmp_path / "seq")
+    concurrent, _ = _run(tmp_path / "store", ner_workers=6, ner_cache_store=True)
+    assert concurrent == sequential
+    # The store's new entries are exported to the per-file layout at the end.
+    for kind in ("bern2", "bridgedb"):
+        exported = {p.name: p.read_text() for p in (tmp_path / "store" / kind).iterdir()}
+        assert exported == {p.name: p.read_text() for p in (tmp_path / "seq" / kind).iterdir()}
+
+
+def test_rate_limit_spaces_requests_per_host():
+    limiter = HostRateLimiter(rate=50.0)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire("http://bern2.example/plain")
+    limiter.acquire("http://bridgedb.example/Human/")  # own bucket, no wait
+    # One token up front, then one every 20 ms.
+    assert time.monotonic() - start == pytest.approx(0.1, abs=0.05)
+
+
+def test_back_off_holds_only_that_host():
+    limiter = HostRateLimiter()
+    limiter.back_off("http://bern2.example/plain", 0.2)
+    assert limiter.acquire("http://bridgedb.example/Human/") == 0.0
+    assert limiter.acquire("http://bern2.example/other") >= 0.15
+
+
+def test_dedupe_matches_per_corpus_results(tmp_path):
+    per_text, per_text_fake = _run(tmp_path / "per-text", _shared_corpus)
+    planned, fake = _run(tmp_path / "planned", _shared_corpus, dedupe=True, ner_workers=4)
+
+    assert planned == per_text
+    # Each distinct text reaches BERN2 once; the four failing ones six times
+    # (3 attempts, then 3 for the one-chunk truncation fallback).
+    distinct = set(fake.bern2_texts)
+    assert len(fake.bern2_texts) == len(distinct) + 4 * (6 - 1)
+    assert len(per_text_fake.bern2_texts) > len(fake.bern2_texts)
+    # One BridgeDb request for the union instead of one per text.
+    assert len(fake.bridgedb_ids) == 1
+    assert len(per_text_fake.bridgedb_ids) > 10
+
+
+def test_dedupe_keeps_the_per_text_cache(tmp_path):
+    _run(tmp_path, _shared_corpus, dedupe=True)
+    _, fake = _run(tmp_path, _shared_corpus)
+    # The per-text path finds every BridgeDb batch the planned run wrote.
+    assert fake.bridgedb_ids == []
+
+
+def test_coverage_reports_distinct_texts(tmp_path, caplog):
+    kedict, kerdict = _shared_corpus()
+    with caplog.at_level("INFO"):
+        cov = report_cache_coverage(kedict, kerdict,
+                                    config=PipelineConfig(ner_cache_dir=tmp_path))
+    assert cov["total"] == 25 + 3 * 15 + 2 + 2 * 15
+    # 25 KE texts, 15 descriptions, 12 + 1 evidence, 2 rdown, 1 shared evidence.
+    assert cov["distinct"] == 25 + 15 + 13 + 2 + 1
+    assert any("distinct texts" in r.message and "dedup" in r.message
+               for r in caplog.records)
@@ -0,0 +1,135 @@
+"""Tests for packing several short texts into one BERN2 request (``ner_pack_chars``).
+
+Requests go over real HTTP to the offline stand-in (scripts/bern2_standin.py),
+which synthesises span-accurate gene annotations, so the offsets mapped back
+to each packed text are checked against the stand-in's answer for that text
+alone. Retry backoffs are patched out.
+"""
+
+import importlib.util
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from aopwiki_rdf.config import PipelineConfig
+from aopwiki_rdf.mapping.ner_el_mapper import (
+    _PACK_SEPARATOR,
+    _cache_key,
+    _pack_texts,
+    _prime_packed,
+    _split_packed_response,
+    map_ner_genes_in_corpus_result,
+    map_ner_genes_in_kes_result,
+    query_bern2,
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+STANDIN_PATH = os.path.join(PROJECT_ROOT, "scripts", "bern2_standin.py")
+
+LEXICON = {"TP53": ["NCBIGene:7157"], "AhR": ["NCBIGene:196"], "CYP1A1": ["NCBIGene:1543"]}
+TEXTS = [
+    "TP53 activation leads to apoptosis.",
+    "Binding of the AhR ligand.",
+    "No genes in this one.",
+    "CYP1A1 is induced via AhR; TP53 is not.",
+] + [f"Key event {i}: AhR or TP53 in the liver." for i in range(25)]
+
+
+@pytest.fixture
+def standin_module():
+    spec = importlib.util.spec_from_file_location("bern2_standin", STANDIN_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(autouse=True)
+def no_backoff():
+    with patch("aopwiki_rdf.mapping.ner_el_mapper.time.sleep"):
+        yield
+
+
+def _cached(cache_dir, text):
+    return json.loads((Path(cache_dir) / "bern2" / f"{_cache_key(text)}.json").read_text())
+
+
+def test_packs_stay_within_the_limit():
+    texts = ["a" * 40, "b" * 40, "c" * 40, "d" * 200]
+    packs = _pack_texts(texts, 100)
+    assert packs == [texts[:2], texts[2:3], texts[3:]]
+    assert all(len(_PACK_SEPARATOR.join(p)) <= 100 for p in packs[:2])
+
+
+def test_split_maps_offsets_back_and_drops_straddling_annotations():
+    texts = ["TP53 here.", "And AhR."]
+    packed = _PACK_SEPARATOR.join(texts)
+    ahr = packed.index("AhR")
+    data = {"text": packed, "annotations": [
+        {"mention": "TP53", "obj": "gene", "id": ["NCBIGene:7157"],
+         "span": {"begin": 0, "end": 4}},
+        {"mention": "AhR", "obj": "gene", "id": ["NCBIGene:196"],
+         "span": {"begin": ahr, "end": ahr + 3}},
+        {"mention": "here.\n\n#", "obj": "gene", "id": ["NCBIGene:1"],
+         "span": {"begin": 5, "end": 13}},
+    ]}
+    first, second = _split_packed_response(data, texts)
+    assert [a["mention"] for a in first["annotations"]] == ["TP53"]
+    assert second["annotations"][0]["span"] == {"begin": 4, "end": 7}
+
+    del data["annotations"][0]["span"]
+    assert _split_packed_response(data, texts) is None
+    assert _split_packed_response({"text": "edited", "annotations": []}, texts) is None
+
+
+def test_packed_entries_match_single_text_responses(standin_module, tmp_path):
+    with standin_module.Bern2StandIn(lexicon=LEXICON) as standin:
+        config = PipelineConfig(ner_cache_dir=tmp_path / "packed", bern2_url=standin.url,
+                                ner_pack_chars=1500)
+        _prime_packed(TEXTS, config, store=None, limiter=None)
+        packed_requests = standin.stats["requests"]
+        single = {text: query_bern2(text, standin.url, tmp_path / "single")
+                  for text in TEXTS}
+
+    assert packed_requests == 1
+    for text in TEXTS:
+        packed = _cached(tmp_path / "packed", text)
+        assert packed["annotations"] == single[text]["annotations"]
+        assert packed["_packed"] and "_packed" not in single[text]
+        for ann in single[text]["annotations"]:
+            assert text[ann["span"]["begin"]:ann["span"]["end"]] == ann["mention"]
+
+
+def test_packing_cuts_request_count(standin_module, tmp_path):
+    kedict = {str(i): {"dc:description": f'"""Key event {i} without gene mentions."""'}
+              for i in range(60)}
+    kedict["long"] = {"dc:description": '"""' + "A long description. " * 100 + '"""'}
+    with standin_module.Bern2StandIn() as standin:
+        config = PipelineConfig(ner_cache_dir=tmp_path / "per-text", bern2_url=standin.url)
+        per_text = map_ner_genes_in_kes_result(kedict, config)
+        per_text_requests = standin.stats["requests"]
+        config.ner_cache_dir, config.ner_pack_chars = tmp_path / "packed", 1500
+        packed = map_ner_genes_in_kes_result(kedict, config)
+
+    assert packed == per_text
+    assert per_text_requests == 61
+    # 60 short texts in two packs; the long one alone, as before.
+    assert standin.stats["requests"] - per_text_requests == 2 + 1
+
+
+def test_failed_packs_fall_back_to_per_text_requests(standin_module, tmp_path):
+    with standin_module.Bern2StandIn(lexicon=LEXICON, truncate_chars=300) as standin:
+        # BridgeDb batches 404 at the stand-in: genes stay unmapped, not failed.
+        config = PipelineConfig(ner_cache_dir=tmp_path, bern2_url=standin.url,
+                                bridgedb_url=standin.url.removesuffix("plain"),
+                                ner_pack_chars=1500, ner_workers=2)
+        ke_results, _ = map_ner_genes_in_corpus_result(
+            {str(i): {"dc:description": f'"""{text}"""'} for i, text in enumerate(TEXTS[:3])},
+            {}, config)
+    # The truncated pack is sent once, then each text alone.
+    assert standin.stats["truncated"] == 1
+    assert standin.stats["requests"] == 1 + 3
+    assert not any(result.failed for result in ke_results.values())
+    assert [a["mention"] for a in _cached(tmp_path, TEXTS[0])["annotations"]] == ["TP53"]
@@ -51,12 +51,15 @@ def test_orchestrator_line_count():
     monolith (pipeline_monolith.py) is ~2,300 lines. The orchestrator has
     grown with added stages (ARR filter, BERN2 enrichment), the COMPAT
     pinned-snapshot branch in _stage_parse (COMPAT-01), and the VoID endpoint
-    overrides (PR #95); 650 lines leaves headroom for a few more while still
-    catching a real slide back toward monolithic logic.
+    overrides (PR #95), and the stage dependency table (STAGE_DEPENDS) with
+    the HGNC download and IRI label maps split into their own stages so they
+    can overlap; 700 lines leaves headroom for a few more while still
+    catching a real slide back toward monolithic logic. The scheduling logic
+    itself lives in aopwiki_rdf.scheduler.
     """
     src = inspect.getsource(pipeline)
     line_count = len(src.splitlines())
-    assert line_count < 650, f"pipeline.py has {line_count} lines (limit: 650)"
+    assert line_count < 700, f"pipeline.py has {line_count} lines (limit: 700)"
 
 
 def test_monolith_preserved():
@@ -88,3 +91,10 @@ def test_context_dict_pattern():
         params = list(sig.parameters.keys())
         assert "config" in params, f"Stage '{name}' missing 'config' parameter"
         assert "context" in params, f"Stage '{name}' missing 'context' parameter"
+
+
+def test_stage_depends_is_valid_graph():
+    """STAGE_DEPENDS only names stages declared earlier in STAGES."""
+    from aopwiki_rdf.scheduler import validate_stage_graph
+    validate_stage_graph(pipeline.STAGES, pipeline.STAGE_DEPENDS)
+    assert set(pipeline.STAGE_DEPENDS) == {name for name, _fn in pipeline.STAGES[1:]}
@@ -0,0 +1,98 @@
+"""Tests for the insertion-ordered set behind hgnclist and the xref lists."""
+
+import copy
+import json
+import pickle
+import time
+
+import pytest
+
+from aopwiki_rdf.mapping import chemical_mapper, gene_mapper
+from aopwiki_rdf.mapping.ordered_set import OrderedSet
+
+
+def test_keeps_first_insertion_order_and_drops_repeats():
+    s = OrderedSet(['hgnc:3', 'hgnc:1', 'hgnc:3'])
+    assert s.add('hgnc:2') is True
+    assert s.add('hgnc:1') is False
+    s.append('hgnc:1')
+    s.extend(['hgnc:4', 'hgnc:2'])
+    s += ['hgnc:5']
+    assert s == ['hgnc:3', 'hgnc:1', 'hgnc:2', 'hgnc:4', 'hgnc:5']
+    assert 'hgnc:4' in s and 'hgnc:6' not in s
+    assert json.dumps(s) == json.dumps(list(s))
+
+
+def test_round_trips_through_pickle_and_copy():
+    s = OrderedSet(['b', 'a'])
+    for clone in (pickle.loads(pickle.dumps(s)), copy.deepcopy(s), copy.copy(s)):
+        assert type(clone) is OrderedSet
+        assert clone == ['b', 'a']
+        clone.append('a')
+        clone.append('c')
+        assert clone == ['b', 'a', 'c']
+    assert s == ['b', 'a']
+
+
+def test_clear_resets_membership():
+    s = OrderedSet(['a'])
+    s.clear()
+    assert 'a' not in s
+    s.append('a')
+    assert s == ['a']
+
+
+@pytest.mark.parametrize('method, args', [
+    ('insert', (0, 'x')), ('remove', ('a',)), ('pop', ()), ('sort', ()),
+    ('reverse', ()), ('__setitem__', (0, 'x')), ('__delitem__', (0,)),
+])
+def test_reordering_mutators_are_rejected(method, args):
+    s = OrderedSet(['a', 'b'])
+    with pytest.raises(TypeError):
+        getattr(s, method)(*args)
+    assert s == ['a', 'b'] and 'a' in s
+
+
+# ---------------------------------------------------------------------------
+# Scaling benchmarks at 10x a current AOP-Wiki release
+# ---------------------------------------------------------------------------
+# A release maps roughly 3,000 genes and 1,500 CAS numbers. At ten times that,
+# the list-based de-duplication these sets replaced made hundreds of millions of
+# comparisons; with constant-time membership both finish well under a second.
+
+def test_build_gene_xrefs_scales_at_10x_corpus(monkeypatch):
+    n_genes = 30_000
+    hgnclist = [f'hgnc:{i}' for i in range(n_genes)]
+    # Neighbouring genes share identifiers so de-duplication is exercised.
+    xrefs = {gene: {'Entrez Gene': [str(i), str(i + 1)],
+                    'Ensembl': [f'ENSG{i // 2:011d}'],
+                    'Uniprot-TrEMBL': [f'P{i:05d}']}
+             for i, gene in enumerate(hgnclist)}
+    monkeypatch.setattr(gene_mapper, 'batch_xrefs_gene', lambda genes, *a, **kw: xrefs)
+
+    start = time.perf_counter()
+    result = gene_mapper.build_gene_xrefs(hgnclist, 'http://bridgedb.invalid/')
+    elapsed = time.perf_counter() - start
+
+    assert result['listofentrez'][:3] == ['ncbigene:0', 'ncbigene:1', 'ncbigene:2']
+    assert len(result['listofentrez']) == n_genes + 1
+    assert len(result['listofensembl']) == n_genes // 2
+    assert elapsed < 5, f"build_gene_xrefs took {elapsed:.1f}s for {n_genes} genes"
+
+
+def test_map_chemicals_scales_at_10x_corpus(monkeypatch):
+    n_chemicals = 15_000
+    chedict = {str(i): {'cheminf:000446': f'"{i}-00-0"'} for i in range(n_chemicals)}
+    batch = {f'{i}-00-0': {'cheminf:000407': [f'chebi:{i // 3}'],
+                           'cheminf:000140': [f'pubchem.compound:{3 * i + k}' for k in range(3)]}
+             for i in range(n_chemicals)}
+    monkeypatch.setattr(chemical_mapper, 'batch_xrefs_chemical', lambda cas, *a, **kw: batch)
+
+    start = time.perf_counter()
+    result = chemical_mapper.map_chemicals(chedict, 'http://bridgedb.invalid/')
+    elapsed = time.perf_counter() - start
+
+    assert result['listofchebi'][:2] == ['chebi:0', 'chebi:1']
+    assert len(result['listofchebi']) == n_chemicals // 3
+    assert len(result['listofpubchem']) == 3 * n_chemicals
+    assert elapsed < 5, f"map_chemicals took {elapsed:.1f}s for {n_chemicals} chemicals"
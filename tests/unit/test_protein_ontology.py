@@ -115,3 +115,89 @@ def test_successful_download_is_parsed(tmp_path):
 
     assert result["pro_hgnclist"] == ["hgnc:1234"]
     assert (out_dir / "promapping.txt").is_file()
+
+
+# Interleaved keys, a key cited twice, an uncited key and a row without any
+# mapped identifier: the indexed store must reproduce the scan exactly.
+INDEXED_PROMAPPING = (
+    "PR:000002\tNCBIGene:672\tis_a\n"
+    "PR:000001\tHGNC:1234\tis_a\n"
+    "PR:000099\tHGNC:9999\tis_a\n"
+    "PR:000002\tUniProtKB:P38398,Homo sapiens\tis_a\n"
+    "PR:000003\tMGI:12345\tis_a\n"
+    "malformed line\n"
+    "PR:000001\tUniProtKB:P12345\tis_a\n"
+)
+INDEXED_PROLIST = ["pr:000001", "pr:000002", "pr:000003"]
+
+
+class _FakeRemote:
+    """Serves a promapping text for urlretrieve and validators for HEAD."""
+
+    def __init__(self, text, etag):
+        self.text = text
+        self.etag = etag
+        self.downloads = 0
+
+    def urlretrieve(self, url, filename):
+        self.downloads += 1
+        _write(Path(filename), self.text)
+        return filename, None
+
+    def urlopen(self, request, timeout=None):
+        assert request.get_method() == "HEAD"
+        response = mock.MagicMock()
+        response.headers = {"ETag": self.etag}
+        response.__enter__.return_value = response
+        return response
+
+
+def _run(remote, out_dir, index_dir, prolist=INDEXED_PROLIST):
+    with mock.patch(
+        "aopwiki_rdf.mapping.protein_ontology.urllib.request.urlretrieve",
+        side_effect=remote.urlretrieve,
+    ), mock.patch(
+        "aopwiki_rdf.mapping.protein_ontology.urllib.request.urlopen",
+        side_effect=remote.urlopen,
+    ):
+        return download_and_parse_promapping(
+            promapping_url="https://proconsortium.org/download/current/promapping.txt",
+            data_dir=out_dir,
+            prolist=prolist,
+            index_dir=index_dir,
+        )
+
+
+def test_indexed_store_matches_full_scan(tmp_path):
+    """Lookups through the store give the scan's lists and key order."""
+    remote = _FakeRemote(INDEXED_PROMAPPING, '"v1"')
+    scanned = _run(remote, tmp_path, index_dir=None)
+    indexed = _run(remote, tmp_path, index_dir=tmp_path / "index")
+
+    for key in ("pro_hgnclist", "pro_uniprotlist", "pro_ncbigenelist"):
+        assert indexed[key] == scanned[key]
+    assert list(indexed["prodict"].items()) == list(scanned["prodict"].items())
+    assert list(scanned["prodict"]) == ["pr:000002", "pr:000001"]
+    assert scanned["prodict"]["pr:000001"] == ["hgnc:1234", "uniprot:P12345"]
+
+
+def test_unchanged_remote_skips_download(tmp_path):
+    """Matching validators answer from the store without downloading."""
+    remote = _FakeRemote(INDEXED_PROMAPPING, '"v1"')
+    first = _run(remote, tmp_path, tmp_path / "index")
+    second = _run(remote, tmp_path, tmp_path / "index", prolist=["pr:000001"])
+
+    assert remote.downloads == 1
+    assert second["prodict"] == {"pr:000001": first["prodict"]["pr:000001"]}
+    assert second["modification_time"] == first["modification_time"]
+
+
+def test_new_release_rebuilds_store(tmp_path):
+    """A changed remote file is downloaded and re-indexed."""
+    remote = _FakeRemote(INDEXED_PROMAPPING, '"v1"')
+    _run(remote, tmp_path, tmp_path / "index")
+    remote.text, remote.etag = "PR:000001\tHGNC:4321\tis_a\n", '"v2"'
+    result = _run(remote, tmp_path, tmp_path / "index")
+
+    assert remote.downloads == 2
+    assert result["prodict"] == {"pr:000001": ["hgnc:4321"]}
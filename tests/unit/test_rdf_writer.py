@@ -991,3 +991,36 @@ def test_writer_output_byte_stable_across_hash_seeds(tmp_path):
         outputs.append(out.read_bytes())
 
     assert outputs[0] == outputs[1], "TTL output is not byte-stable across hash seeds"
+
+
+def test_membership_indexes_keep_scan_order():
+    """Reverse indexes list members in the order the old full scans did."""
+    from aopwiki_rdf.rdf.writer import _build_membership_indexes
+
+    aopdict = {
+        'a2': {'dc:identifier': 'aop:2', 'aopo:has_key_event': {'k1': {}},
+               'aopo:has_key_event_relationship': {'r1': {}}, 'nci:C54571': {}},
+        'a1': {'dc:identifier': 'aop:1', 'aopo:has_key_event': {'k1': {}, 'k2': {}},
+               'aopo:has_key_event_relationship': {}, 'nci:C54571': {'s1': {}}},
+    }
+    kedict = {
+        'k2': {'dc:identifier': 'aop.events:2', 'nci:C54571': {'s1': {}}},
+        'k1': {'dc:identifier': 'aop.events:1'},
+    }
+    strdict = {
+        's2': {'dc:identifier': 'aop.stressor:2', 'aopo:has_chemical_entity': ['"c"'],
+               'linktochemical': ['c1', 'c1']},
+        's1': {'dc:identifier': 'aop.stressor:1', 'aopo:has_chemical_entity': ['"c"'],
+               'linktochemical': ['c1']},
+        's3': {'dc:identifier': 'aop.stressor:3', 'linktochemical': ['c1']},
+    }
+
+    idx = _build_membership_indexes(aopdict, kedict, strdict)
+
+    assert idx.aops_by_ke == {'k1': ['aop:2', 'aop:1'], 'k2': ['aop:1']}
+    assert idx.aops_by_ker == {'r1': ['aop:2']}
+    assert idx.aops_by_stressor == {'s1': ['aop:1']}
+    assert idx.kes_by_stressor == {'s1': ['k2']}
+    assert idx.kes_by_identifier == {'aop.events:2': ['k2'], 'aop.events:1': ['k1']}
+    # s3 has no aopo:has_chemical_entity, so it is not part of c1's stressors.
+    assert idx.stressors_by_chemical == {'c1': ['aop.stressor:2', 'aop.stressor:1']}
@@ -8,9 +8,10 @@ is required.
 """
 
 import gzip
-
 from pathlib import Path
 
+import pytest
+
 from run_conversion import build_config
 
 from aopwiki_rdf import pipeline
@@ -75,6 +76,128 @@ def test_build_config_xml_file_coexists_with_enable_flags():
     assert config.enable_iri_labels is True
 
 
+def test_build_config_parse_cache_dir():
+    """--parse-cache-dir is off by default and Path-typed when given."""
+    assert build_config([]).parse_cache_dir is None
+    config = build_config(["--parse-cache-dir", "data/cache/parse"])
+    assert isinstance(config.parse_cache_dir, Path)
+    assert str(config.parse_cache_dir) == "data/cache/parse"
+
+
+def test_build_config_incremental_dir():
+    """--incremental-dir is off by default and Path-typed when given."""
+    assert build_config([]).incremental_dir is None
+    config = build_config(["--incremental-dir", "data/cache/incremental"])
+    assert isinstance(config.incremental_dir, Path)
+
+
+def test_build_config_automaton_cache_dir():
+    """--automaton-cache-dir is off by default and Path-typed when given."""
+    assert build_config([]).automaton_cache_dir is None
+    config = build_config(["--automaton-cache-dir", "data/cache/automaton"])
+    assert isinstance(config.automaton_cache_dir, Path)
+
+
+def test_build_config_gene_workers():
+    """--gene-workers defaults to in-process scanning."""
+    assert build_config([]).gene_mapping_workers == 1
+    assert build_config(["--gene-workers", "4"]).gene_mapping_workers == 4
+
+
+def test_build_config_bridgedb_url():
+    """--bridgedb-url points the pipeline at another BridgeDb, e.g. a stand-in."""
+    assert build_config([]).bridgedb_url == "https://webservice.bridgedb.org/Human/"
+    url = "http://127.0.0.1:8183/Human/"
+    assert build_config(["--bridgedb-url", url]).bridgedb_url == url
+
+
+def test_build_config_bridgedb_workers():
+    """--bridgedb-workers defaults to sequential BridgeDb requests."""
+    assert build_config([]).bridgedb_workers == 1
+    assert build_config(["--bridgedb-workers", "8"]).bridgedb_workers == 8
+
+
+def test_build_config_bridgedb_cache_dir():
+    """--bridgedb-cache-dir is off by default and coerced to a Path."""
+    assert build_config([]).bridgedb_cache_dir is None
+    config = build_config(["--bridgedb-cache-dir", "data/cache/bridgedb"])
+    assert isinstance(config.bridgedb_cache_dir, Path)
+
+
+def test_build_config_promapping_index_dir():
+    """--promapping-index-dir is off by default and coerced to a Path."""
+    assert build_config([]).promapping_index_dir is None
+    config = build_config(["--promapping-index-dir", "data/cache/promapping"])
+    assert isinstance(config.promapping_index_dir, Path)
+
+
+def test_build_config_http_cache_dir():
+    """--http-cache-dir is off by default and coerced to a Path."""
+    assert build_config([]).http_cache_dir is None
+    config = build_config(["--http-cache-dir", "data/cache/http"])
+    assert isinstance(config.http_cache_dir, Path)
+
+
+def test_build_config_stream_xml_download():
+    """--stream-xml-download is off by default."""
+    assert build_config([]).stream_xml_download is False
+    assert build_config(["--stream-xml-download"]).stream_xml_download is True
+
+
+def test_build_config_ner_cache_store():
+    """--ner-cache-store is off by default."""
+    assert build_config([]).ner_cache_store is False
+    assert build_config(["--ner-cache-store"]).ner_cache_store is True
+
+
+def test_build_config_ner_workers_and_rate_limit():
+    """--ner-workers / --ner-rate-limit default to one uncapped worker."""
+    config = build_config([])
+    assert (config.ner_workers, config.ner_rate_limit) == (1, 0.0)
+    config = build_config(["--ner-workers", "8", "--ner-rate-limit", "2.5"])
+    assert (config.ner_workers, config.ner_rate_limit) == (8, 2.5)
+
+
+def test_build_config_ner_dedupe():
+    """--ner-dedupe is off by default."""
+    assert build_config([]).ner_dedupe is False
+    assert build_config(["--ner-dedupe"]).ner_dedupe is True
+
+
+def test_build_config_ner_pack_chars():
+    """--ner-pack-chars is off by default."""
+    assert build_config([]).ner_pack_chars == 0
+    assert build_config(["--ner-pack-chars", "1500"]).ner_pack_chars == 1500
+
+
+def test_build_config_ner_cache_retention_days():
+    """--ner-cache-retention-days is off by default."""
+    assert build_config([]).ner_cache_retention_days is None
+    assert build_config(["--ner-cache-retention-days", "30"]).ner_cache_retention_days == 30.0
+
+
+def test_build_config_bern2_url():
+    """--bern2-url points the NER pass at another BERN2, e.g. a stand-in."""
+    assert build_config([]).bern2_url == "http://bern2.korea.ac.kr/plain"
+    url = "http://127.0.0.1:8888/plain"
+    assert build_config(["--bern2-url", url]).bern2_url == url
+
+
+def test_build_config_resume_requires_checkpoint_dir():
+    """--resume without --checkpoint-dir is a usage error."""
+    with pytest.raises(SystemExit):
+        build_config(["--resume"])
+    config = build_config(["--checkpoint-dir", "data/cache/run", "--resume"])
+    assert isinstance(config.checkpoint_dir, Path)
+    assert config.resume is True
+
+
+def test_build_config_verify_triple_counts():
+    """--verify-triple-counts is off by default."""
+    assert build_config([]).verify_triple_counts is False
+    assert build_config(["--verify-triple-counts"]).verify_triple_counts is True
+
+
 # --- _stage_parse byte-neutral branch (COMPAT-01, A1) ----------------------
 
 _MINIMAL_XML = (
@@ -101,14 +224,9 @@ def _stub_downstream_parse(monkeypatch, recorder):
         recorder["downloaded_files"].append(filename)
         return True
 
-    class _FakeTree:
-        def getroot(self):
-            return object()
-
-    monkeypatch.setattr(pipeline, "_download_with_retry", _record_download)
-    monkeypatch.setattr(pipeline, "parse", lambda path: _FakeTree())
+    monkeypatch.setattr(pipeline, "download_with_retry", _record_download)
     monkeypatch.setattr(
-        pipeline, "parse_aopwiki_xml", lambda path, config=None: {}
+        pipeline, "stream_aopwiki_xml", lambda path, cache_dir=None: ({}, object())
     )
 
 
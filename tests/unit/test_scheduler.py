@@ -0,0 +1,67 @@
+"""Tests for the dependency-aware stage runner."""
+
+import threading
+
+import pytest
+
+from aopwiki_rdf.scheduler import run_stages, validate_stage_graph
+
+
+def _recording_stage(name, log, barrier=None):
+    def stage(config, context):
+        log.append(('start', name))
+        if barrier is not None:
+            barrier.wait(timeout=5)
+        context[name] = True
+        log.append(('end', name))
+    return stage
+
+
+def test_sequential_runs_in_list_order():
+    log = []
+    stages = [(n, _recording_stage(n, log)) for n in ('a', 'b', 'c')]
+    context = {}
+    run_stages(stages, {'c': ('a',)}, None, context, max_workers=1)
+    assert log == [('start', 'a'), ('end', 'a'), ('start', 'b'), ('end', 'b'),
+                   ('start', 'c'), ('end', 'c')]
+    assert context == {'a': True, 'b': True, 'c': True}
+
+
+def test_parallel_overlaps_independent_stages_and_respects_dependencies():
+    """b and c only pass the barrier if they run at the same time."""
+    log = []
+    barrier = threading.Barrier(2)
+    stages = [
+        ('a', _recording_stage('a', log)),
+        ('b', _recording_stage('b', log, barrier)),
+        ('c', _recording_stage('c', log, barrier)),
+        ('d', _recording_stage('d', log)),
+    ]
+    depends = {'b': ('a',), 'c': ('a',), 'd': ('b', 'c')}
+    run_stages(stages, depends, None, {}, max_workers=4)
+    assert log.index(('end', 'a')) < log.index(('start', 'b'))
+    assert log.index(('end', 'a')) < log.index(('start', 'c'))
+    assert log.index(('start', 'd')) > max(log.index(('end', 'b')), log.index(('end', 'c')))
+
+
+def test_failure_stops_later_stages():
+    log = []
+
+    def boom(config, context):
+        raise SystemExit(1)
+
+    stages = [('a', boom), ('b', _recording_stage('b', log))]
+    with pytest.raises(SystemExit):
+        run_stages(stages, {'b': ('a',)}, None, {}, max_workers=2)
+    assert log == []
+
+
+@pytest.mark.parametrize('depends', [
+    {'a': ('b',)},          # declared after its dependent
+    {'b': ('missing',)},    # unknown dependency
+    {'missing': ('a',)},    # unknown stage
+])
+def test_invalid_graph_raises(depends):
+    stages = [('a', lambda c, x: None), ('b', lambda c, x: None)]
+    with pytest.raises(ValueError):
+        validate_stage_graph(stages, depends)
@@ -0,0 +1,108 @@
+"""Tests for the write-time triple counter (rdf/stats.py)."""
+
+import io
+import os
+import shutil
+
+import pytest
+from rdflib import Graph
+
+from aopwiki_rdf.rdf.stats import RDF_TYPE, TripleCounter
+
+TURTLE = '''@prefix dc: <http://purl.org/dc/elements/1.1/> .
+@prefix chembl.compound: <http://identifiers.org/chembl.compound/> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+# a comment
+chembl.compound:CHEMBL25\ta\t<http://example.org/Chemical> ;
+\tdc:title\t"""Aspirin "acetylsalicylic" acid""" , "Aspirin \\"acetylsalicylic\\" acid" ;
+\tdc:date\t"2024-01-01"^^xsd:date ;
+\tdc:description\t"""multi
+line"""@en ;
+\tdc:source\t[ a <http://example.org/Source> ; dc:title "AOP-Wiki" ] ;
+\tdc:relation\t[ a <http://example.org/Source> ; dc:title "AOP-Wiki" ] ;
+\tdc:rights\ttrue ;
+\tdc:extent\t42 .
+
+chembl.compound:CHEMBL25\tdc:title\t"Aspirin \\"acetylsalicylic\\" acid" .
+'''
+
+
+def _rdflib_count(text):
+    g = Graph()
+    g.parse(data=text, format='turtle')
+    return len(g)
+
+
+def _count(chunks):
+    counter = TripleCounter(io.StringIO())
+    for chunk in chunks:
+        counter.write(chunk)
+    return counter.close()
+
+
+def test_counts_distinct_triples_like_rdflib():
+    stats = _count([TURTLE])
+    assert stats.total == _rdflib_count(TURTLE) == 12
+    assert stats.per_class['http://example.org/Source'] == 2
+    assert stats.per_predicate[RDF_TYPE] == 3
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 64])
+def test_chunk_boundaries_do_not_change_the_count(size, monkeypatch):
+    # Feed the tokeniser on every write so tokens are cut at every position.
+    monkeypatch.setattr('aopwiki_rdf.rdf.stats._FLUSH_CHARS', 1)
+    chunks = [TURTLE[i:i + size] for i in range(0, len(TURTLE), size)]
+    assert _count(chunks).total == 12
+
+
+def test_writes_pass_through_unchanged():
+    out = io.StringIO()
+    counter = TripleCounter(out)
+    counter.write(TURTLE)
+    counter.close()
+    assert out.getvalue() == TURTLE
+
+
+def test_unsupported_turtle_returns_none():
+    assert _count(['@base <http://example.org/> .\n<a> <b> ( 1 2 ) .\n']) is None
+    assert _count(['<http://example.org/a> <http://example.org/b> ']) is None
+
+
+def test_writer_stats_match_rdflib(sample_xml_path, tmp_path):
+    from aopwiki_rdf.parser.xml_parser import parse_aopwiki_xml
+    from aopwiki_rdf.rdf.writer import write_aop_rdf
+
+    parsed = parse_aopwiki_xml(sample_xml_path)
+    entities = {
+        'aopdict': parsed.aopdict, 'kedict': parsed.kedict, 'kerdict': parsed.kerdict,
+        'strdict': parsed.stressordict, 'chedict': parsed.chemicaldict,
+        'taxdict': parsed.taxdict, 'bioobjdict': parsed.bodict,
+        'bioprodict': parsed.bpdict, 'bioactdict': parsed.badict,
+        'prodict': parsed.prodict, 'hgnclist': ['hgnc:1100'],
+        'listofcas': ['cas:50-00-0'], 'listofchebi': ['chebi:1234'],
+    }
+    repo = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    shutil.copy(os.path.join(repo, 'data', 'typelabels.txt'), tmp_path)
+    out = str(tmp_path / 'AOPWikiRDF.ttl')
+
+    stats = write_aop_rdf(out, entities, os.path.join(repo, 'prefixes.csv'))
+
+    g = Graph()
+    g.parse(out, format='turtle')
+    assert stats.total == len(g)
+
+
+def test_pipeline_falls_back_to_rdflib_without_stats(tmp_path):
+    from aopwiki_rdf.config import PipelineConfig
+    from aopwiki_rdf.pipeline import _triple_count
+
+    path = tmp_path / 'out.ttl'
+    path.write_text(TURTLE)
+    config = PipelineConfig(data_dir=tmp_path)
+    stats = _count([TURTLE])
+    stats.total = 99
+    assert _triple_count(config, str(path), stats) == 99
+    assert _triple_count(config, str(path), None) == 12
+    config.verify_triple_counts = True
+    assert _triple_count(config, str(path), stats) == 12
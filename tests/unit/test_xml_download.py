@@ -0,0 +1,155 @@
+"""Tests for the streaming AOP-Wiki XML download (parser/download.py)."""
+
+import gzip
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from aopwiki_rdf import pipeline
+from aopwiki_rdf.config import PipelineConfig
+from aopwiki_rdf.http_cache import ConditionalFetcher
+from aopwiki_rdf.parser.download import _CHUNK_BYTES, download_and_decompress
+
+XML = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<data xmlns="http://www.aopkb.org/aop-xml">\n'
+    + "".join(f'  <key-event id="{i}"><title>Event {i}</title></key-event>\n'
+              for i in range(2000))
+    + "</data>\n"
+).encode("utf-8")
+
+
+class Export:
+    """Serves ``payload`` (optionally cut short) for every GET."""
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.truncate_first = 0
+        self.requests = 0
+        export = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, fmt, *args):
+                pass
+
+            def do_GET(self):
+                export.requests += 1
+                if self.headers.get("If-None-Match") == '"v1"':
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = export.payload
+                if export.truncate_first:
+                    export.truncate_first -= 1
+                    body = body[: len(body) // 2]
+                self.send_response(200)
+                self.send_header("Content-Type", "application/gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", '"v1"')
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}/aop-wiki-xml.gz"
+        threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05},
+                         daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def export():
+    server = Export(gzip.compress(XML))
+    yield server
+    server.close()
+
+
+def test_streams_export_into_one_file(tmp_path, export, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dest = tmp_path / "data" / "aop-wiki-xml-2026-10-17"
+    dest.parent.mkdir()
+    report = download_and_decompress(export.url, str(dest))
+
+    assert dest.read_bytes() == XML
+    assert report.xml_bytes == len(XML)
+    assert report.compressed_bytes == len(export.payload)
+    # Nothing besides the XML is left behind.
+    assert sorted(p.name for p in tmp_path.rglob("*") if p.is_file()) == [dest.name]
+
+
+def test_revalidated_export_reports_no_bytes_received(tmp_path, export):
+    fetcher = ConditionalFetcher(tmp_path / "http")
+    first = download_and_decompress(export.url, str(tmp_path / "a.xml"), fetcher=fetcher)
+    second = download_and_decompress(export.url, str(tmp_path / "b.xml"), fetcher=fetcher)
+
+    assert first.compressed_bytes == len(export.payload)
+    assert second.compressed_bytes == 0
+    # The cached .gz is the second copy on disk, either way.
+    assert first.cached_gzip_bytes == second.cached_gzip_bytes == len(export.payload)
+    assert (tmp_path / "b.xml").read_bytes() == XML
+
+
+def test_multi_member_gzip_matches_gzip_open(tmp_path, export):
+    half = len(XML) // 2
+    export.payload = gzip.compress(XML[:half]) + gzip.compress(XML[half:])
+    dest = tmp_path / "export.xml"
+    download_and_decompress(export.url, str(dest))
+    assert dest.read_bytes() == XML
+
+
+def test_truncated_body_is_retried(tmp_path, export):
+    export.truncate_first = 1
+    dest = tmp_path / "export.xml"
+    with patch("aopwiki_rdf.parser.download.time.sleep"):
+        download_and_decompress(export.url, str(dest), max_retries=2)
+    assert export.requests == 2
+    assert dest.read_bytes() == XML
+
+
+def test_persistent_truncation_fails_without_writing(tmp_path, export):
+    export.truncate_first = 3
+    dest = tmp_path / "export.xml"
+    with patch("aopwiki_rdf.parser.download.time.sleep"):
+        with pytest.raises(gzip.BadGzipFile):
+            download_and_decompress(export.url, str(dest), max_retries=3)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_memory_stays_bounded_by_the_chunk_size(tmp_path):
+    big = XML * 250  # ~30 MB of XML
+    server = Export(gzip.compress(big))
+    try:
+        tracemalloc.start()
+        download_and_decompress(server.url, str(tmp_path / "export.xml"))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        server.close()
+    # A few chunk-sized buffers, however large the export.
+    assert peak < 8 * _CHUNK_BYTES < len(big) / 3
+
+
+def test_parse_stage_streams_when_enabled(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_stream(url, dest, **kwargs):
+        calls.append(dest)
+        with open(dest, "wb") as fh:
+            fh.write(XML)
+
+    monkeypatch.setattr(pipeline, "download_and_decompress", fake_stream)
+    monkeypatch.setattr(pipeline, "download_with_retry",
+                        lambda *a, **k: pytest.fail("buffered download used"))
+    monkeypatch.setattr(pipeline, "stream_aopwiki_xml",
+                        lambda path, cache_dir=None: ({}, object()))
+    config = PipelineConfig(data_dir=tmp_path, stream_xml_download=True)
+    context = {"filepath": str(tmp_path) + "/"}
+    pipeline._stage_parse(config, context)
+
+    assert calls == [str(tmp_path) + "/" + context["aopwikixmlfilename"]]
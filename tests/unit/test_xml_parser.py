@@ -92,3 +92,122 @@ def test_missing_wiki_license_absent(sample_xml_path, tmp_path):
     result = parse_aopwiki_xml(str(src))
     assert '_wiki_license' not in result.aopdict['1']
     assert '_wiki_license' not in result.aopdict['2']
+
+
+# --- Streaming ingest ------------------------------------------------------
+
+def _entities_repr(entities):
+    """Render every dict with its insertion order, so order drift fails too."""
+    import dataclasses
+    return [(f.name, repr(getattr(entities, f.name)))
+            for f in dataclasses.fields(entities)]
+
+
+def test_stream_matches_tree_parse(sample_xml_path):
+    """stream_aopwiki_xml yields exactly what the tree parser yields."""
+    from aopwiki_rdf.parser.xml_parser import parse_aopwiki_xml, stream_aopwiki_xml
+    streamed, _side_tables = stream_aopwiki_xml(sample_xml_path)
+    assert _entities_repr(streamed) == _entities_repr(parse_aopwiki_xml(sample_xml_path))
+
+
+def test_stream_handles_vendor_section_last(sample_xml_path, tmp_path):
+    """The real export puts <vendor-specific> after the entities; order must not matter."""
+    from xml.etree.ElementTree import parse, register_namespace
+    from aopwiki_rdf.parser.xml_parser import AOPXML_NS, parse_aopwiki_xml, stream_aopwiki_xml
+
+    register_namespace('', AOPXML_NS.strip('{}'))
+    tree = parse(sample_xml_path)
+    root = tree.getroot()
+    children = list(root)
+    for child in children:
+        root.remove(child)
+    # Dependents first, then their dependencies, vendor-specific last.
+    children.sort(key=lambda el: (el.tag == AOPXML_NS + 'vendor-specific',
+                                  el.tag not in (AOPXML_NS + 'key-event', AOPXML_NS + 'aop')))
+    root.extend(children)
+    reordered = tmp_path / "reordered.xml"
+    tree.write(reordered, encoding='utf-8', xml_declaration=True)
+
+    streamed, side_tables = stream_aopwiki_xml(str(reordered))
+    assert _entities_repr(streamed) == _entities_repr(parse_aopwiki_xml(sample_xml_path))
+    assert side_tables.ke_ids == ['100', '101']
+    assert side_tables.ker_ids == ['50']
+
+
+def test_stream_releases_elements_before_resolving(sample_xml_path, monkeypatch):
+    """No entity element is still alive once reference resolution starts."""
+    import gc
+    from xml.etree.ElementTree import Element
+    from aopwiki_rdf.parser import xml_parser
+
+    entity_tags = {xml_parser.AOPXML_NS + tag
+                   for tag in ('aop', 'stressor', 'key-event', 'key-event-relationship')}
+    alive = []
+    resolve_aop = xml_parser._resolve_aop
+
+    def counting_resolve_aop(*args):
+        gc.collect()
+        alive.append(sum(1 for obj in gc.get_objects()
+                         if isinstance(obj, Element) and obj.tag in entity_tags))
+        return resolve_aop(*args)
+
+    monkeypatch.setattr(xml_parser, '_resolve_aop', counting_resolve_aop)
+    xml_parser.stream_aopwiki_xml(sample_xml_path)
+    assert alive and set(alive) == {0}
+
+
+def test_stream_side_tables_match_tree(sample_xml_path):
+    """Side tables carry the same KE/KER document order as the tree."""
+    from xml.etree.ElementTree import parse
+    from aopwiki_rdf.parser.xml_parser import XmlSideTables, stream_aopwiki_xml
+    _entities, side_tables = stream_aopwiki_xml(sample_xml_path)
+    assert side_tables == XmlSideTables.from_root(parse(sample_xml_path).getroot())
+
+
+def test_stream_missing_vendor_section_raises(tmp_path):
+    """A file without <vendor-specific> fails the same way the tree parser does."""
+    from aopwiki_rdf.parser.xml_parser import stream_aopwiki_xml
+    src = tmp_path / "no_vendor.xml"
+    src.write_text('<data xmlns="http://www.aopkb.org/aop-xml"></data>')
+    with pytest.raises(ValueError, match="vendor-specific"):
+        stream_aopwiki_xml(str(src))
+
+
+def test_snapshot_hit_skips_reparse(sample_xml_path, tmp_path, monkeypatch):
+    """A second parse of the same bytes loads the snapshot instead of parsing."""
+    from aopwiki_rdf.parser import xml_parser
+    cache_dir = tmp_path / "parse-cache"
+    first, first_tables = xml_parser.stream_aopwiki_xml(sample_xml_path, cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+    def _no_parse(path):
+        raise AssertionError("reparsed despite a snapshot hit")
+
+    monkeypatch.setattr(xml_parser, "iterparse", _no_parse)
+    second, second_tables = xml_parser.stream_aopwiki_xml(sample_xml_path, cache_dir=cache_dir)
+    assert _entities_repr(second) == _entities_repr(first)
+    assert second_tables == first_tables
+
+
+def test_snapshot_invalidated_by_parser_fingerprint(sample_xml_path, tmp_path, monkeypatch):
+    """A snapshot written by another parser version is a miss."""
+    from aopwiki_rdf.parser import snapshot
+    from aopwiki_rdf.parser.xml_parser import stream_aopwiki_xml
+    entities, side_tables = stream_aopwiki_xml(sample_xml_path)
+    snapshot.save_snapshot(sample_xml_path, tmp_path, entities, side_tables)
+    assert snapshot.load_snapshot(sample_xml_path, tmp_path) is not None
+    monkeypatch.setattr(snapshot, "parser_fingerprint", lambda: "other-parser")
+    assert snapshot.load_snapshot(sample_xml_path, tmp_path) is None
+
+
+def test_snapshot_corrupt_file_is_deleted(sample_xml_path, tmp_path):
+    """A truncated snapshot is dropped and the parse falls through."""
+    from aopwiki_rdf.parser import snapshot
+    from aopwiki_rdf.parser.xml_parser import stream_aopwiki_xml
+    path = snapshot.snapshot_path(sample_xml_path, tmp_path)
+    path.write_bytes(b"\x80\x05truncated")
+    assert snapshot.load_snapshot(sample_xml_path, tmp_path) is None
+    assert not path.exists()
+    entities, _side_tables = stream_aopwiki_xml(sample_xml_path, cache_dir=tmp_path)
+    assert _entities_repr(entities) == _entities_repr(stream_aopwiki_xml(sample_xml_path)[0])
+    assert path.exists()
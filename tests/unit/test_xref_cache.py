@@ -0,0 +1,111 @@
+"""Tests for the release-tagged BridgeDb xref cache (mapping/xref_cache.py)."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from aopwiki_rdf.mapping.bridgedb import (
+    BridgeDbClient,
+    batch_xrefs_gene,
+    data_release,
+    fetch_properties,
+    open_client,
+)
+from aopwiki_rdf.mapping.xref_cache import XrefCache
+
+SESSION = "aopwiki_rdf.mapping.bridgedb.requests.Session"
+URL = "http://bridgedb/Human/"
+PROPERTIES = (
+    "DATASOURCENAME\tEnsembl\nDATASOURCEVERSION\t110\n"
+    "DATASOURCENAME\tWikidata\nDATASOURCEVERSION\t2024-05\n"
+)
+
+
+def _response(text):
+    resp = MagicMock()
+    resp.text = text
+    resp.raise_for_status.return_value = None
+    return resp
+
+
+class FakeService:
+    """Records the symbols sent; answers with an Entrez ID derived from each."""
+
+    def __init__(self):
+        self.sent = []
+
+    def post(self, url, data="", **kwargs):
+        symbols = data.split("\n")
+        self.sent.extend(symbols)
+        # Echo one symbol in lower case, as the live service has been seen to.
+        rows = [f"{'brca1' if s == 'BRCA1' else s}\tHGNC Symbol\tL:{len(s)}{s[-1]}"
+                for s in symbols]
+        return _response("\n".join(rows) + "\n")
+
+
+def _map(genes, cache_dir, release="r1", service=None, symbol_lookup=None):
+    service = service or FakeService()
+    with patch(f"{SESSION}.post", side_effect=service.post):
+        with BridgeDbClient(cache=XrefCache(cache_dir, release)) as client:
+            result = batch_xrefs_gene(genes, URL, client=client, symbol_lookup=symbol_lookup)
+    return result, service.sent
+
+
+def test_unchanged_release_answers_from_disk(tmp_path):
+    genes = ["hgnc:1100", "hgnc:11998"]
+    symbols = {"1100": "BRCA1", "11998": "TP53"}
+    first, sent = _map(genes, tmp_path, symbol_lookup=symbols)
+    assert sent == ["BRCA1", "TP53"]
+
+    second, sent = _map(genes, tmp_path, symbol_lookup=symbols)
+    assert sent == []
+    assert list(second.items()) == list(first.items())
+    assert second["hgnc:1100"] == {"Entrez Gene": ["51"]}
+
+
+def test_only_new_identifiers_go_to_the_network(tmp_path):
+    _map(["hgnc:TP53"], tmp_path)
+    result, sent = _map(["hgnc:EGFR", "hgnc:TP53", "hgnc:BRCA1"], tmp_path)
+    assert sent == ["EGFR", "BRCA1"]
+    # Request order is kept, and the lower-cased echo keeps its key.
+    assert list(result) == ["hgnc:EGFR", "hgnc:TP53", "hgnc:brca1"]
+
+
+def test_new_release_evicts_superseded_entries(tmp_path):
+    _map(["hgnc:TP53", "hgnc:EGFR"], tmp_path, release="r1")
+    _, sent = _map(["hgnc:TP53"], tmp_path, release="r2")
+    assert sent == ["TP53"]
+    shard = json.loads((tmp_path / "xrefs-H.json").read_text())
+    assert shard["release"] == "r2"
+    assert list(shard["entries"]) == ["hgnc:TP53"]
+
+
+def test_failed_lookups_are_not_cached(tmp_path):
+    def failing_post(url, data="", **kwargs):
+        raise requests.ConnectionError("down")
+
+    with patch(f"{SESSION}.post", side_effect=failing_post), \
+            patch(f"{SESSION}.get", side_effect=requests.ConnectionError("down")):
+        with BridgeDbClient(max_retries=1, cache=XrefCache(tmp_path, "r1")) as client:
+            result = batch_xrefs_gene(["hgnc:TP53"], URL, client=client)
+    assert result == {"hgnc:TP53": {}}
+    _, sent = _map(["hgnc:TP53"], tmp_path)
+    assert sent == ["TP53"]
+
+
+def test_properties_give_the_data_release():
+    with patch(f"{SESSION}.get", return_value=_response(PROPERTIES + "junk\n\n")):
+        info = fetch_properties(URL)
+    assert info["DATASOURCEVERSION"] == ["110", "2024-05"]
+    assert data_release(info) == "110|2024-05"
+    assert data_release({}) is None
+
+
+def test_open_client_skips_cache_when_release_unknown(tmp_path):
+    with patch(f"{SESSION}.get", side_effect=requests.ConnectionError("down")):
+        with open_client(URL, max_retries=1, cache_dir=tmp_path) as client:
+            assert client.cache is None
+    with patch(f"{SESSION}.get", return_value=_response(PROPERTIES)):
+        with open_client(URL, cache_dir=tmp_path) as client:
+            assert client.cache.release == "110|2024-05"